@@ -37,6 +37,96 @@ class Settings(BaseModel):
     invitation_expiry_interval_seconds: int = Field(
         default=86_400, alias="invitationExpiryIntervalSeconds"
     )
+    invitation_expiry_batch_size: int = Field(
+        default=500, alias="invitationExpiryBatchSize"
+    )
+    invitation_import_batch_size: int = Field(
+        default=500, alias="invitationImportBatchSize"
+    )
+    onboarding_funnel_cache_ttl_seconds: int = Field(
+        default=300, alias="onboardingFunnelCacheTtlSeconds"
+    )
+    hub_metrics_cache_ttl_seconds: int = Field(
+        default=30, alias="hubMetricsCacheTtlSeconds"
+    )
+    hub_metrics_cache_max_entries: int = Field(
+        default=4_096, alias="hubMetricsCacheMaxEntries"
+    )
+    workspace_cache_ttl_seconds: int = Field(
+        default=60, alias="workspaceCacheTtlSeconds"
+    )
+    workspace_cache_max_entries: int = Field(
+        default=1_024, alias="workspaceCacheMaxEntries"
+    )
+    workspace_stream_buffer_size: int = Field(
+        default=256, alias="workspaceStreamBufferSize"
+    )
+    workspace_stream_heartbeat_seconds: int = Field(
+        default=15, alias="workspaceStreamHeartbeatSeconds"
+    )
+    dashboard_cache_ttl_seconds: int = Field(
+        default=30, alias="dashboardCacheTtlSeconds"
+    )
+    dashboard_cache_max_entries: int = Field(
+        default=1_024, alias="dashboardCacheMaxEntries"
+    )
+    task_kpi_rebucket_interval_seconds: int = Field(
+        default=300, alias="taskKpiRebucketIntervalSeconds"
+    )
+    task_kpi_rebucket_batch_size: int = Field(
+        default=1_000, alias="taskKpiRebucketBatchSize"
+    )
+    presence_bucket_seconds: int = Field(
+        default=30, alias="presenceBucketSeconds"
+    )
+    presence_online_seconds: int = Field(
+        default=120, alias="presenceOnlineSeconds"
+    )
+    presence_window_seconds: int = Field(
+        default=600, alias="presenceWindowSeconds"
+    )
+    task_counter_repair_interval_seconds: int = Field(
+        default=3_600, alias="taskCounterRepairIntervalSeconds"
+    )
+    task_counter_repair_batch_size: int = Field(
+        default=500, alias="taskCounterRepairBatchSize"
+    )
+    task_rank_rebalance_interval_seconds: int = Field(
+        default=60, alias="taskRankRebalanceIntervalSeconds"
+    )
+    task_rank_rebalance_batch_size: int = Field(
+        default=50, alias="taskRankRebalanceBatchSize"
+    )
+    task_search_trigram_fallback: bool = Field(
+        default=True, alias="taskSearchTrigramFallback"
+    )
+    task_activity_batch_size: int = Field(
+        default=200, alias="taskActivityBatchSize"
+    )
+    task_activity_flush_interval_ms: int = Field(
+        default=250, alias="taskActivityFlushIntervalMs"
+    )
+    task_activity_max_pending: int = Field(
+        default=10_000, alias="taskActivityMaxPending"
+    )
+    workspace_seed_interval_seconds: int = Field(
+        default=5, alias="workspaceSeedIntervalSeconds"
+    )
+    workspace_seed_batch_size: int = Field(
+        default=20, alias="workspaceSeedBatchSize"
+    )
+    workspace_seed_max_attempts: int = Field(
+        default=5, alias="workspaceSeedMaxAttempts"
+    )
+    invitation_job_interval_seconds: int = Field(
+        default=5, alias="invitationJobIntervalSeconds"
+    )
+    invitation_job_batch_size: int = Field(
+        default=20, alias="invitationJobBatchSize"
+    )
+    invitation_job_max_attempts: int = Field(
+        default=5, alias="invitationJobMaxAttempts"
+    )
 
     @classmethod
     def from_env(cls) -> Settings:
@@ -58,6 +148,96 @@ class Settings(BaseModel):
             invitation_expiry_interval_seconds=int(
                 os.getenv("YOUREVER_INVITATION_EXPIRY_INTERVAL_SECONDS", "86400")
             ),
+            invitation_expiry_batch_size=int(
+                os.getenv("YOUREVER_INVITATION_EXPIRY_BATCH_SIZE", "500")
+            ),
+            invitation_import_batch_size=int(
+                os.getenv("YOUREVER_INVITATION_IMPORT_BATCH_SIZE", "500")
+            ),
+            onboarding_funnel_cache_ttl_seconds=int(
+                os.getenv("YOUREVER_ONBOARDING_FUNNEL_CACHE_TTL_SECONDS", "300")
+            ),
+            hub_metrics_cache_ttl_seconds=int(
+                os.getenv("YOUREVER_HUB_METRICS_CACHE_TTL_SECONDS", "30")
+            ),
+            hub_metrics_cache_max_entries=int(
+                os.getenv("YOUREVER_HUB_METRICS_CACHE_MAX_ENTRIES", "4096")
+            ),
+            workspace_cache_ttl_seconds=int(
+                os.getenv("YOUREVER_WORKSPACE_CACHE_TTL_SECONDS", "60")
+            ),
+            workspace_cache_max_entries=int(
+                os.getenv("YOUREVER_WORKSPACE_CACHE_MAX_ENTRIES", "1024")
+            ),
+            workspace_stream_buffer_size=int(
+                os.getenv("YOUREVER_WORKSPACE_STREAM_BUFFER_SIZE", "256")
+            ),
+            workspace_stream_heartbeat_seconds=int(
+                os.getenv("YOUREVER_WORKSPACE_STREAM_HEARTBEAT_SECONDS", "15")
+            ),
+            dashboard_cache_ttl_seconds=int(
+                os.getenv("YOUREVER_DASHBOARD_CACHE_TTL_SECONDS", "30")
+            ),
+            dashboard_cache_max_entries=int(
+                os.getenv("YOUREVER_DASHBOARD_CACHE_MAX_ENTRIES", "1024")
+            ),
+            task_kpi_rebucket_interval_seconds=int(
+                os.getenv("YOUREVER_TASK_KPI_REBUCKET_INTERVAL_SECONDS", "300")
+            ),
+            task_kpi_rebucket_batch_size=int(
+                os.getenv("YOUREVER_TASK_KPI_REBUCKET_BATCH_SIZE", "1000")
+            ),
+            presence_bucket_seconds=int(
+                os.getenv("YOUREVER_PRESENCE_BUCKET_SECONDS", "30")
+            ),
+            presence_online_seconds=int(
+                os.getenv("YOUREVER_PRESENCE_ONLINE_SECONDS", "120")
+            ),
+            presence_window_seconds=int(
+                os.getenv("YOUREVER_PRESENCE_WINDOW_SECONDS", "600")
+            ),
+            task_counter_repair_interval_seconds=int(
+                os.getenv("YOUREVER_TASK_COUNTER_REPAIR_INTERVAL_SECONDS", "3600")
+            ),
+            task_counter_repair_batch_size=int(
+                os.getenv("YOUREVER_TASK_COUNTER_REPAIR_BATCH_SIZE", "500")
+            ),
+            task_rank_rebalance_interval_seconds=int(
+                os.getenv("YOUREVER_TASK_RANK_REBALANCE_INTERVAL_SECONDS", "60")
+            ),
+            task_rank_rebalance_batch_size=int(
+                os.getenv("YOUREVER_TASK_RANK_REBALANCE_BATCH_SIZE", "50")
+            ),
+            task_search_trigram_fallback=(
+                os.getenv("YOUREVER_TASK_SEARCH_TRIGRAM_FALLBACK", "true").lower() == "true"
+            ),
+            task_activity_batch_size=int(
+                os.getenv("YOUREVER_TASK_ACTIVITY_BATCH_SIZE", "200")
+            ),
+            task_activity_flush_interval_ms=int(
+                os.getenv("YOUREVER_TASK_ACTIVITY_FLUSH_INTERVAL_MS", "250")
+            ),
+            task_activity_max_pending=int(
+                os.getenv("YOUREVER_TASK_ACTIVITY_MAX_PENDING", "10000")
+            ),
+            workspace_seed_interval_seconds=int(
+                os.getenv("YOUREVER_WORKSPACE_SEED_INTERVAL_SECONDS", "5")
+            ),
+            workspace_seed_batch_size=int(
+                os.getenv("YOUREVER_WORKSPACE_SEED_BATCH_SIZE", "20")
+            ),
+            workspace_seed_max_attempts=int(
+                os.getenv("YOUREVER_WORKSPACE_SEED_MAX_ATTEMPTS", "5")
+            ),
+            invitation_job_interval_seconds=int(
+                os.getenv("YOUREVER_INVITATION_JOB_INTERVAL_SECONDS", "5")
+            ),
+            invitation_job_batch_size=int(
+                os.getenv("YOUREVER_INVITATION_JOB_BATCH_SIZE", "20")
+            ),
+            invitation_job_max_attempts=int(
+                os.getenv("YOUREVER_INVITATION_JOB_MAX_ATTEMPTS", "5")
+            ),
         )
 
 
@@ -0,0 +1,46 @@
+"""
+Opaque keyset cursors shared by paginated list endpoints.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable
+
+from .errors import APIError
+
+
+class InvalidCursorError(APIError):
+    """Raised when a client sends a cursor that cannot be decoded."""
+
+    def __init__(self, detail: str = "Invalid pagination cursor") -> None:
+        super().__init__(status_code=400, detail=detail, code="invalid_cursor")
+
+
+@dataclass(frozen=True, slots=True)
+class KeysetCursor:
+    """Position after the last row of a page ordered by ``(sort_value, id)``.
+
+    ``sort_value`` is usually a timestamp. Any JSON-serialisable value also
+    works, provided the reader passes a matching ``parse`` to :meth:`decode`.
+    """
+
+    sort_value: Any
+    id: str
+
+    def encode(self) -> str:
+        value = self.sort_value.isoformat() if isinstance(self.sort_value, datetime) else self.sort_value
+        raw = json.dumps([value, self.id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str, parse: Callable[[Any], Any] = datetime.fromisoformat) -> KeysetCursor:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            return cls(sort_value=parse(sort_value), id=str(row_id))
+        except (ValueError, TypeError, UnicodeError) as error:
+            raise InvalidCursorError() from error
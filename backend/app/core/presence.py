@@ -0,0 +1,205 @@
+"""
+In-process presence registry fed by authenticated API traffic and live connections.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+from ..dependencies import CurrentPrincipal
+from .config import get_settings
+
+
+# (user_id, division_id); ``None`` marks organization-wide activity
+PresenceKey = tuple[str, Optional[str]]
+
+
+@dataclass(slots=True)
+class PresenceProfile:
+    """Display details captured from the principal at heartbeat time."""
+
+    name: str
+    avatar: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class PresenceEntry:
+    user_id: str
+    name: str
+    avatar: Optional[str]
+    status: str
+    last_seen: float
+
+
+class _OrgPresence:
+    """Time-bucketed ring of the keys seen in one organization.
+
+    ``ring`` holds one set per bucket for the retention window and
+    ``last_seen`` the newest bucket per key. Expiring a bucket only visits the
+    keys recorded in it, so expiry is amortized O(1) per heartbeat.
+    """
+
+    __slots__ = ("ring", "last_seen")
+
+    def __init__(self) -> None:
+        self.ring: deque[tuple[int, set[PresenceKey]]] = deque()
+        self.last_seen: dict[PresenceKey, int] = {}
+
+    def touch(self, key: PresenceKey, bucket: int) -> bool:
+        """Record ``key`` in ``bucket``; returns ``True`` when the key is new."""
+
+        if not self.ring or self.ring[-1][0] != bucket:
+            self.ring.append((bucket, set()))
+        self.ring[-1][1].add(key)
+        is_new = key not in self.last_seen
+        self.last_seen[key] = bucket
+        return is_new
+
+    def expire(self, oldest_live_bucket: int) -> list[PresenceKey]:
+        """Drop buckets older than ``oldest_live_bucket`` and return keys that went offline."""
+
+        expired: list[PresenceKey] = []
+        while self.ring and self.ring[0][0] < oldest_live_bucket:
+            bucket, keys = self.ring.popleft()
+            for key in keys:
+                if self.last_seen.get(key) == bucket:
+                    del self.last_seen[key]
+                    expired.append(key)
+        return expired
+
+
+class PresenceRegistry:
+    """Tracks who is active per organization and division without a database.
+
+    Users count as ``online`` when seen within ``online_seconds`` and ``away``
+    until ``window_seconds`` pass without a heartbeat, after which they are
+    dropped. State is per process; each API worker reports the members it has
+    served.
+    """
+
+    def __init__(
+        self,
+        *,
+        bucket_seconds: int = 30,
+        online_seconds: int = 120,
+        window_seconds: int = 600,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._bucket_seconds = max(1, bucket_seconds)
+        self._online_buckets = max(1, -(-online_seconds // self._bucket_seconds))
+        self._window_buckets = max(self._online_buckets, -(-window_seconds // self._bucket_seconds))
+        self._clock = clock
+        self._orgs: dict[str, _OrgPresence] = {}
+        # Organizations touched per bucket, so idle organizations are expired too
+        self._org_ring: deque[tuple[int, set[str]]] = deque()
+        self._profiles: dict[str, PresenceProfile] = {}
+        self._org_counts: dict[str, int] = {}
+
+    def heartbeat(
+        self,
+        principal: CurrentPrincipal,
+        org_id: str,
+        division_id: Optional[str] = None,
+    ) -> None:
+        """Record activity by ``principal`` in an organization and, optionally, a division."""
+
+        bucket = self._current_bucket()
+        self._sweep(bucket)
+        presence = self._orgs.get(org_id)
+        if presence is not None:
+            self._expire(org_id, presence, bucket)
+        presence = self._orgs.setdefault(org_id, _OrgPresence())
+        if not self._org_ring or self._org_ring[-1][0] != bucket:
+            self._org_ring.append((bucket, set()))
+        self._org_ring[-1][1].add(org_id)
+        self._profiles[principal.id] = _profile_for(principal)
+
+        if presence.touch((principal.id, None), bucket):
+            self._org_counts[principal.id] = self._org_counts.get(principal.id, 0) + 1
+        if division_id:
+            presence.touch((principal.id, division_id), bucket)
+
+    def online(
+        self,
+        org_id: str,
+        division_id: Optional[str] = None,
+        *,
+        limit: Optional[int] = None,
+    ) -> list[PresenceEntry]:
+        """Return members seen in the scope, most recent first."""
+
+        bucket = self._current_bucket()
+        self._sweep(bucket)
+        presence = self._orgs.get(org_id)
+        if presence is None:
+            return []
+        self._expire(org_id, presence, bucket)
+
+        seen = [
+            (user_id, last_bucket)
+            for (user_id, key_division), last_bucket in presence.last_seen.items()
+            if key_division == division_id
+        ]
+        seen.sort(key=lambda item: item[1], reverse=True)
+        if limit is not None:
+            seen = seen[:limit]
+
+        entries: list[PresenceEntry] = []
+        for user_id, last_bucket in seen:
+            profile = self._profiles.get(user_id) or PresenceProfile(name="Unknown member")
+            entries.append(
+                PresenceEntry(
+                    user_id=user_id,
+                    name=profile.name,
+                    avatar=profile.avatar,
+                    status="online" if bucket - last_bucket < self._online_buckets else "away",
+                    last_seen=float(last_bucket * self._bucket_seconds),
+                )
+            )
+        return entries
+
+    def _current_bucket(self) -> int:
+        return int(self._clock() // self._bucket_seconds)
+
+    def _sweep(self, bucket: int) -> None:
+        oldest_live_bucket = bucket - self._window_buckets + 1
+        while self._org_ring and self._org_ring[0][0] < oldest_live_bucket:
+            _, org_ids = self._org_ring.popleft()
+            for org_id in org_ids:
+                presence = self._orgs.get(org_id)
+                if presence is not None:
+                    self._expire(org_id, presence, bucket)
+
+    def _expire(self, org_id: str, presence: _OrgPresence, bucket: int) -> None:
+        for user_id, division_id in presence.expire(bucket - self._window_buckets + 1):
+            if division_id is not None:
+                continue
+            remaining = self._org_counts.get(user_id, 0) - 1
+            if remaining > 0:
+                self._org_counts[user_id] = remaining
+            else:
+                self._org_counts.pop(user_id, None)
+                self._profiles.pop(user_id, None)
+        if not presence.last_seen:
+            self._orgs.pop(org_id, None)
+
+
+def _profile_for(principal: CurrentPrincipal) -> PresenceProfile:
+    raw: dict[str, Any] = principal.claims.raw if principal.claims else {}
+    metadata = raw.get("user_metadata") if isinstance(raw.get("user_metadata"), dict) else {}
+    name = metadata.get("full_name") or metadata.get("name") or principal.email or "Unknown member"
+    return PresenceProfile(name=str(name), avatar=metadata.get("avatar_url"))
+
+
+@lru_cache
+def get_presence_registry() -> PresenceRegistry:
+    settings = get_settings()
+    return PresenceRegistry(
+        bucket_seconds=settings.presence_bucket_seconds,
+        online_seconds=settings.presence_online_seconds,
+        window_seconds=settings.presence_window_seconds,
+    )
@@ -25,6 +25,7 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.params import Depends as FastAPIDepends
 
 from ..dependencies import CurrentPrincipal, require_current_principal
+from .presence import get_presence_registry
 from .scope import ScopeContext, ScopeGuard, get_scope_guard, require_division_access, require_organization_access
 
 T = TypeVar("T", bound=Callable[..., Any])
@@ -167,9 +168,11 @@ def require_organization_access_with_id(
             )
 
         guard = scope_guard or get_scope_guard()
-        return await require_organization_access(
+        scope_ctx = await require_organization_access(
             principal, org_id, required_permissions, guard
         )
+        get_presence_registry().heartbeat(principal, org_id)
+        return scope_ctx
 
     return dependency
 
@@ -203,9 +206,11 @@ def require_division_access_with_ids(
             )
 
         guard = scope_guard or get_scope_guard()
-        return await require_division_access(
+        scope_ctx = await require_division_access(
             principal, org_id, div_id, required_permissions, guard
         )
+        get_presence_registry().heartbeat(principal, org_id, div_id)
+        return scope_ctx
 
     return dependency
 
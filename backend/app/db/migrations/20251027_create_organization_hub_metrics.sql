@@ -0,0 +1,166 @@
+-- Maintain per-organization hub metrics incrementally instead of aggregating on read
+CREATE TABLE IF NOT EXISTS public.organization_hub_metrics (
+    org_id UUID PRIMARY KEY,
+    member_count INTEGER NOT NULL DEFAULT 0,
+    active_projects INTEGER NOT NULL DEFAULT 0,
+    last_project_activity TIMESTAMPTZ,
+    last_channel_activity TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    CONSTRAINT fk_organization_hub_metrics_org FOREIGN KEY (org_id) REFERENCES public.organizations (id) ON DELETE CASCADE
+);
+
+-- Backfill from the existing tables once; triggers keep the row current afterwards
+INSERT INTO public.organization_hub_metrics (
+    org_id,
+    member_count,
+    active_projects,
+    last_project_activity,
+    last_channel_activity
+)
+SELECT
+    o.id,
+    COALESCE(mc.member_count, 0),
+    COALESCE(ps.active_projects, 0),
+    ps.last_project_activity,
+    cs.last_channel_activity
+FROM public.organizations o
+LEFT JOIN (
+    SELECT org_id, COUNT(*) AS member_count
+    FROM public.org_memberships
+    GROUP BY org_id
+) mc ON mc.org_id = o.id
+LEFT JOIN (
+    SELECT
+        org_id,
+        COUNT(*) FILTER (WHERE status = 'active' AND archived_at IS NULL) AS active_projects,
+        MAX(updated_at) AS last_project_activity
+    FROM public.workspace_projects
+    GROUP BY org_id
+) ps ON ps.org_id = o.id
+LEFT JOIN (
+    SELECT org_id, MAX(updated_at) AS last_channel_activity
+    FROM public.workspace_channels
+    WHERE archived_at IS NULL
+    GROUP BY org_id
+) cs ON cs.org_id = o.id
+ON CONFLICT (org_id) DO UPDATE SET
+    member_count = EXCLUDED.member_count,
+    active_projects = EXCLUDED.active_projects,
+    last_project_activity = EXCLUDED.last_project_activity,
+    last_channel_activity = EXCLUDED.last_channel_activity,
+    updated_at = NOW();
+
+CREATE OR REPLACE FUNCTION public.bump_organization_hub_metrics(
+    target_org_id UUID,
+    member_delta INTEGER,
+    project_delta INTEGER,
+    project_activity TIMESTAMPTZ,
+    channel_activity TIMESTAMPTZ
+)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF target_org_id IS NULL THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO public.organization_hub_metrics AS m (
+        org_id,
+        member_count,
+        active_projects,
+        last_project_activity,
+        last_channel_activity,
+        updated_at
+    ) VALUES (
+        target_org_id,
+        GREATEST(member_delta, 0),
+        GREATEST(project_delta, 0),
+        project_activity,
+        channel_activity,
+        NOW()
+    )
+    ON CONFLICT (org_id) DO UPDATE SET
+        member_count = GREATEST(m.member_count + member_delta, 0),
+        active_projects = GREATEST(m.active_projects + project_delta, 0),
+        last_project_activity = GREATEST(m.last_project_activity, project_activity),
+        last_channel_activity = GREATEST(m.last_channel_activity, channel_activity),
+        updated_at = NOW();
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.track_org_membership_metrics()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM public.bump_organization_hub_metrics(NEW.org_id, 1, 0, NULL, NULL);
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM public.bump_organization_hub_metrics(OLD.org_id, -1, 0, NULL, NULL);
+    ELSIF NEW.org_id IS DISTINCT FROM OLD.org_id THEN
+        PERFORM public.bump_organization_hub_metrics(OLD.org_id, -1, 0, NULL, NULL);
+        PERFORM public.bump_organization_hub_metrics(NEW.org_id, 1, 0, NULL, NULL);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION public.track_workspace_project_metrics()
+RETURNS TRIGGER AS $$
+DECLARE
+    was_active BOOLEAN := FALSE;
+    is_active BOOLEAN := FALSE;
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        was_active := OLD.status = 'active' AND OLD.archived_at IS NULL;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        is_active := NEW.status = 'active' AND NEW.archived_at IS NULL;
+    END IF;
+
+    IF TG_OP = 'DELETE' THEN
+        PERFORM public.bump_organization_hub_metrics(
+            OLD.org_id, 0, -was_active::INTEGER, NULL, NULL
+        );
+    ELSIF TG_OP = 'UPDATE' AND NEW.org_id IS DISTINCT FROM OLD.org_id THEN
+        PERFORM public.bump_organization_hub_metrics(
+            OLD.org_id, 0, -was_active::INTEGER, NULL, NULL
+        );
+        PERFORM public.bump_organization_hub_metrics(
+            NEW.org_id, 0, is_active::INTEGER, NEW.updated_at, NULL
+        );
+    ELSE
+        PERFORM public.bump_organization_hub_metrics(
+            NEW.org_id, 0, is_active::INTEGER - was_active::INTEGER, NEW.updated_at, NULL
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION public.track_workspace_channel_metrics()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.archived_at IS NULL THEN
+        PERFORM public.bump_organization_hub_metrics(NEW.org_id, 0, 0, NULL, NEW.updated_at);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_org_membership_metrics ON public.org_memberships;
+CREATE TRIGGER trg_org_membership_metrics
+AFTER INSERT OR UPDATE OF org_id OR DELETE ON public.org_memberships
+FOR EACH ROW
+EXECUTE FUNCTION public.track_org_membership_metrics();
+
+DROP TRIGGER IF EXISTS trg_workspace_project_metrics ON public.workspace_projects;
+CREATE TRIGGER trg_workspace_project_metrics
+AFTER INSERT OR UPDATE OR DELETE ON public.workspace_projects
+FOR EACH ROW
+EXECUTE FUNCTION public.track_workspace_project_metrics();
+
+DROP TRIGGER IF EXISTS trg_workspace_channel_metrics ON public.workspace_channels;
+CREATE TRIGGER trg_workspace_channel_metrics
+AFTER INSERT OR UPDATE ON public.workspace_channels
+FOR EACH ROW
+EXECUTE FUNCTION public.track_workspace_channel_metrics();
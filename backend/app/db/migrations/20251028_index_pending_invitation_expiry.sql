@@ -0,0 +1,4 @@
+-- Support deadline lookups and batched expiry sweeps for pending invitations
+CREATE INDEX IF NOT EXISTS invitations_pending_expiry_idx
+    ON public.invitations (expires_at)
+    WHERE status = 'pending' AND deleted_at IS NULL AND expires_at IS NOT NULL;
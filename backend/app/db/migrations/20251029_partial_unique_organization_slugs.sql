@@ -0,0 +1,15 @@
+-- Enforce slug uniqueness among active organizations only and serve prefix lookups
+--
+-- Slug allocation reads every active slug in a byte-order prefix range in one
+-- query, so the index uses the "C" collation to match that comparison. The
+-- partial index also lets a soft-deleted organization's slug be reused, which
+-- the application already assumes when checking availability.
+CREATE UNIQUE INDEX IF NOT EXISTS organizations_active_slug_unique
+    ON public.organizations (slug COLLATE "C")
+    WHERE deleted_at IS NULL;
+
+ALTER TABLE public.organizations
+    DROP CONSTRAINT IF EXISTS organizations_slug_unique;
+
+-- Equality lookups by slug use the default collation and keep idx_organizations_slug.
+CREATE INDEX IF NOT EXISTS idx_organizations_slug ON public.organizations (slug);
@@ -0,0 +1,7 @@
+-- Composite indexes backing keyset pagination on workspace channels and activities
+CREATE INDEX IF NOT EXISTS idx_workspace_channels_org_updated_keyset
+    ON public.workspace_channels (org_id, updated_at DESC, id DESC)
+    WHERE archived_at IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_workspace_activities_org_occurred_keyset
+    ON public.workspace_activities (org_id, occurred_at DESC, id DESC);
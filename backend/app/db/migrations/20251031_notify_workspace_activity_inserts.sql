@@ -0,0 +1,20 @@
+-- Publish new workspace activities for the live SSE stream
+--
+-- The payload carries identifiers only; listeners load the row themselves so
+-- large activity content never hits the 8000-byte NOTIFY limit.
+CREATE OR REPLACE FUNCTION public.notify_workspace_activity_created()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify(
+        'workspace_activity_created',
+        json_build_object('id', NEW.id, 'org_id', NEW.org_id)::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_workspace_activity_created ON public.workspace_activities;
+CREATE TRIGGER trg_workspace_activity_created
+AFTER INSERT ON public.workspace_activities
+FOR EACH ROW
+EXECUTE FUNCTION public.notify_workspace_activity_created();
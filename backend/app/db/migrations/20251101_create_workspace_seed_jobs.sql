@@ -0,0 +1,24 @@
+-- Durable queue for workspace template seeding
+--
+-- One row per (organization, template source). Organization creation enqueues
+-- the row in the same transaction as the organization itself, and the seed
+-- worker claims batches with FOR UPDATE SKIP LOCKED.
+CREATE TABLE IF NOT EXISTS public.workspace_seed_jobs (
+    org_id UUID NOT NULL,
+    template_source TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    requested_by UUID,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    run_after TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    completed_at TIMESTAMPTZ,
+    PRIMARY KEY (org_id, template_source),
+    CONSTRAINT fk_workspace_seed_jobs_org FOREIGN KEY (org_id) REFERENCES public.organizations (id) ON DELETE CASCADE,
+    CONSTRAINT workspace_seed_jobs_status_check CHECK (status IN ('pending', 'completed', 'skipped', 'failed'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_workspace_seed_jobs_pending
+    ON public.workspace_seed_jobs (run_after, created_at)
+    WHERE status = 'pending';
@@ -0,0 +1,160 @@
+-- Maintain dashboard task KPIs incrementally instead of scanning workspace_tasks on read
+--
+-- Every live task carries its KPI bucket ('on_track', 'at_risk', 'overdue') and
+-- the moment that bucket next changes purely because time passes. Triggers keep
+-- per-(org, division, template) bucket counters in step with task writes, and the
+-- dashboard re-bucketing job only touches tasks whose kpi_rebucket_at has passed.
+
+ALTER TABLE public.workspace_tasks
+    ADD COLUMN IF NOT EXISTS kpi_bucket TEXT,
+    ADD COLUMN IF NOT EXISTS kpi_rebucket_at TIMESTAMPTZ;
+
+CREATE OR REPLACE FUNCTION public.workspace_task_kpi_bucket(
+    task_due_at TIMESTAMPTZ,
+    task_priority TEXT,
+    task_archived_at TIMESTAMPTZ,
+    as_of TIMESTAMPTZ
+)
+RETURNS TEXT
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT CASE
+        WHEN task_archived_at IS NOT NULL THEN NULL
+        WHEN task_due_at IS NOT NULL AND task_due_at < as_of THEN 'overdue'
+        WHEN task_due_at IS NOT NULL AND task_due_at < as_of + INTERVAL '2 days' THEN 'at_risk'
+        WHEN task_due_at IS NULL AND task_priority IN ('High', 'Urgent') THEN 'at_risk'
+        ELSE 'on_track'
+    END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.workspace_task_kpi_rebucket_at(
+    task_due_at TIMESTAMPTZ,
+    task_bucket TEXT
+)
+RETURNS TIMESTAMPTZ
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT CASE
+        WHEN task_due_at IS NULL THEN NULL
+        WHEN task_bucket = 'on_track' THEN task_due_at - INTERVAL '2 days'
+        WHEN task_bucket = 'at_risk' THEN task_due_at
+        ELSE NULL
+    END;
+$$;
+
+UPDATE public.workspace_tasks
+   SET kpi_bucket = public.workspace_task_kpi_bucket(due_at, priority, archived_at, NOW());
+
+UPDATE public.workspace_tasks
+   SET kpi_rebucket_at = public.workspace_task_kpi_rebucket_at(due_at, kpi_bucket);
+
+-- Drives the re-bucketing job: only tasks with a pending time-based transition are indexed
+CREATE INDEX IF NOT EXISTS idx_workspace_tasks_kpi_rebucket
+    ON public.workspace_tasks (kpi_rebucket_at)
+    WHERE kpi_rebucket_at IS NOT NULL;
+
+-- division_key is the division id, or the nil UUID for organization-wide tasks
+CREATE TABLE IF NOT EXISTS public.workspace_task_kpi_rollups (
+    org_id UUID NOT NULL,
+    division_key UUID NOT NULL,
+    is_template BOOLEAN NOT NULL,
+    bucket TEXT NOT NULL,
+    task_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (org_id, division_key, is_template, bucket),
+    CONSTRAINT fk_workspace_task_kpi_rollups_org FOREIGN KEY (org_id) REFERENCES public.organizations (id) ON DELETE CASCADE,
+    CONSTRAINT workspace_task_kpi_rollups_bucket_check CHECK (bucket IN ('on_track', 'at_risk', 'overdue'))
+);
+
+-- Backfill from the existing tasks once; triggers keep the counters current afterwards
+INSERT INTO public.workspace_task_kpi_rollups (org_id, division_key, is_template, bucket, task_count)
+SELECT org_id,
+       COALESCE(division_id, '00000000-0000-0000-0000-000000000000'::UUID),
+       is_template,
+       kpi_bucket,
+       COUNT(*)
+  FROM public.workspace_tasks
+ WHERE kpi_bucket IS NOT NULL
+ GROUP BY 1, 2, 3, 4
+ON CONFLICT (org_id, division_key, is_template, bucket) DO UPDATE SET
+    task_count = EXCLUDED.task_count,
+    updated_at = NOW();
+
+CREATE OR REPLACE FUNCTION public.bump_workspace_task_kpi(
+    target_org_id UUID,
+    target_division_id UUID,
+    target_is_template BOOLEAN,
+    target_bucket TEXT,
+    delta INTEGER
+)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    target_division_key UUID := COALESCE(target_division_id, '00000000-0000-0000-0000-000000000000'::UUID);
+BEGIN
+    IF target_org_id IS NULL OR target_bucket IS NULL OR delta = 0 THEN
+        RETURN;
+    END IF;
+
+    IF delta < 0 THEN
+        -- Decrements never create rows, so cascading organization deletes stay valid
+        UPDATE public.workspace_task_kpi_rollups
+           SET task_count = GREATEST(task_count + delta, 0),
+               updated_at = NOW()
+         WHERE org_id = target_org_id
+           AND division_key = target_division_key
+           AND is_template = target_is_template
+           AND bucket = target_bucket;
+        RETURN;
+    END IF;
+
+    INSERT INTO public.workspace_task_kpi_rollups AS r (
+        org_id, division_key, is_template, bucket, task_count, updated_at
+    ) VALUES (
+        target_org_id, target_division_key, target_is_template, target_bucket, delta, NOW()
+    )
+    ON CONFLICT (org_id, division_key, is_template, bucket) DO UPDATE SET
+        task_count = r.task_count + delta,
+        updated_at = NOW();
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.assign_workspace_task_kpi_bucket()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.kpi_bucket := public.workspace_task_kpi_bucket(NEW.due_at, NEW.priority, NEW.archived_at, NOW());
+    NEW.kpi_rebucket_at := public.workspace_task_kpi_rebucket_at(NEW.due_at, NEW.kpi_bucket);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION public.track_workspace_task_kpis()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM public.bump_workspace_task_kpi(NEW.org_id, NEW.division_id, NEW.is_template, NEW.kpi_bucket, 1);
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM public.bump_workspace_task_kpi(OLD.org_id, OLD.division_id, OLD.is_template, OLD.kpi_bucket, -1);
+    ELSIF (NEW.org_id, NEW.division_id, NEW.is_template, NEW.kpi_bucket)
+          IS DISTINCT FROM (OLD.org_id, OLD.division_id, OLD.is_template, OLD.kpi_bucket) THEN
+        PERFORM public.bump_workspace_task_kpi(OLD.org_id, OLD.division_id, OLD.is_template, OLD.kpi_bucket, -1);
+        PERFORM public.bump_workspace_task_kpi(NEW.org_id, NEW.division_id, NEW.is_template, NEW.kpi_bucket, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_workspace_task_kpi_bucket ON public.workspace_tasks;
+CREATE TRIGGER trg_workspace_task_kpi_bucket
+BEFORE INSERT OR UPDATE ON public.workspace_tasks
+FOR EACH ROW
+EXECUTE FUNCTION public.assign_workspace_task_kpi_bucket();
+
+DROP TRIGGER IF EXISTS trg_workspace_task_kpis ON public.workspace_tasks;
+CREATE TRIGGER trg_workspace_task_kpis
+AFTER INSERT OR UPDATE OR DELETE ON public.workspace_tasks
+FOR EACH ROW
+EXECUTE FUNCTION public.track_workspace_task_kpis();
@@ -0,0 +1,34 @@
+-- Keep comment and attachment counts on kanban cards
+--
+-- Card reads previously joined task_comments and task_attachments and grouped
+-- by card to count them. The counts now live on the card row; the tasks
+-- repository adjusts them in the same statement that inserts or deletes a
+-- comment or attachment, and the counter repair job recomputes any drift.
+
+ALTER TABLE public.kanban_cards
+    ADD COLUMN IF NOT EXISTS comment_count INTEGER NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS attachment_count INTEGER NOT NULL DEFAULT 0;
+
+-- Backfill once from the existing child rows
+UPDATE public.kanban_cards AS t
+   SET comment_count = COALESCE(tc.total, 0),
+       attachment_count = COALESCE(ta.total, 0)
+  FROM public.kanban_cards AS k
+  LEFT JOIN (
+      SELECT task_id, COUNT(*) AS total
+        FROM public.task_comments
+       GROUP BY task_id
+  ) AS tc ON tc.task_id = k.id
+  LEFT JOIN (
+      SELECT task_id, COUNT(*) AS total
+        FROM public.task_attachments
+       GROUP BY task_id
+  ) AS ta ON ta.task_id = k.id
+ WHERE t.id = k.id
+   AND (tc.total IS NOT NULL OR ta.total IS NOT NULL);
+
+ALTER TABLE public.kanban_cards
+    DROP CONSTRAINT IF EXISTS kanban_cards_child_counts_non_negative;
+ALTER TABLE public.kanban_cards
+    ADD CONSTRAINT kanban_cards_child_counts_non_negative
+    CHECK (comment_count >= 0 AND attachment_count >= 0);
@@ -0,0 +1,99 @@
+-- Version counter per kanban board for snapshot ETags
+--
+-- Any write to a board, its columns or its cards bumps the board's version, so
+-- the board snapshot endpoint can answer conditional requests with 304 after a
+-- single primary-key lookup. The counter lives in its own table so bumping it
+-- does not touch kanban_boards.updated_at (which orders board listings).
+
+CREATE TABLE IF NOT EXISTS public.kanban_board_versions (
+    board_id UUID PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 1,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    CONSTRAINT fk_kanban_board_versions_board FOREIGN KEY (board_id) REFERENCES public.kanban_boards (id) ON DELETE CASCADE
+);
+
+INSERT INTO public.kanban_board_versions (board_id, version)
+SELECT id, 1
+  FROM public.kanban_boards
+ON CONFLICT (board_id) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION public.bump_kanban_board_version(target_board_id UUID)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF target_board_id IS NULL THEN
+        RETURN;
+    END IF;
+
+    -- Selecting from kanban_boards skips boards deleted earlier in a cascade
+    INSERT INTO public.kanban_board_versions AS v (board_id, version, updated_at)
+    SELECT b.id, 1, NOW()
+      FROM public.kanban_boards b
+     WHERE b.id = target_board_id
+    ON CONFLICT (board_id) DO UPDATE SET
+        version = v.version + 1,
+        updated_at = NOW();
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.track_kanban_board_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP <> 'DELETE' THEN
+        PERFORM public.bump_kanban_board_version(NEW.id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION public.track_kanban_column_board_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM public.bump_kanban_board_version(OLD.board_id);
+    END IF;
+    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.board_id IS DISTINCT FROM OLD.board_id) THEN
+        PERFORM public.bump_kanban_board_version(NEW.board_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION public.track_kanban_card_board_version()
+RETURNS TRIGGER AS $$
+DECLARE
+    old_board_id UUID;
+    new_board_id UUID;
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        SELECT board_id INTO old_board_id FROM public.kanban_columns WHERE id = OLD.column_id;
+        PERFORM public.bump_kanban_board_version(old_board_id);
+    END IF;
+    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.column_id IS DISTINCT FROM OLD.column_id) THEN
+        SELECT board_id INTO new_board_id FROM public.kanban_columns WHERE id = NEW.column_id;
+        IF new_board_id IS DISTINCT FROM old_board_id THEN
+            PERFORM public.bump_kanban_board_version(new_board_id);
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_kanban_boards_version ON public.kanban_boards;
+CREATE TRIGGER trg_kanban_boards_version
+AFTER INSERT OR UPDATE ON public.kanban_boards
+FOR EACH ROW
+EXECUTE FUNCTION public.track_kanban_board_version();
+
+DROP TRIGGER IF EXISTS trg_kanban_columns_board_version ON public.kanban_columns;
+CREATE TRIGGER trg_kanban_columns_board_version
+AFTER INSERT OR UPDATE OR DELETE ON public.kanban_columns
+FOR EACH ROW
+EXECUTE FUNCTION public.track_kanban_column_board_version();
+
+DROP TRIGGER IF EXISTS trg_kanban_cards_board_version ON public.kanban_cards;
+CREATE TRIGGER trg_kanban_cards_board_version
+AFTER INSERT OR UPDATE OR DELETE ON public.kanban_cards
+FOR EACH ROW
+EXECUTE FUNCTION public.track_kanban_card_board_version();
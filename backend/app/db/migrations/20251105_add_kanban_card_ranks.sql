@@ -0,0 +1,86 @@
+-- Order kanban cards by lexicographic rank keys instead of dense positions
+--
+-- Dense integer positions forced every move, insert and delete to shift all
+-- cards between the affected slots. Cards now carry a base-62 ``rank`` compared
+-- byte-wise; a key can always be generated between two neighbours, so moving a
+-- card rewrites exactly one row. The API's integer ``position`` is derived from
+-- rank order on read. Key generation lives in app/modules/tasks/ranking.py.
+
+ALTER TABLE public.kanban_cards
+    ADD COLUMN IF NOT EXISTS rank TEXT COLLATE "C";
+
+-- Mirrors ranking.spaced_keys(): a two-digit block plus a non-zero digit,
+-- centred in the key space so both ends have room to grow.
+CREATE OR REPLACE FUNCTION public.kanban_card_spaced_rank(ordinal BIGINT, total BIGINT)
+RETURNS TEXT
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+DECLARE
+    digits CONSTANT TEXT := '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz';
+    start_block BIGINT := (3844 - CEIL(total / 61.0)::BIGINT) / 2;
+    block BIGINT := start_block + (ordinal - 1) / 61;
+BEGIN
+    RETURN substr(digits, (block / 62)::INTEGER + 1, 1)
+        || substr(digits, (block % 62)::INTEGER + 1, 1)
+        || substr(digits, ((ordinal - 1) % 61)::INTEGER + 2, 1);
+END;
+$$;
+
+UPDATE public.kanban_cards AS t
+   SET rank = public.kanban_card_spaced_rank(ordered.ordinal, ordered.total)
+  FROM (
+      SELECT id,
+             ROW_NUMBER() OVER (PARTITION BY column_id ORDER BY position, created_at, id) AS ordinal,
+             COUNT(*) OVER (PARTITION BY column_id) AS total
+        FROM public.kanban_cards
+  ) AS ordered
+ WHERE t.id = ordered.id
+   AND t.rank IS NULL;
+
+ALTER TABLE public.kanban_cards
+    ALTER COLUMN rank SET NOT NULL;
+
+-- Deferrable so a rebalance can rewrite a whole column in one statement
+ALTER TABLE public.kanban_cards
+    DROP CONSTRAINT IF EXISTS kanban_cards_column_rank_unique;
+ALTER TABLE public.kanban_cards
+    ADD CONSTRAINT kanban_cards_column_rank_unique
+    UNIQUE (column_id, rank) DEFERRABLE INITIALLY IMMEDIATE;
+
+-- Drives the rebalance job; must match ranking.REBALANCE_RANK_LENGTH
+CREATE INDEX IF NOT EXISTS idx_kanban_cards_long_rank
+    ON public.kanban_cards (column_id)
+    WHERE length(rank) > 16;
+
+-- The summary view depends on the dense position column it replaces
+DROP VIEW IF EXISTS public.kanban_task_summary;
+
+ALTER TABLE public.kanban_cards
+    DROP COLUMN IF EXISTS position;
+
+CREATE OR REPLACE VIEW public.kanban_task_summary AS
+SELECT
+    t.id,
+    t.title,
+    t.priority,
+    (ROW_NUMBER() OVER (PARTITION BY t.column_id ORDER BY t.rank) - 1)::INTEGER AS position,
+    t.rank,
+    t.due_date,
+    t.assigned_to,
+    t.labels,
+    t.is_archived,
+    t.updated_at,
+    c.name AS column_name,
+    c.color AS column_color,
+    b.id AS board_id,
+    b.name AS board_name,
+    u.name AS assignee_name,
+    u.email AS assignee_email,
+    t.comment_count,
+    t.attachment_count,
+    CASE WHEN t.due_date < NOW() AND t.completed_at IS NULL THEN true ELSE false END AS is_overdue
+FROM public.kanban_cards t
+JOIN public.kanban_columns c ON t.column_id = c.id
+JOIN public.kanban_boards b ON c.board_id = b.id
+LEFT JOIN public.users u ON t.assigned_to = u.id;
@@ -0,0 +1,11 @@
+-- Check column position uniqueness at the end of each statement
+--
+-- reorder_columns now rewrites every column of a board in one UPDATE joined
+-- against unnest(). A non-deferrable unique constraint is checked row by row,
+-- so swapping two positions in a single statement would fail part-way.
+
+ALTER TABLE public.kanban_columns
+    DROP CONSTRAINT IF EXISTS kanban_columns_unique_position;
+ALTER TABLE public.kanban_columns
+    ADD CONSTRAINT kanban_columns_unique_position
+    UNIQUE (board_id, position) DEFERRABLE INITIALLY IMMEDIATE;
@@ -0,0 +1,25 @@
+-- Full-text search over kanban cards
+--
+-- Task search filtered with ``title ILIKE '%q%' OR description ILIKE '%q%'``,
+-- which scans every card. Cards now carry a generated, weighted ``tsvector``
+-- over title (A), labels (B) and description (C) behind a GIN index, and a
+-- trigram index on title serves the prefix/typo fallback. The expression index
+-- from 20251020_create_kanban_tables.sql never matched the query and is dropped.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE public.kanban_cards
+    ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', COALESCE(title, '')), 'A')
+        || setweight(jsonb_to_tsvector('english', COALESCE(labels, '[]'::jsonb), '["string"]'), 'B')
+        || setweight(to_tsvector('english', COALESCE(description, '')), 'C')
+    ) STORED;
+
+DROP INDEX IF EXISTS public.idx_kanban_cards_search;
+
+CREATE INDEX IF NOT EXISTS idx_kanban_cards_search_vector
+    ON public.kanban_cards USING gin (search_vector);
+
+CREATE INDEX IF NOT EXISTS idx_kanban_cards_title_trgm
+    ON public.kanban_cards USING gin (title gin_trgm_ops);
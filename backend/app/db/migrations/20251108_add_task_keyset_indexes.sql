@@ -0,0 +1,19 @@
+-- Keyset indexes for comment and activity pagination
+--
+-- Comment and activity lists now page on ``(created_at, id)`` cursors instead
+-- of OFFSET, so a deep page costs the same as the first. The row comparison
+-- ``(created_at, id) < ($2, $3)`` needs ``id`` in the index to resolve ties
+-- without a heap recheck; these replace the (parent, created_at) indexes from
+-- 20251020_create_kanban_tables.sql.
+
+CREATE INDEX IF NOT EXISTS idx_task_comments_task_keyset
+    ON public.task_comments (task_id, created_at, id);
+DROP INDEX IF EXISTS public.idx_task_comments_task;
+
+CREATE INDEX IF NOT EXISTS idx_task_activities_task_keyset
+    ON public.task_activities (task_id, created_at, id);
+DROP INDEX IF EXISTS public.idx_task_activities_task;
+
+CREATE INDEX IF NOT EXISTS idx_task_activities_board_keyset
+    ON public.task_activities (board_id, created_at, id);
+DROP INDEX IF EXISTS public.idx_task_activities_board;
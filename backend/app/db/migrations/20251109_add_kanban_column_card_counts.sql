@@ -0,0 +1,76 @@
+-- Live card count per kanban column for WIP limits
+--
+-- WIP checks used to load every card of the target column just to count them.
+-- kanban_columns.card_count now holds the number of non-archived cards, kept
+-- current by a trigger on kanban_cards, so a check reads one column row and a
+-- move can lock that row and compare against wip_limit in the same statement.
+--
+-- The updated_at and board-version triggers on kanban_columns are narrowed to
+-- the user-editable columns: a count change is already reported by the card
+-- trigger and must not reorder column listings or bump the version twice.
+
+ALTER TABLE public.kanban_columns
+    ADD COLUMN IF NOT EXISTS card_count INTEGER NOT NULL DEFAULT 0;
+
+UPDATE public.kanban_columns c
+   SET card_count = counts.card_count
+  FROM (
+        SELECT column_id, COUNT(*)::integer AS card_count
+          FROM public.kanban_cards
+         WHERE NOT COALESCE(is_archived, false)
+         GROUP BY column_id
+       ) counts
+ WHERE c.id = counts.column_id;
+
+CREATE OR REPLACE FUNCTION public.track_kanban_column_card_count()
+RETURNS TRIGGER AS $$
+DECLARE
+    old_column_id UUID;
+    new_column_id UUID;
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND NOT COALESCE(OLD.is_archived, false) THEN
+        old_column_id := OLD.column_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NOT COALESCE(NEW.is_archived, false) THEN
+        new_column_id := NEW.column_id;
+    END IF;
+
+    IF old_column_id IS NOT DISTINCT FROM new_column_id THEN
+        RETURN NULL;
+    END IF;
+
+    -- Lock in id order so two moves between the same columns cannot deadlock
+    IF old_column_id IS NOT NULL AND new_column_id IS NOT NULL THEN
+        PERFORM 1
+           FROM public.kanban_columns
+          WHERE id IN (old_column_id, new_column_id)
+          ORDER BY id
+            FOR UPDATE;
+    END IF;
+
+    IF old_column_id IS NOT NULL THEN
+        UPDATE public.kanban_columns SET card_count = card_count - 1 WHERE id = old_column_id;
+    END IF;
+    IF new_column_id IS NOT NULL THEN
+        UPDATE public.kanban_columns SET card_count = card_count + 1 WHERE id = new_column_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_kanban_cards_column_card_count ON public.kanban_cards;
+CREATE TRIGGER trg_kanban_cards_column_card_count
+AFTER INSERT OR DELETE OR UPDATE OF column_id, is_archived ON public.kanban_cards
+FOR EACH ROW
+EXECUTE FUNCTION public.track_kanban_column_card_count();
+
+DROP TRIGGER IF EXISTS update_kanban_columns_updated_at ON public.kanban_columns;
+CREATE TRIGGER update_kanban_columns_updated_at
+    BEFORE UPDATE OF board_id, name, color, position, column_type, wip_limit ON public.kanban_columns
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS trg_kanban_columns_board_version ON public.kanban_columns;
+CREATE TRIGGER trg_kanban_columns_board_version
+AFTER INSERT OR DELETE OR UPDATE OF board_id, name, color, position, column_type, wip_limit ON public.kanban_columns
+FOR EACH ROW
+EXECUTE FUNCTION public.track_kanban_column_board_version();
@@ -0,0 +1,166 @@
+-- Statement-level, slotted board version bumps
+--
+-- The row-level triggers from 20251104_create_kanban_board_versions.sql bumped
+-- the board's single version row once per card written and held its lock to
+-- commit, so concurrent moves and edits on one board queued behind each other
+-- and a 500-card bulk move bumped the row 500 times.
+--
+-- Versions are now split into slots per board, picked from the writing
+-- transaction id: concurrent transactions mostly bump different rows, and a
+-- transaction keeps reusing the one row it already holds. The board version
+-- is the sum of its slots, which still grows with every committed write.
+-- Statement-level triggers read the transition tables and bump each affected
+-- board once per statement.
+
+ALTER TABLE public.kanban_board_versions
+    ADD COLUMN IF NOT EXISTS slot SMALLINT NOT NULL DEFAULT 0;
+
+ALTER TABLE public.kanban_board_versions DROP CONSTRAINT IF EXISTS kanban_board_versions_pkey;
+ALTER TABLE public.kanban_board_versions ADD CONSTRAINT kanban_board_versions_pkey PRIMARY KEY (board_id, slot);
+
+CREATE OR REPLACE FUNCTION public.bump_kanban_board_versions(target_board_ids UUID[])
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF target_board_ids IS NULL OR cardinality(target_board_ids) = 0 THEN
+        RETURN;
+    END IF;
+
+    -- Selecting from kanban_boards skips boards deleted earlier in a cascade;
+    -- id order keeps multi-board bumps from deadlocking
+    INSERT INTO public.kanban_board_versions AS v (board_id, slot, version, updated_at)
+    SELECT b.id, (txid_current() % 8)::smallint, 1, NOW()
+      FROM public.kanban_boards b
+     WHERE b.id = ANY(target_board_ids)
+     ORDER BY b.id
+    ON CONFLICT (board_id, slot) DO UPDATE SET
+        version = v.version + 1,
+        updated_at = NOW();
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.track_kanban_boards_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM public.bump_kanban_board_versions(ARRAY(SELECT id FROM new_boards));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION public.track_kanban_columns_board_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM public.bump_kanban_board_versions(ARRAY(SELECT DISTINCT board_id FROM new_columns));
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM public.bump_kanban_board_versions(ARRAY(SELECT DISTINCT board_id FROM old_columns));
+    ELSE
+        -- card_count changes are reported by the card trigger
+        PERFORM public.bump_kanban_board_versions(ARRAY(
+            SELECT DISTINCT changed.board_id
+              FROM new_columns n
+              JOIN old_columns o ON o.id = n.id
+             CROSS JOIN LATERAL (VALUES (o.board_id), (n.board_id)) AS changed (board_id)
+             WHERE (n.board_id, n.name, n.color, n.position, n.column_type, n.wip_limit)
+                   IS DISTINCT FROM (o.board_id, o.name, o.color, o.position, o.column_type, o.wip_limit)
+        ));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION public.track_kanban_cards_board_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM public.bump_kanban_board_versions(ARRAY(
+            SELECT DISTINCT c.board_id
+              FROM new_cards n
+              JOIN public.kanban_columns c ON c.id = n.column_id
+        ));
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM public.bump_kanban_board_versions(ARRAY(
+            SELECT DISTINCT c.board_id
+              FROM old_cards o
+              JOIN public.kanban_columns c ON c.id = o.column_id
+        ));
+    ELSE
+        PERFORM public.bump_kanban_board_versions(ARRAY(
+            SELECT c.board_id
+              FROM old_cards o
+              JOIN public.kanban_columns c ON c.id = o.column_id
+            UNION
+            SELECT c.board_id
+              FROM new_cards n
+              JOIN public.kanban_columns c ON c.id = n.column_id
+        ));
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables need one trigger per event
+DROP TRIGGER IF EXISTS trg_kanban_boards_version ON public.kanban_boards;
+DROP TRIGGER IF EXISTS trg_kanban_boards_version_insert ON public.kanban_boards;
+CREATE TRIGGER trg_kanban_boards_version_insert
+AFTER INSERT ON public.kanban_boards
+REFERENCING NEW TABLE AS new_boards
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.track_kanban_boards_version();
+
+DROP TRIGGER IF EXISTS trg_kanban_boards_version_update ON public.kanban_boards;
+CREATE TRIGGER trg_kanban_boards_version_update
+AFTER UPDATE ON public.kanban_boards
+REFERENCING NEW TABLE AS new_boards
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.track_kanban_boards_version();
+
+DROP TRIGGER IF EXISTS trg_kanban_columns_board_version ON public.kanban_columns;
+DROP TRIGGER IF EXISTS trg_kanban_columns_board_version_insert ON public.kanban_columns;
+CREATE TRIGGER trg_kanban_columns_board_version_insert
+AFTER INSERT ON public.kanban_columns
+REFERENCING NEW TABLE AS new_columns
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.track_kanban_columns_board_version();
+
+DROP TRIGGER IF EXISTS trg_kanban_columns_board_version_update ON public.kanban_columns;
+CREATE TRIGGER trg_kanban_columns_board_version_update
+AFTER UPDATE ON public.kanban_columns
+REFERENCING OLD TABLE AS old_columns NEW TABLE AS new_columns
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.track_kanban_columns_board_version();
+
+DROP TRIGGER IF EXISTS trg_kanban_columns_board_version_delete ON public.kanban_columns;
+CREATE TRIGGER trg_kanban_columns_board_version_delete
+AFTER DELETE ON public.kanban_columns
+REFERENCING OLD TABLE AS old_columns
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.track_kanban_columns_board_version();
+
+DROP TRIGGER IF EXISTS trg_kanban_cards_board_version ON public.kanban_cards;
+DROP TRIGGER IF EXISTS trg_kanban_cards_board_version_insert ON public.kanban_cards;
+CREATE TRIGGER trg_kanban_cards_board_version_insert
+AFTER INSERT ON public.kanban_cards
+REFERENCING NEW TABLE AS new_cards
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.track_kanban_cards_board_version();
+
+DROP TRIGGER IF EXISTS trg_kanban_cards_board_version_update ON public.kanban_cards;
+CREATE TRIGGER trg_kanban_cards_board_version_update
+AFTER UPDATE ON public.kanban_cards
+REFERENCING OLD TABLE AS old_cards NEW TABLE AS new_cards
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.track_kanban_cards_board_version();
+
+DROP TRIGGER IF EXISTS trg_kanban_cards_board_version_delete ON public.kanban_cards;
+CREATE TRIGGER trg_kanban_cards_board_version_delete
+AFTER DELETE ON public.kanban_cards
+REFERENCING OLD TABLE AS old_cards
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.track_kanban_cards_board_version();
+
+DROP FUNCTION IF EXISTS public.track_kanban_board_version();
+DROP FUNCTION IF EXISTS public.track_kanban_column_board_version();
+DROP FUNCTION IF EXISTS public.track_kanban_card_board_version();
+DROP FUNCTION IF EXISTS public.bump_kanban_board_version(UUID);
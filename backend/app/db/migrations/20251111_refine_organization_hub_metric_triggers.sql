@@ -0,0 +1,128 @@
+-- Skip no-op hub metric bumps and let channel activity move back
+--
+-- The triggers from 20251027_create_organization_hub_metrics.sql wrote the
+-- organization's metrics row on every project and channel update, even when
+-- no count changed and no timestamp advanced, so unrelated edits across an
+-- organization queued on that one row. Such bumps now return without touching
+-- the row.
+--
+-- The channel trigger also ignored deletes and archiving, so
+-- last_channel_activity could only grow. When the removed channel may have
+-- held the latest activity, the value is recomputed from the remaining
+-- channels through idx_workspace_channels_org_updated_keyset.
+
+CREATE OR REPLACE FUNCTION public.bump_organization_hub_metrics(
+    target_org_id UUID,
+    member_delta INTEGER,
+    project_delta INTEGER,
+    project_activity TIMESTAMPTZ,
+    channel_activity TIMESTAMPTZ
+)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF target_org_id IS NULL THEN
+        RETURN;
+    END IF;
+
+    IF member_delta = 0 AND project_delta = 0 THEN
+        IF project_activity IS NULL AND channel_activity IS NULL THEN
+            RETURN;
+        END IF;
+
+        -- Rows failing the WHERE clause are not locked
+        UPDATE public.organization_hub_metrics m
+           SET last_project_activity = GREATEST(m.last_project_activity, project_activity),
+               last_channel_activity = GREATEST(m.last_channel_activity, channel_activity),
+               updated_at = NOW()
+         WHERE m.org_id = target_org_id
+           AND (
+                project_activity > COALESCE(m.last_project_activity, '-infinity'::timestamptz)
+                OR channel_activity > COALESCE(m.last_channel_activity, '-infinity'::timestamptz)
+           );
+        IF FOUND OR EXISTS (
+            SELECT 1 FROM public.organization_hub_metrics WHERE org_id = target_org_id
+        ) THEN
+            RETURN;
+        END IF;
+    END IF;
+
+    INSERT INTO public.organization_hub_metrics AS m (
+        org_id,
+        member_count,
+        active_projects,
+        last_project_activity,
+        last_channel_activity,
+        updated_at
+    ) VALUES (
+        target_org_id,
+        GREATEST(member_delta, 0),
+        GREATEST(project_delta, 0),
+        project_activity,
+        channel_activity,
+        NOW()
+    )
+    ON CONFLICT (org_id) DO UPDATE SET
+        member_count = GREATEST(m.member_count + member_delta, 0),
+        active_projects = GREATEST(m.active_projects + project_delta, 0),
+        last_project_activity = GREATEST(m.last_project_activity, project_activity),
+        last_channel_activity = GREATEST(m.last_channel_activity, channel_activity),
+        updated_at = NOW();
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.refresh_organization_channel_activity(
+    target_org_id UUID,
+    removed_activity TIMESTAMPTZ
+)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- Only a channel at the current maximum can move the value back
+    UPDATE public.organization_hub_metrics m
+       SET last_channel_activity = (
+               SELECT MAX(c.updated_at)
+                 FROM public.workspace_channels c
+                WHERE c.org_id = target_org_id
+                  AND c.archived_at IS NULL
+           ),
+           updated_at = NOW()
+     WHERE m.org_id = target_org_id
+       AND m.last_channel_activity <= removed_activity;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.track_workspace_channel_metrics()
+RETURNS TRIGGER AS $$
+DECLARE
+    was_listed BOOLEAN := FALSE;
+    is_listed BOOLEAN := FALSE;
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        was_listed := OLD.archived_at IS NULL;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        is_listed := NEW.archived_at IS NULL;
+    END IF;
+
+    IF was_listed THEN
+        IF TG_OP = 'DELETE' OR NOT is_listed THEN
+            PERFORM public.refresh_organization_channel_activity(OLD.org_id, OLD.updated_at);
+        ELSIF NEW.org_id IS DISTINCT FROM OLD.org_id THEN
+            PERFORM public.refresh_organization_channel_activity(OLD.org_id, OLD.updated_at);
+        END IF;
+    END IF;
+    IF is_listed THEN
+        PERFORM public.bump_organization_hub_metrics(NEW.org_id, 0, 0, NULL, NEW.updated_at);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_workspace_channel_metrics ON public.workspace_channels;
+CREATE TRIGGER trg_workspace_channel_metrics
+AFTER INSERT OR UPDATE OR DELETE ON public.workspace_channels
+FOR EACH ROW
+EXECUTE FUNCTION public.track_workspace_channel_metrics();
@@ -0,0 +1,55 @@
+-- Limit the project hub metric trigger to changes in the active count
+--
+-- Every project edit advances updated_at, so the project trigger still wrote
+-- the organization's metrics row on each update to move last_project_activity,
+-- and edits across an organization kept queuing on that one row. The trigger
+-- now fires only for inserts, deletes and updates of org_id, status or
+-- archived_at, and returns early unless a project entered or left the active
+-- count.
+--
+-- The hub reads the latest project activity from workspace_projects through
+-- idx_workspace_projects_org_updated instead; last_project_activity is no
+-- longer written.
+
+CREATE INDEX IF NOT EXISTS idx_workspace_projects_org_updated
+    ON public.workspace_projects (org_id, updated_at DESC);
+
+CREATE OR REPLACE FUNCTION public.track_workspace_project_metrics()
+RETURNS TRIGGER AS $$
+DECLARE
+    was_active BOOLEAN := FALSE;
+    is_active BOOLEAN := FALSE;
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        was_active := OLD.status = 'active' AND OLD.archived_at IS NULL;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        is_active := NEW.status = 'active' AND NEW.archived_at IS NULL;
+    END IF;
+
+    IF TG_OP = 'UPDATE'
+       AND NEW.org_id IS NOT DISTINCT FROM OLD.org_id
+       AND is_active IS NOT DISTINCT FROM was_active THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND NEW.org_id IS DISTINCT FROM OLD.org_id) THEN
+        PERFORM public.bump_organization_hub_metrics(OLD.org_id, 0, -was_active::INTEGER, NULL, NULL);
+        IF TG_OP = 'DELETE' THEN
+            RETURN NULL;
+        END IF;
+        PERFORM public.bump_organization_hub_metrics(NEW.org_id, 0, is_active::INTEGER, NULL, NULL);
+    ELSE
+        PERFORM public.bump_organization_hub_metrics(
+            NEW.org_id, 0, is_active::INTEGER - was_active::INTEGER, NULL, NULL
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_workspace_project_metrics ON public.workspace_projects;
+CREATE TRIGGER trg_workspace_project_metrics
+AFTER INSERT OR DELETE OR UPDATE OF org_id, status, archived_at ON public.workspace_projects
+FOR EACH ROW
+EXECUTE FUNCTION public.track_workspace_project_metrics();
@@ -0,0 +1,28 @@
+-- Durable queue for the invitations sent after organization creation
+--
+-- Invitations used to be sent from an in-process task, so a shutdown dropped
+-- them and their status was only visible on the worker that created the
+-- organization. Organization creation now records one row per organization in
+-- the same transaction as the organization itself; the invitation worker
+-- claims batches with FOR UPDATE SKIP LOCKED and the provisioning status
+-- endpoint reads the row from any worker.
+CREATE TABLE IF NOT EXISTS public.organization_invitation_jobs (
+    org_id UUID PRIMARY KEY,
+    inviter_id UUID NOT NULL,
+    invitations JSONB NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    invited_count INTEGER NOT NULL DEFAULT 0,
+    skipped_emails TEXT[] NOT NULL DEFAULT '{}',
+    run_after TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    completed_at TIMESTAMPTZ,
+    CONSTRAINT fk_organization_invitation_jobs_org FOREIGN KEY (org_id) REFERENCES public.organizations (id) ON DELETE CASCADE,
+    CONSTRAINT organization_invitation_jobs_status_check CHECK (status IN ('pending', 'completed', 'failed'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_organization_invitation_jobs_pending
+    ON public.organization_invitation_jobs (run_after, created_at)
+    WHERE status = 'pending';
@@ -0,0 +1,86 @@
+-- Keep task updated_at for edits, not KPI re-bucketing
+--
+-- The re-bucketing job from 20251102_create_workspace_task_kpi_rollups.sql
+-- rewrites kpi_bucket on tasks whose bucket changed with the clock. The touch
+-- trigger treated that as an edit and advanced updated_at, so the workspace
+-- overview, ordered by updated_at, reshuffled tasks nobody had touched.
+-- Workspace tasks now get their own touch function that leaves updated_at
+-- alone when only kpi_bucket and kpi_rebucket_at differ.
+--
+-- bump_workspace_task_kpi used to clamp decrements at zero silently, hiding
+-- counters that had drifted from the tasks. The clamp stays, but now raises a
+-- warning naming the rollup so the drift shows up in the database log.
+
+CREATE OR REPLACE FUNCTION public.touch_workspace_task_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF (to_jsonb(NEW) - 'kpi_bucket' - 'kpi_rebucket_at')
+       IS NOT DISTINCT FROM (to_jsonb(OLD) - 'kpi_bucket' - 'kpi_rebucket_at') THEN
+        RETURN NEW;
+    END IF;
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_touch_workspace_tasks ON public.workspace_tasks;
+CREATE TRIGGER trg_touch_workspace_tasks
+BEFORE UPDATE ON public.workspace_tasks
+FOR EACH ROW
+EXECUTE FUNCTION public.touch_workspace_task_updated_at();
+
+CREATE OR REPLACE FUNCTION public.bump_workspace_task_kpi(
+    target_org_id UUID,
+    target_division_id UUID,
+    target_is_template BOOLEAN,
+    target_bucket TEXT,
+    delta INTEGER
+)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    target_division_key UUID := COALESCE(target_division_id, '00000000-0000-0000-0000-000000000000'::UUID);
+BEGIN
+    IF target_org_id IS NULL OR target_bucket IS NULL OR delta = 0 THEN
+        RETURN;
+    END IF;
+
+    IF delta < 0 THEN
+        -- Decrements never create rows, so cascading organization deletes stay valid
+        UPDATE public.workspace_task_kpi_rollups
+           SET task_count = task_count + delta,
+               updated_at = NOW()
+         WHERE org_id = target_org_id
+           AND division_key = target_division_key
+           AND is_template = target_is_template
+           AND bucket = target_bucket
+           AND task_count + delta >= 0;
+        IF FOUND THEN
+            RETURN;
+        END IF;
+
+        UPDATE public.workspace_task_kpi_rollups
+           SET task_count = 0,
+               updated_at = NOW()
+         WHERE org_id = target_org_id
+           AND division_key = target_division_key
+           AND is_template = target_is_template
+           AND bucket = target_bucket;
+        IF FOUND THEN
+            RAISE WARNING 'workspace_task_kpi_rollups drift: org % division % template % bucket % clamped at 0 (delta %)',
+                target_org_id, target_division_key, target_is_template, target_bucket, delta;
+        END IF;
+        RETURN;
+    END IF;
+
+    INSERT INTO public.workspace_task_kpi_rollups AS r (
+        org_id, division_key, is_template, bucket, task_count, updated_at
+    ) VALUES (
+        target_org_id, target_division_key, target_is_template, target_bucket, delta, NOW()
+    )
+    ON CONFLICT (org_id, division_key, is_template, bucket) DO UPDATE SET
+        task_count = r.task_count + delta,
+        updated_at = NOW();
+END;
+$$;
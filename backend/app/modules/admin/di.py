@@ -4,9 +4,14 @@ from __future__ import annotations
 
 from fastapi import Depends
 
+from ...core import get_settings
 from ...db.session import get_engine
 from ..users.aggregation import OnboardingAnswerSnapshotRepository
-from .service import AdminOnboardingAnswersService
+from ..users.di import get_onboarding_funnel_repository
+from ..users.funnel import OnboardingFunnelRepository
+from .service import AdminOnboardingAnswersService, AdminOnboardingFunnelService, OnboardingFunnelCache
+
+_FUNNEL_CACHE = OnboardingFunnelCache(ttl_seconds=get_settings().onboarding_funnel_cache_ttl_seconds)
 
 
 async def get_onboarding_snapshot_repository() -> OnboardingAnswerSnapshotRepository:
@@ -18,3 +23,9 @@ async def get_admin_onboarding_answers_service(
     repository: OnboardingAnswerSnapshotRepository = Depends(get_onboarding_snapshot_repository),
 ) -> AdminOnboardingAnswersService:
     return AdminOnboardingAnswersService(repository)
+
+
+async def get_admin_onboarding_funnel_service(
+    repository: OnboardingFunnelRepository = Depends(get_onboarding_funnel_repository),
+) -> AdminOnboardingFunnelService:
+    return AdminOnboardingFunnelService(repository, _FUNNEL_CACHE)
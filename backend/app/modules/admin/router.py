@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 from uuid import UUID
 
@@ -11,12 +11,14 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 
 from ...dependencies import CurrentPrincipal, require_current_principal
-from .di import get_admin_onboarding_answers_service
+from ..onboarding.manifest import DEFAULT_ONBOARDING_MANIFEST
+from .di import get_admin_onboarding_answers_service, get_admin_onboarding_funnel_service
 from .schemas import (
     OnboardingAnswerListResponse,
     OnboardingAnswerUserResponse,
+    OnboardingFunnelResponse,
 )
-from .service import AdminOnboardingAnswersService
+from .service import AdminOnboardingAnswersService, AdminOnboardingFunnelService
 from ..users.exporter import snapshot_to_dict
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
@@ -86,3 +88,24 @@ async def export_onboarding_answers(
     filename = f"onboarding-answers-{datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')}.ndjson"
     headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
     return StreamingResponse(line_iterator(), media_type="application/x-ndjson", headers=headers)
+
+
+@router.get("/onboarding/funnel", response_model=OnboardingFunnelResponse)
+async def get_onboarding_funnel(
+    manifest_version: Optional[str] = Query(None, description="Manifest version, defaults to the active manifest"),
+    day_from: Optional[date] = Query(None, description="Inclusive first day of the window"),
+    day_to: Optional[date] = Query(None, description="Inclusive last day of the window"),
+    _: CurrentPrincipal = Depends(require_admin_principal),
+    service: AdminOnboardingFunnelService = Depends(get_admin_onboarding_funnel_service),
+) -> OnboardingFunnelResponse:
+    if day_from and day_to and day_from > day_to:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="day_from must not be after day_to")
+    version = manifest_version or DEFAULT_ONBOARDING_MANIFEST.version
+    buckets = await service.list_buckets(manifest_version=version, day_from=day_from, day_to=day_to)
+    return OnboardingFunnelResponse.build(
+        manifest_version=version,
+        step_ids=service.step_ids,
+        buckets=buckets,
+        day_from=day_from,
+        day_to=day_to,
+    )
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from math import ceil
 from typing import Any, Dict, Sequence
 
 from pydantic import BaseModel, Field
 
 from ..users.aggregation import OnboardingAnswerSnapshot
+from ..users.funnel import COMPLETED_FUNNEL_STEP, OnboardingFunnelBucket
 
 
 class PaginationMeta(BaseModel):
@@ -79,3 +80,62 @@ class OnboardingAnswerUserResponse(BaseModel):
             total=len(items),
             sessions=[OnboardingAnswerSnapshotPayload.from_snapshot(item) for item in items],
         )
+
+
+class OnboardingFunnelStepPayload(BaseModel):
+    step_id: str
+    sessions: int = Field(ge=0)
+    conversion_from_previous: float | None = None
+
+
+class OnboardingFunnelDayPayload(BaseModel):
+    day: date
+    step_id: str
+    sessions: int = Field(ge=0)
+
+
+class OnboardingFunnelResponse(BaseModel):
+    manifest_version: str
+    day_from: date | None = None
+    day_to: date | None = None
+    steps: list[OnboardingFunnelStepPayload]
+    daily: list[OnboardingFunnelDayPayload]
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        manifest_version: str,
+        step_ids: Sequence[str],
+        buckets: Sequence[OnboardingFunnelBucket],
+        day_from: date | None,
+        day_to: date | None,
+    ) -> "OnboardingFunnelResponse":
+        totals: Dict[str, int] = {}
+        for bucket in buckets:
+            totals[bucket.step_id] = totals.get(bucket.step_id, 0) + bucket.sessions
+
+        steps: list[OnboardingFunnelStepPayload] = []
+        previous: int | None = None
+        for step_id in (*step_ids, COMPLETED_FUNNEL_STEP):
+            sessions = totals.get(step_id, 0)
+            conversion = round(sessions / previous, 4) if previous else None
+            steps.append(
+                OnboardingFunnelStepPayload(
+                    step_id=step_id,
+                    sessions=sessions,
+                    conversion_from_previous=conversion,
+                )
+            )
+            previous = sessions
+
+        return cls(
+            manifest_version=manifest_version,
+            day_from=day_from,
+            day_to=day_to,
+            steps=steps,
+            daily=[
+                OnboardingFunnelDayPayload(day=bucket.day, step_id=bucket.step_id, sessions=bucket.sessions)
+                for bucket in buckets
+            ],
+        )
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from collections.abc import AsyncIterator
-from datetime import datetime
+from datetime import date, datetime
 
 from ..users.aggregation import OnboardingAnswerSnapshot, OnboardingAnswerSnapshotRepository
+from ..users.funnel import OnboardingFunnelBucket, OnboardingFunnelRepository
 
 
 class AdminOnboardingAnswersService:
@@ -51,3 +54,68 @@ class AdminOnboardingAnswersService:
         async for batch in self._repository.iter_all_snapshots(batch_size=batch_size):
             for snapshot in batch:
                 yield snapshot
+
+
+class OnboardingFunnelCache:
+    """In-process TTL cache for funnel reads keyed by manifest version and window."""
+
+    def __init__(self, ttl_seconds: int = 300) -> None:
+        self._ttl = ttl_seconds
+        self._store: dict[tuple[str | None, date | None, date | None], tuple[float, list[OnboardingFunnelBucket]]] = {}
+        self._lock = asyncio.Lock()
+
+    async def get(
+        self, key: tuple[str | None, date | None, date | None]
+    ) -> list[OnboardingFunnelBucket] | None:
+        async with self._lock:
+            entry = self._store.get(key)
+            if not entry:
+                return None
+            expires_at, payload = entry
+            if time.monotonic() >= expires_at:
+                self._store.pop(key, None)
+                return None
+            return payload
+
+    async def set(
+        self,
+        key: tuple[str | None, date | None, date | None],
+        payload: list[OnboardingFunnelBucket],
+    ) -> None:
+        async with self._lock:
+            self._store[key] = (time.monotonic() + self._ttl, payload)
+
+
+class AdminOnboardingFunnelService:
+    """Serve step-level onboarding drop-off from the materialized funnel counters."""
+
+    def __init__(
+        self,
+        repository: OnboardingFunnelRepository,
+        cache: OnboardingFunnelCache,
+    ) -> None:
+        self._repository = repository
+        self._cache = cache
+
+    @property
+    def step_ids(self) -> tuple[str, ...]:
+        return self._repository.step_ids
+
+    async def list_buckets(
+        self,
+        *,
+        manifest_version: str | None,
+        day_from: date | None,
+        day_to: date | None,
+    ) -> list[OnboardingFunnelBucket]:
+        key = (manifest_version, day_from, day_to)
+        cached = await self._cache.get(key)
+        if cached is not None:
+            return cached
+        buckets = await self._repository.list_buckets(
+            manifest_version=manifest_version,
+            day_from=day_from,
+            day_to=day_to,
+        )
+        await self._cache.set(key, buckets)
+        return buckets
@@ -6,14 +6,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ...db.session import db_session_dependency
 from ..users.di import get_user_service
 from ..users.service import UserService
-from ..workspace.di import get_workspace_template_service
-from ..workspace.service import WorkspaceTemplateService
 from .hub_service import (
     HubEventPublisher,
     InvitationActionRateLimiter,
     OrganizationHubService,
 )
-from .repository import OrganizationRepository
+from .repository import InvitationJobRepository, OrganizationRepository
 from .service import OrganizationInvitationService, OrganizationService
 
 
@@ -23,15 +21,21 @@ async def get_organization_repository(
     return OrganizationRepository(session=session)
 
 
+async def get_invitation_job_repository(
+    session: AsyncSession = Depends(db_session_dependency),
+) -> InvitationJobRepository:
+    return InvitationJobRepository(session=session)
+
+
 async def get_organization_service(
     user_service: UserService = Depends(get_user_service),
     repository: OrganizationRepository = Depends(get_organization_repository),
-    workspace_template_service: WorkspaceTemplateService = Depends(get_workspace_template_service),
+    invitation_jobs: InvitationJobRepository = Depends(get_invitation_job_repository),
 ) -> OrganizationService:
     return OrganizationService(
         user_service=user_service,
         repository=repository,
-        workspace_template_service=workspace_template_service,
+        invitation_jobs=invitation_jobs,
     )
 
 
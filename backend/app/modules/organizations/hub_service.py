@@ -84,13 +84,8 @@ class OrganizationHubService:
 
     async def get_overview(self, principal: CurrentPrincipal) -> HubOverview:
         user = await self._user_service.get_current_user(principal)
-        expired = await self._repository.expire_stale_invitations()
-        if expired:
-            logger.info(
-                "hub.invitations.expired",
-                extra={"user_id": principal.id, "expired_count": expired},
-            )
-
+        # Expired invitations are filtered by the read queries; the expiry
+        # scheduler owns the status transition so hub reads never write.
         organizations = await self._repository.get_user_organizations(user.id)
         invitations = await self._repository.get_pending_invitations(user.email)
 
@@ -137,13 +132,6 @@ class OrganizationHubService:
         self, principal: CurrentPrincipal
     ) -> list[HubInvitation]:
         user = await self._user_service.get_current_user(principal)
-        expired = await self._repository.expire_stale_invitations()
-        if expired:
-            logger.info(
-                "hub.invitations.expired",
-                extra={"user_id": principal.id, "expired_count": expired},
-            )
-
         invitations = await self._repository.get_pending_invitations(user.email)
         return [
             HubInvitation.model_validate(invitation.model_dump(by_alias=True))
@@ -0,0 +1,323 @@
+"""Streaming bulk invitation import for CSV and NDJSON uploads."""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import json
+import logging
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from tempfile import SpooledTemporaryFile
+from typing import Any, Dict, List, Optional
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from .repository import OrganizationRepository
+from .schemas import InvitationCreatePayload, InvitationImportError, InvitationImportProgress
+
+logger = logging.getLogger(__name__)
+
+
+SUPPORTED_IMPORT_FORMATS = ("csv", "ndjson")
+
+# Uploads larger than this are spooled to a temporary file instead of memory
+SPOOL_MAX_MEMORY = 1024 * 1024
+_SPOOL_READ_SIZE = 64 * 1024
+
+_FIELD_ALIASES = {
+    "email": "email",
+    "role": "role",
+    "message": "message",
+    "division_id": "divisionId",
+    "divisionid": "divisionId",
+    "expires_at": "expiresAt",
+    "expiresat": "expiresAt",
+}
+
+
+@dataclass(slots=True)
+class ParsedInvitationRow:
+    """Single line of an import upload, either a valid payload or an error."""
+
+    line: int
+    payload: Optional[InvitationCreatePayload] = None
+    error: Optional[str] = None
+
+
+def resolve_import_format(explicit: Optional[str], content_type: Optional[str]) -> str:
+    """Pick the upload format from the query parameter or the Content-Type header."""
+
+    if explicit:
+        normalized = explicit.strip().lower()
+        if normalized not in SUPPORTED_IMPORT_FORMATS:
+            raise ValueError(f"Unsupported import format '{explicit}'")
+        return normalized
+
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if media_type in {"application/x-ndjson", "application/ndjson", "application/jsonl"}:
+        return "ndjson"
+    return "csv"
+
+
+def _in_memory(spool: SpooledTemporaryFile) -> bool:
+    return not getattr(spool, "_rolled", True)
+
+
+async def spool_upload(chunks: AsyncIterator[bytes]) -> SpooledTemporaryFile:
+    """Read a request body into a spooled file, rewound and ready to parse.
+
+    The body has to be consumed before a streaming response starts: while it
+    streams, the server listens on the same receive channel for disconnects
+    and would swallow the remaining body chunks.
+    """
+
+    spool = SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+    try:
+        async for chunk in chunks:
+            if _in_memory(spool):
+                spool.write(chunk)
+            else:
+                await run_in_threadpool(spool.write, chunk)
+        spool.seek(0)
+    except BaseException:
+        spool.close()
+        raise
+    return spool
+
+
+async def iter_spooled_chunks(spool: SpooledTemporaryFile) -> AsyncIterator[bytes]:
+    """Yield a spooled upload in chunks, closing the file when done."""
+
+    try:
+        while True:
+            if _in_memory(spool):
+                chunk = spool.read(_SPOOL_READ_SIZE)
+            else:
+                chunk = await run_in_threadpool(spool.read, _SPOOL_READ_SIZE)
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        spool.close()
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a byte stream incrementally and yield complete lines."""
+
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in chunks:
+        if not chunk:
+            continue
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+def _normalize_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    normalized: Dict[str, Any] = {}
+    for key, value in record.items():
+        alias = _FIELD_ALIASES.get(str(key).strip().replace("-", "_").lower())
+        if alias is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+        if value in ("", None):
+            continue
+        normalized[alias] = value
+    return normalized
+
+
+def _parse_payload(line: int, record: Dict[str, Any]) -> ParsedInvitationRow:
+    try:
+        payload = InvitationCreatePayload.model_validate(_normalize_record(record))
+    except ValidationError as error:
+        first = error.errors()[0] if error.errors() else {}
+        location = ".".join(str(part) for part in first.get("loc", ())) or "row"
+        return ParsedInvitationRow(line=line, error=f"{location}: {first.get('msg', 'invalid value')}")
+    # The batch insert casts division ids to UUID; one bad value would fail the whole batch
+    if payload.division_id is not None:
+        try:
+            uuid.UUID(payload.division_id)
+        except ValueError:
+            return ParsedInvitationRow(line=line, error="divisionId: Input should be a valid UUID")
+    return ParsedInvitationRow(line=line, payload=payload)
+
+
+class _LineFeed:
+    """Line iterator for ``csv.reader`` that can be refilled between records."""
+
+    def __init__(self) -> None:
+        self._lines: deque[str] = deque()
+
+    def extend(self, lines: List[str]) -> None:
+        self._lines.extend(lines)
+
+    def __iter__(self) -> "_LineFeed":
+        return self
+
+    def __next__(self) -> str:
+        if not self._lines:
+            raise StopIteration
+        return self._lines.popleft()
+
+
+async def iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, List[str]]]:
+    """Yield ``(first line number, values)`` for each CSV record.
+
+    Lines are fed to one ``csv.reader`` as they arrive. A record is handed to
+    the reader only once its quotes balance, so quoted fields may contain
+    line breaks and the reader never runs dry in the middle of a record.
+    """
+
+    feed = _LineFeed()
+    reader = csv.reader(feed)
+    pending: List[str] = []
+    quotes = 0
+    start = 0
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not pending:
+            if not line.strip():
+                continue
+            start = line_number
+        pending.append(line + "\n")
+        quotes += line.count('"')
+        if quotes % 2:
+            continue
+        feed.extend(pending)
+        pending, quotes = [], 0
+        yield start, next(reader)
+
+    if pending:
+        # Unterminated quote: the reader takes the rest of the upload as the field
+        feed.extend(pending)
+        yield start, next(reader)
+
+
+async def iter_invitation_rows(
+    chunks: AsyncIterator[bytes],
+    import_format: str,
+) -> AsyncIterator[ParsedInvitationRow]:
+    """Parse an upload into invitation payloads without buffering the whole body."""
+
+    if import_format == "ndjson":
+        line_number = 0
+        async for raw_line in iter_lines(chunks):
+            line_number += 1
+            if not raw_line.strip():
+                continue
+            try:
+                record = json.loads(raw_line)
+            except json.JSONDecodeError as error:
+                yield ParsedInvitationRow(line=line_number, error=f"invalid JSON: {error.msg}")
+                continue
+            if not isinstance(record, dict):
+                yield ParsedInvitationRow(line=line_number, error="expected a JSON object")
+                continue
+            yield _parse_payload(line_number, record)
+        return
+
+    header: Optional[List[str]] = None
+    async for line_number, values in iter_csv_records(iter_lines(chunks)):
+        if header is None:
+            header = [value.strip() for value in values]
+            if "email" not in {column.lower() for column in header}:
+                yield ParsedInvitationRow(line=line_number, error="CSV header must include an email column")
+                return
+            continue
+        yield _parse_payload(line_number, dict(zip(header, values)))
+
+
+class InvitationImporter:
+    """Insert parsed invitations in batches and report progress after each batch.
+
+    Every batch runs through ``OrganizationRepository.insert_invitation_batch``
+    in its own short transaction on a dedicated session, so a large upload
+    never holds a single long-running transaction open. If a batch fails, the
+    import stops and the final record carries ``error``; batches reported
+    before it stay committed.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        *,
+        batch_size: int = 500,
+    ) -> None:
+        self._session_factory = session_factory
+        self._batch_size = max(1, batch_size)
+
+    async def run(
+        self,
+        *,
+        org_id: str,
+        inviter_id: str,
+        rows: AsyncIterator[ParsedInvitationRow],
+    ) -> AsyncIterator[InvitationImportProgress]:
+        progress = InvitationImportProgress()
+        pending: List[InvitationCreatePayload] = []
+        errors: List[InvitationImportError] = []
+
+        async with self._session_factory() as session:
+            repository = OrganizationRepository(session)
+
+            async def flush() -> InvitationImportProgress:
+                nonlocal pending, errors
+                if pending:
+                    inserted, skipped = await repository.insert_invitation_batch(org_id, inviter_id, pending)
+                    progress.inserted += len(inserted)
+                    progress.skipped += len(skipped)
+                snapshot = progress.model_copy(update={"errors": errors})
+                pending = []
+                errors = []
+                return snapshot
+
+            try:
+                async for row in rows:
+                    progress.processed += 1
+                    if row.payload is None:
+                        progress.invalid += 1
+                        errors.append(InvitationImportError(line=row.line, message=row.error or "invalid row"))
+                    else:
+                        pending.append(row.payload)
+                    if len(pending) + len(errors) >= self._batch_size:
+                        yield await flush()
+
+                final = await flush()
+            except Exception:
+                logger.exception(
+                    "organizations.invitations.import_failed",
+                    extra={"org_id": org_id, "inviter_id": inviter_id, "processed": progress.processed},
+                )
+                final = progress.model_copy(
+                    update={
+                        "errors": errors,
+                        "error": "Import stopped; rows after the previous progress record were not saved",
+                    }
+                )
+
+        final.done = True
+        logger.info(
+            "organizations.invitations.imported",
+            extra={
+                "org_id": org_id,
+                "inviter_id": inviter_id,
+                "processed": final.processed,
+                "inserted": final.inserted,
+                "skipped": final.skipped,
+                "invalid": final.invalid,
+                "failed": final.error is not None,
+            },
+        )
+        yield final
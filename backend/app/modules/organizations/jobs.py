@@ -4,22 +4,47 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Callable
 from contextlib import suppress
+from datetime import datetime, timezone
 from typing import Optional
 
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from ...core import get_settings
-from ...db.session import get_session_factory
-from .repository import OrganizationRepository
+from ...db.session import get_engine, get_session_factory
+from .repository import InvitationJobRepository, OrganizationRepository
 
 logger = logging.getLogger(__name__)
 
+# Arbitrary application-wide key for pg_try_advisory_lock; only one worker
+# process sweeps invitations at a time.
+INVITATION_EXPIRY_LOCK_KEY = 7_412_019_001
+
+INVITATION_JOB_RETRY_DELAY_SECONDS = 30
+
 
 class InvitationExpiryScheduler:
-    """Periodically expires invitations that have passed their deadline."""
+    """Expires invitations as their deadlines pass.
 
-    def __init__(self, interval_seconds: Optional[int] = None) -> None:
+    The scheduler sleeps until the earliest pending ``expires_at`` (bounded by
+    ``interval_seconds``) instead of polling on a fixed cadence, and guards each
+    sweep with a Postgres advisory lock so that concurrent worker processes do
+    not race on the same rows.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: Optional[int] = None,
+        *,
+        batch_size: Optional[int] = None,
+        min_sleep_seconds: float = 1.0,
+    ) -> None:
         settings = get_settings()
         self._interval = interval_seconds or settings.invitation_expiry_interval_seconds
+        self._batch_size = batch_size or settings.invitation_expiry_batch_size
+        self._min_sleep = min_sleep_seconds
         self._stop = asyncio.Event()
         self._task: asyncio.Task[None] | None = None
 
@@ -40,16 +65,144 @@ class InvitationExpiryScheduler:
     async def _run(self) -> None:
         session_factory = get_session_factory()
         while not self._stop.is_set():
+            next_expiry: Optional[datetime] = None
             try:
                 async with session_factory() as session:
                     repository = OrganizationRepository(session)
-                    expired = await repository.expire_stale_invitations()
+                    expired = await self._sweep_with_lock(repository)
                     if expired:
                         logger.info("scheduler.invitation.expired", extra={"count": expired})
+                    next_expiry = await repository.get_next_invitation_expiry()
             except Exception as error:  # pragma: no cover - defensive guard
                 logger.error("scheduler.invitation.failed", exc_info=error)
 
             try:
-                await asyncio.wait_for(self._stop.wait(), timeout=self._interval)
+                await asyncio.wait_for(self._stop.wait(), timeout=self._sleep_seconds(next_expiry))
             except asyncio.TimeoutError:
                 continue
+
+    async def _sweep_with_lock(self, repository: OrganizationRepository) -> int:
+        async with get_engine().connect() as lock_connection:
+            acquired = await lock_connection.scalar(
+                text("SELECT pg_try_advisory_lock(:key)"),
+                {"key": INVITATION_EXPIRY_LOCK_KEY},
+            )
+            if not acquired:
+                logger.debug("scheduler.invitation.lock_busy")
+                return 0
+            try:
+                return await repository.expire_stale_invitations(batch_size=self._batch_size)
+            finally:
+                await lock_connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": INVITATION_EXPIRY_LOCK_KEY},
+                )
+
+    def _sleep_seconds(self, next_expiry: Optional[datetime], now: Optional[datetime] = None) -> float:
+        """Seconds until the next known deadline, clamped to [min_sleep, interval]."""
+
+        if next_expiry is None:
+            return float(self._interval)
+        if next_expiry.tzinfo is None:
+            next_expiry = next_expiry.replace(tzinfo=timezone.utc)
+        now = now or datetime.now(timezone.utc)
+        remaining = (next_expiry - now).total_seconds()
+        return min(max(remaining, self._min_sleep), float(self._interval))
+
+
+class InvitationJobWorker:
+    """Sends the invitations queued in ``organization_invitation_jobs``.
+
+    Each batch is claimed with ``FOR UPDATE SKIP LOCKED`` and sent in one
+    transaction, with a savepoint per job, so the invitations and the job's
+    completion commit together and any worker process can pick up the queue
+    after a restart.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: Optional[int] = None,
+        *,
+        batch_size: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ) -> None:
+        settings = get_settings()
+        self._interval = interval_seconds or settings.invitation_job_interval_seconds
+        self._batch_size = batch_size or settings.invitation_job_batch_size
+        self._max_attempts = max_attempts or settings.invitation_job_max_attempts
+        self._session_factory = session_factory
+        self._stop = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="invitation-job-worker")
+
+    async def shutdown(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._stop.is_set():
+            processed = 0
+            try:
+                processed = await self.run_once()
+            except Exception as error:  # pragma: no cover - defensive guard
+                logger.error("organizations.invitation_jobs.failed", exc_info=error)
+
+            # A full batch means more work is likely waiting; go again without sleeping
+            if processed >= self._batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=float(self._interval))
+            except asyncio.TimeoutError:
+                continue
+
+    async def run_once(self) -> int:
+        """Claim and send one batch of due jobs; returns how many were claimed."""
+
+        session_factory = self._session_factory or get_session_factory()
+        async with session_factory() as session:
+            jobs_repository = InvitationJobRepository(session)
+            organizations = OrganizationRepository(session)
+            sent = 0
+
+            async with session.begin():
+                jobs = await jobs_repository.claim_batch(self._batch_size)
+                if not jobs:
+                    return 0
+
+                for job in jobs:
+                    try:
+                        async with session.begin_nested():
+                            inserted, skipped = await organizations.insert_invitations(
+                                job.org_id, job.inviter_id, job.invitations
+                            )
+                    except Exception as error:
+                        logger.error(
+                            "organizations.invitation_jobs.job_failed",
+                            exc_info=error,
+                            extra={"org_id": job.org_id, "attempts": job.attempts + 1},
+                        )
+                        await jobs_repository.mark_failed(
+                            job,
+                            error=str(error) or type(error).__name__,
+                            max_attempts=self._max_attempts,
+                            retry_delay_seconds=INVITATION_JOB_RETRY_DELAY_SECONDS,
+                        )
+                        continue
+                    await jobs_repository.mark_completed(job, invited=len(inserted), skipped=skipped)
+                    sent += len(inserted)
+
+        logger.info(
+            "organizations.invitation_jobs.batch",
+            extra={"claimed": len(jobs), "invited": sent},
+        )
+        return len(jobs)
@@ -4,16 +4,23 @@ Repository functions for organization management.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import json
 import logging
 import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import uuid
 
-from sqlalchemy import bindparam, text, null, JSON
+from sqlalchemy import text, null
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...core import get_settings
 from .schemas import (
     DivisionCreate,
     DivisionResponse,
@@ -22,7 +29,9 @@ from .schemas import (
     InvitationCreatePayload,
     InvitationResponse,
     OrganizationCreate,
+    OrganizationProvisioningStatus,
     OrganizationResponse,
+    ProvisioningStepStatus,
     TemplateResponse,
 )
 
@@ -50,13 +59,127 @@ class DivisionDuplicateError(DivisionValidationError):
 
 
 MAX_SLUG_LENGTH = 63
+ACTIVE_SLUG_INDEX = "organizations_active_slug_unique"
+# Provisioning step backed by ``organization_invitation_jobs``
+INVITATIONS_STEP = "invitations"
+SLUG_SUFFIX_LIMIT = 1000
+_MAX_SLUG_SUFFIX_LENGTH = len(f"-{SLUG_SUFFIX_LIMIT}")
+
+
+def _slug_prefix_range(base_slug: str) -> Tuple[str, str]:
+    """Return the ``[lower, upper)`` byte range holding every candidate for ``base_slug``.
+
+    Candidates are ``base`` and ``base-N``; when the base is long enough that a
+    suffix forces trimming, widen the range to the shortest trimmed base.
+    """
+
+    prefix = base_slug[: MAX_SLUG_LENGTH - _MAX_SLUG_SUFFIX_LENGTH].rstrip("-")
+    if prefix == base_slug:
+        # '.' sorts directly after '-', so this covers "base" and "base-*" only.
+        return base_slug, f"{base_slug}."
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _iter_suffixed_slugs(base_slug: str):
+    """Yield ``base-1``, ``base-2``, ... trimmed to fit ``MAX_SLUG_LENGTH``."""
+
+    for counter in range(1, SLUG_SUFFIX_LIMIT + 1):
+        suffix = f"-{counter}"
+        trimmed_base = base_slug
+        if len(trimmed_base) + len(suffix) > MAX_SLUG_LENGTH:
+            trimmed_base = trimmed_base[: MAX_SLUG_LENGTH - len(suffix)].rstrip("-")
+        if not trimmed_base:
+            return
+        yield f"{trimmed_base}{suffix}"
+
+
+def allocate_slug(base_slug: str, taken: set[str]) -> Optional[str]:
+    """Return ``base_slug`` or its lowest free numeric variant, or ``None``."""
+
+    if base_slug not in taken:
+        return base_slug
+    return next((candidate for candidate in _iter_suffixed_slugs(base_slug) if candidate not in taken), None)
+
+
+def suggest_free_slugs(base_slug: str, taken: set[str], limit: int) -> list[str]:
+    """Return up to ``limit`` free numeric variants of ``base_slug``."""
+
+    suggestions: list[str] = []
+    for candidate in _iter_suffixed_slugs(base_slug):
+        if len(suggestions) >= limit:
+            break
+        if candidate not in taken:
+            suggestions.append(candidate)
+    return suggestions
+
+
+class HubMetricsCache:
+    """Bounded per-organization TTL cache in front of the hub metrics table.
+
+    Expired entries are dropped when read; past ``max_entries`` the least
+    recently used organization is evicted.
+    """
+
+    def __init__(self, ttl_seconds: int = 30, max_entries: int = 4_096) -> None:
+        self._ttl = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._store: OrderedDict[str, tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def get_many(self, org_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        found: Dict[str, Dict[str, Any]] = {}
+        async with self._lock:
+            for org_id in org_ids:
+                entry = self._store.get(org_id)
+                if not entry:
+                    continue
+                expires_at, payload = entry
+                if now >= expires_at:
+                    self._store.pop(org_id, None)
+                    continue
+                self._store.move_to_end(org_id)
+                found[org_id] = payload
+        return found
+
+    async def set_many(self, metrics: Dict[str, Dict[str, Any]]) -> None:
+        expires_at = time.monotonic() + self._ttl
+        async with self._lock:
+            for org_id, payload in metrics.items():
+                self._store[org_id] = (expires_at, payload)
+                self._store.move_to_end(org_id)
+            while len(self._store) > self._max_entries:
+                self._store.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    async def invalidate(self, org_id: str) -> None:
+        async with self._lock:
+            self._store.pop(org_id, None)
+
+
+_HUB_METRICS_CACHE = HubMetricsCache(
+    ttl_seconds=get_settings().hub_metrics_cache_ttl_seconds,
+    max_entries=get_settings().hub_metrics_cache_max_entries,
+)
+
+
+async def invalidate_hub_metrics(org_id: str) -> None:
+    """Drop this process's cached hub metrics after an organization's projects or channels change.
+
+    Other processes pick up the change when their entry expires.
+    """
+
+    await _HUB_METRICS_CACHE.invalidate(str(org_id))
 
 
 class OrganizationRepository:
     """Repository for managing organizations, divisions, and invitations."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, metrics_cache: Optional[HubMetricsCache] = None) -> None:
         self._session = session
+        self._metrics_cache = metrics_cache or _HUB_METRICS_CACHE
 
     async def _reset_transaction(self) -> None:
         """Ensure the session is ready for an explicit transaction."""
@@ -124,6 +247,22 @@ class OrganizationRepository:
         count = result.scalar()
         return count == 0
 
+    async def _load_taken_slugs(self, base_slug: str) -> set[str]:
+        """Fetch every active slug that could collide with a variant of ``base_slug``."""
+
+        lower, upper = _slug_prefix_range(base_slug)
+        query = text(
+            """
+            SELECT slug
+            FROM public.organizations
+            WHERE deleted_at IS NULL
+              AND slug COLLATE "C" >= :lower
+              AND slug COLLATE "C" < :upper
+            """
+        )
+        result = await self._session.execute(query, {"lower": lower, "upper": upper})
+        return {row[0] for row in result.all()}
+
     async def generate_unique_slug(self, base_name: str) -> str:
         """Generate a unique slug from base name."""
         base_slug = self.generate_slug(base_name)
@@ -133,27 +272,13 @@ class OrganizationRepository:
                 "Slug must include at least one alphanumeric character.",
             )
 
-        if await self.check_slug_availability(base_slug):
-            return base_slug
-
-        # Add numeric suffix if slug is taken
-        counter = 1
-        while True:
-            suffix = f"-{counter}"
-            trimmed_base = base_slug
-            if len(trimmed_base) + len(suffix) > MAX_SLUG_LENGTH:
-                trimmed_base = trimmed_base[: MAX_SLUG_LENGTH - len(suffix)]
-                trimmed_base = trimmed_base.rstrip('-')
-            if not trimmed_base:
-                raise SlugValidationError(
-                    "Unable to generate unique slug from the provided name.",
-                )
-            candidate_slug = f"{trimmed_base}{suffix}"
-            if await self.check_slug_availability(candidate_slug):
-                return candidate_slug
-            counter += 1
-            if counter > 1000:  # Safety limit
-                raise ValueError("Unable to generate unique slug")
+        taken = await self._load_taken_slugs(base_slug)
+        candidate_slug = allocate_slug(base_slug, taken)
+        if candidate_slug is None:
+            raise SlugConflictError(
+                f"Unable to generate unique slug from '{base_slug}'.",
+            )
+        return candidate_slug
 
     def _validate_divisions(self, divisions: List[DivisionCreate]) -> None:
         """Validate divisions for uniqueness and proper format."""
@@ -203,18 +328,10 @@ class OrganizationRepository:
     async def suggest_slug_variants(self, slug: str, limit: int = 3) -> list[str]:
         """Generate a list of available slug suggestions."""
 
-        suggestions: list[str] = []
-        base_slug = slug or ""
-        counter = 1
-        max_attempts = max(limit * 5, 5)
-
-        while len(suggestions) < limit and counter <= max_attempts:
-            candidate = f"{base_slug}-{counter}"
-            if await self.check_slug_availability(candidate):
-                suggestions.append(candidate)
-            counter += 1
-
-        return suggestions
+        if not slug:
+            return []
+        taken = await self._load_taken_slugs(slug)
+        return suggest_free_slugs(slug, taken, limit)
 
     async def get_user_organizations(self, user_id: str) -> List[OrganizationResponse]:
         """Get all organizations for a user with their roles."""
@@ -239,12 +356,11 @@ class OrganizationRepository:
 
         org_ids = [str(row["id"]) for row in rows]
         metrics_by_org = await self._load_hub_metrics(org_ids)
+        divisions_by_org = await self._load_organization_divisions(org_ids, user_id)
 
         organizations = []
         for row in rows:
-            # Get divisions for this organization
-            divisions = await self._get_organization_divisions(row["id"], user_id)
-
+            divisions = divisions_by_org.get(str(row["id"]), [])
             metrics = metrics_by_org.get(str(row["id"]), {})
 
             organizations.append(
@@ -265,8 +381,14 @@ class OrganizationRepository:
 
         return organizations
 
-    async def _get_organization_divisions(self, org_id: str, user_id: str) -> List[DivisionResponse]:
-        """Get divisions for an organization with user's role."""
+    async def _load_organization_divisions(
+        self, org_ids: List[str], user_id: str
+    ) -> Dict[str, List[DivisionResponse]]:
+        """Load divisions with the user's role for every organization in one query."""
+
+        if not org_ids:
+            return {}
+
         query = text(
             """
             SELECT
@@ -280,94 +402,92 @@ class OrganizationRepository:
             FROM public.divisions d
             LEFT JOIN public.division_memberships dm
                 ON d.id = dm.division_id AND dm.user_id = :user_id
-            WHERE d.org_id = :org_id AND d.deleted_at IS NULL
-            ORDER BY d.created_at
+            WHERE d.org_id = ANY(:org_ids) AND d.deleted_at IS NULL
+            ORDER BY d.org_id, d.created_at
             """
         )
-        result = await self._session.execute(query, {"org_id": org_id, "user_id": user_id})
-        rows = result.mappings().all()
+        result = await self._session.execute(query, {"org_ids": org_ids, "user_id": user_id})
 
-        return [
-            DivisionResponse(
-                id=str(row["id"]),
-                name=row["name"],
-                key=row["key"],
-                description=row["description"],
-                org_id=str(row["org_id"]),
-                created_at=row["created_at"],
-                user_role=row["user_role"]
+        divisions: Dict[str, List[DivisionResponse]] = {}
+        for row in result.mappings():
+            org_id = str(row["org_id"])
+            divisions.setdefault(org_id, []).append(
+                DivisionResponse(
+                    id=str(row["id"]),
+                    name=row["name"],
+                    key=row["key"],
+                    description=row["description"],
+                    org_id=org_id,
+                    created_at=row["created_at"],
+                    user_role=row["user_role"],
+                )
             )
-            for row in rows
-        ]
+
+        return divisions
 
     async def _load_hub_metrics(self, org_ids: List[str]) -> Dict[str, Dict[str, Any]]:
-        """Load aggregated metrics used by the workspace hub."""
+        """Load hub metrics from the trigger-maintained per-organization rows."""
 
         if not org_ids:
             return {}
 
-        # author=Codex, role=CTO Dev Support, date=2025-10-18: align metrics with workspace_* tables.
+        metrics = await self._metrics_cache.get_many(org_ids)
+        missing = [org_id for org_id in org_ids if org_id not in metrics]
+        if not missing:
+            return metrics
+
         metrics_query = text(
             """
-            WITH member_counts AS (
-                SELECT org_id, COUNT(*) AS member_count
-                FROM public.org_memberships
-                WHERE org_id = ANY(:org_ids)
-                GROUP BY org_id
-            ),
-            project_stats AS (
-                SELECT
-                    org_id,
-                    COUNT(*) FILTER (WHERE status = 'active' AND archived_at IS NULL) AS active_projects,
-                    MAX(updated_at) AS last_project_activity
-                FROM public.workspace_projects
-                WHERE org_id = ANY(:org_ids)
-                GROUP BY org_id
-            ),
-            channel_stats AS (
-                SELECT
-                    org_id,
-                    MAX(updated_at) AS last_channel_activity
-                FROM public.workspace_channels
-                WHERE org_id = ANY(:org_ids)
-                  AND archived_at IS NULL
-                GROUP BY org_id
-            )
             SELECT
                 o.id,
-                COALESCE(mc.member_count, 0) AS member_count,
-                COALESCE(ps.active_projects, 0) AS active_projects,
+                COALESCE(m.member_count, 0) AS member_count,
+                COALESCE(m.active_projects, 0) AS active_projects,
                 GREATEST(
-                    COALESCE(ps.last_project_activity, to_timestamp(0)),
-                    COALESCE(cs.last_channel_activity, to_timestamp(0)),
+                    COALESCE(p.last_project_activity, to_timestamp(0)),
+                    COALESCE(m.last_channel_activity, to_timestamp(0)),
                     COALESCE(o.updated_at, to_timestamp(0))
                 ) AS last_active_at
             FROM public.organizations o
-            LEFT JOIN member_counts mc ON mc.org_id = o.id
-            LEFT JOIN project_stats ps ON ps.org_id = o.id
-            LEFT JOIN channel_stats cs ON cs.org_id = o.id
+            LEFT JOIN public.organization_hub_metrics m ON m.org_id = o.id
+            -- Project edits are not mirrored into the metrics row; one index probe per org
+            LEFT JOIN LATERAL (
+                SELECT wp.updated_at AS last_project_activity
+                FROM public.workspace_projects wp
+                WHERE wp.org_id = o.id
+                ORDER BY wp.updated_at DESC
+                LIMIT 1
+            ) p ON TRUE
             WHERE o.id = ANY(:org_ids)
             """
         )
 
-        # Convert org_ids to array for PostgreSQL ANY operator
-        result = await self._session.execute(metrics_query, {"org_ids": org_ids})
-        metrics: Dict[str, Dict[str, Any]] = {}
+        result = await self._session.execute(metrics_query, {"org_ids": missing})
+        loaded: Dict[str, Dict[str, Any]] = {}
         for row in result.mappings():
-            metrics[str(row["id"])] = {
+            loaded[str(row["id"])] = {
                 "member_count": row["member_count"],
                 "active_projects": row["active_projects"],
                 "last_active_at": row["last_active_at"],
             }
 
+        await self._metrics_cache.set_many(loaded)
+        metrics.update(loaded)
         return metrics
 
     async def create_organization(
         self,
         user_id: str,
-        create_data: OrganizationCreate
+        create_data: OrganizationCreate,
+        seed_template_source: Optional[str] = None,
+        invitations: Sequence[InvitationCreatePayload] = (),
     ) -> Tuple[OrganizationResponse, List[DivisionResponse]]:
-        """Create a new organization with multiple divisions."""
+        """Create a new organization with multiple divisions.
+
+        When ``seed_template_source`` is given, a workspace seeding job is
+        enqueued in the same statement, and ``invitations`` are queued for the
+        invitation worker the same way, so both commit or roll back with the
+        organization itself.
+        """
 
         # Generate or validate slug
         if create_data.slug:
@@ -385,146 +505,167 @@ class OrganizationRepository:
         divisions_to_create = create_data.get_divisions_to_create()
         self._validate_divisions(divisions_to_create)
         prepared_divisions = self._prepare_division_data(divisions_to_create)
+        # Lead the first division, contribute to the rest
+        division_roles = ["lead" if index == 0 else "contributor" for index in range(len(prepared_divisions))]
+
+        # Default invitations without a division to the first division
+        default_division_id = prepared_divisions[0]["id"] if prepared_divisions else None
+        queued_invitations = [
+            {
+                "email": invitation.email,
+                "role": invitation.role or "member",
+                "divisionId": invitation.division_id or default_division_id,
+                "message": invitation.message,
+                "expiresAt": invitation.expires_at.isoformat() if invitation.expires_at else None,
+            }
+            for invitation in invitations
+        ]
+
+        # Resolve the template before opening the write transaction
+        default_tools: Optional[Dict[str, Any]] = None
+        if create_data.template_id:
+            template = await self.get_template(create_data.template_id)
+            if template and template.tools:
+                default_tools = template.tools
+
+        org_id = str(uuid.uuid4())
 
         try:
-            # Start transaction
             await self._reset_transaction()
             await self._session.begin()
 
-            # Create organization
-            org_query = text(
-                """
-                INSERT INTO public.organizations (
-                    id, name, slug, description, logo_url, created_at
-                ) VALUES (
-                    :id, :name, :slug, :description, :logo_url, NOW()
-                )
-                RETURNING id, name, slug, description, logo_url, created_at
+            # Organization, divisions, memberships and settings in one statement;
+            # foreign keys are checked at statement end, after every CTE has run.
+            provision_query = text(
                 """
-            )
-
-            org_id = str(uuid.uuid4())
-            org_result = await self._session.execute(org_query, {
-                "id": org_id,
-                "name": create_data.name,
-                "slug": slug,
-                "description": create_data.description,
-                "logo_url": None
-            })
-            org_row = org_result.mappings().first()
-
-            # Create divisions
-            division_rows = []
-            for division_data in prepared_divisions:
-                division_query = text(
-                    """
-                    INSERT INTO public.divisions (
-                        id, org_id, name, key, description, created_at
+                WITH new_org AS (
+                    INSERT INTO public.organizations (
+                        id, name, slug, description, logo_url, created_at
                     ) VALUES (
-                        :id, :org_id, :name, :key, :description, NOW()
+                        :id, :name, :slug, :description, NULL, NOW()
+                    )
+                    RETURNING id, name, slug, description, logo_url, created_at
+                ),
+                division_input AS (
+                    SELECT *
+                    FROM unnest(
+                        CAST(:division_ids AS UUID[]),
+                        CAST(:division_names AS TEXT[]),
+                        CAST(:division_keys AS TEXT[]),
+                        CAST(:division_descriptions AS TEXT[]),
+                        CAST(:division_roles AS TEXT[])
+                    ) WITH ORDINALITY AS d(id, name, key, description, role, position)
+                ),
+                new_divisions AS (
+                    INSERT INTO public.divisions (
+                        id, org_id, name, key, slug, description, created_at
                     )
+                    SELECT d.id, :id, d.name, d.key, d.key, d.description, NOW()
+                    FROM division_input d
+                    ORDER BY d.position
                     RETURNING id, name, key, description, org_id, created_at
-                    """
-                )
-
-                division_result = await self._session.execute(division_query, {
-                    "id": division_data["id"],
-                    "org_id": org_id,
-                    "name": division_data["name"],
-                    "key": division_data["key"],
-                    "description": division_data["description"]
-                })
-                division_rows.append(division_result.mappings().first())
-
-            # Create organization membership (owner)
-            membership_query = text(
-                """
-                INSERT INTO public.org_memberships (org_id, user_id, role, joined_at)
-                VALUES (:org_id, :user_id, 'owner', NOW())
-                """
-            )
-            await self._session.execute(membership_query, {
-                "org_id": org_id,
-                "user_id": user_id
-            })
-
-            # Create division memberships (lead for first division, member for others)
-            for i, division_row in enumerate(division_rows):
-                role = "lead" if i == 0 else "contributor"
-                div_membership_query = text(
-                    """
+                ),
+                owner_membership AS (
+                    INSERT INTO public.org_memberships (org_id, user_id, role, joined_at)
+                    VALUES (:id, :user_id, 'owner', NOW())
+                ),
+                division_memberships AS (
                     INSERT INTO public.division_memberships (division_id, user_id, role, joined_at)
-                    VALUES (:division_id, :user_id, :role, NOW())
-                    """
-                )
-                await self._session.execute(div_membership_query, {
-                    "division_id": division_row["id"],
-                    "user_id": user_id,
-                    "role": role
-                })
-
-            # Create organization settings
-            settings_query = text(
-                """
-                INSERT INTO public.organization_settings (
-                    id, org_id, default_tools, invitation_token, created_at, updated_at
-                ) VALUES (
-                    :id, :org_id, :default_tools, :invitation_token, NOW(), NOW()
+                    SELECT d.id, :user_id, d.role, NOW()
+                    FROM division_input d
+                ),
+                org_settings AS (
+                    INSERT INTO public.organization_settings (
+                        id, org_id, default_tools, invitation_token, created_at, updated_at
+                    ) VALUES (
+                        :settings_id, :id, CAST(:default_tools AS JSONB), :invitation_token, NOW(), NOW()
+                    )
+                ),
+                seed_job AS (
+                    INSERT INTO public.workspace_seed_jobs (org_id, template_source, requested_by)
+                    SELECT :id, CAST(:seed_template_source AS TEXT), :user_id
+                    WHERE CAST(:seed_template_source AS TEXT) IS NOT NULL
+                ),
+                invitation_job AS (
+                    INSERT INTO public.organization_invitation_jobs (org_id, inviter_id, invitations)
+                    SELECT :id, :user_id, CAST(:invitations AS JSONB)
+                    WHERE CAST(:invitations AS JSONB) IS NOT NULL
                 )
+                SELECT
+                    o.id AS org_id,
+                    o.name AS org_name,
+                    o.slug AS org_slug,
+                    o.description AS org_description,
+                    o.logo_url AS org_logo_url,
+                    o.created_at AS org_created_at,
+                    nd.id,
+                    nd.name,
+                    nd.key,
+                    nd.description,
+                    nd.created_at,
+                    d.role
+                FROM new_org o
+                CROSS JOIN new_divisions nd
+                JOIN division_input d ON d.id = nd.id
+                ORDER BY d.position
                 """
             )
 
-            settings_id = str(uuid.uuid4())
-            invitation_token = str(uuid.uuid4())
-            default_tools = {}
-
-            # Apply template if specified
-            if create_data.template_id:
-                template = await self.get_template(create_data.template_id)
-                if template:
-                    default_tools = template.tools
-
-            # Handle JSON field properly - use None for empty dict to avoid encoding issues
-            if not default_tools:
-                default_tools = None
-
-            await self._session.execute(settings_query, {
-                "id": settings_id,
-                "org_id": org_id,
-                "default_tools": default_tools,
-                "invitation_token": invitation_token
+            result = await self._session.execute(provision_query, {
+                "id": org_id,
+                "name": create_data.name,
+                "slug": slug,
+                "description": create_data.description,
+                "user_id": user_id,
+                "division_ids": [division["id"] for division in prepared_divisions],
+                "division_names": [division["name"] for division in prepared_divisions],
+                "division_keys": [division["key"] for division in prepared_divisions],
+                "division_descriptions": [division["description"] for division in prepared_divisions],
+                "division_roles": division_roles,
+                "settings_id": str(uuid.uuid4()),
+                "default_tools": json.dumps(default_tools) if default_tools else None,
+                "invitation_token": str(uuid.uuid4()),
+                "seed_template_source": seed_template_source,
+                "invitations": json.dumps(queued_invitations) if queued_invitations else None,
             })
+            rows = result.mappings().all()
 
-            # Commit transaction
             await self._session.commit()
 
-            # Create response objects
-            division_responses = []
-            for i, division_row in enumerate(division_rows):
-                role = "lead" if i == 0 else "contributor"
-                division_responses.append(DivisionResponse(
-                    id=str(division_row["id"]),
-                    name=division_row["name"],
-                    key=division_row["key"],
-                    description=division_row["description"],
-                    org_id=str(division_row["org_id"]),
-                    created_at=division_row["created_at"],
-                    user_role=role
-                ))
+            org_row = rows[0]
+            division_responses = [
+                DivisionResponse(
+                    id=str(row["id"]),
+                    name=row["name"],
+                    key=row["key"],
+                    description=row["description"],
+                    org_id=str(row["org_id"]),
+                    created_at=row["created_at"],
+                    user_role=row["role"],
+                )
+                for row in rows
+            ]
 
             organization = OrganizationResponse(
-                id=str(org_row["id"]),
-                name=org_row["name"],
-                slug=org_row["slug"],
-                description=org_row["description"],
-                logo_url=org_row["logo_url"],
-                created_at=org_row["created_at"],
+                id=str(org_row["org_id"]),
+                name=org_row["org_name"],
+                slug=org_row["org_slug"],
+                description=org_row["org_description"],
+                logo_url=org_row["org_logo_url"],
+                created_at=org_row["org_created_at"],
                 divisions=division_responses,
                 user_role="owner"
             )
 
             return organization, division_responses
 
+        except IntegrityError as e:
+            await self._session.rollback()
+            if ACTIVE_SLUG_INDEX in str(e.orig):
+                # A concurrent creator claimed the same slug between allocation and insert.
+                raise SlugConflictError(f"Slug '{slug}' is already taken") from e
+            logger.error(f"Error creating organization: {e}")
+            raise
         except Exception as e:
             await self._session.rollback()
             logger.error(f"Error creating organization: {e}")
@@ -570,30 +711,63 @@ class OrganizationRepository:
 
         return [self._map_invitation(dict(row)) for row in rows]
 
-    async def expire_stale_invitations(self) -> int:
-        """Mark invitations as expired when their deadline passes."""
+    async def expire_stale_invitations(self, batch_size: int = 500) -> int:
+        """Mark invitations as expired in short batches once their deadline passes.
+
+        Each batch runs in its own transaction and skips rows locked by
+        concurrent accept/decline calls, so the sweep never holds row locks
+        across the whole table.
+        """
 
         query = text(
             """
             UPDATE public.invitations
             SET status = 'expired', updated_at = NOW()
+            WHERE id IN (
+                SELECT id
+                FROM public.invitations
+                WHERE status = 'pending'
+                  AND deleted_at IS NULL
+                  AND expires_at IS NOT NULL
+                  AND expires_at <= NOW()
+                ORDER BY expires_at
+                LIMIT :batch_size
+                FOR UPDATE SKIP LOCKED
+            )
+            """
+        )
+
+        total = 0
+        while True:
+            await self._reset_transaction()
+            await self._session.begin()
+            try:
+                result = await self._session.execute(query, {"batch_size": batch_size})
+                await self._session.commit()
+            except Exception as error:
+                await self._session.rollback()
+                logger.error("Error expiring invitations", exc_info=error)
+                raise
+
+            expired = result.rowcount or 0
+            total += expired
+            if expired < batch_size:
+                return total
+
+    async def get_next_invitation_expiry(self) -> Optional[datetime]:
+        """Return the earliest deadline among pending invitations, if any."""
+
+        query = text(
+            """
+            SELECT MIN(expires_at) AS next_expiry
+            FROM public.invitations
             WHERE status = 'pending'
               AND deleted_at IS NULL
               AND expires_at IS NOT NULL
-              AND expires_at <= NOW()
             """
         )
-
-        await self._reset_transaction()
-        await self._session.begin()
-        try:
-            result = await self._session.execute(query)
-            await self._session.commit()
-            return result.rowcount or 0
-        except Exception as error:
-            await self._session.rollback()
-            logger.error("Error expiring invitations", exc_info=error)
-            raise
+        result = await self._session.execute(query)
+        return result.scalar()
 
     async def accept_invitation(
         self,
@@ -672,6 +846,7 @@ class OrganizationRepository:
                 )
 
             await self._session.commit()
+            await self._metrics_cache.invalidate(str(inv_row["org_id"]))
 
             organizations = await self.get_user_organizations(user_id)
             return next((org for org in organizations if org.id == str(inv_row["org_id"])), None)
@@ -700,6 +875,7 @@ class OrganizationRepository:
                 WHERE id = :invitation_id
                     AND status = 'pending'
                     AND deleted_at IS NULL
+                    AND (expires_at IS NULL OR expires_at > NOW())
                     AND LOWER(email) = LOWER(:email)
                 FOR UPDATE
                 """
@@ -753,86 +929,136 @@ class OrganizationRepository:
         if not batch.invitations:
             return InvitationBatchCreateResponse(invitations=[], skipped=[])
 
-        normalized: Dict[str, InvitationCreatePayload] = {}
-        for invitation in batch.invitations:
-            normalized_email = invitation.email.lower()
-            normalized[normalized_email] = invitation
+        inserted, skipped = await self.insert_invitation_batch(org_id, inviter_id, batch.invitations)
+        return InvitationBatchCreateResponse(invitations=inserted, skipped=skipped)
 
-        existing_query = text(
+    async def insert_invitation_batch(
+        self,
+        org_id: str,
+        inviter_id: str,
+        invitations: List[InvitationCreatePayload],
+    ) -> Tuple[List[InvitationResponse], List[str]]:
+        """Insert invitations in their own transaction, skipping pending duplicates.
+
+        Returns the inserted invitations and the emails that were skipped because
+        the address already has a live pending invitation for the organization.
+        """
+
+        await self._reset_transaction()
+        await self._session.begin()
+        try:
+            inserted, skipped = await self.insert_invitations(org_id, inviter_id, invitations)
+            await self._session.commit()
+        except Exception as error:
+            await self._session.rollback()
+            logger.error("Error creating invitations", exc_info=error)
+            raise
+        return inserted, skipped
+
+    async def insert_invitations(
+        self,
+        org_id: str,
+        inviter_id: str,
+        invitations: List[InvitationCreatePayload],
+    ) -> Tuple[List[InvitationResponse], List[str]]:
+        """Insert invitations with one set-based statement in the caller's transaction.
+
+        Same results as ``insert_invitation_batch``, which wraps this in a
+        transaction of its own.
+        """
+
+        normalized: Dict[str, InvitationCreatePayload] = {}
+        for invitation in invitations:
+            normalized[invitation.email.lower()] = invitation
+
+        if not normalized:
+            return [], []
+
+        columns: Dict[str, List[Any]] = {
+            "ids": [],
+            "tokens": [],
+            "token_hashes": [],
+            "emails": [],
+            "division_ids": [],
+            "roles": [],
+            "messages": [],
+            "expires_at": [],
+        }
+        for email, payload in normalized.items():
+            token = str(uuid.uuid4())
+            columns["ids"].append(str(uuid.uuid4()))
+            columns["tokens"].append(token)
+            columns["token_hashes"].append(self._hash_token(token))
+            columns["emails"].append(email)
+            columns["division_ids"].append(payload.division_id)
+            columns["roles"].append(payload.role)
+            columns["messages"].append(payload.message)
+            columns["expires_at"].append(payload.expires_at)
+
+        # Lapsed invitations still hold the pending-email unique index until the
+        # scheduler sweeps them, so retire them before re-inviting the address.
+        retire_query = text(
             """
-            SELECT email
-            FROM public.invitations
+            UPDATE public.invitations
+            SET status = 'expired', updated_at = NOW()
             WHERE org_id = :org_id
               AND status = 'pending'
-              AND LOWER(email) = ANY(:emails)
+              AND expires_at IS NOT NULL
+              AND expires_at <= NOW()
+              AND LOWER(email) = ANY(CAST(:emails AS TEXT[]))
             """
-        ).bindparams(bindparam("emails", expanding=True))
-        emails_array = list(normalized.keys())
-        # Convert emails to tuple for proper SQL array expansion
-        result = await self._session.execute(
-            existing_query,
-            {"org_id": org_id, "emails": tuple(emails_array)},
         )
-        existing = {row["email"].lower() for row in result}
-
-        to_insert: List[Dict[str, Any]] = []
-        skipped: List[str] = []
-
-        for email, payload in normalized.items():
-            if email in existing:
-                skipped.append(payload.email)
-                continue
-
-            token = str(uuid.uuid4())
-            to_insert.append(
-                {
-                    "id": str(uuid.uuid4()),
-                    "token": token,
-                    "token_hash": self._hash_token(token),
-                    "email": email,
-                    "org_id": org_id,
-                    "division_id": payload.division_id,
-                    "role": payload.role,
-                    "message": payload.message,
-                    "inviter_id": inviter_id,
-                    "expires_at": payload.expires_at,
-                }
-            )
-
-        if not to_insert:
-            return InvitationBatchCreateResponse(invitations=[], skipped=skipped)
 
         insert_query = text(
             """
+            WITH incoming AS (
+                SELECT *
+                FROM unnest(
+                    CAST(:ids AS UUID[]),
+                    CAST(:tokens AS UUID[]),
+                    CAST(:token_hashes AS TEXT[]),
+                    CAST(:emails AS TEXT[]),
+                    CAST(:division_ids AS UUID[]),
+                    CAST(:roles AS TEXT[]),
+                    CAST(:messages AS TEXT[]),
+                    CAST(:expires_at AS TIMESTAMPTZ[])
+                ) AS t(id, token, token_hash, email, division_id, role, message, expires_at)
+            )
             INSERT INTO public.invitations (
                 id, token, token_hash, email, org_id, division_id, role, message, status,
                 inviter_id, created_at, updated_at, expires_at
-            ) VALUES (
-                :id, :token, :token_hash, :email, :org_id, :division_id, :role, :message, 'pending',
-                :inviter_id, NOW(), NOW(), :expires_at
             )
+            SELECT
+                incoming.id, incoming.token, incoming.token_hash, incoming.email,
+                CAST(:org_id AS UUID), incoming.division_id, incoming.role, incoming.message,
+                'pending', CAST(:inviter_id AS UUID), NOW(), NOW(), incoming.expires_at
+            FROM incoming
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM public.invitations existing
+                WHERE existing.org_id = CAST(:org_id AS UUID)
+                  AND existing.status = 'pending'
+                  AND LOWER(existing.email) = incoming.email
+            )
+            ON CONFLICT DO NOTHING
             RETURNING id, token, email, org_id, division_id, role, message, status,
                       expires_at, created_at, updated_at, accepted_at, declined_at, inviter_id,
                       token_hash
             """
         )
 
-        inserted: List[InvitationResponse] = []
-        await self._reset_transaction()
-        await self._session.begin()
-        try:
-            for record in to_insert:
-                result = await self._session.execute(insert_query, record)
-                inserted_row = result.mappings().first()
-                if inserted_row:
-                    inserted.append(self._map_invitation(dict(inserted_row)))
-            await self._session.commit()
-        except Exception as error:
-            await self._session.rollback()
-            logger.error("Error creating invitations", exc_info=error)
-            raise
+        await self._session.execute(retire_query, {"org_id": org_id, "emails": columns["emails"]})
+        result = await self._session.execute(
+            insert_query,
+            {"org_id": org_id, "inviter_id": inviter_id, **columns},
+        )
+        inserted = [self._map_invitation(dict(row)) for row in result.mappings().all()]
 
-        return InvitationBatchCreateResponse(invitations=inserted, skipped=skipped)
+        inserted_emails = {invitation.email.lower() for invitation in inserted}
+        skipped = [
+            payload.email for email, payload in normalized.items() if email not in inserted_emails
+        ]
+        return inserted, skipped
 
     async def get_template(self, template_id: str) -> Optional[TemplateResponse]:
         """Get a template by ID."""
@@ -888,3 +1114,129 @@ class OrganizationRepository:
             )
             for row in rows
         ]
+
+
+@dataclass(slots=True)
+class InvitationJob:
+    """A claimed row of ``organization_invitation_jobs``."""
+
+    org_id: str
+    inviter_id: str
+    invitations: List[InvitationCreatePayload]
+    attempts: int
+
+
+class InvitationJobRepository:
+    """Durable queue of the invitations sent after organization creation."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_status(self, org_id: str) -> Optional[OrganizationProvisioningStatus]:
+        """Provisioning status for an organization, or None if it queued no invitations."""
+
+        stmt = text(
+            """
+            SELECT status, last_error, skipped_emails, updated_at
+              FROM public.organization_invitation_jobs
+             WHERE org_id = :org_id
+            """
+        )
+        row = (await self._session.execute(stmt, {"org_id": org_id})).mappings().first()
+        if row is None:
+            return None
+        return OrganizationProvisioningStatus(
+            org_id=org_id,
+            status=row["status"],
+            steps=[
+                ProvisioningStepStatus(
+                    name=INVITATIONS_STEP,
+                    status=row["status"],
+                    detail=row["last_error"],
+                    updated_at=row["updated_at"],
+                )
+            ],
+            skipped_invites=list(row["skipped_emails"] or []),
+        )
+
+    async def claim_batch(self, limit: int) -> List[InvitationJob]:
+        """Lock up to ``limit`` due jobs for the current transaction.
+
+        ``SKIP LOCKED`` lets several workers drain the queue without blocking
+        on, or double-processing, each other's rows.
+        """
+
+        stmt = text(
+            """
+            SELECT org_id::text AS org_id,
+                   inviter_id::text AS inviter_id,
+                   invitations,
+                   attempts
+              FROM public.organization_invitation_jobs
+             WHERE status = 'pending'
+               AND run_after <= NOW()
+             ORDER BY run_after, created_at
+             LIMIT :limit
+               FOR UPDATE SKIP LOCKED
+            """
+        )
+        result = await self._session.execute(stmt, {"limit": limit})
+        return [
+            InvitationJob(
+                org_id=row["org_id"],
+                inviter_id=row["inviter_id"],
+                invitations=[InvitationCreatePayload.model_validate(item) for item in row["invitations"]],
+                attempts=row["attempts"],
+            )
+            for row in result.mappings().all()
+        ]
+
+    async def mark_completed(self, job: InvitationJob, *, invited: int, skipped: List[str]) -> None:
+        stmt = text(
+            """
+            UPDATE public.organization_invitation_jobs
+               SET status = 'completed',
+                   attempts = attempts + 1,
+                   last_error = NULL,
+                   invited_count = :invited,
+                   skipped_emails = CAST(:skipped AS TEXT[]),
+                   updated_at = NOW(),
+                   completed_at = NOW()
+             WHERE org_id = :org_id
+            """
+        )
+        await self._session.execute(
+            stmt,
+            {"invited": invited, "skipped": skipped, "org_id": job.org_id},
+        )
+
+    async def mark_failed(
+        self,
+        job: InvitationJob,
+        *,
+        error: str,
+        max_attempts: int,
+        retry_delay_seconds: int,
+    ) -> None:
+        """Schedule a retry with linear backoff, or give up after ``max_attempts``."""
+
+        stmt = text(
+            """
+            UPDATE public.organization_invitation_jobs
+               SET status = CASE WHEN attempts + 1 >= :max_attempts THEN 'failed' ELSE 'pending' END,
+                   attempts = attempts + 1,
+                   last_error = :error,
+                   run_after = NOW() + make_interval(secs => :retry_delay * (attempts + 1)),
+                   updated_at = NOW()
+             WHERE org_id = :org_id
+            """
+        )
+        await self._session.execute(
+            stmt,
+            {
+                "max_attempts": max_attempts,
+                "error": error,
+                "retry_delay": retry_delay_seconds,
+                "org_id": job.org_id,
+            },
+        )
@@ -2,8 +2,13 @@
 
 from contextlib import asynccontextmanager
 
-from fastapi import APIRouter, Depends, FastAPI, Query, status
+from typing import Optional
 
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from ...core import get_settings
+from ...db.session import get_session_factory
 from ...dependencies import CurrentPrincipal, require_current_principal
 from .di import (
     get_organization_hub_service,
@@ -11,7 +16,14 @@ from .di import (
     get_organization_service,
 )
 from .hub_service import OrganizationHubService
-from .jobs import InvitationExpiryScheduler
+from .invitation_import import (
+    InvitationImporter,
+    iter_invitation_rows,
+    iter_spooled_chunks,
+    resolve_import_format,
+    spool_upload,
+)
+from .jobs import InvitationExpiryScheduler, InvitationJobWorker
 from .schemas import (
     DivisionCreate,
     DivisionCreateRequest,
@@ -24,6 +36,7 @@ from .schemas import (
     InvitationListResponse,
     InvitationResponse,
     OrganizationCreate,
+    OrganizationProvisioningStatus,
     OrganizationResponse,
     OrganizationSummary,
     SlugAvailability,
@@ -33,16 +46,19 @@ from .service import OrganizationInvitationService, OrganizationService
 
 
 _INVITATION_SCHEDULER = InvitationExpiryScheduler()
+_INVITATION_JOB_WORKER = InvitationJobWorker()
 
 
 @asynccontextmanager
 async def _organizations_lifespan(_app: FastAPI):
-    """Manage background invitation expiry scheduler lifecycle."""
+    """Manage background invitation expiry and invitation job lifecycles."""
 
     _INVITATION_SCHEDULER.start()
+    _INVITATION_JOB_WORKER.start()
     try:
         yield
     finally:
+        await _INVITATION_JOB_WORKER.shutdown()
         await _INVITATION_SCHEDULER.shutdown()
 
 
@@ -69,11 +85,25 @@ async def create_organization(
     principal: CurrentPrincipal = Depends(require_current_principal),
     service: OrganizationService = Depends(get_organization_service),
 ) -> WorkspaceCreationResponse:
-    """Create a new organization and optionally send invitations."""
+    """Create a new organization; invitations and template seeding run in the background."""
 
     return await service.create(principal, payload)
 
 
+@router.get(
+    "/{org_id}/provisioning",
+    response_model=OrganizationProvisioningStatus,
+)
+async def get_organization_provisioning(
+    org_id: str,
+    principal: CurrentPrincipal = Depends(require_current_principal),
+    service: OrganizationService = Depends(get_organization_service),
+) -> OrganizationProvisioningStatus:
+    """Return the status of the invitations queued when the organization was created."""
+
+    return await service.get_provisioning_status(principal, org_id)
+
+
 @router.get(
     "/slug/availability",
     response_model=SlugAvailability,
@@ -155,6 +185,45 @@ async def create_invitations(
     return await service.create(principal, org_id, payload)
 
 
+@router.post("/{org_id}/invitations/import")
+async def import_invitations(
+    org_id: str,
+    request: Request,
+    import_format: Optional[str] = Query(None, alias="format", description="csv or ndjson; defaults from Content-Type"),
+    batch_size: Optional[int] = Query(None, ge=1, le=5000, alias="batchSize"),
+    principal: CurrentPrincipal = Depends(require_current_principal),
+    service: OrganizationInvitationService = Depends(get_organization_invitation_service),
+) -> StreamingResponse:
+    """Bulk-create invitations from a streamed CSV or NDJSON upload.
+
+    The upload is spooled to memory or a temporary file before the response
+    starts. The response is an NDJSON stream with one progress record per
+    inserted batch; the last record has ``done`` set, and ``error`` too if a
+    batch could not be saved.
+    """
+
+    try:
+        resolved_format = resolve_import_format(import_format, request.headers.get("content-type"))
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(error)) from error
+
+    inviter_id = await service.authorize_import(principal, org_id)
+    importer = InvitationImporter(
+        get_session_factory(),
+        batch_size=batch_size or get_settings().invitation_import_batch_size,
+    )
+
+    # Read the whole body first; see spool_upload
+    upload = await spool_upload(request.stream())
+
+    async def progress_lines():
+        rows = iter_invitation_rows(iter_spooled_chunks(upload), resolved_format)
+        async for progress in importer.run(org_id=org_id, inviter_id=inviter_id, rows=rows):
+            yield progress.model_dump_json() + "\n"
+
+    return StreamingResponse(progress_lines(), media_type="application/x-ndjson")
+
+
 @router.post(
     "/{org_id}/accept-invitation",
     response_model=HubOrganization,
@@ -110,9 +110,41 @@ class WorkspaceCreationResponse(BaseModel):
     organization: OrganizationResponse
     user_role: str = Field(alias="userRole")
     template_applied: Optional[str] = Field(default=None, alias="templateApplied")
+    # Invitations are sent after the response; these stay empty for old clients
     active_invitations: List[InvitationResponse] = Field(
-        default_factory=list, alias="activeInvitations"
+        default_factory=list,
+        alias="activeInvitations",
+        description="Deprecated and always empty; list invitations with GET /api/organizations/{org_id}/invitations.",
+        json_schema_extra={"deprecated": True},
     )
+    skipped_invites: List[str] = Field(
+        default_factory=list,
+        alias="skippedInvites",
+        description="Deprecated and always empty; read skippedInvites from GET /api/organizations/{org_id}/provisioning.",
+        json_schema_extra={"deprecated": True},
+    )
+    provisioning: Optional[OrganizationProvisioningStatus] = None
+
+
+class ProvisioningStepStatus(BaseModel):
+    """State of one post-create provisioning step."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    name: str
+    status: str = "pending"
+    detail: Optional[str] = None
+    updated_at: Optional[datetime] = Field(default=None, alias="updatedAt")
+
+
+class OrganizationProvisioningStatus(BaseModel):
+    """Progress of the background work that follows organization creation."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    org_id: str = Field(alias="orgId")
+    status: str = "pending"
+    steps: List[ProvisioningStepStatus] = Field(default_factory=list)
     skipped_invites: List[str] = Field(
         default_factory=list, alias="skippedInvites"
     )
@@ -176,6 +208,27 @@ class InvitationBatchCreateResponse(BaseModel):
     skipped: List[str] = Field(default_factory=list, description="Emails that were skipped due to existing pending invites")
 
 
+class InvitationImportError(BaseModel):
+    """Row of a bulk invitation upload that could not be parsed."""
+
+    line: int
+    message: str
+
+
+class InvitationImportProgress(BaseModel):
+    """Running totals emitted after each batch of a bulk invitation import."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    processed: int = 0
+    inserted: int = 0
+    skipped: int = 0
+    invalid: int = 0
+    errors: List[InvitationImportError] = Field(default_factory=list)
+    error: Optional[str] = Field(default=None, description="Set on the final record when the import stopped early")
+    done: bool = False
+
+
 class TemplateResponse(BaseModel):
     """Workspace template definition."""
 
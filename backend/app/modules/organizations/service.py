@@ -9,13 +9,15 @@ from fastapi import HTTPException, status
 
 from ...core import get_settings
 from ...dependencies import CurrentPrincipal
-from ..users.schemas import WorkspaceDivision, WorkspaceOrganization
+from ..users.schemas import WorkspaceDivision, WorkspaceOrganization, WorkspaceUser
 from ..users.service import UserService
-from ..workspace.service import WorkspaceTemplateService
+from ..workspace.templates import DEFAULT_TEMPLATE_SOURCE
 from .mock_data import build_fallback_organizations
 from .repository import (
+    INVITATIONS_STEP,
     DivisionDuplicateError,
     DivisionValidationError,
+    InvitationJobRepository,
     OrganizationRepository,
     SlugConflictError,
     SlugValidationError,
@@ -23,13 +25,14 @@ from .repository import (
 from .schemas import (
     InvitationBatchCreateRequest,
     InvitationBatchCreateResponse,
-    InvitationCreatePayload,
     InvitationListResponse,
     InvitationResponse,
     OrganizationCreate,
     OrganizationDivision,
+    OrganizationProvisioningStatus,
     OrganizationResponse,
     OrganizationSummary,
+    ProvisioningStepStatus,
     SlugAvailability,
     WorkspaceCreationResponse,
 )
@@ -45,19 +48,19 @@ class OrganizationService:
         self,
         user_service: UserService,
         repository: OrganizationRepository,
-        workspace_template_service: WorkspaceTemplateService | None = None,
+        invitation_jobs: InvitationJobRepository | None = None,
     ) -> None:
         self._user_service = user_service
         self._repository = repository
         self._settings = get_settings()
-        self._workspace_template_service = workspace_template_service
+        self._invitation_jobs = invitation_jobs
 
     async def create(
         self,
         principal: CurrentPrincipal,
         payload: OrganizationCreate,
     ) -> WorkspaceCreationResponse:
-        """Create an organization and optionally send invitations."""
+        """Create an organization and queue its invitations for the invitation worker."""
 
         user = await self._user_service.get_current_user(principal)
         if user is None:
@@ -70,6 +73,8 @@ class OrganizationService:
             organization, divisions = await self._repository.create_organization(
                 user_id=user.id,
                 create_data=payload,
+                seed_template_source=DEFAULT_TEMPLATE_SOURCE,
+                invitations=payload.invitations or [],
             )
         except SlugValidationError as error:
             raise HTTPException(
@@ -92,71 +97,45 @@ class OrganizationService:
                 detail=str(error),
             ) from error
 
-        invitations_response = InvitationBatchCreateResponse(
-            invitations=[],
-            skipped=[],
+        steps = [ProvisioningStepStatus(name=INVITATIONS_STEP)] if payload.invitations else []
+        provisioning = OrganizationProvisioningStatus(
+            org_id=organization.id,
+            status="pending" if steps else "completed",
+            steps=steps,
         )
 
-        if payload.invitations:
-            normalized_invites: list[InvitationCreatePayload] = []
-            for invitation in payload.invitations:
-                # Default to first division if no division specified
-                default_division_id = divisions[0].id if divisions else None
-                normalized_invites.append(
-                    InvitationCreatePayload(
-                        email=invitation.email,
-                        role=invitation.role or "member",
-                        division_id=invitation.division_id or default_division_id,
-                        message=invitation.message,
-                        expires_at=invitation.expires_at,
-                    )
-                )
-
-            batch_request = InvitationBatchCreateRequest(
-                invitations=normalized_invites,
-            )
-
-            try:
-                invitations_response = await self._repository.create_invitations(
-                    org_id=organization.id,
-                    inviter_id=user.id,
-                    batch=batch_request,
-                )
-            except Exception as error:  # pragma: no cover - defensive logging
-                logger.error(
-                    "organizations.create.invitation_failure",
-                    exc_info=error,
-                    extra={
-                        "org_id": organization.id,
-                        "user_id": user.id,
-                    },
-                )
-
-        if self._workspace_template_service:
-            try:
-                await self._workspace_template_service.seed_for_organization(
-                    organization=organization,
-                    divisions=divisions,
-                    seeded_by=user.id if user else None,
-                )
-            except Exception as error:  # pragma: no cover - safety log
-                logger.warning(
-                    "organizations.create.workspace_seed_failed",
-                    exc_info=error,
-                    extra={
-                        "org_id": organization.id,
-                        "user_id": user.id if user else None,
-                    },
-                )
-
         return WorkspaceCreationResponse(
             organization=organization,
             user_role="owner",
             template_applied=payload.template_id,
-            active_invitations=invitations_response.invitations,
-            skipped_invites=invitations_response.skipped,
+            provisioning=provisioning,
         )
 
+    async def get_provisioning_status(
+        self,
+        principal: CurrentPrincipal,
+        org_id: str,
+    ) -> OrganizationProvisioningStatus:
+        """Return the background provisioning status for an organization the caller belongs to."""
+
+        user = await self._user_service.get_current_user(principal)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Authentication required",
+            )
+        if not any(organization.id == org_id for organization in user.organizations):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You are not a member of this organization",
+            )
+
+        provisioning = await self._invitation_jobs.get_status(org_id) if self._invitation_jobs else None
+        if provisioning is None:
+            # Nothing was queued when the organization was created
+            return OrganizationProvisioningStatus(org_id=org_id, status="completed")
+        return provisioning
+
     async def check_slug_availability(self, slug: str) -> SlugAvailability:
         """Return slug availability and suggestions for conflicts."""
 
@@ -330,6 +309,22 @@ class OrganizationInvitationService:
     ) -> InvitationBatchCreateResponse:
         """Create invitations scoped to an organization the user manages."""
 
+        user = await self._require_invitation_manager(principal, org_id)
+        return await self._repository.create_invitations(
+            org_id=org_id,
+            inviter_id=user.id,
+            batch=payload,
+        )
+
+    async def authorize_import(self, principal: CurrentPrincipal, org_id: str) -> str:
+        """Check bulk import permissions up front and return the inviter id."""
+
+        user = await self._require_invitation_manager(principal, org_id)
+        return user.id
+
+    async def _require_invitation_manager(
+        self, principal: CurrentPrincipal, org_id: str
+    ) -> WorkspaceUser:
         user = await self._user_service.get_current_user(principal)
         membership = next(
             (organization for organization in user.organizations if organization.id == org_id),
@@ -349,8 +344,4 @@ class OrganizationInvitationService:
                 detail="Only organization admins can send invitations",
             )
 
-        return await self._repository.create_invitations(
-            org_id=org_id,
-            inviter_id=user.id,
-            batch=payload,
-        )
+        return user
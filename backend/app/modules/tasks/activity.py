@@ -0,0 +1,204 @@
+"""Batched writes of the kanban activity log."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from asyncpg.exceptions import DataError, IntegrityConstraintViolationError
+
+from ...core import get_settings
+from ...db.session import get_engine
+from .repository import TasksRepository
+
+logger = logging.getLogger(__name__)
+
+ActivityWriter = Callable[[List[Dict[str, Any]]], Awaitable[int]]
+
+
+class ActivitySink:
+    """Queues activity entries and writes them in batched multi-row inserts.
+
+    Mutations enqueue their audit entry and return without a database
+    round-trip. A background task flushes the queue once it holds
+    ``batch_size`` entries or ``flush_interval_ms`` after the last flush.
+
+    Ordering: ``created_at`` is made strictly increasing in enqueue order and
+    batches are written one at a time from the front of the queue, so the
+    activity feeds (ordered by ``created_at, id``) show entries in the order
+    they were logged; activities written directly take their timestamp from
+    :meth:`reserve_created_at` to stay in that order. Readers in this process call :meth:`flush` first to see
+    their own writes; entries from other workers appear within one interval.
+
+    Overflow: at most ``max_pending`` entries wait in the queue, failed batches
+    included. While the database is unreachable, further entries are dropped
+    and counted, and the count is logged once writes succeed again.
+    """
+
+    def __init__(
+        self,
+        writer: Optional[ActivityWriter] = None,
+        *,
+        batch_size: Optional[int] = None,
+        flush_interval_ms: Optional[int] = None,
+        max_pending: Optional[int] = None,
+    ) -> None:
+        settings = get_settings()
+        self._writer = writer or write_activities
+        self._batch_size = batch_size or settings.task_activity_batch_size
+        self._interval = (flush_interval_ms or settings.task_activity_flush_interval_ms) / 1000
+        self._max_pending = max(self._batch_size, max_pending or settings.task_activity_max_pending)
+        self._pending: List[Dict[str, Any]] = []
+        self._dropped = 0
+        self._last_created_at: Optional[datetime] = None
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._stop = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def reserve_created_at(self, created_at: datetime) -> datetime:
+        """Return ``created_at``, moved past every timestamp handed out so far.
+
+        Activities written outside the queue take their timestamp from here
+        too, so the feed order still matches the order they were logged in.
+        """
+
+        if self._last_created_at is not None and created_at <= self._last_created_at:
+            created_at = self._last_created_at + timedelta(microseconds=1)
+        self._last_created_at = created_at
+        return created_at
+
+    def enqueue(self, activity: Dict[str, Any]) -> bool:
+        """Queue one entry (the ``create_activity`` payload) for the next flush.
+
+        Returns False if the queue is full and the entry was dropped.
+        """
+
+        if len(self._pending) >= self._max_pending:
+            if not self._dropped:
+                logger.error(
+                    "tasks.activity_sink.overflow",
+                    extra={"pending": self.pending, "max_pending": self._max_pending},
+                )
+            self._dropped += 1
+            return False
+
+        created_at = self.reserve_created_at(activity["created_at"])
+        if created_at != activity["created_at"]:
+            activity = {**activity, "created_at": created_at}
+        self._pending.append(activity)
+
+        if self._task is None:
+            self.start()
+        if len(self._pending) >= self._batch_size:
+            self._wakeup.set()
+        return True
+
+    async def flush(self) -> int:
+        """Write everything queued so far, returning how many rows were written.
+
+        A batch that fails to write goes back to the front of the queue and
+        the error propagates; later entries are never written ahead of it.
+        """
+
+        async with self._flush_lock:
+            written = 0
+            while self._pending:
+                batch = self._pending[: self._batch_size]
+                del self._pending[: len(batch)]
+                try:
+                    written += await self._writer(batch)
+                except BaseException:
+                    # Includes cancellation at shutdown, which flushes again
+                    self._pending[:0] = batch
+                    raise
+                if self._dropped:
+                    logger.error("tasks.activity_sink.overflow_recovered", extra={"dropped": self._dropped})
+                    self._dropped = 0
+            return written
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stop.clear()
+        self._task = asyncio.create_task(self._run(), name="task-activity-sink")
+
+    async def shutdown(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        try:
+            await self.flush()
+        except Exception as error:  # pragma: no cover - defensive guard
+            logger.error("tasks.activity_sink.final_flush_failed", extra={"pending": self.pending}, exc_info=error)
+
+    async def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except Exception as error:  # pragma: no cover - defensive guard
+                logger.error("tasks.activity_sink.flush_failed", extra={"pending": self.pending}, exc_info=error)
+
+
+@asynccontextmanager
+async def _engine_repository() -> AsyncIterator[TasksRepository]:
+    async with get_engine().connect() as connection:
+        # The tasks repository speaks asyncpg; each statement commits on its own.
+        raw_connection = await connection.get_raw_connection()
+        yield TasksRepository(raw_connection.driver_connection)
+
+
+async def write_activities(activities: List[Dict[str, Any]]) -> int:
+    """Insert a batch on a dedicated connection.
+
+    If the batch is rejected for its data, entries are retried one by one so
+    a single bad entry cannot hold back the rest; the ones that still fail
+    are logged and dropped.
+    """
+
+    async with _engine_repository() as repository:
+        try:
+            return await repository.create_activities(activities)
+        except (IntegrityConstraintViolationError, DataError) as error:
+            logger.warning("tasks.activity_sink.batch_rejected", extra={"size": len(activities)}, exc_info=error)
+
+        written = 0
+        for activity in activities:
+            try:
+                written += await repository.create_activities([activity])
+            except (IntegrityConstraintViolationError, DataError) as error:
+                logger.error(
+                    "tasks.activity_sink.entry_dropped",
+                    extra={"activity_id": activity.get("id"), "activity_type": str(activity.get("activity_type"))},
+                    exc_info=error,
+                )
+        return written
+
+
+_ACTIVITY_SINK: Optional[ActivitySink] = None
+
+
+def get_activity_sink() -> ActivitySink:
+    """Return the process-wide activity sink."""
+
+    global _ACTIVITY_SINK
+    if _ACTIVITY_SINK is None:
+        _ACTIVITY_SINK = ActivitySink()
+    return _ACTIVITY_SINK
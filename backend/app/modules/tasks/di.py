@@ -23,6 +23,7 @@ from typing import Annotated
 from fastapi import Depends
 
 from ...db.session import get_db_session
+from .activity import get_activity_sink
 from .service import TasksService
 from .repository import TasksRepository
 
@@ -51,9 +52,10 @@ def get_tasks_service(
     Get tasks service instance with repository dependency injection.
 
     The service automatically integrates with the scope guard system
-    for security validation and audit logging.
+    for security validation and audit logging. Activity entries go through
+    the process-wide batching sink.
     """
-    return TasksService(repository)
+    return TasksService(repository, get_activity_sink())
 
 
 # Export dependencies for use in routers
@@ -0,0 +1,180 @@
+"""Background maintenance for kanban task data."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import text
+
+from ...core import get_settings
+from ...db.session import get_engine
+from .repository import TasksRepository
+
+logger = logging.getLogger(__name__)
+
+# Arbitrary application-wide keys for pg_try_advisory_lock; only one worker
+# process runs each maintenance job at a time.
+CARD_COUNTER_REPAIR_LOCK_KEY = 7_412_019_003
+RANK_REBALANCE_LOCK_KEY = 7_412_019_004
+
+
+class CardCounterRepairScheduler:
+    """Periodically recomputes ``comment_count`` and ``attachment_count`` on cards.
+
+    The repository adjusts the counters with every comment and attachment
+    write, so drift only comes from changes made outside it (manual SQL,
+    cascading deletes of users or comments). Each run sweeps all cards in
+    short id-ordered batches and rewrites only those that disagree.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: Optional[int] = None,
+        *,
+        batch_size: Optional[int] = None,
+    ) -> None:
+        settings = get_settings()
+        self._interval = interval_seconds or settings.task_counter_repair_interval_seconds
+        self._batch_size = batch_size or settings.task_counter_repair_batch_size
+        self._stop = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="card-counter-repair-scheduler")
+
+    async def shutdown(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                repaired = await self._repair_with_lock()
+                if repaired:
+                    logger.info("scheduler.card_counters.repaired", extra={"count": repaired})
+            except Exception as error:  # pragma: no cover - defensive guard
+                logger.error("scheduler.card_counters.failed", exc_info=error)
+
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self._interval)
+            except asyncio.TimeoutError:
+                continue
+
+    async def _repair_with_lock(self) -> int:
+        return await _run_with_lock(
+            CARD_COUNTER_REPAIR_LOCK_KEY,
+            lambda repository: repair_card_counters(repository, batch_size=self._batch_size),
+        )
+
+
+class RankRebalanceScheduler:
+    """Respaces card rank keys in columns where they have grown too long.
+
+    Inserting repeatedly between the same two cards lengthens rank keys by one
+    character each time. Columns holding a key past ``REBALANCE_RANK_LENGTH``
+    are found through a partial index and rewritten with evenly spaced keys;
+    columns with short keys are never touched.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: Optional[int] = None,
+        *,
+        batch_size: Optional[int] = None,
+    ) -> None:
+        settings = get_settings()
+        self._interval = interval_seconds or settings.task_rank_rebalance_interval_seconds
+        self._batch_size = batch_size or settings.task_rank_rebalance_batch_size
+        self._stop = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="rank-rebalance-scheduler")
+
+    async def shutdown(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                columns = await _run_with_lock(
+                    RANK_REBALANCE_LOCK_KEY,
+                    lambda repository: rebalance_long_ranks(repository, batch_size=self._batch_size),
+                )
+                if columns:
+                    logger.info("scheduler.card_ranks.rebalanced", extra={"columns": columns})
+            except Exception as error:  # pragma: no cover - defensive guard
+                logger.error("scheduler.card_ranks.failed", exc_info=error)
+
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self._interval)
+            except asyncio.TimeoutError:
+                continue
+
+
+async def _run_with_lock(lock_key: int, work: Callable[[TasksRepository], Awaitable[int]]) -> int:
+    """Run ``work`` against a tasks repository while holding an advisory lock."""
+
+    async with get_engine().connect() as connection:
+        acquired = await connection.scalar(
+            text("SELECT pg_try_advisory_lock(:key)"),
+            {"key": lock_key},
+        )
+        if not acquired:
+            logger.debug("scheduler.tasks.lock_busy", extra={"lock_key": lock_key})
+            return 0
+        await connection.commit()
+        try:
+            # The tasks repository speaks asyncpg; statements run outside the
+            # SQLAlchemy transaction and commit individually.
+            raw_connection = await connection.get_raw_connection()
+            return await work(TasksRepository(raw_connection.driver_connection))
+        finally:
+            await connection.execute(
+                text("SELECT pg_advisory_unlock(:key)"),
+                {"key": lock_key},
+            )
+            await connection.commit()
+
+
+async def repair_card_counters(repository: TasksRepository, *, batch_size: int = 500) -> int:
+    """Sweep every card once, returning how many had drifted counters."""
+
+    repaired = 0
+    after_id: Optional[str] = None
+    while True:
+        after_id, fixed = await repository.recompute_card_counters(after_id=after_id, batch_size=batch_size)
+        repaired += fixed
+        if after_id is None:
+            return repaired
+
+
+async def rebalance_long_ranks(repository: TasksRepository, *, batch_size: int = 50) -> int:
+    """Respace every column holding an over-long rank key, returning how many were rewritten."""
+
+    rebalanced = 0
+    while True:
+        column_ids = await repository.get_columns_needing_rebalance(limit=batch_size)
+        for column_id in column_ids:
+            await repository.rebalance_column(column_id)
+        rebalanced += len(column_ids)
+        if len(column_ids) < batch_size:
+            return rebalanced
@@ -0,0 +1,138 @@
+"""
+Lexicographic rank keys for ordering kanban cards.
+
+Cards are ordered by a short base-62 string compared byte-wise (the column
+uses ``COLLATE "C"``). A key can always be generated between two others, so
+moving a card rewrites only that card. Keys never end in ``"0"``, which keeps
+room below every key.
+
+Appending and prepending step a fixed-width key up or down, so keys stay three
+characters long for thousands of inserts at either end. Inserting between two
+neighbours takes their midpoint, which grows by one character at worst; columns
+whose keys pass ``REBALANCE_RANK_LENGTH`` are respaced in the background.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+_INDEX = {digit: index for index, digit in enumerate(DIGITS)}
+
+# Keys longer than this flag their column for rebalancing. Must match the
+# partial index predicate in 20251105_add_kanban_card_ranks.sql.
+REBALANCE_RANK_LENGTH = 16
+
+# Spaced keys are a two-digit block followed by a non-zero digit, centred in
+# the key space so there is room to grow at both ends. Mirrored by
+# kanban_card_spaced_rank() in the migration.
+_STEP_WIDTH = 3
+_KEYS_PER_BLOCK = BASE - 1
+_BLOCKS = BASE ** (_STEP_WIDTH - 1)
+
+
+def key_between(before: Optional[str], after: Optional[str]) -> str:
+    """Return a key sorting strictly between ``before`` and ``after``.
+
+    ``None`` stands for the start or end of the column.
+    """
+    _validate(before)
+    _validate(after)
+    if before is None and after is None:
+        return spaced_keys(1)[0]
+    if after is None:
+        return key_after(before)
+    if before is None:
+        return key_before(after)
+    if before >= after:
+        raise ValueError(f"rank {before!r} must sort before {after!r}")
+    return _midpoint(before, after)
+
+
+def key_after(before: str) -> str:
+    """Return a key just after ``before``, for appending to a column."""
+    _validate(before)
+    width = max(len(before), _STEP_WIDTH)
+    value = _decode(before.ljust(width, DIGITS[0])) + 1
+    if value % BASE == 0:
+        value += 1
+    if value >= BASE ** width:
+        return before + _midpoint("", None)
+    return _encode(value, width)
+
+
+def key_before(after: str) -> str:
+    """Return a key just before ``after``, for prepending to a column."""
+    _validate(after)
+    width = max(len(after), _STEP_WIDTH)
+    value = _decode(after.ljust(width, DIGITS[0])) - 1
+    if value % BASE == 0:
+        value -= 1
+    if value <= 0:
+        return _midpoint("", after)
+    return _encode(value, width)
+
+
+def keys_after(before: Optional[str], count: int) -> List[str]:
+    """Return ``count`` ascending keys that all sort after ``before``."""
+    if before is None:
+        return spaced_keys(count)
+    keys: List[str] = []
+    current = before
+    for _ in range(count):
+        current = key_after(current)
+        keys.append(current)
+    return keys
+
+
+def spaced_keys(count: int) -> List[str]:
+    """Return ``count`` evenly stepped keys centred in the key space."""
+    blocks = -(-count // _KEYS_PER_BLOCK)
+    if blocks > _BLOCKS:
+        raise ValueError(f"cannot space {count} keys")
+    start = (_BLOCKS - blocks) // 2
+    return [
+        _encode(start + index // _KEYS_PER_BLOCK, _STEP_WIDTH - 1) + DIGITS[1 + index % _KEYS_PER_BLOCK]
+        for index in range(count)
+    ]
+
+
+def _midpoint(before: str, after: Optional[str]) -> str:
+    # Digits missing from ``before`` count as zeros; ``after`` of None is the end of the space.
+    if after is not None:
+        prefix = 0
+        while prefix < len(after) and (before[prefix] if prefix < len(before) else DIGITS[0]) == after[prefix]:
+            prefix += 1
+        if prefix:
+            return after[:prefix] + _midpoint(before[prefix:], after[prefix:])
+
+    low = _INDEX[before[0]] if before else 0
+    high = _INDEX[after[0]] if after is not None else BASE
+    if high - low > 1:
+        return DIGITS[(low + high) // 2]
+    if after is not None and len(after) > 1:
+        return after[:1]
+    return DIGITS[low] + _midpoint(before[1:], None)
+
+
+def _decode(key: str) -> int:
+    value = 0
+    for digit in key:
+        value = value * BASE + _INDEX[digit]
+    return value
+
+
+def _encode(value: int, width: int) -> str:
+    digits = []
+    for _ in range(width):
+        value, remainder = divmod(value, BASE)
+        digits.append(DIGITS[remainder])
+    return "".join(reversed(digits))
+
+
+def _validate(key: Optional[str]) -> None:
+    if key is None:
+        return
+    if not key or key.endswith(DIGITS[0]) or any(digit not in _INDEX for digit in key):
+        raise ValueError(f"invalid rank key {key!r}")
@@ -18,18 +18,112 @@ Key Features:
 - Bulk operations for performance
 """
 
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Callable, Awaitable, Generic, TypeVar
 import uuid
 import json
+import re
 
+from asyncpg.exceptions import UniqueViolationError
+
+from ...core.pagination import KeysetCursor
 from ...dependencies import CurrentPrincipal
+from .ranking import REBALANCE_RANK_LENGTH, key_between, keys_after, spaced_keys
 from .schemas import (
     Board, Column, Task, Comment, Attachment, ActivityEntry,
     TaskPriority, TaskStatus, ColumnType, ActivityType,
-    TaskSummary, BoardSummary, UserSummary
+    TaskSummary, BoardSummary, BoardSnapshot, UserSummary, TotalMode,
+    TaskAccessContext
 )
 
+T = TypeVar("T")
+
+
+class WipLimitExceededError(ValueError):
+    """Raised when a write would put a column over its WIP limit."""
+
+    def __init__(self, column_id: str, wip_limit: int, available: int):
+        super().__init__(f"Column has reached its WIP limit of {wip_limit}")
+        self.column_id = column_id
+        self.wip_limit = wip_limit
+        self.available = max(available, 0)
+
+
+# Zero-based index of card ``t`` within its column, derived from rank order
+_CARD_POSITION_SQL = "(SELECT COUNT(*) FROM kanban_cards s WHERE s.column_id = t.column_id AND s.rank < t.rank)::integer"
+
+# A board's version is the sum of its slotted counters (one index range scan)
+_BOARD_VERSION_SQL = "(SELECT COALESCE(SUM(v.version), 0) FROM kanban_board_versions v WHERE v.board_id = b.id)::bigint"
+
+# Column WIP fields read from the trigger-maintained count of non-archived cards
+_COLUMN_COUNT_SQL = (
+    "c.card_count as task_count, "
+    "COALESCE(c.card_count >= c.wip_limit, false) as is_over_limit"
+)
+
+# Card columns a task update may write; JSON columns are serialised first
+_TASK_UPDATE_FIELDS = (
+    'title', 'description', 'priority', 'story_points', 'due_date',
+    'start_date', 'assigned_to', 'is_archived'
+)
+_TASK_JSON_FIELDS = ('labels', 'custom_fields')
+
+# Concurrent writers can pick the same rank key; the loser re-reads its
+# neighbours and tries again.
+_RANK_ATTEMPTS = 3
+
+
+def _affected_rows(status: Optional[str]) -> int:
+    """Extract the row count from a command tag such as ``UPDATE 3``."""
+    if not status:
+        return 0
+    try:
+        return int(status.split()[-1])
+    except ValueError:
+        return 0
+
+
+def _position_key(value: Any) -> Tuple[str, str]:
+    column_id, rank = value
+    return str(column_id), str(rank)
+
+
+# Keyset sort keys for task search: (expression, SQL type) pairs and how a
+# cursor's JSON value is read back into one parameter per expression. Sorting
+# by due date, which is nullable, stays on offset pages.
+_SEARCH_SORT_KEYS: Dict[str, Tuple[Tuple[Tuple[str, str], ...], Callable[[Any], Tuple[Any, ...]]]] = {
+    "created_at": ((("t.created_at", "timestamptz"),), lambda value: (datetime.fromisoformat(value),)),
+    "updated_at": ((("t.updated_at", "timestamptz"),), lambda value: (datetime.fromisoformat(value),)),
+    "title": ((("t.title", "text"),), lambda value: (str(value),)),
+    "priority": ((("COALESCE(t.priority, 'medium')", "text"),), lambda value: (str(value),)),
+    "position": ((("t.column_id", "uuid"), ("t.rank", "text")), _position_key),
+}
+
+
+def _cursor_value(value: Any) -> Any:
+    return str(value) if isinstance(value, uuid.UUID) else value
+
+
+@dataclass
+class ListPage(Generic[T]):
+    """One page of a list query; ``total`` is only set when it was asked for."""
+    items: List[T]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    total: Optional[int] = None
+
+
+def _prefix_tsquery(query: str) -> Optional[str]:
+    """Turn free text into a ``to_tsquery`` string matching every word as a prefix.
+
+    Only word characters survive, so user input can never inject tsquery syntax.
+    """
+    words = re.findall(r"\w+", query.lower())
+    if not words:
+        return None
+    return " & ".join(f"{word}:*" for word in words)
+
 
 class TasksRepository:
     """
@@ -82,6 +176,81 @@ class TasksRepository:
         result = await self._db.fetchrow(query, board_id)
         return self._row_to_board(result) if result else None
 
+    async def get_board_version(self, board_id: str) -> Optional[Dict[str, Any]]:
+        """Get a board's owning scope and current version with one indexed lookup."""
+        query = f"""
+        SELECT b.organization_id, b.division_id, {_BOARD_VERSION_SQL} AS version
+        FROM kanban_boards b
+        WHERE b.id = $1
+        """
+        result = await self._db.fetchrow(query, board_id)
+        return dict(result) if result else None
+
+    async def get_board_snapshot(self, board_id: str) -> Optional[BoardSnapshot]:
+        """
+        Get a board with its columns and non-archived task summaries.
+
+        Runs three queries regardless of board size inside a read-only
+        repeatable-read transaction, so the columns, tasks and version all
+        describe the same moment.
+        """
+        board_query = f"""
+        SELECT b.*, {_BOARD_VERSION_SQL} AS version
+        FROM kanban_boards b
+        WHERE b.id = $1
+        """
+        columns_query = """
+        SELECT c.*
+        FROM kanban_columns c
+        WHERE c.board_id = $1
+        ORDER BY c.position ASC
+        """
+        tasks_query = """
+        SELECT t.id, t.column_id, t.title, t.priority, t.position, t.due_date, t.assigned_to,
+               t.labels, t.is_archived, t.updated_at, t.comment_count, t.attachment_count,
+               u_assignee.name as assignee_name, u_assignee.email as assignee_email,
+               CASE WHEN t.due_date < NOW() AND t.completed_at IS NULL THEN true ELSE false END as is_overdue
+        FROM (
+            SELECT ranked.*,
+                   (ROW_NUMBER() OVER (PARTITION BY ranked.column_id ORDER BY ranked.rank) - 1)::integer as position,
+                   c.position as column_position
+            FROM kanban_cards ranked
+            JOIN kanban_columns c ON ranked.column_id = c.id
+            WHERE c.board_id = $1
+        ) t
+        LEFT JOIN users u_assignee ON t.assigned_to = u_assignee.id
+        WHERE t.is_archived = false
+        ORDER BY t.column_position ASC, t.rank ASC
+        """
+
+        async with self._db.transaction(isolation='repeatable_read', readonly=True):
+            board_row = await self._db.fetchrow(board_query, board_id)
+            if not board_row:
+                return None
+            column_rows = await self._db.fetch(columns_query, board_id)
+            task_rows = await self._db.fetch(tasks_query, board_id)
+
+        tasks = [self._row_to_task_summary(row) for row in task_rows]
+        task_counts: Dict[str, int] = {}
+        for task in tasks:
+            task_counts[task.column_id] = task_counts.get(task.column_id, 0) + 1
+
+        columns = []
+        for row in column_rows:
+            task_count = task_counts.get(str(row['id']), 0)
+            columns.append(self._row_to_column({
+                **dict(row),
+                'task_count': task_count,
+                'is_over_limit': row['wip_limit'] is not None and task_count >= row['wip_limit'],
+            }))
+
+        return BoardSnapshot(
+            board=self._row_to_board(board_row),
+            columns=columns,
+            tasks=tasks,
+            version=board_row['version'],
+        )
+
     async def list_boards_for_organization(
         self,
         organization_id: str,
@@ -197,14 +366,10 @@ class TasksRepository:
 
     async def get_columns_for_board(self, board_id: str) -> List[Column]:
         """Get all columns for a board, ordered by position."""
-        query = """
-        SELECT c.*,
-               COUNT(t.id) as task_count,
-               CASE WHEN c.wip_limit IS NOT NULL AND COUNT(t.id) >= c.wip_limit THEN true ELSE false END as is_over_limit
+        query = f"""
+        SELECT c.*, {_COLUMN_COUNT_SQL}
         FROM kanban_columns c
-        LEFT JOIN kanban_cards t ON c.id = t.column_id AND t.is_archived = false
         WHERE c.board_id = $1
-        GROUP BY c.id, c.board_id, c.name, c.color, c.position, c.column_type, c.wip_limit, c.created_at, c.updated_at
         ORDER BY c.position ASC
         """
 
@@ -213,14 +378,10 @@ class TasksRepository:
 
     async def get_column_by_id(self, column_id: str) -> Optional[Column]:
         """Get a column by ID."""
-        query = """
-        SELECT c.*,
-               COUNT(t.id) as task_count,
-               CASE WHEN c.wip_limit IS NOT NULL AND COUNT(t.id) >= c.wip_limit THEN true ELSE false END as is_over_limit
+        query = f"""
+        SELECT c.*, {_COLUMN_COUNT_SQL}
         FROM kanban_columns c
-        LEFT JOIN kanban_cards t ON c.id = t.column_id AND t.is_archived = false
         WHERE c.id = $1
-        GROUP BY c.id, c.board_id, c.name, c.color, c.position, c.column_type, c.wip_limit, c.created_at, c.updated_at
         """
 
         result = await self._db.fetchrow(query, column_id)
@@ -256,15 +417,31 @@ class TasksRepository:
         result = await self._db.fetchrow(query, *values)
         return self._row_to_column(result) if result else None
 
-    async def reorder_columns(self, board_id: str, column_orders: List[Tuple[str, int]]) -> bool:
-        """Reorder columns in a board."""
-        async with self._db.transaction():
-            for column_id, position in column_orders:
-                await self._db.execute(
-                    "UPDATE kanban_columns SET position = $1, updated_at = $2 WHERE id = $3 AND board_id = $4",
-                    position, datetime.utcnow(), column_id, board_id
-                )
-        return True
+    async def reorder_columns(self, board_id: str, column_orders: List[Tuple[str, int]]) -> int:
+        """
+        Reorder columns in a board with a single statement.
+
+        Returns the number of columns updated. Columns of other boards are
+        ignored; when a column is listed twice its first position wins.
+        """
+        if not column_orders:
+            return 0
+
+        query = """
+        UPDATE kanban_columns c
+        SET position = ordered.position, updated_at = NOW()
+        FROM (
+            SELECT DISTINCT ON (id) id, position
+            FROM unnest($2::uuid[], $3::integer[]) WITH ORDINALITY AS o(id, position, ordinality)
+            ORDER BY id, ordinality
+        ) ordered
+        WHERE c.id = ordered.id AND c.board_id = $1
+        """
+
+        column_ids = [column_id for column_id, _ in column_orders]
+        positions = [position for _, position in column_orders]
+        status = await self._db.execute(query, board_id, column_ids, positions)
+        return _affected_rows(status)
 
     async def delete_column(self, column_id: str) -> bool:
         """Delete a column and move tasks to a backup column."""
@@ -300,67 +477,100 @@ class TasksRepository:
     # ==================== TASK OPERATIONS ====================
 
     async def create_task(self, task_data: Dict[str, Any]) -> Task:
-        """Create a new task."""
+        """
+        Create a new task.
+
+        Raises:
+            WipLimitExceededError: If the column is full; checked under the column row lock.
+        """
         task_id = task_data.get('id', str(uuid.uuid4()))
 
-        # Get the next position in the column
-        position = task_data.get('position', 0)
-        if position == 0:
-            position = await self._db.fetchval(
-                "SELECT COALESCE(MAX(position), 0) + 1 FROM kanban_cards WHERE column_id = $1",
-                task_data['column_id']
-            ) or 0
+        column_id = task_data['column_id']
+        # A position of 0 (the default) appends to the column
+        position = task_data.get('position') or None
 
-        query = """
-        INSERT INTO kanban_cards (
-            id, column_id, title, description, priority, position,
+        async def allocate() -> str:
+            before, after = await self._rank_neighbours(column_id, position)
+            return key_between(before, after)
+
+        query = f"""
+        INSERT INTO kanban_cards AS t (
+            id, column_id, title, description, priority, rank,
             story_points, due_date, start_date, created_by, assigned_to,
             labels, custom_fields, is_archived, created_at, updated_at
         ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16)
-        RETURNING *
+        RETURNING t.*, {_CARD_POSITION_SQL} as position
         """
 
-        result = await self._db.fetchrow(
-            query,
-            task_id,
-            task_data['column_id'],
-            task_data['title'],
-            task_data.get('description'),
-            task_data['priority'],
-            position,
-            task_data.get('story_points'),
-            task_data.get('due_date'),
-            task_data.get('start_date'),
-            task_data['created_by'],
-            task_data.get('assigned_to'),
-            json.dumps(task_data.get('labels', [])),
-            json.dumps(task_data.get('custom_fields', {})),
-            task_data.get('is_archived', False),
-            task_data['created_at'],
-            task_data['updated_at']
-        )
+        async def write(rank: str):
+            if not task_data.get('is_archived', False):
+                await self._reserve_column_slots(column_id, 1)
+            return await self._db.fetchrow(
+                query,
+                task_id,
+                column_id,
+                task_data['title'],
+                task_data.get('description'),
+                task_data['priority'],
+                rank,
+                task_data.get('story_points'),
+                task_data.get('due_date'),
+                task_data.get('start_date'),
+                task_data['created_by'],
+                task_data.get('assigned_to'),
+                json.dumps(task_data.get('labels', [])),
+                json.dumps(task_data.get('custom_fields', {})),
+                task_data.get('is_archived', False),
+                task_data['created_at'],
+                task_data['updated_at']
+            )
 
+        result = await self._write_with_rank(allocate, write)
         return self._row_to_task(result)
 
+    async def get_task_access_context(self, task_id: str) -> Optional[TaskAccessContext]:
+        """Resolve a task to its column, board and owning scope in one indexed lookup.
+
+        Reads only the keys needed to authorize the task, unlike
+        ``get_task_by_id``, which aggregates comments, attachments and users.
+        """
+        query = """
+        SELECT t.id, t.title, t.assigned_to, t.column_id, c.name as column_name,
+               c.board_id, b.organization_id, b.division_id
+        FROM kanban_cards t
+        JOIN kanban_columns c ON t.column_id = c.id
+        JOIN kanban_boards b ON c.board_id = b.id
+        WHERE t.id = $1
+        """
+
+        row = await self._db.fetchrow(query, task_id)
+        if not row:
+            return None
+        return TaskAccessContext(
+            task_id=str(row['id']),
+            title=row['title'],
+            assigned_to=str(row['assigned_to']) if row['assigned_to'] else None,
+            column_id=str(row['column_id']),
+            column_name=row['column_name'],
+            board_id=str(row['board_id']),
+            organization_id=str(row['organization_id']),
+            division_id=str(row['division_id']) if row['division_id'] else None
+        )
+
     async def get_task_by_id(self, task_id: str) -> Optional[Task]:
         """Get a task by ID with all relationships."""
-        query = """
-        SELECT t.*,
+        query = f"""
+        SELECT t.*, {_CARD_POSITION_SQL} as position,
                c.name as column_name, c.color as column_color, c.position as column_position,
                u_creator.name as creator_name, u_creator.email as creator_email,
                u_assignee.name as assignee_name, u_assignee.email as assignee_email,
-               COUNT(tc.id) as comment_count,
-               COUNT(ta.id) as attachment_count,
                CASE WHEN t.due_date < NOW() AND t.completed_at IS NULL THEN true ELSE false END as is_overdue,
                EXTRACT(DAYS FROM NOW() - t.created_at)::integer as days_since_created
         FROM kanban_cards t
         LEFT JOIN kanban_columns c ON t.column_id = c.id
         LEFT JOIN users u_creator ON t.created_by = u_creator.id
         LEFT JOIN users u_assignee ON t.assigned_to = u_assignee.id
-        LEFT JOIN task_comments tc ON t.id = tc.task_id
-        LEFT JOIN task_attachments ta ON t.id = ta.task_id
         WHERE t.id = $1
-        GROUP BY t.id, c.id, u_creator.id, u_assignee.id
         """
 
         result = await self._db.fetchrow(query, task_id)
@@ -370,44 +580,51 @@ class TasksRepository:
         """Get all tasks in a column, ordered by position."""
         archived_clause = "" if include_archived else "AND t.is_archived = false"
 
+        # Positions count archived cards too, matching the index space move_task uses
         query = f"""
-        SELECT t.id, t.title, t.priority, t.position, t.due_date, t.assigned_to,
-               t.labels, t.is_archived, t.updated_at,
+        SELECT t.id, t.column_id, t.title, t.priority, t.position, t.due_date, t.assigned_to,
+               t.labels, t.is_archived, t.updated_at, t.comment_count, t.attachment_count,
                u_assignee.name as assignee_name, u_assignee.email as assignee_email,
-               COUNT(tc.id) as comment_count,
-               COUNT(ta.id) as attachment_count,
                CASE WHEN t.due_date < NOW() AND t.completed_at IS NULL THEN true ELSE false END as is_overdue
-        FROM kanban_cards t
+        FROM (
+            SELECT ranked.*, (ROW_NUMBER() OVER (ORDER BY ranked.rank) - 1)::integer as position
+            FROM kanban_cards ranked
+            WHERE ranked.column_id = $1
+        ) t
         LEFT JOIN users u_assignee ON t.assigned_to = u_assignee.id
-        LEFT JOIN task_comments tc ON t.id = tc.task_id
-        LEFT JOIN task_attachments ta ON t.id = ta.task_id
-        WHERE t.column_id = $1 {archived_clause}
-        GROUP BY t.id, u_assignee.id
-        ORDER BY t.position ASC
+        WHERE true {archived_clause}
+        ORDER BY t.rank ASC
         """
 
         results = await self._db.fetch(query, column_id)
         return [self._row_to_task_summary(row) for row in results]
 
-    async def update_task(self, task_id: str, update_data: Dict[str, Any]) -> Optional[Task]:
-        """Update task information."""
-        set_clauses = []
+    def _task_set_clauses(
+        self,
+        update_data: Dict[str, Any],
+        param_index: int
+    ) -> Tuple[List[Tuple[str, str]], List[Any]]:
+        """Map updatable fields to ``(column, placeholder)`` pairs and their values."""
+        assignments = []
         values = []
-        param_index = 1
-
         for field, value in update_data.items():
-            if field in ['title', 'description', 'priority', 'story_points', 'due_date',
-                        'start_date', 'assigned_to', 'is_archived']:
-                set_clauses.append(f"{field} = ${param_index}")
+            if field in _TASK_UPDATE_FIELDS:
                 values.append(value)
-                param_index += 1
-            elif field in ['labels', 'custom_fields']:
-                set_clauses.append(f"{field} = ${param_index}")
+            elif field in _TASK_JSON_FIELDS:
                 values.append(json.dumps(value))
-                param_index += 1
+            else:
+                continue
+            assignments.append((field, f"${param_index}"))
+            param_index += 1
+        return assignments, values
 
-        if not set_clauses:
+    async def update_task(self, task_id: str, update_data: Dict[str, Any]) -> Optional[Task]:
+        """Update task information."""
+        assignments, values = self._task_set_clauses(update_data, 1)
+        if not assignments:
             return await self.get_task_by_id(task_id)
+        set_clauses = [f"{field} = {placeholder}" for field, placeholder in assignments]
+        param_index = len(values) + 1
 
         # Handle completion
         if 'completed_at' in update_data:
@@ -420,89 +637,226 @@ class TasksRepository:
         param_index += 1
 
         query = f"""
-        UPDATE kanban_cards
+        UPDATE kanban_cards t
         SET {', '.join(set_clauses)}
-        WHERE id = ${param_index}
-        RETURNING *
+        WHERE t.id = ${param_index}
+        RETURNING t.*, {_CARD_POSITION_SQL} as position
         """
         values.append(task_id)
 
         result = await self._db.fetchrow(query, *values)
         return self._row_to_task(result) if result else None
 
-    async def move_task(self, task_id: str, target_column_id: str, new_position: int) -> bool:
-        """Move a task to a different column and position."""
-        async with self._db.transaction():
-            # Get current task info
-            current = await self._db.fetchrow(
-                "SELECT column_id, position FROM kanban_cards WHERE id = $1",
-                task_id
-            )
+    async def update_task_with_activity(
+        self,
+        task_id: str,
+        update_data: Dict[str, Any],
+        user_id: str,
+        board_id: str,
+        updated_at: Optional[datetime] = None
+    ) -> Optional[Tuple[Task, Dict[str, Dict[str, Any]]]]:
+        """
+        Update a task and log a ``task_updated`` activity in one statement.
 
-            if not current:
-                return False
+        The card row is locked and read before the update, so the diff is
+        taken against the values the update actually replaced. Fields whose
+        value does not change are left alone; when nothing changes the card
+        is not written and no activity is logged.
 
-            current_column_id = current['column_id']
-            current_position = current['position']
-
-            # If moving to same column, just update position
-            if current_column_id == target_column_id:
-                if new_position > current_position:
-                    # Move tasks down to make space
-                    await self._db.execute(
-                        "UPDATE kanban_cards SET position = position - 1 WHERE column_id = $1 AND position > $2 AND position <= $3",
-                        current_column_id, current_position, new_position
-                    )
-                else:
-                    # Move tasks up to make space
-                    await self._db.execute(
-                        "UPDATE kanban_cards SET position = position + 1 WHERE column_id = $1 AND position >= $2 AND position < $3",
-                        current_column_id, new_position, current_position
-                    )
-            else:
-                # Moving to different column
-                # Shift tasks in old column to fill gap
-                await self._db.execute(
-                    "UPDATE kanban_cards SET position = position - 1 WHERE column_id = $1 AND position > $2",
-                    current_column_id, current_position
-                )
+        ``updated_at`` stamps both the card and the activity; callers that
+        queue other activities pass one from the same ordered source.
 
-                # Make space in new column
-                await self._db.execute(
-                    "UPDATE kanban_cards SET position = position + 1 WHERE column_id = $1 AND position >= $2",
-                    target_column_id, new_position
-                )
+        Returns the task with a ``{field: {"old": ..., "new": ...}}`` diff of
+        JSON values, or None if the task does not exist.
+        """
+        assignments, values = self._task_set_clauses(update_data, 1)
+        if not assignments:
+            task = await self.get_task_by_id(task_id)
+            return (task, {}) if task else None
 
-            # Move the task
-            await self._db.execute(
-                "UPDATE kanban_cards SET column_id = $1, position = $2, updated_at = $3 WHERE id = $4",
-                target_column_id, new_position, datetime.utcnow(), task_id
+        param_index = len(values) + 1
+        now_param, id_param, fields_param = param_index, param_index + 1, param_index + 2
+        activity_param, board_param, user_param = param_index + 3, param_index + 4, param_index + 5
+        set_clauses = ", ".join(f"{field} = {placeholder}" for field, placeholder in assignments)
+        changed = " OR ".join(f"t.{field} IS DISTINCT FROM {placeholder}" for field, placeholder in assignments)
+
+        query = f"""
+        WITH old AS (
+            SELECT * FROM kanban_cards WHERE id = ${id_param} FOR UPDATE
+        ), updated AS (
+            UPDATE kanban_cards t
+            SET {set_clauses}, updated_at = ${now_param}::timestamptz
+            FROM old
+            WHERE t.id = old.id AND ({changed})
+            RETURNING t.*
+        ), diff AS (
+            SELECT COALESCE(
+                       jsonb_object_agg(n.key, jsonb_build_object('old', o.value, 'new', n.value)),
+                       '{{}}'::jsonb
+                   ) AS changes
+            FROM old, updated, jsonb_each(to_jsonb(updated)) n, jsonb_each(to_jsonb(old)) o
+            WHERE n.key = ANY(${fields_param}::text[])
+              AND o.key = n.key
+              AND o.value IS DISTINCT FROM n.value
+        ), logged AS (
+            INSERT INTO task_activities (
+                id, task_id, board_id, user_id, activity_type,
+                description, metadata, created_at
             )
+            SELECT ${activity_param}::uuid, updated.id, ${board_param}::uuid, ${user_param}::uuid,
+                   '{ActivityType.TASK_UPDATED.value}',
+                   format('Updated task ''%s''', updated.title),
+                   jsonb_build_object(
+                       'task_title', updated.title,
+                       'changes', (SELECT jsonb_agg(key ORDER BY key) FROM jsonb_object_keys(diff.changes) key),
+                       'old_values', (SELECT jsonb_object_agg(key, value -> 'old') FROM jsonb_each(diff.changes))
+                   ),
+                   ${now_param}::timestamptz
+            FROM updated, diff
+            WHERE diff.changes <> '{{}}'::jsonb
+        )
+        SELECT t.*, {_CARD_POSITION_SQL} as position, (SELECT changes FROM diff) as changes
+        FROM (
+            SELECT * FROM updated
+            UNION ALL
+            SELECT * FROM old WHERE NOT EXISTS (SELECT 1 FROM updated)
+        ) t
+        """
+        values.extend([
+            updated_at or datetime.utcnow(),
+            task_id,
+            [field for field, _ in assignments],
+            str(uuid.uuid4()),
+            board_id,
+            user_id
+        ])
 
-        return True
+        result = await self._db.fetchrow(query, *values)
+        if not result:
+            return None
+        changes = result['changes']
+        if isinstance(changes, str):
+            changes = json.loads(changes)
+        return self._row_to_task(result), changes or {}
+
+    async def move_task(self, task_id: str, target_column_id: str, new_position: int) -> bool:
+        """
+        Move a task to a different column and position.
+
+        ``new_position`` is the card's index among the other cards of the
+        target column. Only the moved card is written: it receives a rank key
+        between its new neighbours.
+
+        The target column's WIP limit is checked in the moving statement
+        while its row is locked, so concurrent moves cannot overfill it.
+        Reordering within a column and moving archived cards always succeed.
+
+        Raises:
+            WipLimitExceededError: If the target column is full.
+        """
+        async def allocate() -> str:
+            before, after = await self._rank_neighbours(target_column_id, new_position, exclude_task_id=task_id)
+            return key_between(before, after)
+
+        # Source and target rows are locked in id order, matching the card count trigger
+        query = """
+        WITH locked AS (
+            SELECT c.id, c.wip_limit, c.card_count
+            FROM kanban_columns c
+            WHERE c.id = $1 OR c.id = (SELECT column_id FROM kanban_cards WHERE id = $4)
+            ORDER BY c.id
+            FOR UPDATE
+        ), card AS (
+            SELECT id, column_id, is_archived FROM kanban_cards WHERE id = $4
+        ), slot AS (
+            SELECT l.wip_limit, l.card_count
+            FROM locked l, card
+            WHERE l.id = $1
+              AND (l.wip_limit IS NULL OR l.card_count < l.wip_limit
+                   OR card.column_id = $1 OR COALESCE(card.is_archived, false))
+        ), moved AS (
+            UPDATE kanban_cards t
+            SET column_id = $1, rank = $2, updated_at = $3
+            FROM slot
+            WHERE t.id = $4
+            RETURNING t.id
+        )
+        SELECT EXISTS (SELECT 1 FROM moved) as moved,
+               EXISTS (SELECT 1 FROM card) AND NOT EXISTS (SELECT 1 FROM slot) as is_full,
+               (SELECT wip_limit FROM locked WHERE id = $1) as wip_limit,
+               (SELECT card_count FROM locked WHERE id = $1) as card_count
+        """
+
+        async def write(rank: str):
+            return await self._db.fetchrow(query, target_column_id, rank, datetime.utcnow(), task_id)
+
+        result = await self._write_with_rank(allocate, write)
+        if result['is_full'] and result['wip_limit'] is not None:
+            raise WipLimitExceededError(
+                target_column_id, result['wip_limit'], result['wip_limit'] - result['card_count']
+            )
+        return bool(result['moved'])
 
     async def bulk_move_tasks(self, task_ids: List[str], target_column_id: str) -> int:
-        """Move multiple tasks to a column."""
+        """
+        Move multiple tasks to the end of a column, keeping the given order.
+
+        The batch moves only if every card arriving from another column fits
+        under the target's WIP limit; the check and the move share one
+        statement holding the column row locks.
+
+        Raises:
+            WipLimitExceededError: If the batch does not fit in the target column.
+        """
         if not task_ids:
             return 0
 
-        async with self._db.transaction():
-            # Get next position in target column
-            max_position = await self._db.fetchval(
-                "SELECT COALESCE(MAX(position), 0) FROM kanban_cards WHERE column_id = $1",
-                target_column_id
-            ) or 0
-
-            # Move all tasks
-            position = max_position + 1
-            for task_id in task_ids:
-                await self._db.execute(
-                    "UPDATE kanban_cards SET column_id = $1, position = $2, updated_at = $3 WHERE id = $4",
-                    target_column_id, position, datetime.utcnow(), task_id
-                )
-                position += 1
+        async def allocate() -> List[str]:
+            return keys_after(await self._last_rank(target_column_id), len(task_ids))
 
-        return len(task_ids)
+        # One statement for the whole batch; a task listed twice keeps its first slot
+        query = """
+        WITH locked AS (
+            SELECT c.id, c.wip_limit, c.card_count
+            FROM kanban_columns c
+            WHERE c.id = $1 OR c.id IN (SELECT column_id FROM kanban_cards WHERE id = ANY($2::uuid[]))
+            ORDER BY c.id
+            FOR UPDATE
+        ), moving AS (
+            SELECT DISTINCT ON (id) id, rank
+            FROM unnest($2::uuid[], $3::text[]) WITH ORDINALITY AS m(id, rank, ordinality)
+            ORDER BY id, ordinality
+        ), room AS (
+            SELECT l.wip_limit, l.card_count,
+                   l.wip_limit IS NULL OR l.card_count + (
+                       SELECT COUNT(*)
+                       FROM kanban_cards t
+                       JOIN moving ON t.id = moving.id
+                       WHERE t.column_id <> $1 AND NOT COALESCE(t.is_archived, false)
+                   ) <= l.wip_limit as fits
+            FROM locked l
+            WHERE l.id = $1
+        ), moved AS (
+            UPDATE kanban_cards t
+            SET column_id = $1, rank = moving.rank, updated_at = NOW()
+            FROM moving, room
+            WHERE t.id = moving.id AND room.fits
+            RETURNING t.id
+        )
+        SELECT (SELECT COUNT(*) FROM moved)::integer as moved, room.fits, room.wip_limit, room.card_count
+        FROM (SELECT 1) one
+        LEFT JOIN room ON true
+        """
+
+        async def write(ranks: List[str]):
+            return await self._db.fetchrow(query, target_column_id, task_ids, ranks)
+
+        result = await self._write_with_rank(allocate, write)
+        if result['fits'] is False:
+            raise WipLimitExceededError(
+                target_column_id, result['wip_limit'], result['wip_limit'] - result['card_count']
+            )
+        return result['moved']
 
     async def bulk_assign_tasks(self, task_ids: List[str], user_id: Optional[str]) -> int:
         """Assign or unassign multiple tasks to a user."""
@@ -510,11 +864,11 @@ class TasksRepository:
             return 0
 
         result = await self._db.execute(
-            "UPDATE kanban_cards SET assigned_to = $1, updated_at = $2 WHERE id = ANY($3)",
-            user_id, datetime.utcnow(), task_ids
+            "UPDATE kanban_cards SET assigned_to = $1, updated_at = NOW() WHERE id = ANY($2::uuid[])",
+            user_id, task_ids
         )
 
-        return result.split()[1] if result else 0  # Extract number of affected rows
+        return _affected_rows(result)
 
     async def delete_task(self, task_id: str) -> bool:
         """Delete a task and all associated data."""
@@ -523,17 +877,9 @@ class TasksRepository:
             await self._db.execute("DELETE FROM task_comments WHERE task_id = $1", task_id)
             await self._db.execute("DELETE FROM task_attachments WHERE task_id = $1", task_id)
 
-            # Delete the task
+            # Delete the task; rank keys leave no gap to close
             result = await self._db.execute("DELETE FROM kanban_cards WHERE id = $1", task_id)
 
-            # Reposition remaining tasks in the column
-            await self._db.execute("""
-                UPDATE kanban_cards
-                SET position = position - 1
-                WHERE column_id = (SELECT column_id FROM kanban_cards WHERE id = $1)
-                AND position > (SELECT position FROM kanban_cards WHERE id = $1)
-            """, task_id)
-
         return True
 
     async def search_tasks(
@@ -550,16 +896,42 @@ class TasksRepository:
         is_archived: Optional[bool] = None,
         limit: int = 20,
         offset: int = 0,
-        sort_by: str = "updated_at",
-        sort_order: str = "desc"
-    ) -> Tuple[List[TaskSummary], int]:
-        """Search tasks with various filters."""
+        sort_by: Optional[str] = None,
+        sort_order: str = "desc",
+        organization_id: Optional[str] = None,
+        division_id: Optional[str] = None,
+        fuzzy: bool = False,
+        cursor: Optional[str] = None,
+        total: Optional[TotalMode] = None
+    ) -> ListPage[TaskSummary]:
+        """
+        Search tasks with various filters.
+
+        ``query`` matches the card's weighted ``search_vector`` (title, labels,
+        description) with every word treated as a prefix. With ``fuzzy`` set,
+        titles that are trigram-similar to the query also match, catching typos.
+        Results default to relevance order when a query is given.
+
+        Pages continue from ``cursor`` on the ``(sort key, id)`` keyset;
+        ``offset`` is honoured only without one. The total is computed only
+        when ``total`` asks for it.
+        """
 
         # Build WHERE clause
         where_conditions = []
         params = []
         param_index = 1
 
+        if organization_id:
+            where_conditions.append(f"b.organization_id = ${param_index}")
+            params.append(organization_id)
+            param_index += 1
+
+        if division_id:
+            where_conditions.append(f"b.division_id = ${param_index}")
+            params.append(division_id)
+            param_index += 1
+
         if board_id:
             where_conditions.append(f"c.board_id = ${param_index}")
             params.append(board_id)
@@ -570,10 +942,25 @@ class TasksRepository:
             params.append(column_id)
             param_index += 1
 
+        relevance_sql = None
         if query:
-            where_conditions.append(f"(t.title ILIKE ${param_index} OR t.description ILIKE ${param_index})")
-            params.append(f"%{query}%")
-            param_index += 1
+            matches = []
+            scores = []
+            tsquery = _prefix_tsquery(query)
+            if tsquery:
+                ts_match = f"to_tsquery('english', ${param_index})"
+                matches.append(f"t.search_vector @@ {ts_match}")
+                scores.append(f"ts_rank_cd(t.search_vector, {ts_match})")
+                params.append(tsquery)
+                param_index += 1
+            if fuzzy:
+                matches.append(f"${param_index} <% t.title")
+                scores.append(f"word_similarity(${param_index}, t.title)")
+                params.append(query)
+                param_index += 1
+            where_conditions.append(f"({' OR '.join(matches)})" if matches else "false")
+            if scores:
+                relevance_sql = scores[0] if len(scores) == 1 else f"GREATEST({', '.join(scores)})"
 
         if status:
             where_conditions.append(f"t.status = ${param_index}")
@@ -591,7 +978,7 @@ class TasksRepository:
             param_index += 1
 
         if labels:
-            where_conditions.append(f"t.labels && ${param_index}")
+            where_conditions.append(f"t.labels ?| ${param_index}::text[]")
             params.append(labels)
             param_index += 1
 
@@ -611,48 +998,182 @@ class TasksRepository:
             param_index += 1
 
         where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
-
-        # Validate sort field
-        valid_sort_fields = ["created_at", "updated_at", "due_date", "priority", "title", "position"]
-        if sort_by not in valid_sort_fields:
-            sort_by = "updated_at"
-
-        # Build ORDER BY
-        order_clause = f"ORDER BY t.{sort_by} {sort_order.upper()}"
-
-        # Count query
-        count_query = f"""
-        SELECT COUNT(*)
+        scope_join = "JOIN kanban_boards b ON c.board_id = b.id" if organization_id or division_id else ""
+        from_clause = f"""
         FROM kanban_cards t
         JOIN kanban_columns c ON t.column_id = c.id
+        {scope_join}
         {where_clause}
         """
-        total_count = await self._db.fetchval(count_query, *params)
+        total_count = await self._page_total(total, from_clause, params)
 
-        # Data query
+        # Validate sort field
+        valid_sort_fields = ["created_at", "updated_at", "due_date", "priority", "title", "position", "relevance"]
+        if sort_by is None:
+            sort_by = "relevance" if relevance_sql else "updated_at"
+        if sort_by not in valid_sort_fields or (sort_by == "relevance" and not relevance_sql):
+            sort_by = "updated_at"
+
+        # Relevance always ranks best first; the id breaks ties so keyset pages are stable
+        if sort_by == "relevance":
+            sort_keys, parse_cursor = ((relevance_sql, "float8"),), lambda value: (float(value),)
+            sort_order = "desc"
+        else:
+            sort_keys, parse_cursor = _SEARCH_SORT_KEYS.get(sort_by, (None, None))
+        descending = sort_order.lower() == "desc"
+        direction = "DESC" if descending else "ASC"
+
+        keyset_clause = ""
+        if cursor and sort_keys:
+            position = KeysetCursor.decode(cursor, parse=parse_cursor)
+            placeholders = []
+            for (_, sql_type), value in zip(sort_keys, position.sort_value):
+                placeholders.append(f"${param_index}::{sql_type}")
+                params.append(value)
+                param_index += 1
+            placeholders.append(f"${param_index}::uuid")
+            params.append(position.id)
+            param_index += 1
+            key_columns = ", ".join(expression for expression, _ in sort_keys)
+            keyset_clause = (
+                f"{'AND' if where_clause else 'WHERE'} ({key_columns}, t.id) "
+                f"{'<' if descending else '>'} ({', '.join(placeholders)})"
+            )
+            offset = 0
+
+        # Build ORDER BY; card order within a column is its rank
+        if sort_keys:
+            order_clause = "ORDER BY " + ", ".join(
+                f"{expression} {direction}" for expression, _ in sort_keys
+            ) + f", t.id {direction}"
+            sort_key_select = "".join(
+                f", {expression} AS sort_key_{index}" for index, (expression, _) in enumerate(sort_keys)
+            )
+        else:
+            order_clause = f"ORDER BY t.{sort_by} {direction}, t.id {direction}"
+            sort_key_select = ""
+
+        # Data query; one extra row tells us whether another page exists
         data_query = f"""
-        SELECT t.id, t.title, t.priority, t.position, t.due_date, t.assigned_to,
-               t.labels, t.is_archived, t.updated_at,
+        SELECT t.id, t.column_id, t.title, t.priority, {_CARD_POSITION_SQL} as position, t.due_date, t.assigned_to,
+               t.labels, t.is_archived, t.updated_at, t.comment_count, t.attachment_count,
                u_assignee.name as assignee_name, u_assignee.email as assignee_email,
-               COUNT(tc.id) as comment_count,
-               COUNT(ta.id) as attachment_count,
                CASE WHEN t.due_date < NOW() AND t.completed_at IS NULL THEN true ELSE false END as is_overdue
+               {sort_key_select}
         FROM kanban_cards t
         JOIN kanban_columns c ON t.column_id = c.id
+        {scope_join}
         LEFT JOIN users u_assignee ON t.assigned_to = u_assignee.id
-        LEFT JOIN task_comments tc ON t.id = tc.task_id
-        LEFT JOIN task_attachments ta ON t.id = ta.task_id
         {where_clause}
-        GROUP BY t.id, u_assignee.id
+        {keyset_clause}
         {order_clause}
         LIMIT ${param_index} OFFSET ${param_index + 1}
         """
-        params.extend([limit, offset])
+        params.extend([limit + 1, offset])
 
         results = await self._db.fetch(data_query, *params)
+        has_more = len(results) > limit
+        results = results[:limit]
         tasks = [self._row_to_task_summary(row) for row in results]
 
-        return tasks, total_count
+        next_cursor = None
+        if has_more and sort_keys:
+            last = results[-1]
+            values = [_cursor_value(last[f"sort_key_{index}"]) for index in range(len(sort_keys))]
+            next_cursor = KeysetCursor(
+                sort_value=values[0] if len(values) == 1 else values,
+                id=str(last["id"])
+            ).encode()
+
+        return ListPage(items=tasks, next_cursor=next_cursor, has_more=has_more, total=total_count)
+
+    # ==================== RANK MAINTENANCE ====================
+
+    async def _last_rank(self, column_id: str) -> Optional[str]:
+        return await self._db.fetchval(
+            "SELECT rank FROM kanban_cards WHERE column_id = $1 ORDER BY rank DESC LIMIT 1",
+            column_id
+        )
+
+    async def _rank_neighbours(
+        self,
+        column_id: str,
+        position: Optional[int],
+        exclude_task_id: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Return the ranks around ``position`` in a column (``None`` appends)."""
+        if position is None:
+            return await self._last_rank(column_id), None
+
+        if position <= 0:
+            first = await self._db.fetchval(
+                "SELECT rank FROM kanban_cards WHERE column_id = $1 AND id IS DISTINCT FROM $2 ORDER BY rank LIMIT 1",
+                column_id, exclude_task_id
+            )
+            return None, first
+
+        rows = await self._db.fetch(
+            "SELECT rank FROM kanban_cards WHERE column_id = $1 AND id IS DISTINCT FROM $2 ORDER BY rank OFFSET $3 LIMIT 2",
+            column_id, exclude_task_id, position - 1
+        )
+        if not rows:
+            # Past the end of the column
+            last = await self._db.fetchval(
+                "SELECT rank FROM kanban_cards WHERE column_id = $1 AND id IS DISTINCT FROM $2 ORDER BY rank DESC LIMIT 1",
+                column_id, exclude_task_id
+            )
+            return last, None
+        return rows[0]['rank'], rows[1]['rank'] if len(rows) > 1 else None
+
+    async def _reserve_column_slots(self, column_id: str, count: int) -> None:
+        """Lock a column row for the rest of the transaction and check its WIP limit."""
+        row = await self._db.fetchrow(
+            "SELECT wip_limit, card_count FROM kanban_columns WHERE id = $1 FOR UPDATE",
+            column_id
+        )
+        if row and row['wip_limit'] is not None and row['card_count'] + count > row['wip_limit']:
+            raise WipLimitExceededError(column_id, row['wip_limit'], row['wip_limit'] - row['card_count'])
+
+    async def _write_with_rank(self, allocate: Callable[[], Awaitable[Any]], write: Callable[[Any], Awaitable[Any]]) -> Any:
+        for attempt in range(_RANK_ATTEMPTS):
+            ranks = await allocate()
+            try:
+                async with self._db.transaction():
+                    return await write(ranks)
+            except UniqueViolationError:
+                if attempt == _RANK_ATTEMPTS - 1:
+                    raise
+
+    async def get_columns_needing_rebalance(self, limit: int = 50) -> List[str]:
+        """Get columns holding a rank key past the rebalance length."""
+        # The literal length lets the planner use the idx_kanban_cards_long_rank partial index
+        results = await self._db.fetch(
+            f"SELECT DISTINCT column_id FROM kanban_cards WHERE length(rank) > {REBALANCE_RANK_LENGTH} LIMIT $1",
+            limit
+        )
+        return [str(row['column_id']) for row in results]
+
+    async def rebalance_column(self, column_id: str) -> int:
+        """Respace every rank key in a column evenly, preserving order, in one statement."""
+        async with self._db.transaction():
+            task_ids = [
+                row['id'] for row in await self._db.fetch(
+                    "SELECT id FROM kanban_cards WHERE column_id = $1 ORDER BY rank FOR UPDATE",
+                    column_id
+                )
+            ]
+            if not task_ids:
+                return 0
+            status = await self._db.execute(
+                """
+                UPDATE kanban_cards t
+                SET rank = spaced.rank
+                FROM unnest($2::uuid[], $3::text[]) AS spaced(id, rank)
+                WHERE t.id = spaced.id AND t.column_id = $1
+                """,
+                column_id, task_ids, spaced_keys(len(task_ids))
+            )
+        return _affected_rows(status)
 
     # ==================== COMMENT OPERATIONS ====================
 
@@ -660,11 +1181,19 @@ class TasksRepository:
         """Create a new comment."""
         comment_id = comment_data.get('id', str(uuid.uuid4()))
 
+        # The card's comment_count is bumped in the same statement
         query = """
-        INSERT INTO task_comments (
-            id, task_id, author_id, content, parent_id, created_at, updated_at
-        ) VALUES ($1, $2, $3, $4, $5, $6, $7)
-        RETURNING *
+        WITH inserted AS (
+            INSERT INTO task_comments (
+                id, task_id, author_id, content, parent_id, created_at, updated_at
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7)
+            RETURNING *
+        ), bumped AS (
+            UPDATE kanban_cards
+            SET comment_count = comment_count + 1
+            WHERE id = (SELECT task_id FROM inserted)
+        )
+        SELECT * FROM inserted
         """
 
         result = await self._db.fetchrow(
@@ -680,22 +1209,36 @@ class TasksRepository:
 
         return self._row_to_comment(result)
 
-    async def get_comments_for_task(self, task_id: str, limit: int = 50, offset: int = 0) -> List[Comment]:
-        """Get comments for a task, ordered by creation date."""
-        query = """
-        SELECT c.*,
-               u.name as author_name, u.email as author_email,
-               c.created_at = c.updated_at as not_edited,
-               CASE WHEN c.created_at != c.updated_at THEN c.updated_at ELSE NULL END as edited_at
-        FROM task_comments c
-        LEFT JOIN users u ON c.author_id = u.id
-        WHERE c.task_id = $1
-        ORDER BY c.created_at ASC
-        LIMIT $2 OFFSET $3
-        """
-
-        results = await self._db.fetch(query, task_id, limit, offset)
-        return [self._row_to_comment(row) for row in results]
+    async def get_comments_for_task(
+        self,
+        task_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        total: Optional[TotalMode] = None
+    ) -> ListPage[Comment]:
+        """Get comments for a task, oldest first."""
+        return await self._page_by_created_at(
+            """
+            SELECT c.*,
+                   u.name as author_name, u.email as author_email,
+                   c.created_at = c.updated_at as not_edited,
+                   CASE WHEN c.created_at != c.updated_at THEN c.updated_at ELSE NULL END as edited_at
+            """,
+            """
+            FROM task_comments c
+            LEFT JOIN users u ON c.author_id = u.id
+            WHERE c.task_id = $1
+            """,
+            [task_id],
+            "c",
+            self._row_to_comment,
+            descending=False,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            total=total
+        )
 
     async def update_comment(self, comment_id: str, content: str) -> Optional[Comment]:
         """Update a comment."""
@@ -710,9 +1253,31 @@ class TasksRepository:
         return self._row_to_comment(result) if result else None
 
     async def delete_comment(self, comment_id: str) -> bool:
-        """Delete a comment."""
-        result = await self._db.execute("DELETE FROM task_comments WHERE id = $1", comment_id)
-        return True
+        """Delete a comment and its replies, keeping the card's comment_count in step."""
+        # Replies cascade with their parent, so the whole thread is deleted
+        # explicitly to know how many comments the card loses.
+        query = """
+        WITH RECURSIVE thread AS (
+            SELECT id FROM task_comments WHERE id = $1
+            UNION ALL
+            SELECT reply.id
+            FROM task_comments reply
+            JOIN thread ON reply.parent_id = thread.id
+        ), removed AS (
+            DELETE FROM task_comments
+            WHERE id IN (SELECT id FROM thread)
+            RETURNING task_id
+        ), bumped AS (
+            UPDATE kanban_cards t
+            SET comment_count = GREATEST(t.comment_count - r.total, 0)
+            FROM (SELECT task_id, COUNT(*) AS total FROM removed GROUP BY task_id) r
+            WHERE t.id = r.task_id
+        )
+        SELECT COUNT(*) FROM removed
+        """
+
+        removed = await self._db.fetchval(query, comment_id)
+        return bool(removed)
 
     # ==================== ATTACHMENT OPERATIONS ====================
 
@@ -720,12 +1285,20 @@ class TasksRepository:
         """Create a new attachment record."""
         attachment_id = attachment_data.get('id', str(uuid.uuid4()))
 
+        # The card's attachment_count is bumped in the same statement
         query = """
-        INSERT INTO task_attachments (
-            id, task_id, uploaded_by, filename, storage_path,
-            content_type, size_bytes, description, created_at
-        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-        RETURNING *
+        WITH inserted AS (
+            INSERT INTO task_attachments (
+                id, task_id, uploaded_by, filename, storage_path,
+                content_type, size_bytes, description, created_at
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+            RETURNING *
+        ), bumped AS (
+            UPDATE kanban_cards
+            SET attachment_count = attachment_count + 1
+            WHERE id = (SELECT task_id FROM inserted)
+        )
+        SELECT * FROM inserted
         """
 
         result = await self._db.fetchrow(
@@ -757,9 +1330,61 @@ class TasksRepository:
         return [self._row_to_attachment(row) for row in results]
 
     async def delete_attachment(self, attachment_id: str) -> bool:
-        """Delete an attachment."""
-        result = await self._db.execute("DELETE FROM task_attachments WHERE id = $1", attachment_id)
-        return True
+        """Delete an attachment, keeping the card's attachment_count in step."""
+        query = """
+        WITH removed AS (
+            DELETE FROM task_attachments
+            WHERE id = $1
+            RETURNING task_id
+        ), bumped AS (
+            UPDATE kanban_cards
+            SET attachment_count = GREATEST(attachment_count - 1, 0)
+            WHERE id = (SELECT task_id FROM removed)
+        )
+        SELECT COUNT(*) FROM removed
+        """
+
+        removed = await self._db.fetchval(query, attachment_id)
+        return bool(removed)
+
+    # ==================== COUNTER MAINTENANCE ====================
+
+    async def recompute_card_counters(self, after_id: Optional[str] = None, batch_size: int = 500) -> Tuple[Optional[str], int]:
+        """
+        Recompute comment and attachment counts for one batch of cards.
+
+        Cards are visited in id order after ``after_id``; only cards whose
+        stored counts drifted are rewritten. Returns the last card id visited
+        (``None`` once the sweep is complete) and the number of cards repaired.
+        """
+        query = """
+        WITH batch AS (
+            SELECT t.id,
+                   (SELECT COUNT(*) FROM task_comments tc WHERE tc.task_id = t.id)::integer AS comment_count,
+                   (SELECT COUNT(*) FROM task_attachments ta WHERE ta.task_id = t.id)::integer AS attachment_count
+            FROM kanban_cards t
+            WHERE $1::uuid IS NULL OR t.id > $1::uuid
+            ORDER BY t.id
+            LIMIT $2
+        ), repaired AS (
+            UPDATE kanban_cards t
+            SET comment_count = b.comment_count,
+                attachment_count = b.attachment_count
+            FROM batch b
+            WHERE t.id = b.id
+              AND (t.comment_count, t.attachment_count) IS DISTINCT FROM (b.comment_count, b.attachment_count)
+            RETURNING t.id
+        )
+        SELECT (SELECT id FROM batch ORDER BY id DESC LIMIT 1) AS last_id,
+               (SELECT COUNT(*) FROM batch) AS visited,
+               (SELECT COUNT(*) FROM repaired) AS repaired
+        """
+
+        row = await self._db.fetchrow(query, after_id, batch_size)
+        if not row or not row['visited']:
+            return None, 0
+        last_id = str(row['last_id']) if row['visited'] >= batch_size else None
+        return last_id, row['repaired']
 
     # ==================== ACTIVITY LOGGING ====================
 
@@ -789,33 +1414,96 @@ class TasksRepository:
 
         return self._row_to_activity(result)
 
-    async def get_activities_for_task(self, task_id: str, limit: int = 50, offset: int = 0) -> List[ActivityEntry]:
-        """Get activity log for a task."""
-        query = """
-        SELECT a.*, u.name as user_name, u.email as user_email
-        FROM task_activities a
-        LEFT JOIN users u ON a.user_id = u.id
-        WHERE a.task_id = $1
-        ORDER BY a.created_at DESC
-        LIMIT $2 OFFSET $3
+    async def create_activities(self, activities: List[Dict[str, Any]]) -> int:
         """
+        Insert a batch of activity entries in one statement.
 
-        results = await self._db.fetch(query, task_id, limit, offset)
-        return [self._row_to_activity(row) for row in results]
+        Entries whose card or board was deleted after they were queued are
+        skipped, as the cascade would have removed them. Returns how many
+        rows were written.
+        """
+        if not activities:
+            return 0
 
-    async def get_activities_for_board(self, board_id: str, limit: int = 50, offset: int = 0) -> List[ActivityEntry]:
-        """Get activity log for a board."""
         query = """
-        SELECT a.*, u.name as user_name, u.email as user_email
-        FROM task_activities a
-        LEFT JOIN users u ON a.user_id = u.id
-        WHERE a.board_id = $1
-        ORDER BY a.created_at DESC
-        LIMIT $2 OFFSET $3
+        INSERT INTO task_activities (
+            id, task_id, board_id, user_id, activity_type,
+            description, metadata, created_at
+        )
+        SELECT a.id, a.task_id, a.board_id, a.user_id, a.activity_type,
+               a.description, a.metadata, a.created_at
+        FROM unnest(
+            $1::uuid[], $2::uuid[], $3::uuid[], $4::uuid[],
+            $5::text[], $6::text[], $7::jsonb[], $8::timestamptz[]
+        ) AS a(id, task_id, board_id, user_id, activity_type, description, metadata, created_at)
+        WHERE (a.task_id IS NULL OR EXISTS (SELECT 1 FROM kanban_cards t WHERE t.id = a.task_id))
+          AND (a.board_id IS NULL OR EXISTS (SELECT 1 FROM kanban_boards b WHERE b.id = a.board_id))
         """
 
-        results = await self._db.fetch(query, board_id, limit, offset)
-        return [self._row_to_activity(row) for row in results]
+        status = await self._db.execute(
+            query,
+            [activity.get('id', str(uuid.uuid4())) for activity in activities],
+            [activity.get('task_id') for activity in activities],
+            [activity.get('board_id') for activity in activities],
+            [activity['user_id'] for activity in activities],
+            [activity['activity_type'] for activity in activities],
+            [activity['description'] for activity in activities],
+            [json.dumps(activity.get('metadata', {})) for activity in activities],
+            [activity['created_at'] for activity in activities]
+        )
+        return _affected_rows(status)
+
+    async def get_activities_for_task(
+        self,
+        task_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        total: Optional[TotalMode] = None
+    ) -> ListPage[ActivityEntry]:
+        """Get activity log for a task, newest first."""
+        return await self._page_by_created_at(
+            "SELECT a.*, u.name as user_name, u.email as user_email",
+            """
+            FROM task_activities a
+            LEFT JOIN users u ON a.user_id = u.id
+            WHERE a.task_id = $1
+            """,
+            [task_id],
+            "a",
+            self._row_to_activity,
+            descending=True,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            total=total
+        )
+
+    async def get_activities_for_board(
+        self,
+        board_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        total: Optional[TotalMode] = None
+    ) -> ListPage[ActivityEntry]:
+        """Get activity log for a board, newest first."""
+        return await self._page_by_created_at(
+            "SELECT a.*, u.name as user_name, u.email as user_email",
+            """
+            FROM task_activities a
+            LEFT JOIN users u ON a.user_id = u.id
+            WHERE a.board_id = $1
+            """,
+            [board_id],
+            "a",
+            self._row_to_activity,
+            descending=True,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            total=total
+        )
 
     # ==================== STATISTICS ====================
 
@@ -864,6 +1552,84 @@ class TasksRepository:
 
     # ==================== HELPER METHODS ====================
 
+    async def _page_total(
+        self,
+        mode: Optional[TotalMode],
+        from_clause: str,
+        params: List[Any]
+    ) -> Optional[int]:
+        """Count the rows of ``from_clause`` (``FROM ... WHERE ...``) when asked to.
+
+        ``ESTIMATE`` reads the planner's row estimate instead of counting, so it
+        costs one plan rather than a scan but is only as fresh as the table
+        statistics.
+        """
+        if mode is None:
+            return None
+        if mode == TotalMode.ESTIMATE:
+            plan = await self._db.fetchval(f"EXPLAIN (FORMAT JSON) SELECT 1 {from_clause}", *params)
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+        return await self._db.fetchval(f"SELECT COUNT(*) {from_clause}", *params)
+
+    async def _page_by_created_at(
+        self,
+        select_clause: str,
+        from_clause: str,
+        params: List[Any],
+        alias: str,
+        convert: Callable[[Any], T],
+        *,
+        descending: bool,
+        limit: int,
+        offset: int,
+        cursor: Optional[str],
+        total: Optional[TotalMode]
+    ) -> ListPage[T]:
+        """Page ``from_clause`` on the ``(created_at, id)`` keyset of table ``alias``.
+
+        ``from_clause`` must end in a WHERE clause. ``offset`` is honoured only
+        when no cursor is given.
+        """
+        total_count = await self._page_total(total, from_clause, params)
+
+        params = list(params)
+        keyset_clause = ""
+        if cursor:
+            position = KeysetCursor.decode(cursor)
+            keyset_clause = (
+                f"AND ({alias}.created_at, {alias}.id) {'<' if descending else '>'} "
+                f"(${len(params) + 1}::timestamptz, ${len(params) + 2}::uuid)"
+            )
+            params.extend([position.sort_value, position.id])
+            offset = 0
+
+        direction = "DESC" if descending else "ASC"
+        query = f"""
+        {select_clause}
+        {from_clause}
+        {keyset_clause}
+        ORDER BY {alias}.created_at {direction}, {alias}.id {direction}
+        LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
+        """
+        # One extra row tells us whether another page exists
+        rows = await self._db.fetch(query, *params, limit + 1, offset)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        next_cursor = (
+            KeysetCursor(sort_value=rows[-1]["created_at"], id=str(rows[-1]["id"])).encode()
+            if has_more
+            else None
+        )
+        return ListPage(
+            items=[convert(row) for row in rows],
+            next_cursor=next_cursor,
+            has_more=has_more,
+            total=total_count
+        )
+
     def _row_to_board(self, row) -> Board:
         """Convert database row to Board object."""
         if not row:
@@ -947,6 +1713,7 @@ class TasksRepository:
             return None
         return TaskSummary(
             id=row['id'],
+            column_id=str(row['column_id']) if row.get('column_id') else None,
             title=row['title'],
             priority=row['priority'],
             position=row['position'],
@@ -25,18 +25,22 @@ API Groups:
 - Search and filtering capabilities
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from contextlib import asynccontextmanager
+
+from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException, Response, status, Query
 from typing import Optional, List
 
 from ...core.scope_integration import require_organization_access_with_id, require_division_access_with_ids
 from ...dependencies import CurrentPrincipal, require_current_principal
 from ...core.scope import ScopeContext
 from ...core.errors import APIError
+from .activity import get_activity_sink
 from .di import get_tasks_service
+from .jobs import CardCounterRepairScheduler, RankRebalanceScheduler
 from .schemas import (
     # Board schemas
     BoardCreate, BoardUpdate, BoardResponse, BoardListResponse, BoardStats, BoardPermissions,
-    BoardSearchRequest,
+    BoardSearchRequest, BoardSnapshot,
 
     # Column schemas
     ColumnCreate, ColumnUpdate, ColumnResponse, ColumnListResponse,
@@ -55,11 +59,51 @@ from .schemas import (
     BulkTaskMove, BulkTaskAssign, BulkOperationResponse,
 
     # Base models
-    TaskPriority, TaskStatus, ColumnType
+    TaskPriority, TaskStatus, ColumnType, TotalMode
 )
 from .service import TasksService
 
-router = APIRouter(prefix="/api", tags=["tasks", "kanban", "boards"])
+_COUNTER_REPAIR_SCHEDULER = CardCounterRepairScheduler()
+_RANK_REBALANCE_SCHEDULER = RankRebalanceScheduler()
+
+
+@asynccontextmanager
+async def _tasks_lifespan(_app: FastAPI):
+    """Run the card maintenance schedulers and the activity sink for the app's lifetime."""
+
+    activity_sink = get_activity_sink()
+    activity_sink.start()
+    _COUNTER_REPAIR_SCHEDULER.start()
+    _RANK_REBALANCE_SCHEDULER.start()
+    try:
+        yield
+    finally:
+        await _RANK_REBALANCE_SCHEDULER.shutdown()
+        await _COUNTER_REPAIR_SCHEDULER.shutdown()
+        # Last, so activities logged while shutting down are still written
+        await activity_sink.shutdown()
+
+
+router = APIRouter(prefix="/api", tags=["tasks", "kanban", "boards"], lifespan=_tasks_lifespan)
+
+
+def _board_etag(board_id: str, version: int) -> str:
+    return f'"{board_id}.{version}"'
+
+
+def _known_board_version(if_none_match: Optional[str], board_id: str) -> Optional[int]:
+    """Extract the board version from an ``If-None-Match`` header we issued."""
+    if not if_none_match:
+        return None
+    for candidate in if_none_match.split(","):
+        tag = candidate.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        tag = tag.strip('"')
+        prefix = f"{board_id}."
+        if tag.startswith(prefix) and tag[len(prefix):].isdigit():
+            return int(tag[len(prefix):])
+    return None
 
 
 # ==================== BOARD MANAGEMENT ENDPOINTS ====================
@@ -156,6 +200,41 @@ async def get_organization_board(
     )
 
 
+@router.get("/organizations/{org_id}/boards/{board_id}/snapshot", response_model=BoardSnapshot)
+async def get_organization_board_snapshot(
+    org_id: str,
+    board_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    scope_ctx: ScopeContext = Depends(require_organization_access_with_id({"board:read"})),
+    principal: CurrentPrincipal = Depends(require_current_principal),
+    service: TasksService = Depends(get_tasks_service)
+):
+    """
+    Get a board, its columns and all non-archived task summaries in one call.
+
+    Requires organization-level board:read permission. The response carries an
+    ETag derived from the board version; sending it back in If-None-Match
+    returns 304 Not Modified while the board is unchanged.
+    """
+    version, snapshot = await service.get_board_snapshot_for_organization(
+        principal, org_id, board_id, known_version=_known_board_version(if_none_match, board_id)
+    )
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Board not found"
+        )
+
+    etag = _board_etag(board_id, version)
+    if snapshot is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    return snapshot
+
+
 @router.put("/organizations/{org_id}/boards/{board_id}", response_model=BoardResponse)
 async def update_organization_board(
     org_id: str,
@@ -809,8 +888,10 @@ async def search_organization_tasks(
     assigned_to: Optional[str] = Query(None, alias="assignedTo", description="Filter by assignee"),
     page: int = Query(default=1, ge=1, description="Page number"),
     per_page: int = Query(default=20, ge=1, le=100, alias="perPage", description="Items per page"),
-    sort_by: str = Query(default="updated_at", alias="sortBy", description="Sort field"),
-    sort_order: str = Query(default="desc", pattern="^(asc|desc)$", alias="sortOrder", description="Sort order")
+    sort_by: Optional[str] = Query(default=None, alias="sortBy", description="Sort field (relevance, updated_at, ...)"),
+    sort_order: str = Query(default="desc", pattern="^(asc|desc)$", alias="sortOrder", description="Sort order"),
+    cursor: Optional[str] = Query(None, description="Continue after this cursor instead of using page"),
+    total: Optional[TotalMode] = Query(None, description="Compute an exact or estimated total")
 ) -> TaskListResponse:
     """
     Search tasks within an organization with various filters.
@@ -825,18 +906,22 @@ async def search_organization_tasks(
         page=page,
         per_page=per_page,
         sort_by=sort_by,
-        sort_order=sort_order
+        sort_order=sort_order,
+        cursor=cursor,
+        total=total
     )
 
-    tasks, total = await service.search_tasks(principal, org_id, search_request)
+    result = await service.search_tasks(principal, org_id, search_request)
 
     return TaskListResponse(
-        tasks=tasks,
-        total=total,
+        tasks=result.items,
+        total=result.total,
         page=page,
         per_page=per_page,
-        has_next=page * per_page < total,
-        has_previous=page > 1
+        has_next=result.has_more,
+        has_previous=page > 1 or cursor is not None,
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total is not None and total == TotalMode.ESTIMATE
     )
 
 
@@ -1004,8 +1089,10 @@ async def search_division_tasks(
     assigned_to: Optional[str] = Query(None, alias="assignedTo", description="Filter by assignee"),
     page: int = Query(default=1, ge=1, description="Page number"),
     per_page: int = Query(default=20, ge=1, le=100, alias="perPage", description="Items per page"),
-    sort_by: str = Query(default="updated_at", alias="sortBy", description="Sort field"),
-    sort_order: str = Query(default="desc", pattern="^(asc|desc)$", alias="sortOrder", description="Sort order")
+    sort_by: Optional[str] = Query(default=None, alias="sortBy", description="Sort field (relevance, updated_at, ...)"),
+    sort_order: str = Query(default="desc", pattern="^(asc|desc)$", alias="sortOrder", description="Sort order"),
+    cursor: Optional[str] = Query(None, description="Continue after this cursor instead of using page"),
+    total: Optional[TotalMode] = Query(None, description="Compute an exact or estimated total")
 ) -> TaskListResponse:
     """Search tasks within a division with various filters."""
     search_request = TaskSearchRequest(
@@ -1016,18 +1103,22 @@ async def search_division_tasks(
         page=page,
         per_page=per_page,
         sort_by=sort_by,
-        sort_order=sort_order
+        sort_order=sort_order,
+        cursor=cursor,
+        total=total
     )
 
-    tasks, total = await service.search_tasks(principal, org_id, search_request, div_id)
+    result = await service.search_tasks(principal, org_id, search_request, div_id)
 
     return TaskListResponse(
-        tasks=tasks,
-        total=total,
+        tasks=result.items,
+        total=result.total,
         page=page,
         per_page=per_page,
-        has_next=page * per_page < total,
-        has_previous=page > 1
+        has_next=result.has_more,
+        has_previous=page > 1 or cursor is not None,
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total is not None and total == TotalMode.ESTIMATE
     )
 
 
@@ -1070,7 +1161,9 @@ async def get_organization_task_comments(
     principal: CurrentPrincipal = Depends(require_current_principal),
     service: TasksService = Depends(get_tasks_service),
     page: int = Query(default=1, ge=1, description="Page number"),
-    per_page: int = Query(default=20, ge=1, le=100, alias="perPage", description="Items per page")
+    per_page: int = Query(default=20, ge=1, le=100, alias="perPage", description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Continue after this cursor instead of using page"),
+    total: Optional[TotalMode] = Query(None, description="Compute an exact or estimated total")
 ) -> CommentListResponse:
     """
     Get comments for a task within an organization.
@@ -1078,15 +1171,17 @@ async def get_organization_task_comments(
     Requires organization-level comment:read permission.
     """
     offset = (page - 1) * per_page
-    comments = await service.get_comments_for_task(principal, org_id, task_id, per_page, offset)
+    result = await service.get_comments_for_task(principal, org_id, task_id, per_page, offset, cursor=cursor, total=total)
 
     return CommentListResponse(
-        comments=comments,
-        total=len(comments),
+        comments=result.items,
+        total=result.total,
         page=page,
         per_page=per_page,
-        has_next=len(comments) == per_page,
-        has_previous=page > 1
+        has_next=result.has_more,
+        has_previous=page > 1 or cursor is not None,
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total is not None and total == TotalMode.ESTIMATE
     )
 
 
@@ -1126,19 +1221,23 @@ async def get_division_task_comments(
     principal: CurrentPrincipal = Depends(require_current_principal),
     service: TasksService = Depends(get_tasks_service),
     page: int = Query(default=1, ge=1, description="Page number"),
-    per_page: int = Query(default=20, ge=1, le=100, alias="perPage", description="Items per page")
+    per_page: int = Query(default=20, ge=1, le=100, alias="perPage", description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Continue after this cursor instead of using page"),
+    total: Optional[TotalMode] = Query(None, description="Compute an exact or estimated total")
 ) -> CommentListResponse:
     """Get comments for a task within a division."""
     offset = (page - 1) * per_page
-    comments = await service.get_comments_for_task(principal, org_id, task_id, per_page, offset, div_id)
+    result = await service.get_comments_for_task(principal, org_id, task_id, per_page, offset, div_id, cursor=cursor, total=total)
 
     return CommentListResponse(
-        comments=comments,
-        total=len(comments),
+        comments=result.items,
+        total=result.total,
         page=page,
         per_page=per_page,
-        has_next=len(comments) == per_page,
-        has_previous=page > 1
+        has_next=result.has_more,
+        has_previous=page > 1 or cursor is not None,
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total is not None and total == TotalMode.ESTIMATE
     )
 
 
@@ -1152,7 +1251,9 @@ async def get_organization_task_activities(
     principal: CurrentPrincipal = Depends(require_current_principal),
     service: TasksService = Depends(get_tasks_service),
     page: int = Query(default=1, ge=1, description="Page number"),
-    per_page: int = Query(default=20, ge=1, le=100, alias="perPage", description="Items per page")
+    per_page: int = Query(default=20, ge=1, le=100, alias="perPage", description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Continue after this cursor instead of using page"),
+    total: Optional[TotalMode] = Query(None, description="Compute an exact or estimated total")
 ) -> ActivityResponse:
     """
     Get activity log for a task within an organization.
@@ -1160,14 +1261,16 @@ async def get_organization_task_activities(
     Requires organization-level activity:read permission.
     """
     offset = (page - 1) * per_page
-    activities = await service.get_task_activities(principal, org_id, task_id, per_page, offset)
+    result = await service.get_task_activities(principal, org_id, task_id, per_page, offset, cursor=cursor, total=total)
 
     return ActivityResponse(
-        activities=activities,
-        total=len(activities),
+        activities=result.items,
+        total=result.total,
         page=page,
         per_page=per_page,
-        has_next=len(activities) == per_page
+        has_next=result.has_more,
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total is not None and total == TotalMode.ESTIMATE
     )
 
 
@@ -1179,7 +1282,9 @@ async def get_organization_board_activities(
     principal: CurrentPrincipal = Depends(require_current_principal),
     service: TasksService = Depends(get_tasks_service),
     page: int = Query(default=1, ge=1, description="Page number"),
-    per_page: int = Query(default=20, ge=1, le=100, alias="perPage", description="Items per page")
+    per_page: int = Query(default=20, ge=1, le=100, alias="perPage", description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Continue after this cursor instead of using page"),
+    total: Optional[TotalMode] = Query(None, description="Compute an exact or estimated total")
 ) -> ActivityResponse:
     """
     Get activity log for a board within an organization.
@@ -1187,14 +1292,16 @@ async def get_organization_board_activities(
     Requires organization-level activity:read permission.
     """
     offset = (page - 1) * per_page
-    activities = await service.get_board_activities(principal, org_id, board_id, per_page, offset)
+    result = await service.get_board_activities(principal, org_id, board_id, per_page, offset, cursor=cursor, total=total)
 
     return ActivityResponse(
-        activities=activities,
-        total=len(activities),
+        activities=result.items,
+        total=result.total,
         page=page,
         per_page=per_page,
-        has_next=len(activities) == per_page
+        has_next=result.has_more,
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total is not None and total == TotalMode.ESTIMATE
     )
 
 
@@ -1208,18 +1315,22 @@ async def get_division_task_activities(
     principal: CurrentPrincipal = Depends(require_current_principal),
     service: TasksService = Depends(get_tasks_service),
     page: int = Query(default=1, ge=1, description="Page number"),
-    per_page: int = Query(default=20, ge=1, le=100, alias="perPage", description="Items per page")
+    per_page: int = Query(default=20, ge=1, le=100, alias="perPage", description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Continue after this cursor instead of using page"),
+    total: Optional[TotalMode] = Query(None, description="Compute an exact or estimated total")
 ) -> ActivityResponse:
     """Get activity log for a task within a division."""
     offset = (page - 1) * per_page
-    activities = await service.get_task_activities(principal, org_id, task_id, per_page, offset, div_id)
+    result = await service.get_task_activities(principal, org_id, task_id, per_page, offset, div_id, cursor=cursor, total=total)
 
     return ActivityResponse(
-        activities=activities,
-        total=len(activities),
+        activities=result.items,
+        total=result.total,
         page=page,
         per_page=per_page,
-        has_next=len(activities) == per_page
+        has_next=result.has_more,
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total is not None and total == TotalMode.ESTIMATE
     )
 
 
@@ -1232,18 +1343,22 @@ async def get_division_board_activities(
     principal: CurrentPrincipal = Depends(require_current_principal),
     service: TasksService = Depends(get_tasks_service),
     page: int = Query(default=1, ge=1, description="Page number"),
-    per_page: int = Query(default=20, ge=1, le=100, alias="perPage", description="Items per page")
+    per_page: int = Query(default=20, ge=1, le=100, alias="perPage", description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Continue after this cursor instead of using page"),
+    total: Optional[TotalMode] = Query(None, description="Compute an exact or estimated total")
 ) -> ActivityResponse:
     """Get activity log for a board within a division."""
     offset = (page - 1) * per_page
-    activities = await service.get_board_activities(principal, org_id, board_id, per_page, offset, div_id)
+    result = await service.get_board_activities(principal, org_id, board_id, per_page, offset, div_id, cursor=cursor, total=total)
 
     return ActivityResponse(
-        activities=activities,
-        total=len(activities),
+        activities=result.items,
+        total=result.total,
         page=page,
         per_page=per_page,
-        has_next=len(activities) == per_page
+        has_next=result.has_more,
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total is not None and total == TotalMode.ESTIMATE
     )
 
 
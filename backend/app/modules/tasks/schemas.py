@@ -70,6 +70,12 @@ class ActivityType(str, Enum):
     PRIORITY_CHANGED = "priority_changed"
 
 
+class TotalMode(str, Enum):
+    """How a list response computes ``total``; omitted totals are not counted."""
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+
+
 # Base Models
 class BaseModelWithTimestamps(BaseModel):
     """Base model with timestamp fields for all entities."""
@@ -342,6 +348,7 @@ class TaskSummary(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
     id: str = Field(..., description="Task identifier")
+    column_id: Optional[str] = Field(None, alias="columnId", description="Containing column ID")
     title: str = Field(..., description="Task title")
     priority: TaskPriority = Field(..., description="Task priority")
     position: int = Field(..., description="Position within column")
@@ -360,6 +367,20 @@ class TaskSummary(BaseModel):
     is_overdue: bool = Field(default=False, description="Whether task is overdue")
 
 
+class TaskAccessContext(BaseModel):
+    """Where a task lives, for authorizing and logging task operations."""
+    model_config = ConfigDict(populate_by_name=True)
+
+    task_id: str = Field(..., alias="taskId", description="Task identifier")
+    title: str = Field(..., description="Task title")
+    assigned_to: Optional[str] = Field(None, alias="assignedTo", description="Assigned user ID")
+    column_id: str = Field(..., alias="columnId", description="Containing column ID")
+    column_name: str = Field(..., alias="columnName", description="Containing column name")
+    board_id: str = Field(..., alias="boardId", description="Containing board ID")
+    organization_id: str = Field(..., alias="organizationId", description="Owning organization ID")
+    division_id: Optional[str] = Field(None, alias="divisionId", description="Owning division ID")
+
+
 # Board Models
 class BoardCreate(BaseModel):
     """Request model for creating kanban boards."""
@@ -463,10 +484,12 @@ class TaskListResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
     tasks: List[TaskSummary] = Field(default_factory=list, description="List of tasks")
-    total: int = Field(default=0, description="Total number of tasks")
+    total: Optional[int] = Field(None, description="Total number of tasks, when requested")
     page: int = Field(default=1, description="Current page number")
     per_page: int = Field(default=20, description="Items per page")
     has_next: bool = Field(default=False, description="Whether there are more pages")
+    next_cursor: Optional[str] = Field(None, alias="nextCursor", description="Cursor for the next page")
+    total_is_estimate: bool = Field(default=False, alias="totalIsEstimate", description="Whether total is a planner estimate")
     has_previous: bool = Field(default=False, description="Whether there are previous pages")
 
 
@@ -509,6 +532,16 @@ class BoardResponse(BaseModel):
             return cls(board=Board(**entity))
 
 
+class BoardSnapshot(BaseModel):
+    """Everything needed to render a board, read from a single database snapshot."""
+    model_config = ConfigDict(populate_by_name=True)
+
+    board: Board = Field(..., description="Board data")
+    columns: List[Column] = Field(default_factory=list, description="Board columns ordered by position")
+    tasks: List[TaskSummary] = Field(default_factory=list, description="Non-archived tasks ordered by column and position")
+    version: int = Field(..., description="Board version the snapshot was read at")
+
+
 class BoardListResponse(BaseModel):
     """Response model for board list operations."""
     model_config = ConfigDict(populate_by_name=True)
@@ -534,10 +567,12 @@ class CommentListResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
     comments: List[Comment] = Field(default_factory=list, description="List of comments")
-    total: int = Field(default=0, description="Total number of comments")
+    total: Optional[int] = Field(None, description="Total number of comments, when requested")
     page: int = Field(default=1, description="Current page number")
     per_page: int = Field(default=20, description="Items per page")
     has_next: bool = Field(default=False, description="Whether there are more pages")
+    next_cursor: Optional[str] = Field(None, alias="nextCursor", description="Cursor for the next page")
+    total_is_estimate: bool = Field(default=False, alias="totalIsEstimate", description="Whether total is a planner estimate")
 
 
 class ActivityResponse(BaseModel):
@@ -545,10 +580,12 @@ class ActivityResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
     activities: List[ActivityEntry] = Field(default_factory=list, description="List of activities")
-    total: int = Field(default=0, description="Total number of activities")
+    total: Optional[int] = Field(None, description="Total number of activities, when requested")
     page: int = Field(default=1, description="Current page number")
     per_page: int = Field(default=20, description="Items per page")
     has_next: bool = Field(default=False, description="Whether there are more pages")
+    next_cursor: Optional[str] = Field(None, alias="nextCursor", description="Cursor for the next page")
+    total_is_estimate: bool = Field(default=False, alias="totalIsEstimate", description="Whether total is a planner estimate")
 
 
 # Bulk Operations
@@ -590,8 +627,12 @@ class TaskSearchRequest(BaseModel):
     is_archived: Optional[bool] = Field(None, alias="isArchived", description="Filter by archived status")
     page: int = Field(default=1, ge=1, description="Page number")
     per_page: int = Field(default=20, ge=1, le=100, alias="perPage", description="Items per page")
-    sort_by: str = Field(default="updated_at", alias="sortBy", description="Sort field")
+    sort_by: Optional[str] = Field(
+        None, alias="sortBy", description="Sort field; defaults to relevance with a query, else updated_at"
+    )
     sort_order: str = Field(default="desc", pattern="^(asc|desc)$", alias="sortOrder", description="Sort order")
+    cursor: Optional[str] = Field(None, description="Continue after this cursor instead of using page")
+    total: Optional[TotalMode] = Field(None, description="Compute an exact or estimated total")
 
 
 class BoardSearchRequest(BaseModel):
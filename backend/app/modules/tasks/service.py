@@ -23,13 +23,15 @@ from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, Tuple
 import uuid
 
+from ...core import get_settings
 from ...dependencies import CurrentPrincipal
 from ...core.scope_integration import ScopedService
 from ...core.scope import ScopeContext
-from .repository import TasksRepository
+from .activity import ActivitySink
+from .repository import ListPage, TasksRepository, WipLimitExceededError
 from .schemas import (
     Board, Column, Task, Comment, Attachment, ActivityEntry,
-    TaskPriority, TaskStatus, ColumnType, ActivityType,
+    TaskPriority, ColumnType, ActivityType,
     TaskCreate, TaskUpdate, TaskMove, TaskAssign,
     ColumnCreate, ColumnUpdate,
     BoardCreate, BoardUpdate,
@@ -41,7 +43,7 @@ from .schemas import (
     TaskListResponse, ColumnListResponse, BoardListResponse,
     CommentListResponse, ActivityResponse,
     BoardStats, BoardPermissions,
-    TaskSummary, BoardSummary
+    TaskSummary, BoardSummary, BoardSnapshot, TotalMode, TaskAccessContext
 )
 
 
@@ -54,9 +56,13 @@ class TasksService(ScopedService):
     and division boundaries while enforcing proper business rules.
     """
 
-    def __init__(self, repository: TasksRepository) -> None:
+    def __init__(self, repository: TasksRepository, activity_sink: Optional[ActivitySink] = None) -> None:
         super().__init__()
         self._repository = repository
+        # Without a sink, activities are written inline
+        self._activity_sink = activity_sink
+        # The service is created per request, so contexts live for one request
+        self._task_contexts: Dict[str, Optional[TaskAccessContext]] = {}
 
     # ==================== BOARD OPERATIONS ====================
 
@@ -181,6 +187,36 @@ class TasksService(ScopedService):
 
         return None
 
+    async def get_board_snapshot_for_organization(
+        self,
+        principal: CurrentPrincipal,
+        organization_id: str,
+        board_id: str,
+        known_version: Optional[int] = None
+    ) -> Tuple[Optional[int], Optional[BoardSnapshot]]:
+        """
+        Get a board with its columns and tasks in a constant number of queries.
+
+        Returns ``(version, snapshot)``. The version is ``None`` when the board
+        does not exist in the organization; the snapshot is ``None`` when the
+        board is still at ``known_version`` and the caller's copy is current.
+        """
+        # Validate organization access
+        scope_ctx = await self.validate_organization_access(
+            principal, organization_id, {"board:read"}
+        )
+
+        current = await self._repository.get_board_version(board_id)
+        if not current or str(current['organization_id']) != organization_id:
+            return None, None
+        if known_version is not None and current['version'] == known_version:
+            return current['version'], None
+
+        snapshot = await self._repository.get_board_snapshot(board_id)
+        if snapshot is None:
+            return None, None
+        return snapshot.version, snapshot
+
     async def get_board_for_division(
         self,
         principal: CurrentPrincipal,
@@ -591,19 +627,19 @@ class TasksService(ScopedService):
         if not board:
             return False
 
-        success = await self._repository.reorder_columns(board_id, column_orders)
+        reordered = await self._repository.reorder_columns(board_id, column_orders)
 
         # Log activity
-        if success:
+        if reordered:
             await self._log_activity(
                 board_id=board_id,
                 user_id=principal.id,
                 activity_type=ActivityType.TASK_UPDATED,
                 description="Reordered columns",
-                metadata={"column_count": len(column_orders)}
+                metadata={"column_count": reordered}
             )
 
-        return success
+        return reordered > 0
 
     # ==================== TASK OPERATIONS ====================
 
@@ -658,7 +694,10 @@ class TasksService(ScopedService):
             "updated_at": datetime.utcnow(),
         }
 
-        task = await self._repository.create_task(task_data)
+        try:
+            task = await self._repository.create_task(task_data)
+        except WipLimitExceededError:
+            raise ValueError(self._wip_limit_message(column)) from None
 
         # Log activity
         await self._log_activity(
@@ -688,21 +727,13 @@ class TasksService(ScopedService):
 
         Validates board access and returns task with all details.
         """
-        # Get task
-        task = await self._repository.get_task_by_id(task_id)
-        if not task:
-            return None
-
-        # Get column and validate board access
-        column = await self._repository.get_column_by_id(task.column_id)
-        if not column:
-            return None
-
-        board = await self._validate_board_access(
-            principal, organization_id, column.board_id, division_id, {"task:read"}
+        context = await self._validate_task_access(
+            principal, organization_id, task_id, division_id, {"task:read"}
         )
+        if not context:
+            return None
 
-        return task if board else None
+        return await self._repository.get_task_by_id(task_id)
 
     async def update_task(
         self,
@@ -717,60 +748,33 @@ class TasksService(ScopedService):
 
         Validates board access and updates task with business rule validation.
         """
-        # Get task and validate access
-        task = await self._repository.get_task_by_id(task_id)
-        if not task:
+        context = await self._validate_task_access(
+            principal, organization_id, task_id, division_id, {"task:update"}
+        )
+        if not context:
             return None
 
-        column = await self._repository.get_column_by_id(task.column_id)
-        if not column:
-            return None
+        update_data = {
+            field: value
+            for field, value in task_request.dict(exclude_unset=True).items()
+            if value is not None
+        }
 
-        board = await self._validate_board_access(
-            principal, organization_id, column.board_id, division_id, {"task:update"}
+        # The repository diffs against the locked row and logs the activity
+        # in the same statement, skipping both when nothing changes
+        result = await self._repository.update_task_with_activity(
+            task_id,
+            update_data,
+            user_id=principal.id,
+            board_id=context.board_id,
+            updated_at=self._activity_timestamp()
         )
+        self._forget_task_context(task_id)
 
-        if not board:
+        if not result:
             return None
 
-        # Track changes for activity logging
-        old_values = {}
-        changes = []
-
-        update_data = {}
-        for field, value in task_request.dict(exclude_unset=True).items():
-            if value is not None and getattr(task, field) != value:
-                old_values[field] = getattr(task, field)
-                update_data[field] = value
-                changes.append(field)
-
-        if not update_data:
-            return task
-
-        # Handle status changes
-        if 'status' in update_data:
-            if update_data['status'] == TaskStatus.DONE and task.status != TaskStatus.DONE:
-                update_data['completed_at'] = datetime.utcnow()
-            elif update_data['status'] != TaskStatus.DONE and task.status == TaskStatus.DONE:
-                update_data['completed_at'] = None
-
-        updated_task = await self._repository.update_task(task_id, update_data)
-
-        # Log activity
-        if updated_task:
-            await self._log_activity(
-                task_id=task_id,
-                board_id=column.board_id,
-                user_id=principal.id,
-                activity_type=ActivityType.TASK_UPDATED,
-                description=f"Updated task '{updated_task.title}'",
-                metadata={
-                    "task_title": updated_task.title,
-                    "changes": changes,
-                    "old_values": old_values
-                }
-            )
-
+        updated_task, _changes = result
         return updated_task
 
     async def move_task(
@@ -786,49 +790,37 @@ class TasksService(ScopedService):
 
         Validates board access and handles position reordering.
         """
-        # Get task and current column
-        task = await self._repository.get_task_by_id(task_id)
-        if not task:
-            return False
-
-        current_column = await self._repository.get_column_by_id(task.column_id)
-        if not current_column:
+        context = await self._validate_task_access(
+            principal, organization_id, task_id, division_id, {"task:update"}
+        )
+        if not context:
             return False
 
-        # Get target column
+        # Get target column; moves never leave the board
         target_column = await self._repository.get_column_by_id(move_request.target_column_id)
-        if not target_column:
+        if not target_column or target_column.board_id != context.board_id:
             return False
 
-        # Validate board access for both columns
-        board = await self._validate_board_access(
-            principal, organization_id, current_column.board_id, division_id, {"task:update"}
-        )
-
-        if not board or current_column.board_id != target_column.board_id:
-            return False
-
-        # Validate WIP limits
-        if target_column.wip_limit:
-            current_tasks = await self._repository.get_tasks_for_column(target_column.id)
-            if len(current_tasks) >= target_column.wip_limit:
-                raise ValueError(f"Column '{target_column.name}' has reached its WIP limit of {target_column.wip_limit}")
-
-        success = await self._repository.move_task(
-            task_id, move_request.target_column_id, move_request.position
-        )
+        # The repository checks the WIP limit in the move statement itself
+        try:
+            success = await self._repository.move_task(
+                task_id, move_request.target_column_id, move_request.position
+            )
+        except WipLimitExceededError:
+            raise ValueError(self._wip_limit_message(target_column)) from None
+        self._forget_task_context(task_id)
 
         # Log activity
         if success:
             await self._log_activity(
                 task_id=task_id,
-                board_id=current_column.board_id,
+                board_id=context.board_id,
                 user_id=principal.id,
                 activity_type=ActivityType.TASK_MOVED,
-                description=f"Moved task '{task.title}' to '{target_column.name}'",
+                description=f"Moved task '{context.title}' to '{target_column.name}'",
                 metadata={
-                    "task_title": task.title,
-                    "from_column": current_column.name,
+                    "task_title": context.title,
+                    "from_column": context.column_name,
                     "to_column": target_column.name,
                     "position": move_request.position
                 }
@@ -849,35 +841,26 @@ class TasksService(ScopedService):
 
         Validates board access and updates task assignment.
         """
-        # Get task and validate access
-        task = await self._repository.get_task_by_id(task_id)
-        if not task:
-            return None
-
-        column = await self._repository.get_column_by_id(task.column_id)
-        if not column:
-            return None
-
-        board = await self._validate_board_access(
-            principal, organization_id, column.board_id, division_id, {"task:assign"}
+        context = await self._validate_task_access(
+            principal, organization_id, task_id, division_id, {"task:assign"}
         )
-
-        if not board:
+        if not context:
             return None
 
-        old_assignee = task.assigned_to
+        old_assignee = context.assigned_to
         activity_type = ActivityType.TASK_ASSIGNED if assign_request.user_id else ActivityType.TASK_UNASSIGNED
 
         updated_task = await self._repository.update_task(task_id, {
             "assigned_to": assign_request.user_id
         })
+        self._forget_task_context(task_id)
 
         # Log activity
         if updated_task:
             action = "assigned to" if assign_request.user_id else "unassigned from"
             await self._log_activity(
                 task_id=task_id,
-                board_id=column.board_id,
+                board_id=context.board_id,
                 user_id=principal.id,
                 activity_type=activity_type,
                 description=f"{action.title()} task '{updated_task.title}'",
@@ -902,33 +885,25 @@ class TasksService(ScopedService):
 
         Validates board access and handles task deletion with cleanup.
         """
-        # Get task and validate access
-        task = await self._repository.get_task_by_id(task_id)
-        if not task:
-            return False
-
-        column = await self._repository.get_column_by_id(task.column_id)
-        if not column:
-            return False
-
-        board = await self._validate_board_access(
-            principal, organization_id, column.board_id, division_id, {"task:delete"}
+        context = await self._validate_task_access(
+            principal, organization_id, task_id, division_id, {"task:delete"}
         )
-
-        if not board:
+        if not context:
             return False
 
         # Log activity before deletion
         await self._log_activity(
             task_id=task_id,
-            board_id=column.board_id,
+            board_id=context.board_id,
             user_id=principal.id,
             activity_type=ActivityType.TASK_UPDATED,
-            description=f"Deleted task '{task.title}'",
-            metadata={"task_title": task.title}
+            description=f"Deleted task '{context.title}'",
+            metadata={"task_title": context.title}
         )
 
-        return await self._repository.delete_task(task_id)
+        deleted = await self._repository.delete_task(task_id)
+        self._forget_task_context(task_id)
+        return deleted
 
     async def search_tasks(
         self,
@@ -936,7 +911,7 @@ class TasksService(ScopedService):
         organization_id: str,
         search_request: TaskSearchRequest,
         division_id: Optional[str] = None
-    ) -> Tuple[List[TaskSummary], int]:
+    ) -> ListPage[TaskSummary]:
         """
         Search tasks with various filters.
 
@@ -952,8 +927,10 @@ class TasksService(ScopedService):
                 principal, organization_id, {"task:read"}
             )
 
-        # Build search parameters
+        # Build search parameters; scoping is applied in SQL through the board
         search_params = {
+            "organization_id": organization_id,
+            "division_id": division_id,
             "query": search_request.query,
             "status": search_request.status,
             "priority": search_request.priority,
@@ -965,20 +942,12 @@ class TasksService(ScopedService):
             "limit": search_request.per_page,
             "offset": (search_request.page - 1) * search_request.per_page,
             "sort_by": search_request.sort_by,
-            "sort_order": search_request.sort_order
+            "sort_order": search_request.sort_order,
+            "fuzzy": get_settings().task_search_trigram_fallback,
+            "cursor": search_request.cursor,
+            "total": search_request.total
         }
 
-        # If division scope, limit search to division boards
-        if division_id:
-            # Get board IDs for this division
-            boards = await self._repository.list_boards_for_division(
-                organization_id, division_id, limit=1000
-            )
-            if boards:
-                board_ids = [board.id for board in boards]
-                # Note: This would need to be implemented in repository
-                # search_params["board_ids"] = board_ids
-
         return await self._repository.search_tasks(**search_params)
 
     # ==================== BULK OPERATIONS ====================
@@ -1017,19 +986,8 @@ class TasksService(ScopedService):
                 message="Bulk move failed - access denied"
             )
 
-        # Validate WIP limits
-        if target_column.wip_limit:
-            current_tasks = await self._repository.get_tasks_for_column(target_column.id)
-            available_space = target_column.wip_limit - len(current_tasks)
-            if available_space < len(bulk_request.task_ids):
-                return BulkOperationResponse(
-                    success_count=0,
-                    failure_count=len(bulk_request.task_ids),
-                    errors=[f"Column '{target_column.name}' has only {available_space} slots available"],
-                    message="Bulk move failed - WIP limit exceeded"
-                )
-
         try:
+            # WIP limits are enforced atomically by the repository
             moved_count = await self._repository.bulk_move_tasks(
                 bulk_request.task_ids, bulk_request.target_column_id
             )
@@ -1053,6 +1011,14 @@ class TasksService(ScopedService):
                 message=f"Successfully moved {moved_count} tasks"
             )
 
+        except WipLimitExceededError as e:
+            return BulkOperationResponse(
+                success_count=0,
+                failure_count=len(bulk_request.task_ids),
+                errors=[f"Column '{target_column.name}' has only {e.available} slots available"],
+                message="Bulk move failed - WIP limit exceeded"
+            )
+
         except Exception as e:
             return BulkOperationResponse(
                 success_count=0,
@@ -1157,7 +1123,7 @@ class TasksService(ScopedService):
         if comment:
             await self._log_activity(
                 task_id=task_id,
-                board_id=task.column_id,  # This would need to be fetched from task
+                board_id=task.board_id,
                 user_id=principal.id,
                 activity_type=ActivityType.COMMENT_ADDED,
                 description=f"Added comment to task '{task.title}'",
@@ -1176,8 +1142,11 @@ class TasksService(ScopedService):
         task_id: str,
         limit: int = 50,
         offset: int = 0,
-        division_id: Optional[str] = None
-    ) -> List[Comment]:
+        division_id: Optional[str] = None,
+        *,
+        cursor: Optional[str] = None,
+        total: Optional[TotalMode] = None
+    ) -> ListPage[Comment]:
         """
         Get comments for a task.
 
@@ -1189,9 +1158,11 @@ class TasksService(ScopedService):
         )
 
         if not task:
-            return []
+            return ListPage(items=[])
 
-        return await self._repository.get_comments_for_task(task_id, limit, offset)
+        return await self._repository.get_comments_for_task(
+            task_id, limit, offset, cursor=cursor, total=total
+        )
 
     # ==================== ACTIVITY OPERATIONS ====================
 
@@ -1202,8 +1173,11 @@ class TasksService(ScopedService):
         task_id: str,
         limit: int = 50,
         offset: int = 0,
-        division_id: Optional[str] = None
-    ) -> List[ActivityEntry]:
+        division_id: Optional[str] = None,
+        *,
+        cursor: Optional[str] = None,
+        total: Optional[TotalMode] = None
+    ) -> ListPage[ActivityEntry]:
         """
         Get activity log for a task.
 
@@ -1215,9 +1189,12 @@ class TasksService(ScopedService):
         )
 
         if not task:
-            return []
+            return ListPage(items=[])
 
-        return await self._repository.get_activities_for_task(task_id, limit, offset)
+        await self._flush_activities()
+        return await self._repository.get_activities_for_task(
+            task_id, limit, offset, cursor=cursor, total=total
+        )
 
     async def get_board_activities(
         self,
@@ -1226,8 +1203,11 @@ class TasksService(ScopedService):
         board_id: str,
         limit: int = 50,
         offset: int = 0,
-        division_id: Optional[str] = None
-    ) -> List[ActivityEntry]:
+        division_id: Optional[str] = None,
+        *,
+        cursor: Optional[str] = None,
+        total: Optional[TotalMode] = None
+    ) -> ListPage[ActivityEntry]:
         """
         Get activity log for a board.
 
@@ -1239,9 +1219,12 @@ class TasksService(ScopedService):
         )
 
         if not board:
-            return []
+            return ListPage(items=[])
 
-        return await self._repository.get_activities_for_board(board_id, limit, offset)
+        await self._flush_activities()
+        return await self._repository.get_activities_for_board(
+            board_id, limit, offset, cursor=cursor, total=total
+        )
 
     # ==================== HELPER METHODS ====================
 
@@ -1298,22 +1281,35 @@ class TasksService(ScopedService):
         task_id: str,
         division_id: Optional[str],
         required_permissions: set
-    ) -> Optional[Task]:
-        """Validate task access through board validation."""
-        task = await self._repository.get_task_by_id(task_id)
-        if not task:
+    ) -> Optional[TaskAccessContext]:
+        """Validate task access against the owning board's scope.
+
+        Resolves the task's access context once per request; later checks for
+        the same task reuse it.
+        """
+        if task_id not in self._task_contexts:
+            self._task_contexts[task_id] = await self._repository.get_task_access_context(task_id)
+        context = self._task_contexts[task_id]
+        if not context:
             return None
 
-        # Get column to validate board access
-        column = await self._repository.get_column_by_id(task.column_id)
-        if not column:
+        # Check organization match
+        if context.organization_id != organization_id:
             return None
 
-        board = await self._validate_board_access(
-            principal, organization_id, column.board_id, division_id, required_permissions
-        )
+        # Check division match if division context
+        if division_id and context.division_id != division_id:
+            return None
 
-        return task if board else None
+        return context
+
+    def _forget_task_context(self, task_id: str) -> None:
+        """Drop a memoized context after the task moved, changed or was deleted."""
+        self._task_contexts.pop(task_id, None)
+
+    @staticmethod
+    def _wip_limit_message(column: Column) -> str:
+        return f"Column '{column.name}' has reached its WIP limit of {column.wip_limit}"
 
     async def _validate_task_creation(
         self,
@@ -1321,11 +1317,9 @@ class TasksService(ScopedService):
         task_request: TaskCreate
     ) -> Optional[str]:
         """Validate business rules for task creation."""
-        # Check WIP limits
-        if column.wip_limit:
-            current_tasks = await self._repository.get_tasks_for_column(column.id)
-            if len(current_tasks) >= column.wip_limit:
-                return f"Column '{column.name}' has reached its WIP limit of {column.wip_limit}"
+        # Early check on the live count; create_task re-checks under the column lock
+        if column.is_over_limit:
+            return self._wip_limit_message(column)
 
         # Validate due date
         if task_request.due_date and task_request.due_date < datetime.utcnow():
@@ -1351,7 +1345,22 @@ class TasksService(ScopedService):
             "activity_type": activity_type,
             "description": description,
             "metadata": metadata,
-            "created_at": datetime.utcnow(),
+            "created_at": self._activity_timestamp(),
         }
 
-        await self._repository.create_activity(activity_data)
\ No newline at end of file
+        if self._activity_sink is not None:
+            self._activity_sink.enqueue(activity_data)
+            return
+        await self._repository.create_activity(activity_data)
+
+    def _activity_timestamp(self) -> datetime:
+        """Timestamp for a new activity, ordered after every one already queued."""
+        now = datetime.utcnow()
+        if self._activity_sink is not None:
+            return self._activity_sink.reserve_created_at(now)
+        return now
+
+    async def _flush_activities(self) -> None:
+        """Write queued activities so a following read includes them."""
+        if self._activity_sink is not None:
+            await self._activity_sink.flush()
\ No newline at end of file
@@ -7,11 +7,14 @@ from .aggregation import (
     drain_backlog,
     iter_completed_onboarding_sessions,
 )
+from .funnel import OnboardingFunnelBucket, OnboardingFunnelRepository
 
 __all__ = [
     "OnboardingAnswerAggregationWorker",
     "OnboardingAnswerSnapshot",
     "OnboardingAnswerSnapshotRepository",
+    "OnboardingFunnelBucket",
+    "OnboardingFunnelRepository",
     "drain_backlog",
     "iter_completed_onboarding_sessions",
 ]
@@ -6,10 +6,14 @@
 Dependency wiring for the users module.
 """
 
+from functools import lru_cache
+
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...db.session import db_session_dependency, get_engine
+from ..onboarding.manifest import DEFAULT_ONBOARDING_MANIFEST
+from .funnel import OnboardingFunnelRecorder, OnboardingFunnelRepository
 from .publishers import OnboardingAnswerPublisher, PostgresNotifyOnboardingAnswerPublisher
 from .repository import UserRepository
 from .service import UserService
@@ -27,5 +31,21 @@ async def get_user_repository(
     return UserRepository(session=session, answer_publisher=publisher)
 
 
-async def get_user_service(repository: UserRepository = Depends(get_user_repository)) -> UserService:
-    return UserService(repository=repository)
+@lru_cache
+def get_onboarding_funnel_repository() -> OnboardingFunnelRepository:
+    return OnboardingFunnelRepository(
+        get_engine(),
+        manifest_version=DEFAULT_ONBOARDING_MANIFEST.version,
+        step_ids=[step.id for step in DEFAULT_ONBOARDING_MANIFEST.steps],
+    )
+
+
+async def get_onboarding_funnel_recorder() -> OnboardingFunnelRecorder:
+    return get_onboarding_funnel_repository()
+
+
+async def get_user_service(
+    repository: UserRepository = Depends(get_user_repository),
+    funnel_recorder: OnboardingFunnelRecorder = Depends(get_onboarding_funnel_recorder),
+) -> UserService:
+    return UserService(repository=repository, funnel_recorder=funnel_recorder)
@@ -0,0 +1,222 @@
+"""Incrementally maintained onboarding funnel counters."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Any, Iterable, List, Protocol, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .aggregation import CANONICAL_STEP_ALIASES
+from .schemas import StoredOnboardingStatus
+
+logger = logging.getLogger(__name__)
+
+
+COMPLETED_FUNNEL_STEP = "completed"
+
+
+@dataclass(frozen=True, slots=True)
+class OnboardingFunnelBucket:
+    """Number of sessions that reached a step on a given day."""
+
+    manifest_version: str
+    day: date
+    step_id: str
+    sessions: int
+
+
+def reached_funnel_steps(
+    status: StoredOnboardingStatus,
+    known_steps: Sequence[str],
+) -> List[str]:
+    """Return the manifest steps a status has reached, in manifest order."""
+
+    reached = set()
+    candidates: Iterable[str | None] = (
+        *status.completedSteps,
+        *status.skippedSteps,
+        status.lastStep,
+    )
+    for raw_step in candidates:
+        if not raw_step:
+            continue
+        canonical = CANONICAL_STEP_ALIASES.get(str(raw_step).strip())
+        if canonical:
+            reached.add(canonical)
+
+    steps = [step for step in known_steps if step in reached]
+    if status.completed:
+        steps.append(COMPLETED_FUNNEL_STEP)
+    return steps
+
+
+class OnboardingFunnelRecorder(Protocol):
+    """Contract for recording onboarding funnel progress."""
+
+    async def record_progress(
+        self,
+        *,
+        session_id: str,
+        status: StoredOnboardingStatus,
+    ) -> None:
+        """Count the steps reached by a session that were not counted before."""
+
+
+class OnboardingFunnelRepository:
+    """Maintain per-day, per-step onboarding funnel counts.
+
+    Each session contributes at most once to a step: the first time a step is
+    reached is recorded in ``onboarding_funnel_progress`` and only those new
+    rows are added to the daily ``onboarding_funnel_daily`` totals, so repeated
+    progress saves do not inflate the funnel and reads never touch
+    ``onboarding_sessions.data``.
+    """
+
+    PROGRESS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS public.onboarding_funnel_progress (
+        session_id UUID NOT NULL,
+        step_id TEXT NOT NULL,
+        manifest_version TEXT NOT NULL,
+        reached_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (session_id, step_id)
+    )
+    """
+
+    DAILY_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS public.onboarding_funnel_daily (
+        manifest_version TEXT NOT NULL,
+        day DATE NOT NULL,
+        step_id TEXT NOT NULL,
+        sessions BIGINT NOT NULL DEFAULT 0,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (manifest_version, day, step_id)
+    )
+    """
+
+    DAILY_DAY_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_onboarding_funnel_daily_day
+        ON public.onboarding_funnel_daily (day DESC);
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        manifest_version: str,
+        step_ids: Sequence[str],
+    ) -> None:
+        self._engine = engine
+        self._manifest_version = manifest_version
+        self._step_ids = tuple(step_ids)
+        self._schema_ready = False
+
+    @property
+    def step_ids(self) -> tuple[str, ...]:
+        return self._step_ids
+
+    async def ensure_schema(self) -> None:
+        if self._schema_ready:
+            return
+        async with self._engine.begin() as conn:
+            await conn.execute(text(self.PROGRESS_TABLE_SQL))
+            await conn.execute(text(self.DAILY_TABLE_SQL))
+            await conn.execute(text(self.DAILY_DAY_INDEX_SQL))
+        self._schema_ready = True
+
+    async def record_progress(
+        self,
+        *,
+        session_id: str,
+        status: StoredOnboardingStatus,
+        reached_at: datetime | None = None,
+    ) -> None:
+        steps = reached_funnel_steps(status, self._step_ids)
+        if not steps:
+            return
+
+        await self.ensure_schema()
+        reached_at = reached_at or datetime.now(timezone.utc)
+        statement = text(
+            """
+            WITH reached AS (
+                INSERT INTO public.onboarding_funnel_progress (
+                    session_id,
+                    step_id,
+                    manifest_version,
+                    reached_at
+                )
+                SELECT CAST(:session_id AS UUID), step_id, :manifest_version, :reached_at
+                FROM unnest(CAST(:step_ids AS TEXT[])) AS step_id
+                ON CONFLICT (session_id, step_id) DO NOTHING
+                RETURNING step_id
+            )
+            INSERT INTO public.onboarding_funnel_daily (
+                manifest_version,
+                day,
+                step_id,
+                sessions,
+                updated_at
+            )
+            SELECT :manifest_version, CAST(:reached_at AS DATE), step_id, COUNT(*), NOW()
+            FROM reached
+            GROUP BY step_id
+            ON CONFLICT (manifest_version, day, step_id) DO UPDATE SET
+                sessions = public.onboarding_funnel_daily.sessions + EXCLUDED.sessions,
+                updated_at = NOW()
+            """
+        )
+        async with self._engine.begin() as conn:
+            await conn.execute(
+                statement,
+                {
+                    "session_id": session_id,
+                    "manifest_version": self._manifest_version,
+                    "reached_at": reached_at,
+                    "step_ids": steps,
+                },
+            )
+
+    async def list_buckets(
+        self,
+        *,
+        manifest_version: str | None = None,
+        day_from: date | None = None,
+        day_to: date | None = None,
+    ) -> List[OnboardingFunnelBucket]:
+        """Return funnel buckets ordered by day for the requested window."""
+
+        await self.ensure_schema()
+        where_clauses: list[str] = ["manifest_version = :manifest_version"]
+        params: dict[str, Any] = {"manifest_version": manifest_version or self._manifest_version}
+        if day_from:
+            where_clauses.append("day >= :day_from")
+            params["day_from"] = day_from
+        if day_to:
+            where_clauses.append("day <= :day_to")
+            params["day_to"] = day_to
+
+        query = text(
+            f"""
+            SELECT manifest_version, day, step_id, sessions
+            FROM public.onboarding_funnel_daily
+            WHERE {' AND '.join(where_clauses)}
+            ORDER BY day ASC, step_id ASC
+            """
+        )
+        async with self._engine.connect() as conn:
+            result = await conn.execute(query, params)
+            rows = result.mappings().all()
+
+        return [
+            OnboardingFunnelBucket(
+                manifest_version=str(row["manifest_version"]),
+                day=row["day"],
+                step_id=str(row["step_id"]),
+                sessions=int(row["sessions"] or 0),
+            )
+            for row in rows
+        ]
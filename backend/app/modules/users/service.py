@@ -17,6 +17,7 @@ from ...dependencies import CurrentPrincipal
 from ...core.scope_integration import ScopedService
 from ...core.scope import ScopeContext
 from .checksums import compute_status_checksum
+from .funnel import OnboardingFunnelRecorder
 from .repository import UserRepository
 from .schemas import (
     OnboardingSession,
@@ -86,9 +87,26 @@ class UserService(ScopedService):
     and division boundaries.
     """
 
-    def __init__(self, repository: UserRepository) -> None:
+    def __init__(
+        self,
+        repository: UserRepository,
+        funnel_recorder: OnboardingFunnelRecorder | None = None,
+    ) -> None:
         super().__init__()
         self._repository = repository
+        self._funnel_recorder = funnel_recorder
+
+    async def _record_funnel_progress(self, session: OnboardingSession) -> None:
+        """Feed the onboarding funnel counters without failing the user's save."""
+        if self._funnel_recorder is None:
+            return
+        try:
+            await self._funnel_recorder.record_progress(session_id=session.id, status=session.status)
+        except Exception:
+            logger.exception(
+                "onboarding.funnel.record_failed",
+                extra={"user_id": session.userId, "session_id": session.id},
+            )
 
     async def _ensure_user(self, principal: CurrentPrincipal) -> WorkspaceUser:
         """Ensure user exists with scope validation."""
@@ -246,6 +264,7 @@ class UserService(ScopedService):
             f"submitted_{key}": value for key, value in _status_metrics(status).items()
         }
         session = await self._repository.update_onboarding_status(principal.id, next_status)
+        await self._record_funnel_progress(session)
         persisted_metrics = {f"persisted_{key}": value for key, value in _status_metrics(session.status).items()}
         logger.info(
             "onboarding.progress_saved",
@@ -277,6 +296,7 @@ class UserService(ScopedService):
         self._ensure_revision_is_current(current_session.status, status)
         next_status = self._with_next_revision(status)
         session = await self._repository.complete_onboarding(principal.id, next_status, answers)
+        await self._record_funnel_progress(session)
         submitted_metrics = {f"submitted_{key}": value for key, value in _status_metrics(status).items()}
         persisted_metrics = {f"persisted_{key}": value for key, value in _status_metrics(session.status).items()}
         logger.info(
@@ -1,11 +1,14 @@
 """Dependency wiring for workspace module."""
 
+from functools import lru_cache
+
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...db.session import db_session_dependency
+from ...db.session import db_session_dependency, get_engine, get_session_factory
 from .repository import WorkspacePermissionRepository, WorkspaceRepository
 from .service import WorkspaceService, WorkspaceTemplateService
+from .streaming import ActivityBroadcaster
 
 
 async def get_workspace_repository(
@@ -31,3 +34,8 @@ async def get_workspace_template_service(
     session: AsyncSession = Depends(db_session_dependency),
 ) -> WorkspaceTemplateService:
     return WorkspaceTemplateService(session)
+
+
+@lru_cache
+def get_activity_broadcaster() -> ActivityBroadcaster:
+    return ActivityBroadcaster(get_engine, get_session_factory)
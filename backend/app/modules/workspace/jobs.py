@@ -0,0 +1,138 @@
+"""Background worker that applies queued workspace templates."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import suppress
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...core import get_settings
+from ...db.session import get_session_factory
+from .repository import WorkspaceSeedJobRepository
+from .service import WorkspaceTemplateService
+
+logger = logging.getLogger(__name__)
+
+
+SEED_RETRY_DELAY_SECONDS = 30
+
+
+class WorkspaceSeedWorker:
+    """Drains ``workspace_seed_jobs`` outside the request path.
+
+    Each batch is claimed with ``FOR UPDATE SKIP LOCKED`` and applied in one
+    transaction, with a savepoint per job so a failing template only rolls back
+    its own rows. Jobs are keyed by ``(org_id, template_source)`` and
+    ``apply_template`` skips populated organizations, so a retried or
+    re-enqueued job never duplicates content.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: Optional[int] = None,
+        *,
+        batch_size: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ) -> None:
+        settings = get_settings()
+        self._interval = interval_seconds or settings.workspace_seed_interval_seconds
+        self._batch_size = batch_size or settings.workspace_seed_batch_size
+        self._max_attempts = max_attempts or settings.workspace_seed_max_attempts
+        self._session_factory = session_factory
+        self._stop = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="workspace-seed-worker")
+
+    async def shutdown(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while not self._stop.is_set():
+            processed = 0
+            try:
+                processed = await self.run_once()
+            except Exception as error:  # pragma: no cover - defensive guard
+                logger.error("workspace.seed_worker.failed", exc_info=error)
+
+            # A full batch means more work is likely waiting; go again without sleeping
+            if processed >= self._batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=float(self._interval))
+            except asyncio.TimeoutError:
+                continue
+
+    async def run_once(self) -> int:
+        """Claim and apply one batch of due jobs; returns how many were claimed."""
+
+        session_factory = self._session_factory or get_session_factory()
+        async with session_factory() as session:
+            repository = WorkspaceSeedJobRepository(session)
+            service = WorkspaceTemplateService(session)
+            seeded_org_ids: list[str] = []
+
+            async with session.begin():
+                jobs = await repository.claim_batch(self._batch_size)
+                if not jobs:
+                    return 0
+                contexts = await repository.load_seed_context([job.org_id for job in jobs])
+
+                for job in jobs:
+                    context = contexts.get(job.org_id)
+                    if context is None:
+                        await repository.mark_failed(
+                            job,
+                            error="Organization not found",
+                            max_attempts=1,
+                            retry_delay_seconds=SEED_RETRY_DELAY_SECONDS,
+                        )
+                        continue
+                    organization, divisions = context
+                    try:
+                        async with session.begin_nested():
+                            seeded = await service.apply_template(
+                                organization=organization,
+                                divisions=divisions,
+                                template_source=job.template_source,
+                                seeded_by=job.requested_by,
+                            )
+                    except Exception as error:
+                        logger.error(
+                            "workspace.seed_worker.job_failed",
+                            exc_info=error,
+                            extra={"org_id": job.org_id, "attempts": job.attempts + 1},
+                        )
+                        await repository.mark_failed(
+                            job,
+                            error=str(error) or type(error).__name__,
+                            max_attempts=self._max_attempts,
+                            retry_delay_seconds=SEED_RETRY_DELAY_SECONDS,
+                        )
+                        continue
+                    await repository.mark_completed(job, seeded=seeded)
+                    if seeded:
+                        seeded_org_ids.append(job.org_id)
+
+            for org_id in seeded_org_ids:
+                await service.invalidate_organization(org_id)
+
+        logger.info(
+            "workspace.seed_worker.batch",
+            extra={"claimed": len(jobs), "seeded": len(seeded_org_ids)},
+        )
+        return len(jobs)
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime
+import json
 import logging
 from typing import Any, Optional
 
-from sqlalchemy import CursorResult, text
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...core.pagination import InvalidCursorError, KeysetCursor
 from ...dependencies import CurrentPrincipal
+from ..organizations.repository import invalidate_hub_metrics
+from ..organizations.schemas import OrganizationDivision, OrganizationResponse
 from .schemas import (
     ActivityFeedResponse,
     ChannelCreatePayload,
@@ -22,10 +28,15 @@ from .schemas import (
     WorkspaceDoc,
     WorkspaceOverview,
     WorkspaceProject,
+    WorkspaceSeedStatus,
     WorkspaceTask,
 )
 
 
+OVERVIEW_CHANNEL_LIMIT = 50
+NIL_UUID = "00000000-0000-0000-0000-000000000000"
+
+
 class WorkspaceRepository:
     """Repository encapsulating SQL for workspace resources."""
 
@@ -44,183 +55,206 @@ class WorkspaceRepository:
     def _to_optional_str(value: Any) -> Optional[str]:
         return str(value) if value is not None else None
 
-    async def fetch_overview(
-        self,
-        *,
-        org_id: str,
-        division_id: Optional[str],
-        include_templates: bool,
-    ) -> WorkspaceOverview:
-        projects = await self._fetch_projects(org_id=org_id, division_id=division_id, include_templates=include_templates)
-        tasks = await self._fetch_tasks(org_id=org_id, division_id=division_id, include_templates=include_templates)
-        docs = await self._fetch_docs(org_id=org_id, division_id=division_id, include_templates=include_templates)
-        channels = await self._fetch_channels(
-            org_id=org_id,
-            division_id=division_id,
-            include_templates=include_templates,
-            page=1,
-            page_size=50,
-        )
-        has_templates = any(item.is_template for item in (*projects, *tasks, *docs, *channels.items))
-        return WorkspaceOverview(
-            orgId=org_id,
-            divisionId=division_id,
-            projects=projects,
-            tasks=tasks,
-            docs=docs,
-            channels=channels.items,
-            hasTemplates=has_templates,
+    @staticmethod
+    def _json_rows(value: Any) -> list[dict[str, Any]]:
+        """Normalize a ``json_agg`` column that drivers may return decoded or as text."""
+        if value is None:
+            return []
+        if isinstance(value, (str, bytes)):
+            return json.loads(value)
+        return list(value)
+
+    @classmethod
+    def _map_project(cls, row: Mapping[str, Any]) -> WorkspaceProject:
+        return WorkspaceProject.model_validate(
+            {
+                "id": cls._to_str(row["id"]),
+                "orgId": cls._to_str(row["org_id"]),
+                "divisionId": cls._to_optional_str(row["division_id"]),
+                "name": row["name"],
+                "description": row["description"],
+                "badgeCount": row["badge_count"],
+                "dotColor": row["dot_color"],
+                "status": row["status"],
+                "defaultView": row["default_view"],
+                "isTemplate": row["is_template"],
+                "updatedAt": row["updated_at"],
+            }
         )
 
-    async def _fetch_projects(
-        self,
-        *,
-        org_id: str,
-        division_id: Optional[str],
-        include_templates: bool,
-    ) -> list[WorkspaceProject]:
-        stmt = text(
-            """
-            SELECT id,
-                   org_id,
-                   division_id,
-                   name,
-                   description,
-                   badge_count,
-                   dot_color,
-                   status,
-                   default_view,
-                   is_template,
-                   updated_at
-              FROM public.workspace_projects
-             WHERE org_id = :org_id
-               AND archived_at IS NULL
-               AND (CAST(:division_id AS UUID) IS NULL OR division_id IS NULL OR division_id = CAST(:division_id AS UUID))
-               AND (:include_templates OR is_template = FALSE)
-             ORDER BY is_template DESC, updated_at DESC
-            """
+    @classmethod
+    def _map_task(cls, row: Mapping[str, Any]) -> WorkspaceTask:
+        return WorkspaceTask.model_validate(
+            {
+                "id": cls._to_str(row["id"]),
+                "orgId": cls._to_str(row["org_id"]),
+                "divisionId": cls._to_optional_str(row["division_id"]),
+                "projectId": cls._to_optional_str(row["project_id"]),
+                "name": row["name"],
+                "priority": row["priority"],
+                "badgeVariant": row["badge_variant"],
+                "dotColor": row["dot_color"],
+                "isTemplate": row["is_template"],
+                "updatedAt": row["updated_at"],
+            }
         )
-        result: CursorResult = await self._session.execute(
-            stmt,
-            {"org_id": org_id, "division_id": division_id, "include_templates": include_templates},
+
+    @classmethod
+    def _map_doc(cls, row: Mapping[str, Any]) -> WorkspaceDoc:
+        return WorkspaceDoc.model_validate(
+            {
+                "id": cls._to_str(row["id"]),
+                "orgId": cls._to_str(row["org_id"]),
+                "divisionId": cls._to_optional_str(row["division_id"]),
+                "name": row["name"],
+                "url": row["url"],
+                "summary": row["summary"],
+                "isTemplate": row["is_template"],
+                "updatedAt": row["updated_at"],
+            }
         )
-        rows = result.mappings().all()
-        return [
-            WorkspaceProject.model_validate(
-                {
-                    "id": self._to_str(row["id"]),
-                    "orgId": self._to_str(row["org_id"]),
-                    "divisionId": self._to_optional_str(row["division_id"]),
-                    "name": row["name"],
-                    "description": row["description"],
-                    "badgeCount": row["badge_count"],
-                    "dotColor": row["dot_color"],
-                    "status": row["status"],
-                    "defaultView": row["default_view"],
-                    "isTemplate": row["is_template"],
-                    "updatedAt": row["updated_at"],
-                }
-            )
-            for row in rows
-        ]
 
-    async def _fetch_tasks(
-        self,
-        *,
-        org_id: str,
-        division_id: Optional[str],
-        include_templates: bool,
-    ) -> list[WorkspaceTask]:
-        stmt = text(
-            """
-            SELECT id,
-                   org_id,
-                   division_id,
-                   project_id,
-                   name,
-                   priority,
-                   badge_variant,
-                   dot_color,
-                   is_template,
-                   updated_at
-              FROM public.workspace_tasks
-             WHERE org_id = :org_id
-               AND archived_at IS NULL
-               AND (CAST(:division_id AS UUID) IS NULL OR division_id IS NULL OR division_id = CAST(:division_id AS UUID))
-               AND (:include_templates OR is_template = FALSE)
-             ORDER BY is_template DESC, updated_at DESC
-            """
+    @classmethod
+    def _map_channel(cls, row: Mapping[str, Any]) -> WorkspaceChannel:
+        return WorkspaceChannel(
+            id=cls._to_str(row["id"]),
+            org_id=cls._to_str(row["org_id"]),
+            division_id=cls._to_optional_str(row["division_id"]),
+            slug=row["slug"],
+            name=row["name"],
+            channel_type=row["channel_type"],
+            topic=row["topic"],
+            description=row["description"],
+            member_count=row["member_count"],
+            is_favorite=row["is_favorite"],
+            is_muted=row["is_muted"],
+            unread_count=row["unread_count"],
+            is_template=row["is_template"],
+            updated_at=row["updated_at"],
         )
-        result = await self._session.execute(
-            stmt,
-            {"org_id": org_id, "division_id": division_id, "include_templates": include_templates},
+
+    @classmethod
+    def _map_activity(cls, row: Mapping[str, Any]) -> WorkspaceActivity:
+        return WorkspaceActivity.model_validate(
+            {
+                "id": cls._to_str(row["id"]),
+                "orgId": cls._to_str(row["org_id"]),
+                "divisionId": cls._to_optional_str(row["division_id"]),
+                "activityType": row["activity_type"],
+                "content": row["content"],
+                "metadata": row["metadata"],
+                "occurredAt": row["occurred_at"],
+                "isTemplate": row["is_template"],
+                "author": {
+                    "id": cls._to_optional_str(row["actor_id"]),
+                    "name": row["actor_name"] or "Workspace",  # fallback to generic name
+                    "role": row["actor_role"],
+                },
+            }
         )
-        rows = result.mappings().all()
-        return [
-            WorkspaceTask.model_validate(
-                {
-                    "id": self._to_str(row["id"]),
-                    "orgId": self._to_str(row["org_id"]),
-                    "divisionId": self._to_optional_str(row["division_id"]),
-                    "projectId": self._to_optional_str(row["project_id"]),
-                    "name": row["name"],
-                    "priority": row["priority"],
-                    "badgeVariant": row["badge_variant"],
-                    "dotColor": row["dot_color"],
-                    "isTemplate": row["is_template"],
-                    "updatedAt": row["updated_at"],
-                }
-            )
-            for row in rows
-        ]
 
-    async def _fetch_docs(
+    async def fetch_overview(
         self,
         *,
         org_id: str,
         division_id: Optional[str],
         include_templates: bool,
-    ) -> list[WorkspaceDoc]:
+    ) -> WorkspaceOverview:
+        """Load every overview section in a single round-trip.
+
+        Each section is a ``json_agg`` sub-select over the same scope filter, so
+        the overview costs one statement instead of one query per section plus a
+        channel COUNT the overview never used.
+        """
         stmt = text(
             """
-            SELECT id,
-                   org_id,
-                   division_id,
-                   name,
-                   url,
-                   summary,
-                   is_template,
-                   updated_at
-              FROM public.workspace_docs
-             WHERE org_id = :org_id
-               AND archived_at IS NULL
-               AND (CAST(:division_id AS UUID) IS NULL OR division_id IS NULL OR division_id = CAST(:division_id AS UUID))
-               AND (:include_templates OR is_template = FALSE)
-             ORDER BY is_template DESC, updated_at DESC
+            WITH scope AS (
+                SELECT CAST(:org_id AS UUID) AS org_id,
+                       CAST(:division_id AS UUID) AS division_id,
+                       CAST(:include_templates AS BOOLEAN) AS include_templates
+            )
+            SELECT
+                (
+                    SELECT COALESCE(json_agg(p ORDER BY p.is_template DESC, p.updated_at DESC), '[]'::json)
+                      FROM (
+                          SELECT wp.id, wp.org_id, wp.division_id, wp.name, wp.description,
+                                 wp.badge_count, wp.dot_color, wp.status, wp.default_view,
+                                 wp.is_template, wp.updated_at
+                            FROM public.workspace_projects wp, scope s
+                           WHERE wp.org_id = s.org_id
+                             AND wp.archived_at IS NULL
+                             AND (s.division_id IS NULL OR wp.division_id IS NULL OR wp.division_id = s.division_id)
+                             AND (s.include_templates OR wp.is_template = FALSE)
+                      ) p
+                ) AS projects,
+                (
+                    SELECT COALESCE(json_agg(t ORDER BY t.is_template DESC, t.updated_at DESC), '[]'::json)
+                      FROM (
+                          SELECT wt.id, wt.org_id, wt.division_id, wt.project_id, wt.name,
+                                 wt.priority, wt.badge_variant, wt.dot_color, wt.is_template,
+                                 wt.updated_at
+                            FROM public.workspace_tasks wt, scope s
+                           WHERE wt.org_id = s.org_id
+                             AND wt.archived_at IS NULL
+                             AND (s.division_id IS NULL OR wt.division_id IS NULL OR wt.division_id = s.division_id)
+                             AND (s.include_templates OR wt.is_template = FALSE)
+                      ) t
+                ) AS tasks,
+                (
+                    SELECT COALESCE(json_agg(d ORDER BY d.is_template DESC, d.updated_at DESC), '[]'::json)
+                      FROM (
+                          SELECT wd.id, wd.org_id, wd.division_id, wd.name, wd.url, wd.summary,
+                                 wd.is_template, wd.updated_at
+                            FROM public.workspace_docs wd, scope s
+                           WHERE wd.org_id = s.org_id
+                             AND wd.archived_at IS NULL
+                             AND (s.division_id IS NULL OR wd.division_id IS NULL OR wd.division_id = s.division_id)
+                             AND (s.include_templates OR wd.is_template = FALSE)
+                      ) d
+                ) AS docs,
+                (
+                    SELECT COALESCE(json_agg(c ORDER BY c.is_template DESC, c.name ASC), '[]'::json)
+                      FROM (
+                          SELECT wc.id, wc.org_id, wc.division_id, wc.slug, wc.name, wc.channel_type,
+                                 wc.topic, wc.description, wc.member_count, wc.is_favorite,
+                                 wc.is_muted, wc.unread_count, wc.is_template, wc.updated_at
+                            FROM public.workspace_channels wc, scope s
+                           WHERE wc.org_id = s.org_id
+                             AND wc.archived_at IS NULL
+                             AND (s.division_id IS NULL OR wc.division_id IS NULL OR wc.division_id = s.division_id)
+                             AND (s.include_templates OR wc.is_template = FALSE)
+                           ORDER BY wc.is_template DESC, wc.name ASC
+                           LIMIT :channel_limit
+                      ) c
+                ) AS channels
             """
         )
         result = await self._session.execute(
             stmt,
-            {"org_id": org_id, "division_id": division_id, "include_templates": include_templates},
+            {
+                "org_id": org_id,
+                "division_id": division_id,
+                "include_templates": include_templates,
+                "channel_limit": OVERVIEW_CHANNEL_LIMIT,
+            },
+        )
+        row = result.mappings().one()
+        projects = [self._map_project(item) for item in self._json_rows(row["projects"])]
+        tasks = [self._map_task(item) for item in self._json_rows(row["tasks"])]
+        docs = [self._map_doc(item) for item in self._json_rows(row["docs"])]
+        channels = [self._map_channel(item) for item in self._json_rows(row["channels"])]
+        has_templates = any(item.is_template for item in (*projects, *tasks, *docs, *channels))
+        return WorkspaceOverview(
+            orgId=org_id,
+            divisionId=division_id,
+            projects=projects,
+            tasks=tasks,
+            docs=docs,
+            channels=channels,
+            hasTemplates=has_templates,
         )
-        rows = result.mappings().all()
-        return [
-            WorkspaceDoc.model_validate(
-                {
-                    "id": self._to_str(row["id"]),
-                    "orgId": self._to_str(row["org_id"]),
-                    "divisionId": self._to_optional_str(row["division_id"]),
-                    "name": row["name"],
-                    "url": row["url"],
-                    "summary": row["summary"],
-                    "isTemplate": row["is_template"],
-                    "updatedAt": row["updated_at"],
-                }
-            )
-            for row in rows
-        ]
 
-    async def _fetch_channels(
+    async def list_channels(
         self,
         *,
         org_id: str,
@@ -228,10 +262,23 @@ class WorkspaceRepository:
         include_templates: bool,
         page: int,
         page_size: int,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
     ) -> ChannelListResponse:
-        offset = max(page - 1, 0) * page_size
+        """Page channels newest-first on the ``(updated_at, id)`` keyset.
+
+        ``page`` is honoured as an offset only when no cursor is supplied, for
+        clients that have not moved to ``nextCursor`` yet. The COUNT runs only
+        when ``include_total`` is requested.
+        """
+        position = KeysetCursor.decode(cursor) if cursor else None
+        keyset_clause = (
+            "AND (updated_at, id) < (CAST(:cursor_ts AS TIMESTAMPTZ), CAST(:cursor_id AS UUID))"
+            if position
+            else ""
+        )
         stmt = text(
-            """
+            f"""
             SELECT id,
                    org_id,
                    division_id,
@@ -251,72 +298,66 @@ class WorkspaceRepository:
                AND archived_at IS NULL
                AND (CAST(:division_id AS UUID) IS NULL OR division_id IS NULL OR division_id = CAST(:division_id AS UUID))
                AND (:include_templates OR is_template = FALSE)
-             ORDER BY is_template DESC, name ASC
+               {keyset_clause}
+             ORDER BY updated_at DESC, id DESC
              LIMIT :limit OFFSET :offset
             """
         )
-        total_stmt = text(
-            """
-            SELECT COUNT(*)::INT
-              FROM public.workspace_channels
-             WHERE org_id = :org_id
-               AND archived_at IS NULL
-               AND (CAST(:division_id AS UUID) IS NULL OR division_id IS NULL OR division_id = CAST(:division_id AS UUID))
-               AND (:include_templates OR is_template = FALSE)
-            """
-        )
         params = {
             "org_id": org_id,
             "division_id": division_id,
             "include_templates": include_templates,
-            "limit": page_size,
-            "offset": offset,
+            "cursor_ts": position.sort_value if position else None,
+            "cursor_id": position.id if position else None,
+            # One extra row tells us whether another page exists without a COUNT
+            "limit": page_size + 1,
+            "offset": 0 if position else max(page - 1, 0) * page_size,
         }
         result = await self._session.execute(stmt, params)
         rows = result.mappings().all()
-        total_result = await self._session.execute(total_stmt, params)
-        total = int(total_result.scalar_one())
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        total: Optional[int] = None
+        if include_total:
+            total_stmt = text(
+                """
+                SELECT COUNT(*)::INT
+                  FROM public.workspace_channels
+                 WHERE org_id = :org_id
+                   AND archived_at IS NULL
+                   AND (CAST(:division_id AS UUID) IS NULL OR division_id IS NULL OR division_id = CAST(:division_id AS UUID))
+                   AND (:include_templates OR is_template = FALSE)
+                """
+            )
+            total_result = await self._session.execute(total_stmt, params)
+            total = int(total_result.scalar_one())
+
+        next_cursor = (
+            KeysetCursor(sort_value=rows[-1]["updated_at"], id=self._to_str(rows[-1]["id"])).encode()
+            if has_more
+            else None
+        )
         return ChannelListResponse(
-            items=[
-                WorkspaceChannel(
-                    id=self._to_str(row["id"]),
-                    org_id=self._to_str(row["org_id"]),
-                    division_id=self._to_optional_str(row["division_id"]),
-                    slug=row["slug"],
-                    name=row["name"],
-                    channel_type=row["channel_type"],
-                    topic=row["topic"],
-                    description=row["description"],
-                    member_count=row["member_count"],
-                    is_favorite=row["is_favorite"],
-                    is_muted=row["is_muted"],
-                    unread_count=row["unread_count"],
-                    is_template=row["is_template"],
-                    updated_at=row["updated_at"],
-                )
-                for row in rows
-            ],
+            items=[self._map_channel(row) for row in rows],
             total=total,
             page=page,
             pageSize=page_size,
+            nextCursor=next_cursor,
         )
 
-    async def list_channels(
-        self,
-        *,
-        org_id: str,
-        division_id: Optional[str],
-        include_templates: bool,
-        page: int,
-        page_size: int,
-    ) -> ChannelListResponse:
-        return await self._fetch_channels(
-            org_id=org_id,
-            division_id=division_id,
-            include_templates=include_templates,
-            page=page,
-            page_size=page_size,
-        )
+    @staticmethod
+    def _decode_activity_cursor(cursor: str) -> KeysetCursor:
+        """Decode an activity cursor, accepting the bare ISO timestamps issued previously."""
+        try:
+            return KeysetCursor.decode(cursor)
+        except InvalidCursorError:
+            try:
+                occurred_at = datetime.fromisoformat(cursor)
+            except ValueError:
+                raise InvalidCursorError() from None
+            # The nil UUID sorts first, so this matches the old "occurred_at < cursor" filter
+            return KeysetCursor(sort_value=occurred_at, id=NIL_UUID)
 
     async def fetch_activity_feed(
         self,
@@ -327,11 +368,14 @@ class WorkspaceRepository:
         limit: int,
         cursor: Optional[str],
     ) -> ActivityFeedResponse:
-        cursor_ts: Optional[datetime] = None
-        if cursor:
-            cursor_ts = datetime.fromisoformat(cursor)
+        position = self._decode_activity_cursor(cursor) if cursor else None
+        keyset_clause = (
+            "AND (occurred_at, id) < (CAST(:cursor_ts AS TIMESTAMPTZ), CAST(:cursor_id AS UUID))"
+            if position
+            else ""
+        )
         stmt = text(
-            """
+            f"""
             SELECT id,
                    org_id,
                    division_id,
@@ -347,8 +391,8 @@ class WorkspaceRepository:
              WHERE org_id = :org_id
                AND (CAST(:division_id AS UUID) IS NULL OR division_id IS NULL OR division_id = CAST(:division_id AS UUID))
                AND (:include_templates OR is_template = FALSE)
-               AND (:cursor_ts IS NULL OR occurred_at < :cursor_ts)
-             ORDER BY occurred_at DESC
+               {keyset_clause}
+             ORDER BY occurred_at DESC, id DESC
              LIMIT :limit
             """
         )
@@ -356,34 +400,92 @@ class WorkspaceRepository:
             "org_id": org_id,
             "division_id": division_id,
             "include_templates": include_templates,
-            "cursor_ts": cursor_ts,
-            "limit": limit,
+            "cursor_ts": position.sort_value if position else None,
+            "cursor_id": position.id if position else None,
+            "limit": limit + 1,
         }
         result = await self._session.execute(stmt, params)
         rows = result.mappings().all()
-        activities = [
-            WorkspaceActivity.model_validate(
-                {
-                    "id": self._to_str(row["id"]),
-                    "orgId": self._to_str(row["org_id"]),
-                    "divisionId": self._to_optional_str(row["division_id"]),
-                    "activityType": row["activity_type"],
-                    "content": row["content"],
-                    "metadata": row["metadata"],
-                    "occurredAt": row["occurred_at"],
-                    "isTemplate": row["is_template"],
-                    "author": {
-                        "id": self._to_optional_str(row["actor_id"]),
-                        "name": row["actor_name"] or "Workspace",  # fallback to generic name
-                        "role": row["actor_role"],
-                    },
-                }
-            )
-            for row in rows
-        ]
-        next_cursor = activities[-1].occurredAt.isoformat() if len(activities) == limit else None
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        activities = [self._map_activity(row) for row in rows]
+        next_cursor = (
+            KeysetCursor(sort_value=activities[-1].occurred_at, id=str(activities[-1].id)).encode()
+            if has_more
+            else None
+        )
         return ActivityFeedResponse(items=activities, nextCursor=next_cursor)
 
+    async def fetch_activities_after(
+        self,
+        *,
+        org_id: str,
+        division_id: Optional[str],
+        include_templates: bool,
+        after: KeysetCursor,
+        limit: int,
+    ) -> list[WorkspaceActivity]:
+        """Return activities newer than ``after`` in ascending keyset order."""
+        stmt = text(
+            """
+            SELECT id,
+                   org_id,
+                   division_id,
+                   activity_type,
+                   content,
+                   metadata,
+                   occurred_at,
+                   is_template,
+                   actor_id,
+                   actor_name,
+                   actor_role
+              FROM public.workspace_activities
+             WHERE org_id = :org_id
+               AND (CAST(:division_id AS UUID) IS NULL OR division_id IS NULL OR division_id = CAST(:division_id AS UUID))
+               AND (:include_templates OR is_template = FALSE)
+               AND (occurred_at, id) > (CAST(:cursor_ts AS TIMESTAMPTZ), CAST(:cursor_id AS UUID))
+             ORDER BY occurred_at ASC, id ASC
+             LIMIT :limit
+            """
+        )
+        result = await self._session.execute(
+            stmt,
+            {
+                "org_id": org_id,
+                "division_id": division_id,
+                "include_templates": include_templates,
+                "cursor_ts": after.sort_value,
+                "cursor_id": after.id,
+                "limit": limit,
+            },
+        )
+        return [self._map_activity(row) for row in result.mappings().all()]
+
+    async def fetch_activities_by_ids(self, activity_ids: list[str]) -> list[WorkspaceActivity]:
+        """Load specific activities, oldest first, for live fan-out."""
+        if not activity_ids:
+            return []
+        stmt = text(
+            """
+            SELECT id,
+                   org_id,
+                   division_id,
+                   activity_type,
+                   content,
+                   metadata,
+                   occurred_at,
+                   is_template,
+                   actor_id,
+                   actor_name,
+                   actor_role
+              FROM public.workspace_activities
+             WHERE id = ANY(CAST(:activity_ids AS UUID[]))
+             ORDER BY occurred_at ASC, id ASC
+            """
+        )
+        result = await self._session.execute(stmt, {"activity_ids": activity_ids})
+        return [self._map_activity(row) for row in result.mappings().all()]
+
     async def create_project(
         self,
         *,
@@ -431,6 +533,7 @@ class WorkspaceRepository:
         )
         row = result.mappings().one()
         await self._session.commit()
+        await invalidate_hub_metrics(row["org_id"])
         return WorkspaceProject(
             id=row["id"],
             orgId=row["org_id"],
@@ -488,6 +591,7 @@ class WorkspaceRepository:
         )
         row = result.mappings().one()
         await self._session.commit()
+        await invalidate_hub_metrics(row["org_id"])
         return WorkspaceProject(
             id=row["id"],
             orgId=row["org_id"],
@@ -504,10 +608,13 @@ class WorkspaceRepository:
 
     async def delete_project(self, *, project_id: str) -> None:
         stmt = text(
-            """DELETE FROM public.workspace_projects WHERE id = :project_id"""
+            """DELETE FROM public.workspace_projects WHERE id = :project_id RETURNING org_id"""
         )
-        await self._session.execute(stmt, {"project_id": project_id})
+        result = await self._session.execute(stmt, {"project_id": project_id})
+        org_id = result.scalar_one_or_none()
         await self._session.commit()
+        if org_id is not None:
+            await invalidate_hub_metrics(org_id)
 
     async def create_channel(
         self,
@@ -577,6 +684,7 @@ class WorkspaceRepository:
         )
         row = result.mappings().one()
         await self._session.commit()
+        await invalidate_hub_metrics(row["org_id"])
         return WorkspaceChannel(
             id=row["id"],
             orgId=row["org_id"],
@@ -646,6 +754,7 @@ class WorkspaceRepository:
         )
         row = result.mappings().one()
         await self._session.commit()
+        await invalidate_hub_metrics(row["org_id"])
         return WorkspaceChannel(
             id=row["id"],
             orgId=row["org_id"],
@@ -664,9 +773,12 @@ class WorkspaceRepository:
         )
 
     async def delete_channel(self, *, channel_id: str) -> None:
-        stmt = text("DELETE FROM public.workspace_channels WHERE id = :channel_id")
-        await self._session.execute(stmt, {"channel_id": channel_id})
+        stmt = text("DELETE FROM public.workspace_channels WHERE id = :channel_id RETURNING org_id")
+        result = await self._session.execute(stmt, {"channel_id": channel_id})
+        org_id = result.scalar_one_or_none()
         await self._session.commit()
+        if org_id is not None:
+            await invalidate_hub_metrics(org_id)
 
 
 class WorkspacePermissionRepository:
@@ -714,3 +826,187 @@ class WorkspacePermissionRepository:
         )
         if result.scalar_one_or_none() is None:
             raise PermissionError("User does not belong to this division")
+
+
+@dataclass(slots=True)
+class WorkspaceSeedJob:
+    """A claimed row of ``workspace_seed_jobs``."""
+
+    org_id: str
+    template_source: str
+    requested_by: Optional[str]
+    attempts: int
+
+
+class WorkspaceSeedJobRepository:
+    """Durable queue backing background workspace template seeding."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_status(self, org_id: str) -> Optional[WorkspaceSeedStatus]:
+        stmt = text(
+            """
+            SELECT org_id::text AS org_id,
+                   template_source,
+                   status,
+                   attempts,
+                   last_error,
+                   created_at,
+                   updated_at,
+                   completed_at
+              FROM public.workspace_seed_jobs
+             WHERE org_id = :org_id
+             ORDER BY created_at DESC
+             LIMIT 1
+            """
+        )
+        row = (await self._session.execute(stmt, {"org_id": org_id})).mappings().first()
+        if row is None:
+            return None
+        return WorkspaceSeedStatus(
+            orgId=row["org_id"],
+            templateSource=row["template_source"],
+            status=row["status"],
+            attempts=row["attempts"],
+            lastError=row["last_error"],
+            createdAt=row["created_at"],
+            updatedAt=row["updated_at"],
+            completedAt=row["completed_at"],
+        )
+
+    async def claim_batch(self, limit: int) -> list[WorkspaceSeedJob]:
+        """Lock up to ``limit`` due jobs for the current transaction.
+
+        ``SKIP LOCKED`` lets several workers drain the queue without blocking
+        on, or double-processing, each other's rows.
+        """
+
+        stmt = text(
+            """
+            SELECT org_id::text AS org_id,
+                   template_source,
+                   requested_by::text AS requested_by,
+                   attempts
+              FROM public.workspace_seed_jobs
+             WHERE status = 'pending'
+               AND run_after <= NOW()
+             ORDER BY run_after, created_at
+             LIMIT :limit
+               FOR UPDATE SKIP LOCKED
+            """
+        )
+        result = await self._session.execute(stmt, {"limit": limit})
+        return [
+            WorkspaceSeedJob(
+                org_id=row["org_id"],
+                template_source=row["template_source"],
+                requested_by=row["requested_by"],
+                attempts=row["attempts"],
+            )
+            for row in result.mappings().all()
+        ]
+
+    async def mark_completed(self, job: WorkspaceSeedJob, *, seeded: bool) -> None:
+        stmt = text(
+            """
+            UPDATE public.workspace_seed_jobs
+               SET status = :status,
+                   attempts = attempts + 1,
+                   last_error = NULL,
+                   updated_at = NOW(),
+                   completed_at = NOW()
+             WHERE org_id = :org_id
+               AND template_source = :template_source
+            """
+        )
+        await self._session.execute(
+            stmt,
+            {
+                "status": "completed" if seeded else "skipped",
+                "org_id": job.org_id,
+                "template_source": job.template_source,
+            },
+        )
+
+    async def mark_failed(
+        self,
+        job: WorkspaceSeedJob,
+        *,
+        error: str,
+        max_attempts: int,
+        retry_delay_seconds: int,
+    ) -> None:
+        """Schedule a retry with linear backoff, or give up after ``max_attempts``."""
+
+        stmt = text(
+            """
+            UPDATE public.workspace_seed_jobs
+               SET status = CASE WHEN attempts + 1 >= :max_attempts THEN 'failed' ELSE 'pending' END,
+                   attempts = attempts + 1,
+                   last_error = :error,
+                   run_after = NOW() + make_interval(secs => :retry_delay * (attempts + 1)),
+                   updated_at = NOW()
+             WHERE org_id = :org_id
+               AND template_source = :template_source
+            """
+        )
+        await self._session.execute(
+            stmt,
+            {
+                "max_attempts": max_attempts,
+                "error": error,
+                "retry_delay": retry_delay_seconds,
+                "org_id": job.org_id,
+                "template_source": job.template_source,
+            },
+        )
+
+    async def load_seed_context(
+        self, org_ids: list[str]
+    ) -> dict[str, tuple[OrganizationResponse, list[OrganizationDivision]]]:
+        """Load organizations and their divisions for a batch of jobs in one round trip."""
+
+        if not org_ids:
+            return {}
+        stmt = text(
+            """
+            SELECT o.id::text AS id,
+                   o.name,
+                   o.slug,
+                   o.description,
+                   COALESCE(
+                       (
+                           SELECT json_agg(
+                                      json_build_object(
+                                          'id', d.id::text,
+                                          'name', d.name,
+                                          'key', d.key,
+                                          'description', d.description,
+                                          'orgId', d.org_id::text
+                                      )
+                                      ORDER BY d.created_at, d.id
+                                  )
+                             FROM public.divisions AS d
+                            WHERE d.org_id = o.id
+                              AND d.deleted_at IS NULL
+                       ),
+                       '[]'::json
+                   ) AS divisions
+              FROM public.organizations AS o
+             WHERE o.id = ANY(CAST(:org_ids AS UUID[]))
+            """
+        )
+        result = await self._session.execute(stmt, {"org_ids": org_ids})
+        contexts: dict[str, tuple[OrganizationResponse, list[OrganizationDivision]]] = {}
+        for row in result.mappings().all():
+            divisions = [OrganizationDivision.model_validate(item) for item in WorkspaceRepository._json_rows(row["divisions"])]
+            organization = OrganizationResponse(
+                id=row["id"],
+                name=row["name"],
+                slug=row["slug"],
+                description=row["description"],
+                divisions=divisions,
+            )
+            contexts[row["id"]] = (organization, divisions)
+        return contexts
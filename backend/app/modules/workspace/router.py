@@ -18,12 +18,21 @@ Security Implementation:
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from contextlib import asynccontextmanager
+from typing import Optional
 
+from fastapi import APIRouter, Depends, FastAPI, Header, Query, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from ...core import get_settings
+from ...core.pagination import KeysetCursor
+from ...core.presence import get_presence_registry
 from ...core.scope_integration import require_organization_access_with_id, require_division_access_with_ids
+from ...db.session import get_session_factory
 from ...dependencies import CurrentPrincipal, require_current_principal
 from ...core.scope import ScopeContext
-from .di import get_workspace_service
+from .di import get_activity_broadcaster, get_workspace_service, get_workspace_template_service
+from .jobs import WorkspaceSeedWorker
 from .schemas import (
     ActivityFeedResponse,
     ChannelCreatePayload,
@@ -34,10 +43,57 @@ from .schemas import (
     WorkspaceOverview,
     WorkspaceProject,
     WorkspaceChannel,
+    WorkspaceSeedStatus,
 )
-from .service import WorkspaceService
+from .service import WorkspaceService, WorkspaceTemplateService
+from .streaming import activity_event_stream
+
+
+_SEED_WORKER = WorkspaceSeedWorker()
+
+
+@asynccontextmanager
+async def _workspace_lifespan(_app: FastAPI):
+    """Run the template seed worker and stop the live activity listener on shutdown."""
+
+    _SEED_WORKER.start()
+    try:
+        yield
+    finally:
+        await _SEED_WORKER.shutdown()
+        await get_activity_broadcaster().shutdown()
+
+
+router = APIRouter(prefix="/api", tags=["workspaces"], lifespan=_workspace_lifespan)
 
-router = APIRouter(prefix="/api", tags=["workspaces"])
+
+async def _activity_stream_response(
+    *,
+    principal: CurrentPrincipal,
+    service: WorkspaceService,
+    org_id: str,
+    division_id: Optional[str],
+    include_templates: bool,
+    last_event_id: Optional[str],
+) -> StreamingResponse:
+    await service.authorize_activity_stream(principal=principal, org_id=org_id, division_id=division_id)
+    settings = get_settings()
+    events = activity_event_stream(
+        get_activity_broadcaster(),
+        get_session_factory(),
+        org_id=org_id,
+        division_id=division_id,
+        include_templates=include_templates,
+        last_event_id=KeysetCursor.decode(last_event_id) if last_event_id else None,
+        buffer_size=settings.workspace_stream_buffer_size,
+        heartbeat_seconds=settings.workspace_stream_heartbeat_seconds,
+        on_keepalive=lambda: get_presence_registry().heartbeat(principal, org_id, division_id),
+    )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 # Organization-scoped workspace endpoints
@@ -64,12 +120,35 @@ async def get_organization_workspace_overview(
     )
 
 
+@router.get("/organizations/{org_id}/workspace/seed-status", response_model=WorkspaceSeedStatus)
+async def get_organization_workspace_seed_status(
+    org_id: str,
+    scope_ctx: ScopeContext = Depends(require_organization_access_with_id({"workspace:read"})),
+    principal: CurrentPrincipal = Depends(require_current_principal),
+    service: WorkspaceTemplateService = Depends(get_workspace_template_service),
+) -> WorkspaceSeedStatus:
+    """
+    Return progress of the background template seeding job.
+
+    Requires organization-level workspace:read permission.
+    """
+    seed_status = await service.get_seed_status(principal=principal, org_id=org_id)
+    if seed_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No template seeding job recorded for this organization",
+        )
+    return seed_status
+
+
 @router.get("/organizations/{org_id}/workspace/channels", response_model=ChannelListResponse)
 async def list_organization_channels(
     org_id: str,
     include_templates: bool = Query(default=True, alias="includeTemplates"),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200, alias="pageSize"),
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=False, alias="includeTotal"),
     scope_ctx: ScopeContext = Depends(require_organization_access_with_id({"workspace:read"})),
     principal: CurrentPrincipal = Depends(require_current_principal),
     service: WorkspaceService = Depends(get_workspace_service),
@@ -87,6 +166,8 @@ async def list_organization_channels(
         include_templates=include_templates,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
@@ -116,6 +197,32 @@ async def get_organization_activity_feed(
     )
 
 
+@router.get("/organizations/{org_id}/workspace/activities/stream")
+async def stream_organization_activities(
+    org_id: str,
+    include_templates: bool = Query(default=True, alias="includeTemplates"),
+    last_event_id_query: str | None = Query(default=None, alias="lastEventId"),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    scope_ctx: ScopeContext = Depends(require_organization_access_with_id({"workspace:read"})),
+    principal: CurrentPrincipal = Depends(require_current_principal),
+    service: WorkspaceService = Depends(get_workspace_service),
+) -> StreamingResponse:
+    """
+    Stream new organization activities as Server-Sent Events.
+
+    Reconnecting clients send ``Last-Event-ID`` (or ``lastEventId``) and receive
+    everything written after that event before live delivery resumes.
+    """
+    return await _activity_stream_response(
+        principal=principal,
+        service=service,
+        org_id=org_id,
+        division_id=None,
+        include_templates=include_templates,
+        last_event_id=last_event_id or last_event_id_query,
+    )
+
+
 @router.post("/organizations/{org_id}/workspace/projects", response_model=WorkspaceProject, status_code=201)
 async def create_organization_project(
     org_id: str,
@@ -288,6 +395,8 @@ async def list_division_channels(
     include_templates: bool = Query(default=True, alias="includeTemplates"),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200, alias="pageSize"),
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=False, alias="includeTotal"),
     scope_ctx: ScopeContext = Depends(require_division_access_with_ids({"workspace:read"})),
     principal: CurrentPrincipal = Depends(require_current_principal),
     service: WorkspaceService = Depends(get_workspace_service),
@@ -305,6 +414,8 @@ async def list_division_channels(
         include_templates=include_templates,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
@@ -335,6 +446,32 @@ async def get_division_activity_feed(
     )
 
 
+@router.get("/organizations/{org_id}/divisions/{div_id}/workspace/activities/stream")
+async def stream_division_activities(
+    org_id: str,
+    div_id: str,
+    include_templates: bool = Query(default=True, alias="includeTemplates"),
+    last_event_id_query: str | None = Query(default=None, alias="lastEventId"),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    scope_ctx: ScopeContext = Depends(require_division_access_with_ids({"workspace:read"})),
+    principal: CurrentPrincipal = Depends(require_current_principal),
+    service: WorkspaceService = Depends(get_workspace_service),
+) -> StreamingResponse:
+    """
+    Stream new division activities as Server-Sent Events.
+
+    Supports the same ``Last-Event-ID`` resumption as the organization stream.
+    """
+    return await _activity_stream_response(
+        principal=principal,
+        service=service,
+        org_id=org_id,
+        division_id=div_id,
+        include_templates=include_templates,
+        last_event_id=last_event_id or last_event_id_query,
+    )
+
+
 @router.post("/organizations/{org_id}/divisions/{div_id}/workspace/projects", response_model=WorkspaceProject, status_code=201)
 async def create_division_project(
     org_id: str,
@@ -180,9 +180,10 @@ class ChannelListResponse(BaseModel):
     """Paginated channel list."""
 
     items: list[WorkspaceChannel]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int = Field(alias="pageSize")
+    next_cursor: Optional[str] = Field(default=None, alias="nextCursor")
 
     model_config = ConfigDict(populate_by_name=True)
 
@@ -196,6 +197,21 @@ class ActivityFeedResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class WorkspaceSeedStatus(BaseModel):
+    """Progress of the background template seeding job for an organization."""
+
+    org_id: str = Field(alias="orgId")
+    template_source: str = Field(alias="templateSource")
+    status: Literal["pending", "completed", "skipped", "failed"]
+    attempts: int = 0
+    last_error: Optional[str] = Field(default=None, alias="lastError")
+    created_at: datetime = Field(alias="createdAt")
+    updated_at: datetime = Field(alias="updatedAt")
+    completed_at: Optional[datetime] = Field(default=None, alias="completedAt")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
 class ProjectCreatePayload(BaseModel):
     name: str
     description: Optional[str] = None
@@ -16,16 +16,19 @@ import asyncio
 import json
 import logging
 import time
+from collections import OrderedDict
 from typing import Optional, Sequence
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...core import get_settings
 from ...dependencies import CurrentPrincipal
 from ...core.scope_integration import ScopedService
 from ...core.scope import ScopeContext
+from ..organizations.repository import invalidate_hub_metrics
 from ..organizations.schemas import OrganizationDivision, OrganizationResponse
-from .repository import WorkspacePermissionRepository, WorkspaceRepository
+from .repository import WorkspacePermissionRepository, WorkspaceRepository, WorkspaceSeedJobRepository
 from .schemas import (
     ActivityFeedResponse,
     ChannelCreatePayload,
@@ -36,41 +39,78 @@ from .schemas import (
     WorkspaceChannel,
     WorkspaceOverview,
     WorkspaceProject,
+    WorkspaceSeedStatus,
 )
 from .templates import build_template_payload
 
 logger = logging.getLogger(__name__)
 
 
+OverviewCacheKey = tuple[str, Optional[str], bool]
+
+
 class WorkspaceCache:
-    """Simple in-process TTL cache keyed by organization scope."""
+    """Bounded in-process LRU cache of workspace overviews.
+
+    Entries are keyed by ``(org_id, division_id, include_templates)`` and shared
+    by every principal whose scope has already been validated. An org-to-keys
+    index keeps ``clear_scope`` proportional to the organization's entries.
+    """
 
-    def __init__(self, ttl_seconds: int = 60) -> None:
+    def __init__(self, ttl_seconds: int = 60, max_entries: int = 1_024) -> None:
         self._ttl = ttl_seconds
-        self._store: dict[str, tuple[float, object]] = {}
+        self._max_entries = max(1, max_entries)
+        self._store: OrderedDict[OverviewCacheKey, tuple[float, object]] = OrderedDict()
+        self._org_index: dict[str, set[OverviewCacheKey]] = {}
         self._lock = asyncio.Lock()
 
-    async def get(self, key: str) -> Optional[object]:
+    @staticmethod
+    def overview_key(org_id: str, division_id: Optional[str], include_templates: bool) -> OverviewCacheKey:
+        return (org_id, division_id, include_templates)
+
+    async def get(self, key: OverviewCacheKey) -> Optional[object]:
         async with self._lock:
             entry = self._store.get(key)
             if not entry:
                 return None
             expires_at, payload = entry
             if time.monotonic() >= expires_at:
-                self._store.pop(key, None)
+                self._discard(key)
                 return None
+            self._store.move_to_end(key)
             return payload
 
-    async def set(self, key: str, payload: object) -> None:
+    async def set(self, key: OverviewCacheKey, payload: object) -> None:
         async with self._lock:
             self._store[key] = (time.monotonic() + self._ttl, payload)
+            self._store.move_to_end(key)
+            self._org_index.setdefault(key[0], set()).add(key)
+            while len(self._store) > self._max_entries:
+                oldest = next(iter(self._store))
+                self._discard(oldest)
 
     async def clear_scope(self, org_id: str) -> None:
         async with self._lock:
-            keys_to_remove = [key for key in self._store if f":{org_id}:" in key]
-            for key in keys_to_remove:
+            for key in self._org_index.pop(org_id, set()):
                 self._store.pop(key, None)
 
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def _discard(self, key: OverviewCacheKey) -> None:
+        self._store.pop(key, None)
+        keys = self._org_index.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                self._org_index.pop(key[0], None)
+
+
+_WORKSPACE_CACHE = WorkspaceCache(
+    ttl_seconds=get_settings().workspace_cache_ttl_seconds,
+    max_entries=get_settings().workspace_cache_max_entries,
+)
+
 
 class WorkspaceService(ScopedService):
     """
@@ -90,7 +130,7 @@ class WorkspaceService(ScopedService):
         super().__init__()
         self._repository = repository
         self._permission_repository = permission_repository
-        self._cache = cache or WorkspaceCache()
+        self._cache = cache if cache is not None else _WORKSPACE_CACHE
 
     # Organization-scoped methods
     async def get_overview_for_organization(
@@ -118,9 +158,10 @@ class WorkspaceService(ScopedService):
                 principal, org_id, division_id, {"workspace:read"}
             )
 
-        cache_key = f"overview:{org_id}:{division_id or 'all'}:{'templates' if include_templates else 'live'}:{principal.id}"
+        # Scope was validated above, so the entry can be shared across principals
+        cache_key = WorkspaceCache.overview_key(org_id, division_id, include_templates)
         cached = await self._cache.get(cache_key)
-        if cached:
+        if cached is not None:
             return cached  # type: ignore[return-value]
         overview = await self._repository.fetch_overview(
             org_id=org_id,
@@ -146,9 +187,10 @@ class WorkspaceService(ScopedService):
         """
         await self._permission_repository.ensure_membership(principal, org_id)
         await self._permission_repository.ensure_division_membership(principal, org_id, division_id)
-        cache_key = f"overview:{org_id}:{division_id or 'all'}:{'templates' if include_templates else 'live'}:{principal.id}"
+        # Scope was validated above, so the entry can be shared across principals
+        cache_key = WorkspaceCache.overview_key(org_id, division_id, include_templates)
         cached = await self._cache.get(cache_key)
-        if cached:
+        if cached is not None:
             return cached  # type: ignore[return-value]
         overview = await self._repository.fetch_overview(
             org_id=org_id,
@@ -167,6 +209,8 @@ class WorkspaceService(ScopedService):
         include_templates: bool,
         page: int,
         page_size: int,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
     ) -> ChannelListResponse:
         """
         List channels for an organization with scope validation.
@@ -188,6 +232,8 @@ class WorkspaceService(ScopedService):
             include_templates=include_templates,
             page=page,
             page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
         )
 
     # Legacy method for backward compatibility
@@ -200,6 +246,8 @@ class WorkspaceService(ScopedService):
         include_templates: bool,
         page: int,
         page_size: int,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
     ) -> ChannelListResponse:
         await self._permission_repository.ensure_membership(principal, org_id)
         await self._permission_repository.ensure_division_membership(principal, org_id, division_id)
@@ -209,6 +257,8 @@ class WorkspaceService(ScopedService):
             include_templates=include_templates,
             page=page,
             page_size=page_size,
+            cursor=cursor,
+            include_total=include_total,
         )
 
     async def fetch_activity_feed_for_organization(
@@ -243,6 +293,18 @@ class WorkspaceService(ScopedService):
             cursor=cursor,
         )
 
+    async def authorize_activity_stream(
+        self,
+        *,
+        principal: CurrentPrincipal,
+        org_id: str,
+        division_id: Optional[str],
+    ) -> None:
+        """Validate access before a live activity stream is opened."""
+        await self.validate_organization_access(principal, org_id, {"activity:read"})
+        if division_id:
+            await self.validate_division_access(principal, org_id, division_id, {"activity:read"})
+
     async def create_project_for_organization(
         self,
         *,
@@ -488,9 +550,10 @@ class WorkspaceTemplateService(ScopedService):
     and division boundaries.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, cache: Optional[WorkspaceCache] = None) -> None:
         super().__init__()
         self._session = session
+        self._cache = cache if cache is not None else _WORKSPACE_CACHE
 
     async def _should_seed(self, org_id: str) -> bool:
         query = text(
@@ -506,43 +569,46 @@ class WorkspaceTemplateService(ScopedService):
         exists = result.scalar()
         return not bool(exists)
 
-    async def seed_for_organization(
+    async def invalidate_organization(self, org_id: str) -> None:
+        """Drop cached overviews and hub metrics once seeded rows are committed."""
+        await self._cache.clear_scope(org_id)
+        await invalidate_hub_metrics(org_id)
+
+    async def get_seed_status(
         self,
         *,
         principal: CurrentPrincipal,
+        org_id: str,
+    ) -> Optional[WorkspaceSeedStatus]:
+        await self.validate_organization_access(principal, org_id, {"workspace:read"})
+        return await WorkspaceSeedJobRepository(self._session).get_status(org_id)
+
+    async def apply_template(
+        self,
+        *,
         organization: OrganizationResponse,
         divisions: Sequence[OrganizationDivision],
-        seeded_by: Optional[str] = None,
-    ) -> None:
+        template_source: str,
+        seeded_by: Optional[str],
+    ) -> bool:
         """
-        Seed template data for an organization with scope validation.
+        Insert template rows inside the caller's transaction.
 
-        This method validates that the principal has admin access to the organization
-        before seeding template data.
+        Returns ``False`` without writing when the organization already has
+        workspace content. Every statement uses the transaction's ``NOW()``, so
+        seeded rows share one timestamp.
         """
-        # Validate organization admin access
-        scope_ctx = await self.validate_organization_access(
-            principal, organization.id, {"workspace:admin"}
-        )
         if not await self._should_seed(organization.id):
             logger.info(
                 "workspace.templates.skip", extra={"org_id": organization.id, "reason": "already-populated"}
             )
-            return
+            return False
 
         payload = build_template_payload(organization, divisions)
-        template_source = "default:v1"
-        now_query = text("SELECT NOW()")
-        now_result = await self._session.execute(now_query)
-        timestamp = now_result.scalar_one()
-        projects_json = json.dumps(payload["projects"])
-        tasks_json = json.dumps(payload["tasks"])
-        docs_json = json.dumps(payload["docs"])
-        channels_json = json.dumps(payload["channels"])
-        activities_json = json.dumps(payload["activities"])
-
-        async with self._session.begin():
-            await self._session.execute(
+        base_params = {"org_id": organization.id, "template_source": template_source}
+
+        await self._session.execute(
+            text(
                 """
                 INSERT INTO public.workspace_projects (
                     org_id,
@@ -568,19 +634,16 @@ class WorkspaceTemplateService(ScopedService):
                        'board',
                        TRUE,
                        :template_source,
-                       :timestamp,
-                       :timestamp
-                  FROM JSONB_ARRAY_ELEMENTS(:projects::JSONB) AS projects
-                """,
-                {
-                    "org_id": organization.id,
-                    "projects": projects_json,
-                    "template_source": template_source,
-                    "timestamp": timestamp,
-                },
-            )
+                       NOW(),
+                       NOW()
+                  FROM JSONB_ARRAY_ELEMENTS(CAST(:projects AS JSONB)) AS projects
+                """
+            ),
+            {**base_params, "projects": json.dumps(payload["projects"])},
+        )
 
-            await self._session.execute(
+        await self._session.execute(
+            text(
                 """
                 INSERT INTO public.workspace_tasks (
                     org_id,
@@ -611,19 +674,16 @@ class WorkspaceTemplateService(ScopedService):
                        COALESCE((tasks->>'due_at')::timestamptz, NULL),
                        TRUE,
                        :template_source,
-                       :timestamp,
-                       :timestamp
-                  FROM JSONB_ARRAY_ELEMENTS(:tasks::JSONB) AS tasks
-                """,
-                {
-                    "org_id": organization.id,
-                    "tasks": tasks_json,
-                    "template_source": template_source,
-                    "timestamp": timestamp,
-                },
-            )
+                       NOW(),
+                       NOW()
+                  FROM JSONB_ARRAY_ELEMENTS(CAST(:tasks AS JSONB)) AS tasks
+                """
+            ),
+            {**base_params, "tasks": json.dumps(payload["tasks"])},
+        )
 
-            await self._session.execute(
+        await self._session.execute(
+            text(
                 """
                 INSERT INTO public.workspace_docs (
                     org_id,
@@ -643,19 +703,16 @@ class WorkspaceTemplateService(ScopedService):
                        docs->>'summary',
                        TRUE,
                        :template_source,
-                       :timestamp,
-                       :timestamp
-                  FROM JSONB_ARRAY_ELEMENTS(:docs::JSONB) AS docs
-                """,
-                {
-                    "org_id": organization.id,
-                    "docs": docs_json,
-                    "template_source": template_source,
-                    "timestamp": timestamp,
-                },
-            )
+                       NOW(),
+                       NOW()
+                  FROM JSONB_ARRAY_ELEMENTS(CAST(:docs AS JSONB)) AS docs
+                """
+            ),
+            {**base_params, "docs": json.dumps(payload["docs"])},
+        )
 
-            await self._session.execute(
+        await self._session.execute(
+            text(
                 """
                 INSERT INTO public.workspace_channels (
                     org_id,
@@ -687,19 +744,16 @@ class WorkspaceTemplateService(ScopedService):
                        0,
                        TRUE,
                        :template_source,
-                       :timestamp,
-                       :timestamp
-                  FROM JSONB_ARRAY_ELEMENTS(:channels::JSONB) AS channels
-                """,
-                {
-                    "org_id": organization.id,
-                    "channels": channels_json,
-                    "template_source": template_source,
-                    "timestamp": timestamp,
-                },
-            )
+                       NOW(),
+                       NOW()
+                  FROM JSONB_ARRAY_ELEMENTS(CAST(:channels AS JSONB)) AS channels
+                """
+            ),
+            {**base_params, "channels": json.dumps(payload["channels"])},
+        )
 
-            await self._session.execute(
+        await self._session.execute(
+            text(
                 """
                 INSERT INTO public.workspace_activities (
                     org_id,
@@ -717,27 +771,26 @@ class WorkspaceTemplateService(ScopedService):
                 )
                 SELECT :org_id,
                        CAST(activities->>'division_id' AS UUID),
-                       :seeded_by,
+                       CAST(:seeded_by AS UUID),
                        COALESCE(:seeded_by_name, 'Workspace Guide'),
                        'guide',
                        activities->>'activity_type',
                        activities->>'content',
                        activities->'metadata',
-                       :timestamp,
+                       NOW(),
                        TRUE,
                        :template_source,
-                       :timestamp
-                  FROM JSONB_ARRAY_ELEMENTS(:activities::JSONB) AS activities
-                """,
-                {
-                    "org_id": organization.id,
-                    "activities": activities_json,
-                    "template_source": template_source,
-                    "timestamp": timestamp,
-                    "seeded_by": seeded_by or principal.id,
-                    "seeded_by_name": organization.name,
-                },
-            )
+                       NOW()
+                  FROM JSONB_ARRAY_ELEMENTS(CAST(:activities AS JSONB)) AS activities
+                """
+            ),
+            {
+                **base_params,
+                "activities": json.dumps(payload["activities"]),
+                "seeded_by": seeded_by,
+                "seeded_by_name": organization.name,
+            },
+        )
 
         logger.info(
             "workspace.templates.seeded",
@@ -747,4 +800,4 @@ class WorkspaceTemplateService(ScopedService):
                 "template_source": template_source,
             },
         )
-
+        return True
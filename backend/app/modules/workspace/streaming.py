@@ -0,0 +1,281 @@
+"""Live workspace activity delivery over Server-Sent Events."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable
+from contextlib import suppress
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from ...core.pagination import KeysetCursor
+from .repository import WorkspaceRepository
+from .schemas import WorkspaceActivity
+
+logger = logging.getLogger(__name__)
+
+
+ACTIVITY_NOTIFY_CHANNEL = "workspace_activity_created"
+_RECONNECT_DELAY_SECONDS = 1.0
+
+
+def activity_cursor(activity: WorkspaceActivity) -> KeysetCursor:
+    return KeysetCursor(sort_value=activity.occurred_at, id=str(activity.id))
+
+
+def format_activity_event(activity: WorkspaceActivity) -> str:
+    """Render one activity as an SSE frame whose id is its keyset cursor."""
+
+    data = activity.model_dump_json(by_alias=True)
+    return f"id: {activity_cursor(activity).encode()}\nevent: activity\ndata: {data}\n\n"
+
+
+class ActivitySubscription:
+    """One SSE connection's bounded buffer of pending activities.
+
+    When the buffer overflows the subscription is closed rather than growing;
+    the client reconnects with ``Last-Event-ID`` and catches up from the table.
+    """
+
+    def __init__(
+        self,
+        *,
+        org_id: str,
+        division_id: Optional[str],
+        include_templates: bool,
+        buffer_size: int,
+    ) -> None:
+        self.org_id = org_id
+        self.division_id = division_id
+        self.include_templates = include_templates
+        self.closed = False
+        self._queue: asyncio.Queue[Optional[WorkspaceActivity]] = asyncio.Queue(maxsize=max(1, buffer_size))
+
+    def matches(self, activity: WorkspaceActivity) -> bool:
+        if activity.is_template and not self.include_templates:
+            return False
+        if self.division_id is None or activity.division_id is None:
+            return True
+        return str(activity.division_id) == self.division_id
+
+    def offer(self, activity: WorkspaceActivity) -> None:
+        if self.closed:
+            return
+        try:
+            self._queue.put_nowait(activity)
+        except asyncio.QueueFull:
+            logger.info(
+                "workspace.activity_stream.buffer_overflow",
+                extra={"org_id": self.org_id, "buffer_size": self._queue.maxsize},
+            )
+            self.close()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        # Make room for the end-of-stream marker; the client resumes from its last event id
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    async def next(self, timeout: float) -> Optional[WorkspaceActivity]:
+        """Wait for the next activity; ``None`` means the stream must end."""
+
+        return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+
+
+class ActivityBroadcaster:
+    """Fans ``workspace_activities`` inserts out to in-process SSE subscribers.
+
+    A single LISTEN connection per process receives the row ids published by
+    the insert trigger. Each batch of ids is loaded once and offered to every
+    matching subscription, so open tabs add no per-tab queries.
+    """
+
+    def __init__(
+        self,
+        engine_getter: Callable[[], AsyncEngine],
+        session_factory_getter: Callable[[], Callable[[], AsyncSession]],
+        *,
+        channel: str = ACTIVITY_NOTIFY_CHANNEL,
+    ) -> None:
+        self._engine_getter = engine_getter
+        self._session_factory_getter = session_factory_getter
+        self._channel = channel
+        self._subscribers: dict[str, set[ActivitySubscription]] = defaultdict(set)
+        self._notices: asyncio.Queue[str] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+        self._lock = asyncio.Lock()
+
+    async def subscribe(
+        self,
+        *,
+        org_id: str,
+        division_id: Optional[str],
+        include_templates: bool,
+        buffer_size: int,
+    ) -> ActivitySubscription:
+        subscription = ActivitySubscription(
+            org_id=org_id,
+            division_id=division_id,
+            include_templates=include_templates,
+            buffer_size=buffer_size,
+        )
+        async with self._lock:
+            self._subscribers[org_id].add(subscription)
+            if self._task is None or self._task.done():
+                self._task = asyncio.create_task(self._run(), name="workspace-activity-broadcaster")
+        return subscription
+
+    async def unsubscribe(self, subscription: ActivitySubscription) -> None:
+        async with self._lock:
+            subscribers = self._subscribers.get(subscription.org_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    self._subscribers.pop(subscription.org_id, None)
+
+    async def shutdown(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        self._close_all()
+
+    def _on_notify(self, _connection: Any, _pid: int, _channel: str, payload: str) -> None:
+        self._notices.put_nowait(payload)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with self._engine_getter().connect() as connection:
+                    raw_connection = await connection.get_raw_connection()
+                    driver = raw_connection.driver_connection
+                    await driver.add_listener(self._channel, self._on_notify)
+                    logger.info("workspace.activity_stream.listening", extra={"channel": self._channel})
+                    try:
+                        while True:
+                            await self._dispatch(await self._drain_notices())
+                    finally:
+                        with suppress(Exception):
+                            await driver.remove_listener(self._channel, self._on_notify)
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                logger.error("workspace.activity_stream.listener_failed", exc_info=error)
+                # Events may have been missed; clients resume from their last event id
+                self._close_all()
+                await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+
+    async def _drain_notices(self) -> list[str]:
+        payloads = [await self._notices.get()]
+        while not self._notices.empty():
+            payloads.append(self._notices.get_nowait())
+        return payloads
+
+    async def _dispatch(self, payloads: list[str]) -> None:
+        activity_ids: list[str] = []
+        for payload in payloads:
+            try:
+                notice = json.loads(payload)
+            except json.JSONDecodeError:
+                logger.warning("workspace.activity_stream.invalid_payload", extra={"payload": payload})
+                continue
+            if str(notice.get("org_id")) in self._subscribers:
+                activity_ids.append(str(notice["id"]))
+        if not activity_ids:
+            return
+
+        async with self._session_factory_getter()() as session:
+            activities = await WorkspaceRepository(session).fetch_activities_by_ids(activity_ids)
+
+        for activity in activities:
+            for subscription in tuple(self._subscribers.get(str(activity.org_id), ())):
+                if subscription.matches(activity):
+                    subscription.offer(activity)
+
+    def _close_all(self) -> None:
+        for subscribers in self._subscribers.values():
+            for subscription in subscribers:
+                subscription.close()
+
+
+async def activity_event_stream(
+    broadcaster: ActivityBroadcaster,
+    session_factory: Callable[[], AsyncSession],
+    *,
+    org_id: str,
+    division_id: Optional[str],
+    include_templates: bool,
+    last_event_id: Optional[KeysetCursor],
+    buffer_size: int,
+    heartbeat_seconds: float,
+    catch_up_page_size: int = 100,
+    on_keepalive: Optional[Callable[[], None]] = None,
+) -> AsyncIterator[str]:
+    """Yield SSE frames: missed activities after ``last_event_id``, then live ones.
+
+    ``on_keepalive`` runs with every keep-alive frame, letting callers treat an
+    open stream as ongoing activity (for example, presence heartbeats).
+    """
+
+    # Subscribe before catching up so nothing written in between is lost.
+    # Live events are deduplicated only against ids sent during catch-up:
+    # ``occurred_at`` is not commit order, so a live event that sorts before
+    # the last one sent may still be new.
+    subscription = await broadcaster.subscribe(
+        org_id=org_id,
+        division_id=division_id,
+        include_templates=include_templates,
+        buffer_size=buffer_size,
+    )
+    try:
+        yield f"retry: {int(_RECONNECT_DELAY_SECONDS * 1000)}\n\n"
+
+        last_sent = last_event_id
+        replayed: set[str] = set()
+        if last_sent is not None:
+            async with session_factory() as session:
+                repository = WorkspaceRepository(session)
+                while True:
+                    backlog = await repository.fetch_activities_after(
+                        org_id=org_id,
+                        division_id=division_id,
+                        include_templates=include_templates,
+                        after=last_sent,
+                        limit=catch_up_page_size,
+                    )
+                    for activity in backlog:
+                        yield format_activity_event(activity)
+                        last_sent = activity_cursor(activity)
+                        replayed.add(str(activity.id))
+                    if len(backlog) < catch_up_page_size:
+                        break
+
+        while True:
+            try:
+                activity = await subscription.next(timeout=heartbeat_seconds)
+            except asyncio.TimeoutError:
+                # A quiet interval means notices for rows seen during catch-up have been delivered
+                replayed.clear()
+                if on_keepalive is not None:
+                    on_keepalive()
+                yield ": keep-alive\n\n"
+                continue
+            if activity is None:
+                return
+            if replayed:
+                activity_id = str(activity.id)
+                if activity_id in replayed:
+                    replayed.discard(activity_id)
+                    continue
+            yield format_activity_event(activity)
+    finally:
+        await broadcaster.unsubscribe(subscription)
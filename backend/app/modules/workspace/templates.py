@@ -16,6 +16,8 @@ class DivisionContext:
     slug: str
 
 
+DEFAULT_TEMPLATE_SOURCE = "default:v1"
+
 COLOR_PALETTE = [
     "bg-blue-500",
     "bg-emerald-500",
@@ -0,0 +1,106 @@
+"""Background workers for dashboard aggregates."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import text
+
+from ...core import get_settings
+from ...db.session import get_engine, get_session_factory
+from .repository import TaskKpiRepository
+
+logger = logging.getLogger(__name__)
+
+# Arbitrary application-wide key for pg_try_advisory_lock; only one worker
+# process re-buckets task KPIs at a time.
+TASK_KPI_REBUCKET_LOCK_KEY = 7_412_019_002
+
+
+class TaskKpiRebucketScheduler:
+    """Moves tasks between KPI buckets as due dates approach and pass.
+
+    Write-time triggers keep the rollups exact for every change except the
+    passage of time. This scheduler sleeps until the earliest pending
+    ``kpi_rebucket_at`` (bounded by ``interval_seconds``) and re-buckets only
+    the tasks whose transition is due.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: Optional[int] = None,
+        *,
+        batch_size: Optional[int] = None,
+        min_sleep_seconds: float = 1.0,
+    ) -> None:
+        settings = get_settings()
+        self._interval = interval_seconds or settings.task_kpi_rebucket_interval_seconds
+        self._batch_size = batch_size or settings.task_kpi_rebucket_batch_size
+        self._min_sleep = min_sleep_seconds
+        self._stop = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(), name="task-kpi-rebucket-scheduler")
+
+    async def shutdown(self) -> None:
+        if self._task is None:
+            return
+        self._stop.set()
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        session_factory = get_session_factory()
+        while not self._stop.is_set():
+            next_transition: Optional[datetime] = None
+            try:
+                async with session_factory() as session:
+                    repository = TaskKpiRepository(session)
+                    moved = await self._rebucket_with_lock(repository)
+                    if moved:
+                        logger.info("scheduler.task_kpi.rebucketed", extra={"count": moved})
+                    next_transition = await repository.get_next_rebucket_at()
+            except Exception as error:  # pragma: no cover - defensive guard
+                logger.error("scheduler.task_kpi.failed", exc_info=error)
+
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self._sleep_seconds(next_transition))
+            except asyncio.TimeoutError:
+                continue
+
+    async def _rebucket_with_lock(self, repository: TaskKpiRepository) -> int:
+        async with get_engine().connect() as lock_connection:
+            acquired = await lock_connection.scalar(
+                text("SELECT pg_try_advisory_lock(:key)"),
+                {"key": TASK_KPI_REBUCKET_LOCK_KEY},
+            )
+            if not acquired:
+                logger.debug("scheduler.task_kpi.lock_busy")
+                return 0
+            try:
+                return await repository.rebucket_due_tasks(batch_size=self._batch_size)
+            finally:
+                await lock_connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": TASK_KPI_REBUCKET_LOCK_KEY},
+                )
+
+    def _sleep_seconds(self, next_transition: Optional[datetime], now: Optional[datetime] = None) -> float:
+        """Seconds until the next bucket transition, clamped to [min_sleep, interval]."""
+
+        if next_transition is None:
+            return float(self._interval)
+        if next_transition.tzinfo is None:
+            next_transition = next_transition.replace(tzinfo=timezone.utc)
+        now = now or datetime.now(timezone.utc)
+        remaining = (next_transition - now).total_seconds()
+        return min(max(remaining, self._min_sleep), float(self._interval))
@@ -2,23 +2,34 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 
 import json
 
 from sqlalchemy import CursorResult, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...core.presence import PresenceRegistry, get_presence_registry
 from ..workspace.schemas import WorkspaceActivity, WorkspaceDoc, WorkspaceProject
 from .schemas import DashboardKpi, DashboardPresenceMember, DashboardSummary
 
 
+DASHBOARD_PROJECT_LIMIT = 6
+DASHBOARD_DOC_LIMIT = 6
+DASHBOARD_ACTIVITY_LIMIT = 10
+DASHBOARD_PRESENCE_LIMIT = 12
+# Rollup key for tasks that belong to the whole organization rather than a division
+NIL_DIVISION_KEY = "00000000-0000-0000-0000-000000000000"
+
+
 class DashboardRepository:
     """Executes raw SQL queries for dashboard aggregates."""
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, presence: Optional[PresenceRegistry] = None) -> None:
         self._session = session
+        self._presence = presence if presence is not None else get_presence_registry()
 
     async def fetch_summary(
         self,
@@ -27,11 +38,99 @@ class DashboardRepository:
         division_id: Optional[str],
         include_templates: bool,
     ) -> DashboardSummary:
-        totals = await self._load_kpis(org_id=org_id, division_id=division_id, include_templates=include_templates)
-        projects = await self._load_projects(org_id=org_id, division_id=division_id, include_templates=include_templates)
-        docs = await self._load_docs(org_id=org_id, division_id=division_id, include_templates=include_templates)
-        activity = await self._load_activity(org_id=org_id, division_id=division_id, include_templates=include_templates)
-        presence = await self._load_presence(org_id=org_id)
+        """Load KPIs, projects, docs, activity and presence in one round-trip.
+
+        Each section is a sub-select over the same scope, so the landing page
+        costs a single statement rather than four sequential queries. KPIs read
+        the trigger-maintained ``workspace_task_kpi_rollups`` counters instead
+        of counting tasks, and presence comes from the in-process registry.
+        """
+        stmt = text(
+            """
+            WITH scope AS (
+                SELECT CAST(:org_id AS UUID) AS org_id,
+                       CAST(:division_id AS UUID) AS division_id,
+                       CAST(:include_templates AS BOOLEAN) AS include_templates
+            ),
+            task_totals AS (
+                SELECT
+                    COALESCE(SUM(r.task_count), 0)::INT AS total_tasks,
+                    COALESCE(SUM(r.task_count) FILTER (WHERE r.bucket = 'overdue'), 0)::INT AS overdue_tasks,
+                    COALESCE(SUM(r.task_count) FILTER (WHERE r.bucket = 'at_risk'), 0)::INT AS stuck_tasks
+                  FROM public.workspace_task_kpi_rollups r, scope s
+                 WHERE r.org_id = s.org_id
+                   AND (s.division_id IS NULL OR r.division_key IN (CAST(:nil_division AS UUID), s.division_id))
+                   AND (s.include_templates OR r.is_template = FALSE)
+            )
+            SELECT
+                tt.total_tasks,
+                tt.overdue_tasks,
+                tt.stuck_tasks,
+                (
+                    SELECT COALESCE(json_agg(p ORDER BY p.is_template DESC, p.updated_at DESC), '[]'::json)
+                      FROM (
+                          SELECT wp.id, wp.org_id, wp.division_id, wp.name, wp.description,
+                                 wp.badge_count, wp.dot_color, wp.status, wp.default_view,
+                                 wp.is_template, wp.updated_at
+                            FROM public.workspace_projects wp, scope s
+                           WHERE wp.org_id = s.org_id
+                             AND wp.archived_at IS NULL
+                             AND (s.division_id IS NULL OR wp.division_id IS NULL OR wp.division_id = s.division_id)
+                             AND (s.include_templates OR wp.is_template = FALSE)
+                           ORDER BY wp.is_template DESC, wp.updated_at DESC
+                           LIMIT :project_limit
+                      ) p
+                ) AS projects,
+                (
+                    SELECT COALESCE(json_agg(d ORDER BY d.is_template DESC, d.updated_at DESC), '[]'::json)
+                      FROM (
+                          SELECT wd.id, wd.org_id, wd.division_id, wd.name, wd.url, wd.summary,
+                                 wd.is_template, wd.updated_at
+                            FROM public.workspace_docs wd, scope s
+                           WHERE wd.org_id = s.org_id
+                             AND wd.archived_at IS NULL
+                             AND (s.division_id IS NULL OR wd.division_id IS NULL OR wd.division_id = s.division_id)
+                             AND (s.include_templates OR wd.is_template = FALSE)
+                           ORDER BY wd.is_template DESC, wd.updated_at DESC
+                           LIMIT :doc_limit
+                      ) d
+                ) AS docs,
+                (
+                    SELECT COALESCE(json_agg(a ORDER BY a.occurred_at DESC), '[]'::json)
+                      FROM (
+                          SELECT wa.id, wa.org_id, wa.division_id, wa.actor_id, wa.actor_name,
+                                 wa.actor_role, wa.activity_type, wa.content, wa.metadata,
+                                 wa.occurred_at, wa.is_template
+                            FROM public.workspace_activities wa, scope s
+                           WHERE wa.org_id = s.org_id
+                             AND (s.division_id IS NULL OR wa.division_id IS NULL OR wa.division_id = s.division_id)
+                             AND (s.include_templates OR wa.is_template = FALSE)
+                           ORDER BY wa.occurred_at DESC
+                           LIMIT :activity_limit
+                      ) a
+                ) AS activity
+              FROM task_totals tt
+            """
+        )
+        result: CursorResult = await self._session.execute(
+            stmt,
+            {
+                "org_id": org_id,
+                "division_id": division_id,
+                "include_templates": include_templates,
+                "nil_division": NIL_DIVISION_KEY,
+                "project_limit": DASHBOARD_PROJECT_LIMIT,
+                "doc_limit": DASHBOARD_DOC_LIMIT,
+                "activity_limit": DASHBOARD_ACTIVITY_LIMIT,
+            },
+        )
+        row = result.mappings().one()
+
+        totals = self._map_kpis(row)
+        projects = [self._map_project(item) for item in self._json_rows(row["projects"])]
+        docs = [self._map_doc(item) for item in self._json_rows(row["docs"])]
+        activity = [self._map_activity(item) for item in self._json_rows(row["activity"])]
+        presence = self._load_presence(org_id=org_id, division_id=division_id)
 
         has_templates = any(item.is_template for item in (*projects, *docs, *activity))
 
@@ -47,40 +146,16 @@ class DashboardRepository:
             hasTemplates=has_templates,
         )
 
-    async def _load_kpis(
-        self,
-        *,
-        org_id: str,
-        division_id: Optional[str],
-        include_templates: bool,
-    ) -> list[DashboardKpi]:
-        stmt = text(
-            """
-            WITH scoped_tasks AS (
-                SELECT *
-                  FROM public.workspace_tasks
-                 WHERE org_id = :org_id
-                   AND archived_at IS NULL
-                   AND (CAST(:division_id AS UUID) IS NULL OR division_id IS NULL OR division_id = CAST(:division_id AS UUID))
-                   AND (:include_templates OR is_template = FALSE)
-            )
-            SELECT
-                COUNT(*)::INT AS total_tasks,
-                COUNT(*) FILTER (
-                    WHERE due_at IS NOT NULL AND due_at < NOW()
-                )::INT AS overdue_tasks,
-                COUNT(*) FILTER (
-                    WHERE (due_at IS NOT NULL AND due_at >= NOW() AND due_at < NOW() + INTERVAL '2 days')
-                       OR (due_at IS NULL AND priority IN ('High', 'Urgent'))
-                )::INT AS stuck_tasks
-            FROM scoped_tasks
-            """
-        )
-        result: CursorResult = await self._session.execute(
-            stmt,
-            {"org_id": org_id, "division_id": division_id, "include_templates": include_templates},
-        )
-        row = result.mappings().first() or {"total_tasks": 0, "overdue_tasks": 0, "stuck_tasks": 0}
+    @staticmethod
+    def _json_rows(value: Any) -> list[dict[str, Any]]:
+        if value is None:
+            return []
+        if isinstance(value, (str, bytes)):
+            return json.loads(value)
+        return list(value)
+
+    @staticmethod
+    def _map_kpis(row: Mapping[str, Any]) -> list[DashboardKpi]:
         total = int(row["total_tasks"]) if row["total_tasks"] is not None else 0
         overdue = int(row["overdue_tasks"]) if row["overdue_tasks"] is not None else 0
         stuck = int(row["stuck_tasks"]) if row["stuck_tasks"] is not None else 0
@@ -92,213 +167,128 @@ class DashboardRepository:
             DashboardKpi(id="overdue", label="Overdue", count=overdue, deltaDirection="flat"),
         ]
 
-    async def _load_projects(
-        self,
-        *,
-        org_id: str,
-        division_id: Optional[str],
-        include_templates: bool,
-        limit: int = 6,
-    ) -> list[WorkspaceProject]:
-        stmt = text(
-            """
-            SELECT id,
-                   org_id,
-                   division_id,
-                   name,
-                   description,
-                   badge_count,
-                   dot_color,
-                   status,
-                   default_view,
-                   is_template,
-                   updated_at
-              FROM public.workspace_projects
-             WHERE org_id = :org_id
-               AND archived_at IS NULL
-               AND (CAST(:division_id AS UUID) IS NULL OR division_id IS NULL OR division_id = CAST(:division_id AS UUID))
-               AND (:include_templates OR is_template = FALSE)
-             ORDER BY is_template DESC, updated_at DESC
-             LIMIT :limit
-            """
-        )
-        result = await self._session.execute(
-            stmt,
-            {
-                "org_id": org_id,
-                "division_id": division_id,
-                "include_templates": include_templates,
-                "limit": limit,
-            },
+    @staticmethod
+    def _map_project(row: Mapping[str, Any]) -> WorkspaceProject:
+        return WorkspaceProject(
+            id=str(row["id"]),
+            orgId=str(row["org_id"]),
+            divisionId=str(row["division_id"]) if row["division_id"] else None,
+            name=row["name"],
+            description=row["description"],
+            badgeCount=row["badge_count"] or 0,
+            dotColor=row["dot_color"],
+            status=row["status"],
+            defaultView=row["default_view"],
+            isTemplate=row["is_template"],
+            updatedAt=row["updated_at"],
         )
-        rows = result.mappings().all()
-        return [
-            WorkspaceProject(
-                id=str(row["id"]),
-                orgId=str(row["org_id"]),
-                divisionId=str(row["division_id"]) if row["division_id"] else None,
-                name=row["name"],
-                description=row["description"],
-                badgeCount=row["badge_count"] or 0,
-                dotColor=row["dot_color"],
-                status=row["status"],
-                defaultView=row["default_view"],
-                isTemplate=row["is_template"],
-                updatedAt=row["updated_at"],
-            )
-            for row in rows
-        ]
 
-    async def _load_docs(
-        self,
-        *,
-        org_id: str,
-        division_id: Optional[str],
-        include_templates: bool,
-        limit: int = 6,
-    ) -> list[WorkspaceDoc]:
-        stmt = text(
-            """
-            SELECT id,
-                   org_id,
-                   division_id,
-                   name,
-                   url,
-                   summary,
-                   is_template,
-                   updated_at
-              FROM public.workspace_docs
-             WHERE org_id = :org_id
-               AND archived_at IS NULL
-               AND (CAST(:division_id AS UUID) IS NULL OR division_id IS NULL OR division_id = CAST(:division_id AS UUID))
-               AND (:include_templates OR is_template = FALSE)
-             ORDER BY is_template DESC, updated_at DESC
-             LIMIT :limit
-            """
+    @staticmethod
+    def _map_doc(row: Mapping[str, Any]) -> WorkspaceDoc:
+        return WorkspaceDoc(
+            id=str(row["id"]),
+            orgId=str(row["org_id"]),
+            divisionId=str(row["division_id"]) if row["division_id"] else None,
+            name=row["name"],
+            url=row["url"],
+            summary=row["summary"],
+            isTemplate=row["is_template"],
+            updatedAt=row["updated_at"],
         )
-        result = await self._session.execute(
-            stmt,
-            {
-                "org_id": org_id,
-                "division_id": division_id,
-                "include_templates": include_templates,
-                "limit": limit,
+
+    @staticmethod
+    def _map_activity(row: Mapping[str, Any]) -> WorkspaceActivity:
+        metadata_value = row["metadata"]
+        if isinstance(metadata_value, str):
+            try:
+                metadata = json.loads(metadata_value)
+            except json.JSONDecodeError:
+                metadata = None
+        elif isinstance(metadata_value, dict):
+            metadata = metadata_value
+        else:
+            metadata = None
+        return WorkspaceActivity(
+            id=str(row["id"]),
+            orgId=str(row["org_id"]),
+            divisionId=str(row["division_id"]) if row["division_id"] else None,
+            activityType=row["activity_type"],
+            content=row["content"],
+            metadata=metadata,
+            occurredAt=row["occurred_at"],
+            isTemplate=row["is_template"],
+            author={
+                "id": str(row["actor_id"]) if row["actor_id"] else None,
+                "name": row["actor_name"] or "System",
+                "role": row["actor_role"],
+                "avatar": None,
             },
         )
-        rows = result.mappings().all()
+
+    def _load_presence(self, *, org_id: str, division_id: Optional[str]) -> list[DashboardPresenceMember]:
         return [
-            WorkspaceDoc(
-                id=str(row["id"]),
-                orgId=str(row["org_id"]),
-                divisionId=str(row["division_id"]) if row["division_id"] else None,
-                name=row["name"],
-                url=row["url"],
-                summary=row["summary"],
-                isTemplate=row["is_template"],
-                updatedAt=row["updated_at"],
+            DashboardPresenceMember(
+                id=entry.user_id,
+                name=entry.name,
+                avatar=entry.avatar,
+                status=entry.status,
             )
-            for row in rows
+            for entry in self._presence.online(org_id, division_id, limit=DASHBOARD_PRESENCE_LIMIT)
         ]
 
-    async def _load_activity(
-        self,
-        *,
-        org_id: str,
-        division_id: Optional[str],
-        include_templates: bool,
-        limit: int = 10,
-    ) -> list[WorkspaceActivity]:
+
+class TaskKpiRepository:
+    """Maintains the time-dependent part of the task KPI rollups."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def rebucket_due_tasks(self, batch_size: int = 1_000) -> int:
+        """Move tasks whose KPI bucket changed with the clock, in short batches.
+
+        Touching ``kpi_bucket`` re-runs the bucket trigger, which recomputes the
+        bucket and next transition and adjusts the rollup counters. The touch
+        trigger ignores KPI-only changes, so ``updated_at`` is left as is. Only
+        rows on the partial ``kpi_rebucket_at`` index are read.
+        """
+
         stmt = text(
             """
-            SELECT id,
-                   org_id,
-                   division_id,
-                   actor_id,
-                   actor_name,
-                   actor_role,
-                   activity_type,
-                   content,
-                   metadata,
-                   occurred_at,
-                   is_template
-              FROM public.workspace_activities
-             WHERE org_id = :org_id
-               AND (CAST(:division_id AS UUID) IS NULL OR division_id IS NULL OR division_id = CAST(:division_id AS UUID))
-               AND (:include_templates OR is_template = FALSE)
-             ORDER BY occurred_at DESC
-             LIMIT :limit
+            UPDATE public.workspace_tasks
+               SET kpi_bucket = kpi_bucket
+             WHERE id IN (
+                 SELECT id
+                   FROM public.workspace_tasks
+                  WHERE kpi_rebucket_at IS NOT NULL
+                    AND kpi_rebucket_at <= NOW()
+                  ORDER BY kpi_rebucket_at
+                  LIMIT :batch_size
+                    FOR UPDATE SKIP LOCKED
+             )
             """
         )
-        result = await self._session.execute(
-            stmt,
-            {
-                "org_id": org_id,
-                "division_id": division_id,
-                "include_templates": include_templates,
-                "limit": limit,
-            },
-        )
-        rows = result.mappings().all()
-        activities: list[WorkspaceActivity] = []
-        for row in rows:
-            metadata_value = row["metadata"]
-            if isinstance(metadata_value, str):
-                try:
-                    metadata = json.loads(metadata_value)
-                except json.JSONDecodeError:
-                    metadata = None
-            elif isinstance(metadata_value, dict):
-                metadata = metadata_value
-            else:
-                metadata = None
-            activities.append(
-                WorkspaceActivity(
-                    id=str(row["id"]),
-                    orgId=str(row["org_id"]),
-                    divisionId=str(row["division_id"]) if row["division_id"] else None,
-                    activityType=row["activity_type"],
-                    content=row["content"],
-                    metadata=metadata,
-                    occurredAt=row["occurred_at"],
-                    isTemplate=row["is_template"],
-                    author={
-                        "id": str(row["actor_id"]) if row["actor_id"] else None,
-                        "name": row["actor_name"] or "System",
-                        "role": row["actor_role"],
-                        "avatar": None,
-                    },
-                )
-            )
-        return activities
 
-    async def _load_presence(self, *, org_id: str, limit: int = 12) -> list[DashboardPresenceMember]:
-        stmt = text(
-            """
-            SELECT om.user_id,
-                   COALESCE(u.display_name, u.full_name, u.name, u.email) AS display_name,
-                   u.avatar_url,
-                   om.role,
-                   om.joined_at
-              FROM public.org_memberships AS om
-              LEFT JOIN public.users AS u ON u.id = om.user_id
-             WHERE om.org_id = :org_id
-             ORDER BY om.joined_at NULLS LAST
-             LIMIT :limit
-            """
+        total = 0
+        while True:
+            if self._session.in_transaction():
+                await self._session.rollback()
+            await self._session.begin()
+            try:
+                result = await self._session.execute(stmt, {"batch_size": batch_size})
+                await self._session.commit()
+            except Exception:
+                await self._session.rollback()
+                raise
+
+            moved = result.rowcount or 0
+            total += moved
+            if moved < batch_size:
+                return total
+
+    async def get_next_rebucket_at(self) -> Optional[datetime]:
+        """Return the earliest pending time-based bucket transition, if any."""
+
+        result = await self._session.execute(
+            text("SELECT MIN(kpi_rebucket_at) FROM public.workspace_tasks WHERE kpi_rebucket_at IS NOT NULL")
         )
-        result = await self._session.execute(stmt, {"org_id": org_id, "limit": limit})
-        rows = result.mappings().all()
-        presence: list[DashboardPresenceMember] = []
-        statuses = ("online", "away", "offline")
-        for index, row in enumerate(rows):
-            member_id = row["user_id"]
-            presence.append(
-                DashboardPresenceMember(
-                    id=str(member_id) if member_id else f"anonymous-{index}",
-                    name=row["display_name"] or "Unknown member",
-                    avatar=row["avatar_url"],
-                    role=row["role"],
-                    status=statuses[index % len(statuses)],
-                )
-            )
-        return presence
+        return result.scalar()
@@ -18,16 +18,33 @@ Security Implementation:
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from contextlib import asynccontextmanager
+
+from fastapi import APIRouter, Depends, FastAPI, Query, HTTPException, status
 
 from ...core.scope_integration import require_organization_access_with_id, require_division_access_with_ids
 from ...dependencies import CurrentPrincipal, require_current_principal
 from ...core.scope import ScopeContext
 from .di import get_dashboard_service
+from .jobs import TaskKpiRebucketScheduler
 from .schemas import DashboardSummary, DashboardWidgetCreateRequest, DashboardWidgetResponse, DashboardUpdateRequest
 from .service import DashboardService
 
-router = APIRouter(prefix="/api", tags=["workspace-dashboard"])
+_KPI_REBUCKET_SCHEDULER = TaskKpiRebucketScheduler()
+
+
+@asynccontextmanager
+async def _dashboard_lifespan(_app: FastAPI):
+    """Run the task KPI re-bucketing scheduler for the app's lifetime."""
+
+    _KPI_REBUCKET_SCHEDULER.start()
+    try:
+        yield
+    finally:
+        await _KPI_REBUCKET_SCHEDULER.shutdown()
+
+
+router = APIRouter(prefix="/api", tags=["workspace-dashboard"], lifespan=_dashboard_lifespan)
 
 
 # Organization-scoped dashboard endpoints
@@ -148,10 +165,10 @@ async def refresh_organization_dashboard(
     Refresh dashboard data for an organization.
 
     Requires organization-level dashboard:read permission.
-    Triggers a refresh of cached dashboard data.
+    Invalidates cached dashboard data and rebuilds the default summary.
     """
-    await service.refresh_dashboard_for_organization(principal, org_id)
-    return {"message": "Dashboard refresh initiated successfully"}
+    summary = await service.refresh_dashboard_for_organization(principal, org_id)
+    return {"message": "Dashboard refreshed successfully", "generatedAt": summary.generated_at}
 
 
 # Division-scoped dashboard endpoints
@@ -278,7 +295,7 @@ async def refresh_division_dashboard(
     Refresh dashboard data for a division.
 
     Requires division-level dashboard:read permission.
-    Triggers a refresh of cached dashboard data.
+    Invalidates cached dashboard data and rebuilds the default summary.
     """
-    await service.refresh_dashboard_for_division(principal, org_id, div_id)
-    return {"message": "Dashboard refresh initiated successfully"}
+    summary = await service.refresh_dashboard_for_division(principal, org_id, div_id)
+    return {"message": "Dashboard refreshed successfully", "generatedAt": summary.generated_at}
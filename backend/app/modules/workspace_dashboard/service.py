@@ -12,8 +12,12 @@ All operations are scoped to prevent cross-tenant data access.
 
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
 
+from ...core import get_settings
 from ...dependencies import CurrentPrincipal
 from ...core.scope_integration import ScopedService
 from ...core.scope import ScopeContext
@@ -22,6 +26,119 @@ from .repository import DashboardRepository
 from .schemas import DashboardSummary, DashboardWidget, DashboardWidgetCreateRequest, DashboardWidgetResponse, DashboardUpdateRequest
 
 
+SummaryCacheKey = tuple[str, Optional[str], bool]
+
+
+class DashboardSummaryCache:
+    """Bounded in-process cache of composed dashboard summaries.
+
+    Freshness is measured from each summary's ``generated_at`` rather than from
+    insertion time, so a summary is never served older than ``ttl_seconds``.
+    Concurrent misses for the same key share one load, which keeps a burst of
+    members opening the landing page down to a single query.
+    """
+
+    def __init__(self, ttl_seconds: int = 30, max_entries: int = 1_024) -> None:
+        self._ttl = ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._store: OrderedDict[SummaryCacheKey, DashboardSummary] = OrderedDict()
+        self._inflight: dict[SummaryCacheKey, asyncio.Future[DashboardSummary]] = {}
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def summary_key(org_id: str, division_id: Optional[str], include_templates: bool) -> SummaryCacheKey:
+        return (org_id, division_id, include_templates)
+
+    async def get(self, key: SummaryCacheKey, *, now: Optional[datetime] = None) -> Optional[DashboardSummary]:
+        async with self._lock:
+            return self._get_fresh(key, now or datetime.now(timezone.utc))
+
+    async def get_or_load(
+        self,
+        key: SummaryCacheKey,
+        loader: Callable[[], Awaitable[DashboardSummary]],
+    ) -> DashboardSummary:
+        while True:
+            async with self._lock:
+                cached = self._get_fresh(key, datetime.now(timezone.utc))
+                if cached is not None:
+                    return cached
+                pending = self._inflight.get(key)
+                owner = pending is None
+                if owner:
+                    pending = asyncio.get_running_loop().create_future()
+                    self._inflight[key] = pending
+
+            if owner:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Only the owning request was cancelled: take over the load instead
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        try:
+            summary = await loader()
+        except BaseException as error:
+            async with self._lock:
+                if self._inflight.get(key) is pending:
+                    self._inflight.pop(key)
+            if isinstance(error, asyncio.CancelledError):
+                pending.cancel()
+            else:
+                pending.set_exception(error)
+                # Mark retrieved so failures without waiters are not logged as unhandled
+                pending.exception()
+            raise
+        async with self._lock:
+            # A clear_scope during the load removed the in-flight marker; do not cache stale data
+            if self._inflight.pop(key, None) is pending:
+                self._put(key, summary)
+        pending.set_result(summary)
+        return summary
+
+    async def set(self, key: SummaryCacheKey, summary: DashboardSummary) -> None:
+        async with self._lock:
+            self._put(key, summary)
+
+    async def clear_scope(self, org_id: str, division_id: Optional[str] = None) -> None:
+        """Drop summaries for an organization, or for one division and the org-wide views."""
+
+        async with self._lock:
+            for key in [*self._store, *self._inflight]:
+                if key[0] != org_id:
+                    continue
+                if division_id is None or key[1] in (None, division_id):
+                    self._store.pop(key, None)
+                    self._inflight.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def _get_fresh(self, key: SummaryCacheKey, now: datetime) -> Optional[DashboardSummary]:
+        summary = self._store.get(key)
+        if summary is None:
+            return None
+        if (now - summary.generated_at).total_seconds() >= self._ttl:
+            self._store.pop(key, None)
+            return None
+        self._store.move_to_end(key)
+        return summary
+
+    def _put(self, key: SummaryCacheKey, summary: DashboardSummary) -> None:
+        self._store[key] = summary
+        self._store.move_to_end(key)
+        while len(self._store) > self._max_entries:
+            self._store.popitem(last=False)
+
+
+_DASHBOARD_CACHE = DashboardSummaryCache(
+    ttl_seconds=get_settings().dashboard_cache_ttl_seconds,
+    max_entries=get_settings().dashboard_cache_max_entries,
+)
+
+
 class DashboardService(ScopedService):
     """
     Encapsulates secure dashboard domain behaviors with scope validation.
@@ -36,10 +153,34 @@ class DashboardService(ScopedService):
         *,
         repository: DashboardRepository,
         permission_repository: WorkspacePermissionRepository,
+        cache: Optional[DashboardSummaryCache] = None,
     ) -> None:
         super().__init__()
         self._repository = repository
         self._permission_repository = permission_repository
+        self._cache = cache if cache is not None else _DASHBOARD_CACHE
+
+    async def _load_summary(
+        self,
+        *,
+        org_id: str,
+        division_id: Optional[str],
+        include_templates: bool,
+    ) -> DashboardSummary:
+        key = DashboardSummaryCache.summary_key(org_id, division_id, include_templates)
+        return await self._cache.get_or_load(
+            key,
+            lambda: self._repository.fetch_summary(
+                org_id=org_id,
+                division_id=division_id,
+                include_templates=include_templates,
+            ),
+        )
+
+    async def _rebuild_summary(self, *, org_id: str, division_id: Optional[str]) -> DashboardSummary:
+        await self._cache.clear_scope(org_id, division_id)
+        # Warm the default view the landing page requests; other variants load on demand
+        return await self._load_summary(org_id=org_id, division_id=division_id, include_templates=True)
 
     # Organization-scoped methods
     async def get_summary_for_organization(
@@ -67,7 +208,7 @@ class DashboardService(ScopedService):
                 principal, org_id, division_id, {"dashboard:read"}
             )
 
-        return await self._repository.fetch_summary(
+        return await self._load_summary(
             org_id=org_id,
             division_id=division_id,
             include_templates=include_templates,
@@ -89,7 +230,7 @@ class DashboardService(ScopedService):
         """
         await self._permission_repository.ensure_membership(principal, org_id)
         await self._permission_repository.ensure_division_membership(principal, org_id, division_id)
-        return await self._repository.fetch_summary(
+        return await self._load_summary(
             org_id=org_id,
             division_id=division_id,
             include_templates=include_templates,
@@ -160,10 +301,10 @@ class DashboardService(ScopedService):
         self,
         principal: CurrentPrincipal,
         org_id: str,
-    ) -> None:
-        """Refresh dashboard data for an organization with scope validation."""
+    ) -> DashboardSummary:
+        """Invalidate and rebuild cached dashboard data for an organization with scope validation."""
         await self.validate_organization_access(principal, org_id, {"dashboard:read"})
-        # For now, do nothing - real implementation would clear cache
+        return await self._rebuild_summary(org_id=org_id, division_id=None)
 
     # Division-scoped widget methods
     async def list_widgets_for_division(
@@ -235,7 +376,7 @@ class DashboardService(ScopedService):
         principal: CurrentPrincipal,
         org_id: str,
         division_id: str,
-    ) -> None:
-        """Refresh dashboard data for a division with scope validation."""
+    ) -> DashboardSummary:
+        """Invalidate and rebuild cached dashboard data for a division with scope validation."""
         await self.validate_division_access(principal, org_id, division_id, {"dashboard:read"})
-        # For now, do nothing - real implementation would clear cache
+        return await self._rebuild_summary(org_id=org_id, division_id=division_id)
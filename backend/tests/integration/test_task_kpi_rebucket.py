@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.config import get_settings
+from app.modules.workspace_dashboard.repository import TaskKpiRepository
+
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.skipif(not get_settings().database_url, reason="needs a migrated database"),
+]
+
+
+async def test_rebucket_keeps_task_updated_at() -> None:
+    database_url = get_settings().database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    engine = create_async_engine(database_url)
+    org_id = str(uuid.uuid4())
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            # Due in exactly two days: on track when inserted, at risk once the clock moves on
+            row = (
+                await session.execute(
+                    text(
+                        """
+                        WITH org AS (
+                            INSERT INTO public.organizations (id, name, slug, created_at)
+                            VALUES (:org_id, 'KPI rebucket', :slug, NOW())
+                            RETURNING id
+                        )
+                        INSERT INTO public.workspace_tasks (org_id, name, due_at)
+                        SELECT id, 'Write the report', NOW() + INTERVAL '2 days' FROM org
+                        RETURNING id, kpi_bucket, updated_at
+                        """
+                    ),
+                    {"org_id": org_id, "slug": f"kpi-rebucket-{org_id}"},
+                )
+            ).mappings().one()
+            await session.commit()
+            assert row["kpi_bucket"] == "on_track"
+
+            await TaskKpiRepository(session).rebucket_due_tasks()
+
+            after = (
+                await session.execute(
+                    text("SELECT kpi_bucket, updated_at FROM public.workspace_tasks WHERE id = :id"),
+                    {"id": row["id"]},
+                )
+            ).mappings().one()
+            assert after["kpi_bucket"] == "at_risk"
+            assert after["updated_at"] == row["updated_at"]
+    finally:
+        async with engine.begin() as connection:
+            await connection.execute(text("DELETE FROM public.organizations WHERE id = :org_id"), {"org_id": org_id})
+        await engine.dispose()
@@ -61,6 +61,8 @@ class _StubWorkspaceService:
         include_templates: bool,
         page: int,
         page_size: int,
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> ChannelListResponse:
         self.channel_calls.append(
             {
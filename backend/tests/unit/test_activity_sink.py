@@ -0,0 +1,119 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from app.modules.tasks.activity import ActivitySink
+
+NOW = datetime(2025, 11, 10, 9, 0, tzinfo=timezone.utc)
+
+
+def _entry(number: int) -> dict:
+    return {
+        "id": f"activity-{number}",
+        "board_id": "board-1",
+        "user_id": "user-1",
+        "activity_type": "task_moved",
+        "description": f"Move {number}",
+        "metadata": {},
+        "created_at": NOW,
+    }
+
+
+class _RecordingWriter:
+    def __init__(self, failures: int = 0) -> None:
+        self.batches: list[list[dict]] = []
+        self._failures = failures
+
+    async def __call__(self, batch):
+        if self._failures:
+            self._failures -= 1
+            raise ConnectionError("database unavailable")
+        self.batches.append(batch)
+        return len(batch)
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_batches_in_enqueue_order() -> None:
+    writer = _RecordingWriter()
+    sink = ActivitySink(writer, batch_size=2, flush_interval_ms=60_000)
+
+    for number in range(5):
+        sink.enqueue(_entry(number))
+
+    assert await sink.flush() == 5
+    await sink.shutdown()
+
+    written = [entry for batch in writer.batches for entry in batch]
+    assert [len(batch) for batch in writer.batches] == [2, 2, 1]
+    assert [entry["id"] for entry in written] == [f"activity-{number}" for number in range(5)]
+    created = [entry["created_at"] for entry in written]
+    assert created == sorted(created) and len(set(created)) == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_stays_at_the_front_of_the_queue() -> None:
+    writer = _RecordingWriter(failures=1)
+    sink = ActivitySink(writer, batch_size=10, flush_interval_ms=60_000)
+    sink.enqueue(_entry(1))
+    sink.enqueue(_entry(2))
+
+    with pytest.raises(ConnectionError):
+        await sink.flush()
+    assert sink.pending == 2
+
+    sink.enqueue(_entry(3))
+    assert await sink.flush() == 3
+    await sink.shutdown()
+    assert [entry["id"] for entry in writer.batches[0]] == ["activity-1", "activity-2", "activity-3"]
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_written_without_waiting_for_the_interval() -> None:
+    writer = _RecordingWriter()
+    sink = ActivitySink(writer, batch_size=2, flush_interval_ms=60_000)
+
+    sink.enqueue(_entry(1))
+    sink.enqueue(_entry(2))
+    for _ in range(20):
+        if writer.batches:
+            break
+        await asyncio.sleep(0.01)
+
+    assert len(writer.batches) == 1
+    sink.enqueue(_entry(3))
+    await sink.shutdown()
+    assert [len(batch) for batch in writer.batches] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_new_entries_during_an_outage() -> None:
+    writer = _RecordingWriter(failures=1)
+    sink = ActivitySink(writer, batch_size=2, flush_interval_ms=60_000, max_pending=4)
+
+    accepted = [sink.enqueue(_entry(number)) for number in range(6)]
+    assert accepted == [True] * 4 + [False] * 2
+
+    with pytest.raises(ConnectionError):
+        await sink.flush()
+    assert sink.pending == 4
+    assert sink.enqueue(_entry(6)) is False
+
+    assert await sink.flush() == 4
+    assert sink.enqueue(_entry(7)) is True
+    await sink.shutdown()
+    written = [entry["id"] for batch in writer.batches for entry in batch]
+    assert written == [f"activity-{number}" for number in (0, 1, 2, 3, 7)]
+
+
+@pytest.mark.asyncio
+async def test_reserved_timestamps_stay_ordered_with_queued_entries() -> None:
+    sink = ActivitySink(_RecordingWriter(), batch_size=10, flush_interval_ms=60_000)
+    sink.enqueue(_entry(1))
+
+    reserved = sink.reserve_created_at(NOW)
+    sink.enqueue(_entry(2))
+    await sink.shutdown()
+
+    assert NOW < reserved
+    assert reserved < sink.reserve_created_at(NOW)
@@ -0,0 +1,95 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+from app.modules.tasks.repository import TasksRepository
+from app.modules.tasks.router import _board_etag, _known_board_version
+
+NOW = datetime(2025, 11, 4, 9, 0, tzinfo=timezone.utc)
+
+
+def _card(card_id: str, column_id: str, position: int) -> dict:
+    return {
+        "id": card_id,
+        "column_id": column_id,
+        "title": f"Card {card_id}",
+        "priority": "medium",
+        "position": position,
+        "due_date": None,
+        "assigned_to": None,
+        "labels": "[]",
+        "is_archived": False,
+        "comment_count": 2,
+        "attachment_count": 0,
+        "is_overdue": False,
+    }
+
+
+class _StubConnection:
+    def __init__(self) -> None:
+        self.queries = 0
+        self.transactions: list[dict] = []
+
+    @asynccontextmanager
+    async def _transaction(self, **options):
+        self.transactions.append(options)
+        yield
+
+    def transaction(self, **options):
+        return self._transaction(**options)
+
+    async def fetchrow(self, query, *args):
+        self.queries += 1
+        return {
+            "id": "board-1",
+            "name": "Roadmap",
+            "description": None,
+            "organization_id": "org-1",
+            "division_id": None,
+            "project_id": None,
+            "created_by": "user-1",
+            "is_public": False,
+            "settings": "{}",
+            "created_at": NOW,
+            "updated_at": NOW,
+            "version": 7,
+        }
+
+    async def fetch(self, query, *args):
+        self.queries += 1
+        if "FROM kanban_columns c\n" in query and "kanban_cards" not in query:
+            return [
+                {"id": "col-1", "board_id": "board-1", "name": "Todo", "color": "#3b82f6",
+                 "position": 0, "column_type": "todo", "wip_limit": 2,
+                 "created_at": NOW, "updated_at": NOW},
+                {"id": "col-2", "board_id": "board-1", "name": "Done", "color": "#3b82f6",
+                 "position": 1, "column_type": "done", "wip_limit": None,
+                 "created_at": NOW, "updated_at": NOW},
+            ]
+        return [_card("a", "col-1", 0), _card("b", "col-1", 1), _card("c", "col-2", 0)]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_reads_board_in_three_queries_in_one_transaction() -> None:
+    connection = _StubConnection()
+
+    snapshot = await TasksRepository(connection).get_board_snapshot("board-1")
+
+    assert connection.queries == 3
+    assert connection.transactions == [{"isolation": "repeatable_read", "readonly": True}]
+    assert snapshot.version == 7
+    assert [task.column_id for task in snapshot.tasks] == ["col-1", "col-1", "col-2"]
+    todo, done = snapshot.columns
+    assert (todo.task_count, todo.is_over_limit) == (2, True)
+    assert (done.task_count, done.is_over_limit) == (1, False)
+
+
+def test_known_board_version_reads_only_our_etags() -> None:
+    etag = _board_etag("board-1", 7)
+
+    assert _known_board_version(etag, "board-1") == 7
+    assert _known_board_version(f'W/{etag}, "other"', "board-1") == 7
+    assert _known_board_version(_board_etag("board-2", 7), "board-1") is None
+    assert _known_board_version("*", "board-1") is None
+    assert _known_board_version(None, "board-1") is None
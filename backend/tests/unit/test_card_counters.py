@@ -0,0 +1,48 @@
+import pytest
+
+from app.modules.tasks.jobs import repair_card_counters
+from app.modules.tasks.repository import TasksRepository
+
+
+class _StubConnection:
+    def __init__(self, rows=None, value=None) -> None:
+        self._rows = list(rows or [])
+        self._value = value
+        self.calls: list[tuple] = []
+
+    async def fetchrow(self, query, *args):
+        self.calls.append(args)
+        return self._rows.pop(0)
+
+    async def fetchval(self, query, *args):
+        self.calls.append(args)
+        return self._value
+
+
+@pytest.mark.asyncio
+async def test_repair_sweeps_in_batches_until_a_short_one() -> None:
+    connection = _StubConnection(
+        rows=[
+            {"last_id": "card-2", "visited": 2, "repaired": 1},
+            {"last_id": "card-4", "visited": 2, "repaired": 0},
+            {"last_id": "card-5", "visited": 1, "repaired": 2},
+        ]
+    )
+
+    repaired = await repair_card_counters(TasksRepository(connection), batch_size=2)
+
+    assert repaired == 3
+    assert connection.calls == [(None, 2), ("card-2", 2), ("card-4", 2)]
+
+
+@pytest.mark.asyncio
+async def test_repair_stops_on_empty_table() -> None:
+    connection = _StubConnection(rows=[{"last_id": None, "visited": 0, "repaired": 0}])
+
+    assert await repair_card_counters(TasksRepository(connection), batch_size=10) == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_reports_whether_a_row_was_removed() -> None:
+    assert await TasksRepository(_StubConnection(value=3)).delete_comment("comment-1") is True
+    assert await TasksRepository(_StubConnection(value=0)).delete_attachment("attachment-1") is False
@@ -0,0 +1,129 @@
+import random
+from contextlib import asynccontextmanager
+
+import pytest
+from asyncpg.exceptions import UniqueViolationError
+
+from app.modules.tasks.ranking import key_between, keys_after, spaced_keys
+from app.modules.tasks.repository import TasksRepository, _affected_rows
+
+
+def test_random_inserts_stay_ordered_and_short() -> None:
+    rng = random.Random(7)
+    ranks = spaced_keys(20)
+
+    for _ in range(500):
+        index = rng.randint(0, len(ranks))
+        before = ranks[index - 1] if index else None
+        after = ranks[index] if index < len(ranks) else None
+        ranks.insert(index, key_between(before, after))
+
+    assert ranks == sorted(ranks)
+    assert len(set(ranks)) == len(ranks)
+    assert not any(rank.endswith("0") for rank in ranks)
+
+
+def test_appends_and_prepends_keep_fixed_width() -> None:
+    ranks = [key_between(None, None)]
+    for _ in range(2_000):
+        ranks.append(key_between(ranks[-1], None))
+        ranks.insert(0, key_between(None, ranks[0]))
+
+    assert ranks == sorted(ranks)
+    assert max(len(rank) for rank in ranks) == 3
+
+
+def test_spaced_keys_are_ascending_and_unique() -> None:
+    ranks = spaced_keys(500)
+
+    assert ranks == sorted(ranks)
+    assert len(set(ranks)) == 500
+    assert keys_after(ranks[-1], 3) == sorted(keys_after(ranks[-1], 3))
+
+
+def test_key_between_rejects_inverted_bounds() -> None:
+    with pytest.raises(ValueError):
+        key_between("V2", "V1")
+
+
+class _StubConnection:
+    def __init__(self, neighbours: list[str], failures: int = 0) -> None:
+        self._neighbours = neighbours
+        self._failures = failures
+        self.writes: list[tuple] = []
+
+    @asynccontextmanager
+    async def _transaction(self):
+        yield
+
+    def transaction(self):
+        return self._transaction()
+
+    async def fetch(self, query, *args):
+        return [{"rank": rank} for rank in self._neighbours]
+
+    async def fetchval(self, query, *args):
+        return self._neighbours[0] if self._neighbours else None
+
+    async def fetchrow(self, query, *args):
+        if self._failures:
+            self._failures -= 1
+            raise UniqueViolationError("duplicate rank")
+        self.writes.append(args)
+        return {"moved": True, "is_full": False, "wip_limit": None, "card_count": 3}
+
+
+@pytest.mark.asyncio
+async def test_move_writes_only_the_moved_card() -> None:
+    connection = _StubConnection(["V1", "V2"])
+
+    moved = await TasksRepository(connection).move_task("task-1", "column-2", 5)
+
+    assert moved is True
+    assert len(connection.writes) == 1
+    column_id, rank, _, task_id = connection.writes[0]
+    assert (column_id, task_id) == ("column-2", "task-1")
+    assert "V1" < rank < "V2"
+
+
+@pytest.mark.asyncio
+async def test_move_retries_when_a_concurrent_move_took_the_rank() -> None:
+    connection = _StubConnection(["V1", "V2"], failures=1)
+
+    assert await TasksRepository(connection).move_task("task-1", "column-2", 5) is True
+    assert len(connection.writes) == 1
+
+
+class _BulkConnection(_StubConnection):
+    def __init__(self, status: str) -> None:
+        super().__init__(["V1"])
+        self._status = status
+
+    async def fetchrow(self, query, *args):
+        self.writes.append(args)
+        return {"moved": _affected_rows(self._status), "fits": True, "wip_limit": None, "card_count": 0}
+
+    async def execute(self, query, *args):
+        self.writes.append(args)
+        return self._status
+
+
+@pytest.mark.asyncio
+async def test_bulk_move_is_one_statement_with_ranks_after_the_column_tail() -> None:
+    connection = _BulkConnection("UPDATE 2")
+
+    moved = await TasksRepository(connection).bulk_move_tasks(["a", "b", "missing"], "column-2")
+
+    assert moved == 2
+    assert len(connection.writes) == 1
+    column_id, task_ids, ranks = connection.writes[0]
+    assert (column_id, task_ids) == ("column-2", ["a", "b", "missing"])
+    assert "V1" < ranks[0] < ranks[1] < ranks[2]
+
+
+@pytest.mark.asyncio
+async def test_bulk_operations_report_affected_rows() -> None:
+    repository = TasksRepository(_BulkConnection("UPDATE 3"))
+
+    assert await repository.bulk_assign_tasks(["a", "b", "c", "d"], "user-1") == 3
+    assert await repository.reorder_columns("board-1", [("c1", 1), ("c2", 0), ("c3", 2)]) == 3
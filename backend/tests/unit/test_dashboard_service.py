@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import asyncio
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock
 
 import pytest
@@ -8,7 +9,7 @@ import pytest
 from app.dependencies import CurrentPrincipal
 from app.modules.workspace_dashboard.repository import DashboardRepository
 from app.modules.workspace_dashboard.schemas import DashboardKpi, DashboardSummary
-from app.modules.workspace_dashboard.service import DashboardService
+from app.modules.workspace_dashboard.service import DashboardService, DashboardSummaryCache
 from app.modules.workspace.repository import WorkspacePermissionRepository
 
 
@@ -54,7 +55,11 @@ class TestDashboardService:
         repository: AsyncMock,
         permission_repository: AsyncMock,
     ) -> DashboardService:
-        return DashboardService(repository=repository, permission_repository=permission_repository)
+        return DashboardService(
+            repository=repository,
+            permission_repository=permission_repository,
+            cache=DashboardSummaryCache(),
+        )
 
     async def test_get_summary_checks_permissions(
         self,
@@ -79,3 +84,112 @@ class TestDashboardService:
         )
         assert summary.org_id == "org-1"
         assert len(summary.kpis) == 3
+
+
+def _summary(org_id: str = "org-1", *, generated_at: datetime | None = None) -> DashboardSummary:
+    return DashboardSummary(
+        orgId=org_id,
+        divisionId=None,
+        generatedAt=generated_at or datetime.now(timezone.utc),
+        kpis=[],
+        projects=[],
+        docs=[],
+        activity=[],
+        presence=[],
+        hasTemplates=False,
+    )
+
+
+class TestDashboardSummaryCache:
+    async def test_concurrent_misses_share_one_load(self) -> None:
+        cache = DashboardSummaryCache(ttl_seconds=30)
+        key = cache.summary_key("org-1", None, True)
+        release = asyncio.Event()
+        calls = 0
+
+        async def loader() -> DashboardSummary:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return _summary()
+
+        waiters = [asyncio.create_task(cache.get_or_load(key, loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+
+    async def test_waiters_take_over_when_the_owner_is_cancelled(self) -> None:
+        cache = DashboardSummaryCache(ttl_seconds=30)
+        key = cache.summary_key("org-1", None, True)
+        release = asyncio.Event()
+        calls = 0
+
+        async def loader() -> DashboardSummary:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return _summary()
+
+        owner = asyncio.create_task(cache.get_or_load(key, loader))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(cache.get_or_load(key, loader)) for _ in range(3)]
+        await asyncio.sleep(0)
+        owner.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert owner.cancelled()
+        assert calls == 2
+        assert all(result is results[0] for result in results)
+
+    async def test_freshness_is_measured_from_generated_at(self) -> None:
+        cache = DashboardSummaryCache(ttl_seconds=30)
+        key = cache.summary_key("org-1", None, True)
+        generated_at = datetime.now(timezone.utc) - timedelta(seconds=10)
+        await cache.set(key, _summary(generated_at=generated_at))
+
+        assert await cache.get(key, now=generated_at + timedelta(seconds=29)) is not None
+        assert await cache.get(key, now=generated_at + timedelta(seconds=30)) is None
+        assert len(cache) == 0
+
+    async def test_division_clear_keeps_sibling_divisions(self) -> None:
+        cache = DashboardSummaryCache()
+        org_key = cache.summary_key("org-1", None, True)
+        div_key = cache.summary_key("org-1", "div-1", True)
+        sibling_key = cache.summary_key("org-1", "div-2", True)
+        other_key = cache.summary_key("org-2", None, True)
+        for key in (org_key, div_key, sibling_key, other_key):
+            await cache.set(key, _summary(key[0]))
+
+        await cache.clear_scope("org-1", "div-1")
+
+        assert await cache.get(org_key) is None
+        assert await cache.get(div_key) is None
+        assert await cache.get(sibling_key) is not None
+        assert await cache.get(other_key) is not None
+
+
+async def test_refresh_invalidates_and_rebuilds_summary() -> None:
+    repository = AsyncMock(spec=DashboardRepository)
+    stale, fresh = _summary(), _summary()
+    repository.fetch_summary.side_effect = [stale, fresh]
+    service = DashboardService(
+        repository=repository,
+        permission_repository=AsyncMock(spec=WorkspacePermissionRepository),
+        cache=DashboardSummaryCache(),
+    )
+    service.validate_organization_access = AsyncMock()
+    principal = CurrentPrincipal(id="user-123", email="user@example.com", role="member")
+
+    first = await service.get_summary(principal=principal, org_id="org-1", division_id=None, include_templates=True)
+    cached = await service.get_summary(principal=principal, org_id="org-1", division_id=None, include_templates=True)
+    refreshed = await service.refresh_dashboard_for_organization(principal, "org-1")
+    after = await service.get_summary(principal=principal, org_id="org-1", division_id=None, include_templates=True)
+
+    assert first is stale and cached is stale
+    assert refreshed is fresh and after is fresh
+    assert repository.fetch_summary.await_count == 2
@@ -0,0 +1,47 @@
+import pytest
+
+from app.modules.organizations import repository as organization_repository
+from app.modules.organizations.repository import HubMetricsCache, invalidate_hub_metrics
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_get_many_returns_only_cached_organizations() -> None:
+    cache = HubMetricsCache(ttl_seconds=60)
+    await cache.set_many({"org-1": {"member_count": 3}})
+
+    cached = await cache.get_many(["org-1", "org-2"])
+
+    assert cached == {"org-1": {"member_count": 3}}
+
+
+async def test_expired_and_invalidated_entries_are_dropped() -> None:
+    expired = HubMetricsCache(ttl_seconds=0)
+    await expired.set_many({"org-1": {"member_count": 3}})
+    assert await expired.get_many(["org-1"]) == {}
+
+    cache = HubMetricsCache(ttl_seconds=60)
+    await cache.set_many({"org-1": {"member_count": 3}})
+    await cache.invalidate("org-1")
+    assert await cache.get_many(["org-1"]) == {}
+
+
+async def test_invalidate_hub_metrics_drops_the_shared_entry(monkeypatch) -> None:
+    cache = HubMetricsCache(ttl_seconds=60)
+    monkeypatch.setattr(organization_repository, "_HUB_METRICS_CACHE", cache)
+    await cache.set_many({"org-1": {"member_count": 3}, "org-2": {"member_count": 1}})
+
+    await invalidate_hub_metrics("org-1")
+
+    assert await cache.get_many(["org-1", "org-2"]) == {"org-2": {"member_count": 1}}
+
+
+async def test_least_recently_used_organizations_are_evicted() -> None:
+    cache = HubMetricsCache(ttl_seconds=60, max_entries=2)
+    await cache.set_many({"org-1": {"member_count": 1}, "org-2": {"member_count": 2}})
+    await cache.get_many(["org-1"])
+
+    await cache.set_many({"org-3": {"member_count": 3}})
+
+    assert len(cache) == 2
+    assert set(await cache.get_many(["org-1", "org-2", "org-3"])) == {"org-1", "org-3"}
@@ -0,0 +1,19 @@
+from datetime import datetime, timedelta, timezone
+
+from app.modules.organizations.jobs import InvitationExpiryScheduler
+
+
+def test_sleeps_until_next_deadline() -> None:
+    scheduler = InvitationExpiryScheduler(interval_seconds=3600)
+    now = datetime(2025, 10, 28, 12, 0, tzinfo=timezone.utc)
+
+    assert scheduler._sleep_seconds(now + timedelta(seconds=90), now) == 90
+
+
+def test_sleep_is_clamped_to_interval_and_minimum() -> None:
+    scheduler = InvitationExpiryScheduler(interval_seconds=3600, min_sleep_seconds=1.0)
+    now = datetime(2025, 10, 28, 12, 0, tzinfo=timezone.utc)
+
+    assert scheduler._sleep_seconds(None, now) == 3600
+    assert scheduler._sleep_seconds(now + timedelta(days=3), now) == 3600
+    assert scheduler._sleep_seconds(now - timedelta(minutes=5), now) == 1.0
@@ -0,0 +1,176 @@
+import asyncio
+import importlib
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.dependencies import CurrentPrincipal, require_current_principal
+from app.modules.organizations import invitation_import as import_module
+from app.modules.organizations.di import get_organization_invitation_service
+from app.modules.organizations.invitation_import import (
+    InvitationImporter,
+    iter_invitation_rows,
+    resolve_import_format,
+)
+
+# The package re-exports ``router`` under the submodule's name
+router_module = importlib.import_module("app.modules.organizations.router")
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def _collect(chunks, import_format: str):
+    return [row async for row in iter_invitation_rows(chunks, import_format)]
+
+
+async def test_csv_rows_are_parsed_across_chunk_boundaries() -> None:
+    rows = await _collect(
+        _chunks(b"email,role,division_id\r\nada@exa", b"mple.com,admin,\r\nnot-an-email,member,\r\n"),
+        "csv",
+    )
+
+    assert [row.line for row in rows] == [2, 3]
+    assert rows[0].payload is not None
+    assert rows[0].payload.email == "ada@example.com"
+    assert rows[0].payload.role == "admin"
+    assert rows[0].payload.division_id is None
+    assert rows[1].payload is None
+    assert rows[1].error.startswith("email")
+
+
+async def test_ndjson_rows_accept_camel_case_fields() -> None:
+    rows = await _collect(
+        _chunks(b'{"email": "grace@example.com", "expiresAt": "2030-01-01T00:00:00Z"}\n[1]\n'),
+        "ndjson",
+    )
+
+    assert rows[0].payload is not None
+    assert rows[0].payload.expires_at is not None
+    assert rows[1].error == "expected a JSON object"
+
+
+async def test_csv_without_email_header_is_rejected() -> None:
+    rows = await _collect(_chunks(b"name,role\nAda,admin\n"), "csv")
+
+    assert len(rows) == 1
+    assert rows[0].error == "CSV header must include an email column"
+
+
+async def test_format_resolution() -> None:
+    assert resolve_import_format(None, "application/x-ndjson; charset=utf-8") == "ndjson"
+    assert resolve_import_format(None, "text/csv") == "csv"
+    assert resolve_import_format("NDJSON", "text/csv") == "ndjson"
+    with pytest.raises(ValueError):
+        resolve_import_format("xml", None)
+
+
+class _StubInvitationService:
+    async def authorize_import(self, principal, org_id):
+        return "user-1"
+
+
+class _StubRepository:
+    batches: list[list[str]] = []
+
+    def __init__(self, session) -> None:
+        pass
+
+    async def insert_invitation_batch(self, org_id, inviter_id, invitations):
+        _StubRepository.batches.append([invitation.email for invitation in invitations])
+        return list(invitations), []
+
+
+@asynccontextmanager
+async def _session():
+    yield object()
+
+
+async def test_import_endpoint_reads_a_streamed_body(monkeypatch) -> None:
+    monkeypatch.setattr(import_module, "OrganizationRepository", _StubRepository)
+    monkeypatch.setattr(router_module, "get_session_factory", lambda: _session)
+    _StubRepository.batches = []
+
+    app = FastAPI()
+    app.include_router(router_module.router)
+    app.dependency_overrides[require_current_principal] = lambda: CurrentPrincipal(id="user-1")
+    app.dependency_overrides[get_organization_invitation_service] = _StubInvitationService
+
+    body = _chunks(
+        b"email,role,message\r\n",
+        b'ada@example.com,admin,"Welcome,\r\nAda"\r\n',
+        b"grace@example.com,member,\r\n",
+    )
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await asyncio.wait_for(
+            client.post(
+                "/api/organizations/org-1/invitations/import?batchSize=1",
+                content=body,
+                headers={"Content-Type": "text/csv"},
+            ),
+            timeout=5,
+        )
+
+    assert response.status_code == 200
+    progress = [json.loads(line) for line in response.text.splitlines()]
+    assert progress[-1]["done"] is True
+    assert progress[-1]["inserted"] == 2
+    assert _StubRepository.batches == [["ada@example.com"], ["grace@example.com"]]
+
+
+async def test_csv_quoted_fields_may_span_lines() -> None:
+    rows = await _collect(
+        _chunks(b'email,message\n"ada@example.com","Hello\n\nwelcome ""aboard"""\n', b"grace@example.com,Hi\n"),
+        "csv",
+    )
+
+    assert [row.line for row in rows] == [2, 5]
+    assert rows[0].payload.message == 'Hello\n\nwelcome "aboard"'
+    assert rows[1].payload.email == "grace@example.com"
+
+
+async def test_malformed_division_id_is_a_row_error() -> None:
+    rows = await _collect(
+        _chunks(b"email,division_id\nada@example.com,finance\ngrace@example.com,0b7c6d1e-5f4a-4c3b-9a2d-1e0f9c8b7a65\n"),
+        "csv",
+    )
+
+    assert rows[0].payload is None
+    assert rows[0].error.startswith("divisionId")
+    assert rows[1].payload.division_id == "0b7c6d1e-5f4a-4c3b-9a2d-1e0f9c8b7a65"
+
+
+class _FailingRepository(_StubRepository):
+    async def insert_invitation_batch(self, org_id, inviter_id, invitations):
+        if len(_StubRepository.batches) == 1:
+            raise ConnectionError("database unavailable")
+        return await super().insert_invitation_batch(org_id, inviter_id, invitations)
+
+
+async def test_failed_batch_ends_the_stream_with_an_error_record(monkeypatch) -> None:
+    monkeypatch.setattr(import_module, "OrganizationRepository", _FailingRepository)
+    _StubRepository.batches = []
+    rows = iter_invitation_rows(
+        _chunks(b"email\nada@example.com\ngrace@example.com\nlinus@example.com\n"), "csv"
+    )
+
+    progress = [
+        record
+        async for record in InvitationImporter(_session, batch_size=1).run(
+            org_id="org-1", inviter_id="user-1", rows=rows
+        )
+    ]
+
+    assert len(progress) == 2
+    assert progress[0].error is None
+    assert progress[-1].error.startswith("Import stopped")
+    assert progress[-1].done is True
+    assert progress[-1].inserted == 1
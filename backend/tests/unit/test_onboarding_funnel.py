@@ -0,0 +1,122 @@
+from datetime import date
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.dependencies import CurrentPrincipal
+from app.modules.admin.schemas import OnboardingFunnelResponse
+from app.modules.admin.service import AdminOnboardingFunnelService, OnboardingFunnelCache
+from app.modules.users.funnel import (
+    COMPLETED_FUNNEL_STEP,
+    OnboardingFunnelBucket,
+    reached_funnel_steps,
+)
+from app.modules.users.repository import UserRepository
+from app.modules.users.schemas import OnboardingSession, StoredOnboardingStatus
+from app.modules.users.service import UserService
+
+pytestmark = pytest.mark.asyncio
+
+_STEPS = ("profile", "work-profile", "tools", "invite", "preferences", "workspace-hub")
+
+
+def _session(status: StoredOnboardingStatus) -> OnboardingSession:
+    return OnboardingSession(
+        id="00000000-0000-0000-0000-000000000001",
+        userId="user-1",
+        currentStep=status.lastStep or "profile",
+        isCompleted=status.completed,
+        startedAt=None,
+        completedAt=None,
+        status=status,
+    )
+
+
+class _StubFunnelRepository:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @property
+    def step_ids(self) -> tuple[str, ...]:
+        return _STEPS
+
+    async def list_buckets(self, *, manifest_version, day_from, day_to):
+        self.calls += 1
+        return [
+            OnboardingFunnelBucket(manifest_version, date(2025, 10, 1), "profile", 10),
+            OnboardingFunnelBucket(manifest_version, date(2025, 10, 1), "work-profile", 5),
+        ]
+
+
+async def test_reached_steps_are_canonical_and_ordered() -> None:
+    status = StoredOnboardingStatus(
+        completedSteps=["work_profile", "profile"],
+        skippedSteps=["tools"],
+        lastStep="workspaceHub",
+        completed=True,
+    )
+
+    steps = reached_funnel_steps(status, _STEPS)
+
+    assert steps == ["profile", "work-profile", "tools", "workspace-hub", COMPLETED_FUNNEL_STEP]
+
+
+async def test_progress_save_feeds_funnel_recorder() -> None:
+    principal = CurrentPrincipal(id="user-1", email="user@example.com")
+    status = StoredOnboardingStatus(completedSteps=["profile"], lastStep="work-profile")
+    repository = AsyncMock(spec=UserRepository)
+    repository.get_or_create_onboarding_session.return_value = _session(StoredOnboardingStatus())
+    repository.update_onboarding_status.return_value = _session(status)
+    recorder = AsyncMock()
+    service = UserService(repository=repository, funnel_recorder=recorder)
+
+    await service.update_onboarding_progress(principal, status)
+
+    recorder.record_progress.assert_awaited_once_with(
+        session_id="00000000-0000-0000-0000-000000000001", status=status
+    )
+
+
+async def test_funnel_failures_do_not_fail_progress_save() -> None:
+    principal = CurrentPrincipal(id="user-1", email="user@example.com")
+    status = StoredOnboardingStatus(completedSteps=["profile"], lastStep="work-profile")
+    repository = AsyncMock(spec=UserRepository)
+    repository.get_or_create_onboarding_session.return_value = _session(StoredOnboardingStatus())
+    repository.update_onboarding_status.return_value = _session(status)
+    recorder = AsyncMock()
+    recorder.record_progress.side_effect = RuntimeError("database unavailable")
+    service = UserService(repository=repository, funnel_recorder=recorder)
+
+    session = await service.update_onboarding_progress(principal, status)
+
+    assert session.status == status
+
+
+async def test_funnel_reads_are_cached() -> None:
+    repository = _StubFunnelRepository()
+    service = AdminOnboardingFunnelService(repository, OnboardingFunnelCache(ttl_seconds=60))
+
+    first = await service.list_buckets(manifest_version="2024-10-11", day_from=None, day_to=None)
+    second = await service.list_buckets(manifest_version="2024-10-11", day_from=None, day_to=None)
+
+    assert first == second
+    assert repository.calls == 1
+
+
+async def test_funnel_response_computes_step_conversion() -> None:
+    buckets = await _StubFunnelRepository().list_buckets(
+        manifest_version="2024-10-11", day_from=None, day_to=None
+    )
+
+    response = OnboardingFunnelResponse.build(
+        manifest_version="2024-10-11",
+        step_ids=_STEPS,
+        buckets=buckets,
+        day_from=None,
+        day_to=None,
+    )
+
+    assert [step.sessions for step in response.steps[:3]] == [10, 5, 0]
+    assert response.steps[0].conversion_from_previous is None
+    assert response.steps[1].conversion_from_previous == 0.5
+    assert response.steps[-1].step_id == COMPLETED_FUNNEL_STEP
@@ -179,7 +179,7 @@ async def test_get_overview_combines_data() -> None:
     assert overview.organizations[0].member_count == 8
     assert overview.organizations[0].active_projects == 3
     assert overview.organizations[0].last_active_at is not None
-    assert repository.expire_calls == 1
+    assert repository.expire_calls == 0
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,150 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.modules.organizations.jobs import InvitationJobWorker
+from app.modules.organizations.repository import (
+    INVITATIONS_STEP,
+    InvitationJob,
+    InvitationJobRepository,
+    OrganizationRepository,
+)
+from app.modules.organizations.schemas import (
+    InvitationCreatePayload,
+    OrganizationCreate,
+    OrganizationResponse,
+)
+from app.modules.organizations.service import OrganizationService
+
+pytestmark = pytest.mark.asyncio
+
+
+class _StubSession:
+    def __init__(self) -> None:
+        self.savepoints = 0
+        self.rolled_back_savepoints = 0
+
+    @asynccontextmanager
+    async def begin(self):
+        yield self
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        self.savepoints += 1
+        try:
+            yield self
+        except Exception:
+            self.rolled_back_savepoints += 1
+            raise
+
+
+def _worker(session: _StubSession, **kwargs) -> InvitationJobWorker:
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    return InvitationJobWorker(interval_seconds=1, session_factory=session_factory, **kwargs)
+
+
+def _job(org_id: str, *emails: str) -> InvitationJob:
+    return InvitationJob(
+        org_id=org_id,
+        inviter_id="user-1",
+        invitations=[InvitationCreatePayload(email=email) for email in emails],
+        attempts=0,
+    )
+
+
+async def test_run_once_sends_each_job_in_its_own_savepoint(monkeypatch) -> None:
+    outcomes: dict = {}
+
+    async def claim_batch(self, limit):
+        return [_job("org-1", "ada@example.com", "grace@example.com"), _job("org-broken", "linus@example.com")]
+
+    async def insert_invitations(self, org_id, inviter_id, invitations):
+        if org_id == "org-broken":
+            raise RuntimeError("insert failed")
+        return [object()], [invitations[1].email]
+
+    async def mark_completed(self, job, *, invited, skipped):
+        outcomes[job.org_id] = ("completed", invited, skipped)
+
+    async def mark_failed(self, job, *, error, max_attempts, retry_delay_seconds):
+        outcomes[job.org_id] = ("failed", error, max_attempts)
+
+    monkeypatch.setattr(InvitationJobRepository, "claim_batch", claim_batch)
+    monkeypatch.setattr(InvitationJobRepository, "mark_completed", mark_completed)
+    monkeypatch.setattr(InvitationJobRepository, "mark_failed", mark_failed)
+    monkeypatch.setattr(OrganizationRepository, "insert_invitations", insert_invitations)
+    session = _StubSession()
+
+    claimed = await _worker(session, max_attempts=3).run_once()
+
+    assert claimed == 2
+    assert outcomes == {
+        "org-1": ("completed", 1, ["grace@example.com"]),
+        "org-broken": ("failed", "insert failed", 3),
+    }
+    assert session.savepoints == 2
+    assert session.rolled_back_savepoints == 1
+
+
+async def test_run_once_with_empty_queue_does_nothing(monkeypatch) -> None:
+    async def claim_batch(self, limit):
+        return []
+
+    monkeypatch.setattr(InvitationJobRepository, "claim_batch", claim_batch)
+
+    assert await _worker(_StubSession()).run_once() == 0
+
+
+class _StubUserService:
+    async def get_current_user(self, principal):
+        return SimpleNamespace(id="user-1", organizations=[SimpleNamespace(id="org-1")])
+
+
+class _StubOrganizationRepository:
+    def __init__(self) -> None:
+        self.queued: list = []
+
+    async def create_organization(self, *, user_id, create_data, seed_template_source, invitations):
+        self.queued = list(invitations)
+        organization = OrganizationResponse(
+            id="org-1",
+            name="Acme",
+            slug="acme",
+            created_at=datetime(2025, 10, 1, tzinfo=timezone.utc),
+            divisions=[],
+            user_role="owner",
+        )
+        return organization, []
+
+
+class _StubInvitationJobs:
+    async def get_status(self, org_id):
+        return None
+
+
+async def test_create_queues_invitations_with_the_organization() -> None:
+    repository = _StubOrganizationRepository()
+    service = OrganizationService(_StubUserService(), repository, _StubInvitationJobs())
+
+    response = await service.create(
+        SimpleNamespace(id="user-1"),
+        OrganizationCreate(name="Acme", divisionName="Core", invitations=[{"email": "ada@example.com"}]),
+    )
+
+    assert [invitation.email for invitation in repository.queued] == ["ada@example.com"]
+    assert response.provisioning.status == "pending"
+    assert [step.name for step in response.provisioning.steps] == [INVITATIONS_STEP]
+
+
+async def test_status_without_a_queued_job_is_completed() -> None:
+    service = OrganizationService(_StubUserService(), _StubOrganizationRepository(), _StubInvitationJobs())
+
+    status = await service.get_provisioning_status(SimpleNamespace(id="user-1"), "org-1")
+
+    assert status.status == "completed"
+    assert status.steps == []
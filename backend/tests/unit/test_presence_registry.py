@@ -0,0 +1,77 @@
+from app.core.presence import PresenceRegistry
+from app.dependencies import CurrentPrincipal
+from app.dependencies.auth import TokenClaims
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _principal(user_id: str, name: str | None = None) -> CurrentPrincipal:
+    claims = TokenClaims(subject=user_id, raw={"user_metadata": {"full_name": name}} if name else {})
+    return CurrentPrincipal(id=user_id, email=f"{user_id}@example.com", claims=claims)
+
+
+def _registry(clock: _Clock) -> PresenceRegistry:
+    return PresenceRegistry(bucket_seconds=30, online_seconds=60, window_seconds=300, clock=clock)
+
+
+def test_online_is_scoped_to_organization_and_division() -> None:
+    clock = _Clock()
+    registry = _registry(clock)
+
+    registry.heartbeat(_principal("ada", "Ada Lovelace"), "org-1", "div-1")
+    registry.heartbeat(_principal("bob"), "org-1")
+    registry.heartbeat(_principal("cy"), "org-2", "div-9")
+
+    assert {entry.user_id for entry in registry.online("org-1")} == {"ada", "bob"}
+    assert [entry.user_id for entry in registry.online("org-1", "div-1")] == ["ada"]
+    assert registry.online("org-1", "div-1")[0].name == "Ada Lovelace"
+    assert registry.online("org-1")[0].status == "online"
+
+
+def test_members_go_away_then_expire() -> None:
+    clock = _Clock()
+    registry = _registry(clock)
+    registry.heartbeat(_principal("ada"), "org-1", "div-1")
+
+    clock.now += 90
+    registry.heartbeat(_principal("bob"), "org-1")
+    statuses = {entry.user_id: entry.status for entry in registry.online("org-1")}
+    assert statuses == {"bob": "online", "ada": "away"}
+    assert [entry.user_id for entry in registry.online("org-1", limit=1)] == ["bob"]
+
+    clock.now += 300
+    assert registry.online("org-1") == []
+    assert registry.online("org-1", "div-1") == []
+    assert registry._profiles == {}
+    assert registry._orgs == {}
+
+
+def test_idle_organizations_are_swept_by_activity_elsewhere() -> None:
+    clock = _Clock()
+    registry = _registry(clock)
+    registry.heartbeat(_principal("ada"), "org-1")
+
+    clock.now += 600
+    registry.heartbeat(_principal("bob"), "org-2")
+
+    assert "org-1" not in registry._orgs
+    assert set(registry._profiles) == {"bob"}
+
+
+def test_user_stays_known_while_active_in_another_org() -> None:
+    clock = _Clock()
+    registry = _registry(clock)
+    registry.heartbeat(_principal("ada", "Ada"), "org-1")
+
+    clock.now += 240
+    registry.heartbeat(_principal("ada", "Ada"), "org-2")
+    clock.now += 120
+
+    assert registry.online("org-1") == []
+    assert [entry.name for entry in registry.online("org-2")] == ["Ada"]
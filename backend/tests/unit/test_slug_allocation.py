@@ -0,0 +1,65 @@
+import pytest
+
+from app.modules.organizations.repository import (
+    MAX_SLUG_LENGTH,
+    OrganizationRepository,
+    SlugConflictError,
+    allocate_slug,
+    suggest_free_slugs,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+class _StubResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class _StubSession:
+    def __init__(self, slugs):
+        self._slugs = slugs
+        self.calls = []
+
+    async def execute(self, query, params):
+        self.calls.append(params)
+        lower, upper = params["lower"], params["upper"]
+        return _StubResult([(slug,) for slug in self._slugs if lower <= slug < upper])
+
+
+async def test_allocate_slug_prefers_base_then_lowest_gap() -> None:
+    assert allocate_slug("acme", set()) == "acme"
+    assert allocate_slug("acme", {"acme", "acme-1", "acme-3"}) == "acme-2"
+
+
+async def test_allocate_slug_trims_long_bases_for_suffix() -> None:
+    base = "a" * MAX_SLUG_LENGTH
+
+    candidate = allocate_slug(base, {base})
+
+    assert candidate == "a" * (MAX_SLUG_LENGTH - 2) + "-1"
+
+
+async def test_suggestions_skip_taken_variants() -> None:
+    assert suggest_free_slugs("acme", {"acme", "acme-2"}, 3) == ["acme-1", "acme-3", "acme-4"]
+
+
+async def test_generate_unique_slug_uses_a_single_query() -> None:
+    session = _StubSession(["acme", "acme-1", "acme-2", "acmecorp", "acme-corp"])
+    repository = OrganizationRepository(session)
+
+    slug = await repository.generate_unique_slug("Acme")
+
+    assert slug == "acme-3"
+    assert len(session.calls) == 1
+
+
+async def test_generate_unique_slug_raises_when_suffixes_are_exhausted() -> None:
+    taken = ["acme"] + [f"acme-{counter}" for counter in range(1, 1001)]
+    repository = OrganizationRepository(_StubSession(taken))
+
+    with pytest.raises(SlugConflictError):
+        await repository.generate_unique_slug("acme")
@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.modules.tasks.schemas import TaskAccessContext, TaskAssign
+from app.modules.tasks.service import TasksService
+
+PRINCIPAL = SimpleNamespace(id="user-1")
+
+
+class _StubRepository:
+    """Only the lightweight lookups exist; aggregate board/column reads would raise."""
+
+    def __init__(self) -> None:
+        self.context_lookups = 0
+        self.activities: list[dict] = []
+
+    async def get_task_access_context(self, task_id):
+        self.context_lookups += 1
+        return TaskAccessContext(
+            task_id=task_id,
+            title="Ship it",
+            assigned_to="user-2",
+            column_id="column-1",
+            column_name="Todo",
+            board_id="board-1",
+            organization_id="org-1",
+            division_id="div-1",
+        )
+
+    async def get_task_by_id(self, task_id):
+        return SimpleNamespace(id=task_id)
+
+    async def update_task(self, task_id, data):
+        return SimpleNamespace(id=task_id, title="Ship it", **data)
+
+    async def create_activity(self, activity_data):
+        self.activities.append(activity_data)
+
+
+@pytest.mark.asyncio
+async def test_access_context_is_resolved_once_per_request() -> None:
+    repository = _StubRepository()
+    service = TasksService(repository)
+
+    assert await service.get_task(PRINCIPAL, "org-1", "task-1") is not None
+    assert await service.get_task(PRINCIPAL, "org-1", "task-1", "div-1") is not None
+    assert repository.context_lookups == 1
+
+
+@pytest.mark.asyncio
+async def test_other_scopes_are_denied_from_the_context_alone() -> None:
+    service = TasksService(_StubRepository())
+
+    assert await service.get_task(PRINCIPAL, "org-2", "task-1") is None
+    assert await service.get_task(PRINCIPAL, "org-1", "task-1", "div-2") is None
+
+
+@pytest.mark.asyncio
+async def test_assign_logs_against_the_context_board_and_forgets_it() -> None:
+    repository = _StubRepository()
+    service = TasksService(repository)
+
+    await service.assign_task(PRINCIPAL, "org-1", "task-1", TaskAssign(userId="user-3"))
+    await service.get_task(PRINCIPAL, "org-1", "task-1")
+
+    [activity] = repository.activities
+    assert activity["board_id"] == "board-1"
+    assert activity["metadata"]["old_assignee"] == "user-2"
+    assert activity["metadata"]["new_assignee"] == "user-3"
+    assert repository.context_lookups == 2
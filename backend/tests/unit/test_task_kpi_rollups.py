@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.modules.workspace_dashboard.jobs import TaskKpiRebucketScheduler
+from app.modules.workspace_dashboard.repository import TaskKpiRepository
+
+
+class _Result:
+    def __init__(self, rowcount: int) -> None:
+        self.rowcount = rowcount
+
+
+class _StubSession:
+    def __init__(self, rowcounts: list[int]) -> None:
+        self._rowcounts = list(rowcounts)
+        self.commits = 0
+        self.batch_sizes: list[int] = []
+
+    def in_transaction(self) -> bool:
+        return False
+
+    async def begin(self) -> None:
+        return None
+
+    async def execute(self, _stmt, params):
+        self.batch_sizes.append(params["batch_size"])
+        return _Result(self._rowcounts.pop(0))
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_rebucket_commits_batches_until_a_short_one() -> None:
+    session = _StubSession([2, 2, 1])
+
+    moved = await TaskKpiRepository(session).rebucket_due_tasks(batch_size=2)
+
+    assert moved == 5
+    assert session.commits == 3
+    assert session.batch_sizes == [2, 2, 2]
+
+
+def test_sleeps_until_next_bucket_transition() -> None:
+    scheduler = TaskKpiRebucketScheduler(interval_seconds=300, min_sleep_seconds=1.0)
+    now = datetime(2025, 11, 2, 12, 0, tzinfo=timezone.utc)
+
+    assert scheduler._sleep_seconds(now + timedelta(seconds=45), now) == 45
+    assert scheduler._sleep_seconds(None, now) == 300
+    assert scheduler._sleep_seconds(now + timedelta(days=2), now) == 300
+    assert scheduler._sleep_seconds(now - timedelta(seconds=5), now) == 1.0
@@ -0,0 +1,118 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.pagination import InvalidCursorError, KeysetCursor
+from app.modules.tasks.repository import TasksRepository, _prefix_tsquery
+from app.modules.tasks.schemas import TotalMode
+
+NOW = datetime(2025, 11, 8, 9, 0, tzinfo=timezone.utc)
+
+
+class _RecordingConnection:
+    def __init__(self, rows: list[dict] | None = None) -> None:
+        self.calls: list[tuple[str, tuple]] = []
+        self._rows = rows or []
+
+    async def fetchval(self, query, *args):
+        self.calls.append((query, args))
+        if query.startswith("EXPLAIN"):
+            return '[{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 1234}}]'
+        return 0
+
+    async def fetch(self, query, *args):
+        self.calls.append((query, args))
+        return self._rows
+
+
+def _activity(activity_id: str) -> dict:
+    return {
+        "id": activity_id,
+        "board_id": "board-1",
+        "task_id": "task-1",
+        "user_id": "user-1",
+        "activity_type": "task_moved",
+        "description": "Moved",
+        "metadata": "{}",
+        "created_at": NOW,
+        "user_name": "Ada",
+        "user_email": "ada@example.com",
+    }
+
+
+def test_prefix_tsquery_keeps_only_words() -> None:
+    assert _prefix_tsquery("Fix login") == "fix:* & login:*"
+    assert _prefix_tsquery("deploy & | !(prod):*") == "deploy:* & prod:*"
+    assert _prefix_tsquery("!!!") is None
+
+
+@pytest.mark.asyncio
+async def test_search_scopes_in_sql_and_ranks_by_relevance() -> None:
+    connection = _RecordingConnection()
+
+    page = await TasksRepository(connection).search_tasks(
+        organization_id="org-1", division_id="div-1", query="logn", fuzzy=True, total=TotalMode.EXACT
+    )
+
+    (count_query, count_args), (data_query, data_args) = connection.calls
+    assert page.total == 0
+    assert count_args == ("org-1", "div-1", "logn:*", "logn")
+    assert data_args == count_args + (21, 0)
+    assert "JOIN kanban_boards b" in count_query
+    assert "ILIKE" not in data_query
+    assert "t.search_vector @@ to_tsquery('english', $3)" in data_query
+    assert "$4 <% t.title" in data_query
+    assert "ORDER BY GREATEST(ts_rank_cd(" in data_query
+
+
+@pytest.mark.asyncio
+async def test_search_without_query_keeps_recency_order_and_skips_board_join() -> None:
+    connection = _RecordingConnection()
+
+    page = await TasksRepository(connection).search_tasks(board_id="board-1", sort_by="relevance")
+
+    [(data_query, _)] = connection.calls
+    assert page.total is None
+    assert "kanban_boards" not in data_query
+    assert "ORDER BY t.updated_at DESC, t.id DESC" in data_query
+
+
+@pytest.mark.asyncio
+async def test_search_continues_after_a_position_cursor() -> None:
+    connection = _RecordingConnection()
+    cursor = KeysetCursor(sort_value=["column-1", "V1"], id="task-9").encode()
+
+    await TasksRepository(connection).search_tasks(
+        board_id="board-1", sort_by="position", sort_order="asc", cursor=cursor, offset=40
+    )
+
+    [(data_query, args)] = connection.calls
+    assert "(t.column_id, t.rank, t.id) > ($2::uuid, $3::text, $4::uuid)" in data_query
+    assert args == ("board-1", "column-1", "V1", "task-9", 21, 0)
+
+
+@pytest.mark.asyncio
+async def test_search_rejects_a_cursor_from_another_sort() -> None:
+    cursor = KeysetCursor(sort_value=NOW, id="task-9").encode()
+
+    with pytest.raises(InvalidCursorError):
+        await TasksRepository(_RecordingConnection()).search_tasks(sort_by="position", cursor=cursor)
+
+
+@pytest.mark.asyncio
+async def test_activity_pages_hand_out_keyset_cursors_and_estimates() -> None:
+    connection = _RecordingConnection([_activity("a3"), _activity("a2"), _activity("a1")])
+    repository = TasksRepository(connection)
+
+    first = await repository.get_activities_for_board("board-1", limit=2, total=TotalMode.ESTIMATE)
+
+    assert first.total == 1234
+    assert [entry.id for entry in first.items] == ["a3", "a2"]
+    assert first.has_more
+    assert KeysetCursor.decode(first.next_cursor) == KeysetCursor(sort_value=NOW, id="a2")
+
+    await repository.get_activities_for_board("board-1", limit=2, offset=100, cursor=first.next_cursor)
+
+    query, args = connection.calls[-1]
+    assert "(a.created_at, a.id) < ($2::timestamptz, $3::uuid)" in query
+    assert args == ("board-1", NOW, "a2", 3, 0)
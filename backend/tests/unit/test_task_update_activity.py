@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.modules.tasks.repository import TasksRepository
+
+NOW = datetime(2025, 11, 9, 9, 0, tzinfo=timezone.utc)
+
+
+class _StubConnection:
+    def __init__(self, changes) -> None:
+        self.calls: list[tuple[str, tuple]] = []
+        self._changes = changes
+
+    async def fetchrow(self, query, *args):
+        self.calls.append((query, args))
+        return {
+            "id": "task-1",
+            "column_id": "column-1",
+            "title": "Ship it",
+            "description": None,
+            "priority": "high",
+            "position": 0,
+            "story_points": None,
+            "due_date": None,
+            "start_date": None,
+            "completed_at": None,
+            "created_by": "user-1",
+            "assigned_to": None,
+            "labels": '["backend"]',
+            "custom_fields": None,
+            "is_archived": False,
+            "created_at": NOW,
+            "updated_at": NOW,
+            "changes": self._changes,
+        }
+
+
+@pytest.mark.asyncio
+async def test_update_diffs_and_logs_in_one_statement() -> None:
+    connection = _StubConnection('{"priority": {"old": "low", "new": "high"}}')
+
+    task, changes = await TasksRepository(connection).update_task_with_activity(
+        "task-1",
+        {"priority": "high", "labels": ["backend"], "completed_at": NOW, "unknown": 1},
+        user_id="user-1",
+        board_id="board-1",
+    )
+
+    [(query, args)] = connection.calls
+    assert task.priority == "high"
+    assert changes == {"priority": {"old": "low", "new": "high"}}
+    assert "priority = $1, labels = $2, updated_at = $3::timestamptz" in query
+    assert "t.priority IS DISTINCT FROM $1 OR t.labels IS DISTINCT FROM $2" in query
+    assert "INSERT INTO task_activities" in query
+    assert args[:2] == ("high", '["backend"]')
+    assert args[3:5] == ("task-1", ["priority", "labels"])
+    assert args[6:] == ("board-1", "user-1")
@@ -0,0 +1,71 @@
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from app.modules.tasks.repository import TasksRepository, WipLimitExceededError
+from app.modules.tasks.schemas import BulkTaskMove
+from app.modules.tasks.service import TasksService
+
+PRINCIPAL = SimpleNamespace(id="user-1")
+
+
+class _StubConnection:
+    def __init__(self, row) -> None:
+        self.queries: list[str] = []
+        self._row = row
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def fetchval(self, query, *args):
+        return None
+
+    async def fetchrow(self, query, *args):
+        self.queries.append(query)
+        return self._row
+
+
+@pytest.mark.asyncio
+async def test_move_checks_the_limit_in_the_moving_statement() -> None:
+    connection = _StubConnection({"moved": False, "is_full": True, "wip_limit": 3, "card_count": 3})
+
+    with pytest.raises(WipLimitExceededError) as error:
+        await TasksRepository(connection).move_task("task-1", "column-2", 0)
+
+    [query] = connection.queries
+    assert "FOR UPDATE" in query and "UPDATE kanban_cards" in query
+    assert error.value.available == 0
+
+
+@pytest.mark.asyncio
+async def test_move_within_limit_reports_success() -> None:
+    connection = _StubConnection({"moved": True, "is_full": False, "wip_limit": 3, "card_count": 2})
+
+    assert await TasksRepository(connection).move_task("task-1", "column-2", 0) is True
+
+
+class _FullColumnRepository:
+    """Reports a full target column; loading its cards would raise."""
+
+    async def get_column_by_id(self, column_id):
+        return SimpleNamespace(id=column_id, board_id="board-1", name="Doing", wip_limit=2, is_over_limit=True)
+
+    async def get_board_by_id(self, board_id):
+        return SimpleNamespace(id=board_id, organization_id="org-1", division_id=None)
+
+    async def bulk_move_tasks(self, task_ids, target_column_id):
+        raise WipLimitExceededError(target_column_id, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_bulk_move_reports_remaining_slots() -> None:
+    service = TasksService(_FullColumnRepository())
+
+    response = await service.bulk_move_tasks(
+        PRINCIPAL, "org-1", BulkTaskMove(taskIds=["task-1", "task-2"], targetColumnId="column-2")
+    )
+
+    assert response.success_count == 0
+    assert response.errors == ["Column 'Doing' has only 1 slots available"]
@@ -0,0 +1,109 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.modules.workspace.repository import WorkspaceRepository
+from app.modules.workspace.schemas import WorkspaceActivity
+from app.modules.workspace.streaming import (
+    ActivitySubscription,
+    activity_cursor,
+    activity_event_stream,
+)
+
+pytestmark = pytest.mark.asyncio
+
+_BASE = datetime(2025, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _activity(index: int, *, division_id=None, is_template=False) -> WorkspaceActivity:
+    return WorkspaceActivity.model_validate(
+        {
+            "id": f"00000000-0000-0000-0000-00000000000{index}",
+            "orgId": "org-1",
+            "divisionId": division_id,
+            "activityType": "post",
+            "content": f"update {index}",
+            "occurredAt": _BASE + timedelta(seconds=index),
+            "isTemplate": is_template,
+            "author": {"id": None, "name": "Workspace", "role": None},
+        }
+    )
+
+
+class _StubBroadcaster:
+    def __init__(self) -> None:
+        self.subscription = None
+        self.unsubscribed = False
+
+    async def subscribe(self, **kwargs) -> ActivitySubscription:
+        self.subscription = ActivitySubscription(**kwargs)
+        return self.subscription
+
+    async def unsubscribe(self, subscription) -> None:
+        self.unsubscribed = True
+
+
+def _session_factory():
+    @asynccontextmanager
+    async def factory():
+        yield object()
+
+    return factory
+
+
+async def test_subscription_filters_by_division_and_templates() -> None:
+    subscription = ActivitySubscription(org_id="org-1", division_id="div-1", include_templates=False, buffer_size=8)
+
+    assert subscription.matches(_activity(1))
+    assert subscription.matches(_activity(2, division_id="div-1"))
+    assert not subscription.matches(_activity(3, division_id="div-2"))
+    assert not subscription.matches(_activity(4, is_template=True))
+
+
+async def test_overflow_closes_the_subscription() -> None:
+    subscription = ActivitySubscription(org_id="org-1", division_id=None, include_templates=True, buffer_size=2)
+
+    for index in range(3):
+        subscription.offer(_activity(index))
+
+    assert subscription.closed
+    assert await subscription.next(timeout=0.1) is None
+
+
+async def test_stream_skips_replayed_live_events_but_keeps_backdated_ones(monkeypatch) -> None:
+    async def fetch_activities_after(self, *, after, limit, **kwargs):
+        return [_activity(2), _activity(3)] if after == activity_cursor(_activity(1)) else []
+
+    monkeypatch.setattr(WorkspaceRepository, "fetch_activities_after", fetch_activities_after)
+    broadcaster = _StubBroadcaster()
+    stream = activity_event_stream(
+        broadcaster,
+        _session_factory(),
+        org_id="org-1",
+        division_id=None,
+        include_templates=True,
+        last_event_id=activity_cursor(_activity(1)),
+        buffer_size=8,
+        heartbeat_seconds=5,
+    )
+
+    frames = [await stream.__anext__() for _ in range(3)]
+    assert frames[0].startswith("retry:")
+    assert "update 2" in frames[1]
+    assert "update 3" in frames[2]
+
+    broadcaster.subscription.offer(_activity(3))
+    broadcaster.subscription.offer(_activity(0))
+    broadcaster.subscription.offer(_activity(4))
+    backdated = await asyncio.wait_for(stream.__anext__(), timeout=1)
+    assert "update 0" in backdated
+    live = await asyncio.wait_for(stream.__anext__(), timeout=1)
+    assert "update 4" in live
+    assert live.startswith(f"id: {activity_cursor(_activity(4)).encode()}\n")
+
+    broadcaster.subscription.close()
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+    assert broadcaster.unsubscribed
@@ -0,0 +1,168 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.pagination import InvalidCursorError, KeysetCursor
+from app.modules.workspace.repository import NIL_UUID, WorkspaceRepository
+
+pytestmark = pytest.mark.asyncio
+
+
+class _StubResult:
+    def __init__(self, row):
+        self._row = row
+
+    def mappings(self):
+        return self
+
+    def one(self):
+        return self._row
+
+
+class _StubSession:
+    def __init__(self, row):
+        self._row = row
+        self.statements = 0
+
+    async def execute(self, stmt, params):
+        self.statements += 1
+        return _StubResult(self._row)
+
+
+async def test_overview_loads_all_sections_in_one_statement() -> None:
+    session = _StubSession(
+        {
+            "projects": [
+                {
+                    "id": "11111111-1111-1111-1111-111111111111",
+                    "org_id": "22222222-2222-2222-2222-222222222222",
+                    "division_id": None,
+                    "name": "Launch",
+                    "description": None,
+                    "badge_count": 0,
+                    "dot_color": "bg-blue-500",
+                    "status": "active",
+                    "default_view": "board",
+                    "is_template": True,
+                    "updated_at": "2025-10-01T12:00:00+00:00",
+                }
+            ],
+            "tasks": [],
+            "docs": None,
+            "channels": "[]",
+        }
+    )
+
+    overview = await WorkspaceRepository(session).fetch_overview(
+        org_id="22222222-2222-2222-2222-222222222222",
+        division_id=None,
+        include_templates=True,
+    )
+
+    assert session.statements == 1
+    assert [project.name for project in overview.projects] == ["Launch"]
+    assert overview.docs == []
+    assert overview.channels == []
+    assert overview.has_templates is True
+
+
+class _StubRowsResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _RecordingSession:
+    def __init__(self, rows):
+        self._rows = rows
+        self.calls = []
+
+    async def execute(self, stmt, params):
+        self.calls.append((str(stmt), params))
+        return _StubRowsResult(self._rows)
+
+
+def _activity_row(index: int) -> dict:
+    return {
+        "id": f"00000000-0000-0000-0000-00000000000{index}",
+        "org_id": "22222222-2222-2222-2222-222222222222",
+        "division_id": None,
+        "activity_type": "post",
+        "content": "hello",
+        "metadata": None,
+        "occurred_at": datetime(2025, 10, 1, 12, 0, tzinfo=timezone.utc),
+        "is_template": False,
+        "actor_id": None,
+        "actor_name": None,
+        "actor_role": None,
+    }
+
+
+async def test_activity_cursor_carries_id_for_tied_timestamps() -> None:
+    session = _RecordingSession([_activity_row(1), _activity_row(2), _activity_row(3)])
+    repository = WorkspaceRepository(session)
+
+    page = await repository.fetch_activity_feed(
+        org_id="22222222-2222-2222-2222-222222222222",
+        division_id=None,
+        include_templates=True,
+        limit=2,
+        cursor=None,
+    )
+
+    assert len(page.items) == 2
+    position = KeysetCursor.decode(page.next_cursor)
+    assert position.id == "00000000-0000-0000-0000-000000000002"
+
+    await repository.fetch_activity_feed(
+        org_id="22222222-2222-2222-2222-222222222222",
+        division_id=None,
+        include_templates=True,
+        limit=2,
+        cursor=page.next_cursor,
+    )
+
+    sql, params = session.calls[-1]
+    assert "(occurred_at, id) <" in sql
+    assert params["cursor_id"] == "00000000-0000-0000-0000-000000000002"
+
+
+async def test_legacy_timestamp_cursor_is_still_accepted() -> None:
+    session = _RecordingSession([])
+
+    await WorkspaceRepository(session).fetch_activity_feed(
+        org_id="22222222-2222-2222-2222-222222222222",
+        division_id=None,
+        include_templates=True,
+        limit=20,
+        cursor="2025-10-01T12:00:00+00:00",
+    )
+
+    _, params = session.calls[-1]
+    assert params["cursor_id"] == NIL_UUID
+
+
+async def test_channel_total_is_only_counted_on_request() -> None:
+    session = _RecordingSession([])
+
+    response = await WorkspaceRepository(session).list_channels(
+        org_id="22222222-2222-2222-2222-222222222222",
+        division_id=None,
+        include_templates=True,
+        page=1,
+        page_size=50,
+    )
+
+    assert response.total is None
+    assert response.next_cursor is None
+    assert len(session.calls) == 1
+
+
+async def test_malformed_cursor_is_rejected() -> None:
+    with pytest.raises(InvalidCursorError):
+        KeysetCursor.decode("not-a-cursor")
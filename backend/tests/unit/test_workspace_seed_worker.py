@@ -0,0 +1,126 @@
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.modules.organizations.schemas import OrganizationResponse
+from app.modules.workspace.jobs import WorkspaceSeedWorker
+from app.modules.workspace.repository import WorkspaceSeedJob, WorkspaceSeedJobRepository
+from app.modules.workspace.service import WorkspaceTemplateService
+
+pytestmark = pytest.mark.asyncio
+
+
+class _StubSession:
+    def __init__(self) -> None:
+        self.savepoints = 0
+        self.rolled_back_savepoints = 0
+
+    @asynccontextmanager
+    async def begin(self):
+        yield self
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        self.savepoints += 1
+        try:
+            yield self
+        except Exception:
+            self.rolled_back_savepoints += 1
+            raise
+
+
+def _worker(session: _StubSession, **kwargs) -> WorkspaceSeedWorker:
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    return WorkspaceSeedWorker(interval_seconds=1, session_factory=session_factory, **kwargs)
+
+
+def _patch_queue(monkeypatch, claimed, outcomes):
+    async def claim_batch(self, limit):
+        return claimed[:limit]
+
+    async def load_seed_context(self, org_ids):
+        return {
+            org_id: (OrganizationResponse(id=org_id, name=org_id, divisions=[]), [])
+            for org_id in org_ids
+            if org_id != "org-missing"
+        }
+
+    async def mark_completed(self, job, *, seeded):
+        outcomes[job.org_id] = "completed" if seeded else "skipped"
+
+    async def mark_failed(self, job, *, error, max_attempts, retry_delay_seconds):
+        outcomes[job.org_id] = ("failed", error, max_attempts)
+
+    monkeypatch.setattr(WorkspaceSeedJobRepository, "claim_batch", claim_batch)
+    monkeypatch.setattr(WorkspaceSeedJobRepository, "load_seed_context", load_seed_context)
+    monkeypatch.setattr(WorkspaceSeedJobRepository, "mark_completed", mark_completed)
+    monkeypatch.setattr(WorkspaceSeedJobRepository, "mark_failed", mark_failed)
+
+
+def _job(org_id: str, attempts: int = 0) -> WorkspaceSeedJob:
+    return WorkspaceSeedJob(org_id=org_id, template_source="default:v1", requested_by="user-1", attempts=attempts)
+
+
+async def test_run_once_isolates_failures_per_job(monkeypatch) -> None:
+    outcomes: dict = {}
+    invalidated: list[str] = []
+    _patch_queue(
+        monkeypatch,
+        [_job("org-new"), _job("org-populated"), _job("org-broken"), _job("org-missing")],
+        outcomes,
+    )
+
+    async def apply_template(self, *, organization, divisions, template_source, seeded_by):
+        if organization.id == "org-broken":
+            raise RuntimeError("insert failed")
+        return organization.id == "org-new"
+
+    async def invalidate_organization(self, org_id):
+        invalidated.append(org_id)
+
+    monkeypatch.setattr(WorkspaceTemplateService, "apply_template", apply_template)
+    monkeypatch.setattr(WorkspaceTemplateService, "invalidate_organization", invalidate_organization)
+    session = _StubSession()
+
+    claimed = await _worker(session, max_attempts=3).run_once()
+
+    assert claimed == 4
+    assert outcomes == {
+        "org-new": "completed",
+        "org-populated": "skipped",
+        "org-broken": ("failed", "insert failed", 3),
+        "org-missing": ("failed", "Organization not found", 1),
+    }
+    assert session.savepoints == 3
+    assert session.rolled_back_savepoints == 1
+    assert invalidated == ["org-new"]
+
+
+async def test_run_once_with_empty_queue_does_nothing(monkeypatch) -> None:
+    outcomes: dict = {}
+    _patch_queue(monkeypatch, [], outcomes)
+
+    assert await _worker(_StubSession()).run_once() == 0
+    assert outcomes == {}
+
+
+async def test_full_batch_is_retried_without_sleeping(monkeypatch) -> None:
+    worker = _worker(_StubSession(), batch_size=2)
+    results = iter([2, 2, 0])
+    calls = 0
+
+    async def run_once():
+        nonlocal calls
+        calls += 1
+        value = next(results)
+        if value == 0:
+            worker._stop.set()
+        return value
+
+    monkeypatch.setattr(worker, "run_once", run_once)
+    await worker._run()
+
+    assert calls == 3
@@ -195,3 +195,63 @@ class TestWorkspaceService:
             "div-2",
         )
         repository.update_channel.assert_awaited_once_with(channel_id="chan-1", payload=payload)
+
+
+class TestWorkspaceCache:
+    """Validate bounded, org-indexed cache behaviour."""
+
+    async def test_entries_are_shared_across_principals(self) -> None:
+        repository = AsyncMock(spec=WorkspaceRepository)
+        permission_repository = AsyncMock(spec=WorkspacePermissionRepository)
+        repository.fetch_overview.return_value = WorkspaceOverview(
+            orgId="org-1",
+            divisionId=None,
+            projects=[],
+            tasks=[],
+            docs=[],
+            channels=[],
+            hasTemplates=False,
+        )
+        service = WorkspaceService(
+            repository=repository,
+            permission_repository=permission_repository,
+            cache=WorkspaceCache(ttl_seconds=60),
+        )
+
+        for member in ("user-1", "user-2"):
+            await service.get_overview(
+                principal=CurrentPrincipal(id=member, email=f"{member}@example.com"),
+                org_id="org-1",
+                division_id=None,
+                include_templates=False,
+            )
+
+        repository.fetch_overview.assert_awaited_once()
+
+    async def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = WorkspaceCache(ttl_seconds=60, max_entries=2)
+        first = WorkspaceCache.overview_key("org-1", None, False)
+        second = WorkspaceCache.overview_key("org-2", None, False)
+        third = WorkspaceCache.overview_key("org-3", None, False)
+
+        await cache.set(first, "first")
+        await cache.set(second, "second")
+        assert await cache.get(first) == "first"
+        await cache.set(third, "third")
+
+        assert len(cache) == 2
+        assert await cache.get(second) is None
+        assert await cache.get(first) == "first"
+        assert await cache.get(third) == "third"
+
+    async def test_clear_scope_only_drops_that_organization(self) -> None:
+        cache = WorkspaceCache(ttl_seconds=60)
+        await cache.set(WorkspaceCache.overview_key("org-1", None, False), "all")
+        await cache.set(WorkspaceCache.overview_key("org-1", "div-1", True), "division")
+        await cache.set(WorkspaceCache.overview_key("org-10", None, False), "other")
+
+        await cache.clear_scope("org-1")
+
+        assert await cache.get(WorkspaceCache.overview_key("org-1", None, False)) is None
+        assert await cache.get(WorkspaceCache.overview_key("org-1", "div-1", True)) is None
+        assert await cache.get(WorkspaceCache.overview_key("org-10", None, False)) == "other"